@@ -5,13 +5,13 @@ Authentication API Endpoints
 Routes for user registration, login, and token management.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.schemas.user import UserCreate, UserResponse, Token
-from app.services.auth_service import create_user, authenticate_user, get_user_by_email
-from app.core.security import create_access_token, verify_token
+from app.schemas.user import UserCreate, UserResponse, Token, EmailVerify, EmailRequest, PasswordResetConfirm
+from app.services.auth_service import create_user, authenticate_user
+from app.core.security import create_access_token
 from app.services.company_service import get_company_by_id
 from app.dependencies import get_db, get_current_user
 from app.services import auth_service # ← ADD THIS IMPORT
@@ -30,41 +30,6 @@ router = APIRouter(
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-# ===== DEPENDENCY: GET CURRENT USER =====
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> UserResponse:
-    """
-    Dependency to get currently authenticated user.
-    Extracts and verifies JWT token, then returns user object.
-    """
-    payload = verify_token(token)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    email: str = payload.get("sub")
-    if email is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user = get_user_by_email(db, email=email)
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
-    
-    return user
-
-
 # ===== ENDPOINT: REGISTER NEW USER =====
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def register(
@@ -123,6 +88,57 @@ def login(
     return {"access_token": access_token, "token_type": "bearer"}
 
 
+# ===== ENDPOINT: VERIFY EMAIL =====
+@router.post("/verify-email", response_model=UserResponse)
+def verify_email(
+    verify_data: EmailVerify,
+    db: Session = Depends(get_db)
+):
+    """
+    Confirm an email address using the token from the verification email.
+    """
+    return auth_service.verify_email(db, verify_data.token)
+
+
+@router.post("/verify-email/resend", status_code=status.HTTP_202_ACCEPTED)
+def resend_verification(
+    email_data: EmailRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Send the verification email again.
+    Always returns 202 so the response does not reveal which emails are registered.
+    """
+    auth_service.resend_verification_email(db, email_data.email)
+    return {"message": "If the account exists and is unverified, a new email is on its way"}
+
+
+# ===== ENDPOINTS: PASSWORD RESET =====
+@router.post("/password-reset/request", status_code=status.HTTP_202_ACCEPTED)
+def request_password_reset(
+    email_data: EmailRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Email a password reset link.
+    Always returns 202 so the response does not reveal which emails are registered.
+    """
+    auth_service.request_password_reset(db, email_data.email)
+    return {"message": "If the account exists, a reset link is on its way"}
+
+
+@router.post("/password-reset/confirm")
+def confirm_password_reset(
+    reset_data: PasswordResetConfirm,
+    db: Session = Depends(get_db)
+):
+    """
+    Set a new password using the token from the reset email.
+    """
+    auth_service.reset_password(db, reset_data.token, reset_data.new_password)
+    return {"message": "Password updated. You can now log in."}
+
+
 # ===== ENDPOINT: GET CURRENT USER INFO =====
 @router.get("/me", response_model=UserResponse)
 def get_me(current_user: UserResponse = Depends(get_current_user)):
@@ -145,5 +161,5 @@ def protected_route(current_user: UserResponse = Depends(get_current_user)):
     return {
         "message": "This is a protected route",
         "user": current_user.email,
-        "role": current_user.role
+        "role": current_user.current_role
     }
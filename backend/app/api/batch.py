@@ -0,0 +1,127 @@
+# app/api/batch.py
+
+"""
+Batch API Endpoint
+Runs many small read requests in one HTTP call, one auth resolution
+and one database session.
+
+Supported sub-requests (same responses as the normal endpoints):
+- GET /api/v1/auth/me
+- GET /api/v1/companies/
+- GET /api/v1/companies/{company_id}
+
+All company-by-id lookups in a batch are grouped into a single `IN (...)` query.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+from starlette.routing import compile_path
+from app.database import get_db
+from app.dependencies import get_current_user
+from app.schemas.batch import BatchRequest, BatchResponse, BatchSubRequest, BatchSubResponse
+from app.schemas.user import UserResponse
+from app.services.company_service import get_member_company_profiles, get_user_companies_detailed
+from app.core.permissions import Permission, role_has_permission
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/batch",
+    tags=["Batch"]
+)
+
+
+# ===== BATCHABLE ROUTES =====
+# (method, path template, operation name)
+_ROUTES = [
+    ("GET", "/api/v1/auth/me", "me"),
+    ("GET", "/api/v1/companies/", "companies"),
+    ("GET", "/api/v1/companies/{company_id:int}", "company"),
+]
+_COMPILED_ROUTES = [
+    (method, *compile_path(path)[::2], operation)  # (method, regex, convertors, operation)
+    for method, path, operation in _ROUTES
+]
+
+
+def _match(sub_request: BatchSubRequest) -> tuple[Optional[str], dict, int]:
+    """
+    Find the operation for a sub-request.
+    
+    Returns:
+        (operation, path params, status) - operation is None when nothing matches
+    """
+    path = sub_request.path.split("?", 1)[0]
+    path_matched = False
+    for method, regex, convertors, operation in _COMPILED_ROUTES:
+        match = regex.match(path)
+        if not match:
+            continue
+        path_matched = True
+        if method == sub_request.method.upper():
+            params = {
+                name: convertors[name].convert(value)
+                for name, value in match.groupdict().items()
+            }
+            return operation, params, status.HTTP_200_OK
+    if path_matched:
+        return None, {}, status.HTTP_405_METHOD_NOT_ALLOWED
+    return None, {}, status.HTTP_404_NOT_FOUND
+
+
+# ===== ENDPOINT: BATCH =====
+@router.post("", response_model=BatchResponse)
+def batch(
+    batch_request: BatchRequest,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """
+    Execute up to 100 read sub-requests and return one multiplexed response.
+    
+    Request Body:
+    {
+        "requests": [
+            {"id": "me", "method": "GET", "path": "/api/v1/auth/me"},
+            {"id": "c5", "method": "GET", "path": "/api/v1/companies/5"},
+            {"id": "c7", "method": "GET", "path": "/api/v1/companies/7"}
+        ]
+    }
+    
+    Response: {"responses": [{"id": "me", "status": 200, "body": {...}}, ...]}
+    """
+    plans = [(sub_request, *_match(sub_request)) for sub_request in batch_request.requests]
+    
+    # Group every company-by-id lookup into one query
+    company_ids = {params["company_id"] for _, operation, params, _ in plans if operation == "company"}
+    profiles = get_member_company_profiles(db, current_user.id, company_ids) if company_ids else {}
+    
+    responses = []
+    my_companies = None
+    for sub_request, operation, params, sub_status in plans:
+        body = None
+        if operation == "me":
+            body = current_user.model_dump(mode="json")
+        elif operation == "companies":
+            if my_companies is None:
+                my_companies = [
+                    company.model_dump(mode="json")
+                    for company in get_user_companies_detailed(db, current_user.id)
+                ]
+            body = my_companies
+        elif operation == "company":
+            found = profiles.get(params["company_id"])
+            if found and role_has_permission(found[1], Permission.COMPANY_VIEW):
+                body = found[0].model_dump(mode="json")
+            else:
+                sub_status = status.HTTP_403_FORBIDDEN
+                body = {"detail": "You do not have permission to perform this action"}
+        elif sub_status == status.HTTP_405_METHOD_NOT_ALLOWED:
+            body = {"detail": "Method Not Allowed"}
+        else:
+            body = {"detail": "Not Found"}
+        
+        responses.append(BatchSubResponse(id=sub_request.id, status=sub_status, body=body))
+    
+    return BatchResponse(responses=responses)
@@ -0,0 +1,68 @@
+# app/api/bootstrap.py
+
+"""
+Bootstrap API Endpoint
+Everything the dashboard needs after login, in a single request.
+"""
+
+import hashlib
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import get_current_user
+from app.schemas.bootstrap import BootstrapResponse
+from app.schemas.user import UserResponse
+from app.services.company_service import get_user_memberships
+from app.core.permissions import Permission, role_permissions
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/bootstrap",
+    tags=["Bootstrap"]
+)
+
+
+# ===== ENDPOINT: BOOTSTRAP =====
+@router.get("", response_model=BootstrapResponse)
+def bootstrap(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """
+    Get the current user, current company profile, role and all memberships.
+    
+    Replaces the /auth/me, /companies/ and current-company calls with
+    one round trip and one query.
+    
+    Supports ETag: send the previous ETag in the If-None-Match header
+    and an unchanged payload returns 304 Not Modified with no body.
+    """
+    memberships = get_user_memberships(db, current_user.id)
+    
+    current_company = next(
+        (membership for membership in memberships if membership.id == current_user.current_company_id),
+        None
+    )
+    permissions = role_permissions(current_user.current_role)
+    
+    payload = BootstrapResponse(
+        user=current_user,
+        current_company=current_company,
+        current_role=current_user.current_role,
+        permissions=[permission.name for permission in Permission if permission in permissions],
+        companies=memberships
+    )
+    body = payload.model_dump_json()
+    
+    etag = '"' + hashlib.sha1(body.encode()).hexdigest() + '"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",  # Browser may keep it, but must revalidate
+    }
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
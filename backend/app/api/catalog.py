@@ -0,0 +1,66 @@
+# app/api/catalog.py
+
+"""
+Catalog API Endpoints
+Fast product lookups for the POS: barcode scans and search-as-you-type.
+Served from the in-process catalog index, not the database.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.money import from_sen
+from app.core.permissions import Permission
+from app.schemas.catalog import CatalogItemResponse
+from app.schemas.user import UserResponse
+from app.services import catalog_service
+from app.services.catalog_service import CatalogItem
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/catalog",
+    tags=["Catalog"]
+)
+
+
+def _item_response(item: CatalogItem) -> CatalogItemResponse:
+    return CatalogItemResponse(
+        id=item.id,
+        sku=item.sku,
+        barcode=item.barcode,
+        name=item.name,
+        category=item.category,
+        unit=item.unit,
+        price=from_sen(item.price),
+    )
+
+
+@router.get("/scan/{code}", response_model=CatalogItemResponse)
+def scan(
+    company_id: int,
+    code: str,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_VIEW))
+):
+    """Resolve a scanned barcode (or a typed SKU) to a product."""
+    item = catalog_service.scan(db, company_id, code)
+    if item is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No product with code {code}")
+    return _item_response(item)
+
+
+@router.get("/search", response_model=list[CatalogItemResponse])
+def search(
+    company_id: int,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_VIEW))
+):
+    """
+    Search-as-you-type: exact barcode / SKU first, then SKU or name words
+    starting with `q`, then names similar to `q` (typos).
+    """
+    return [_item_response(item) for item in catalog_service.search(db, company_id, q, limit)]
@@ -1,11 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.schemas.company import CompanyUpdate, CompanyResponse, CompanySelect # Added CompanySelect
-from app.schemas.user import UserResponse # Import UserResponse
-from app.dependencies import get_current_user
+from app.schemas.company import CompanyUpdate, CompanyResponse, CompanySelect, InvitationCreate, InvitationResponse, LogoUploadResponse # Added CompanySelect
+from app.schemas.user import UserResponse, CompanySelectResponse # Import UserResponse
+from app.dependencies import get_current_user, require_company_permission
+from app.core.permissions import Permission
+from app.core.config import settings
+from app.core import storage
+from app.core.images import LOGO_RENDITIONS, detect_image_type, render_logo_renditions, rendition_filename, run_in_image_pool
+from app.schemas.audit import AuditLogResponse
+from app.services.invitation_service import create_invitation
+from app.services.audit_service import get_company_audit_log
 from app.models.user import User
-from app.services.company_service import get_company_by_id, update_company, get_user_companies_detailed, set_active_company # Added set_active_company
+from app.services.company_service import get_company_by_id, get_company_profile, update_company, get_user_companies_detailed, set_active_company, set_company_logo # Added set_active_company
 
 router = APIRouter(
     prefix="/api/v1/companies",
@@ -23,20 +33,29 @@ def get_my_companies(
     companies = get_user_companies_detailed(db, current_user.id)
     return companies
 
+@router.get("/{company_id}", response_model=CompanyResponse)
+def get_company(
+    company_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.COMPANY_VIEW))
+):
+    """
+    Retrieve a company's profile.
+    Only members of the company can view it.
+    """
+    return get_company_profile(db, company_id)
+
 @router.put("/{company_id}", response_model=CompanyResponse)
 def update_company_profile(
     company_id: int,
     company_data: CompanyUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserResponse = Depends(require_company_permission(Permission.COMPANY_UPDATE))
 ):
     """
     Update a company's profile.
-    Only the company owner or an admin of that company can update its profile.
+    Only members whose role grants COMPANY_UPDATE (admins) can update its profile.
     """
-    # TODO: Implement authorization logic to ensure only owner/admin can update
-    # For now, we'll just check if the user is authenticated.
-    
     company = get_company_by_id(db, company_id)
     if not company:
         raise HTTPException(
@@ -44,23 +63,97 @@ def update_company_profile(
             detail="Company not found"
         )
     
-    # Placeholder for actual authorization check
-    # In a real app, you'd check if current_user is an admin or owner of company_id
-    # For now, we'll allow any authenticated user to update if they know the ID.
-    # This needs to be strengthened.
-    
-    updated_company = update_company(db, company, company_data)
+    updated_company = update_company(db, company, company_data, actor_user_id=current_user.id)
     return updated_company
 
 
-@router.post("/select", response_model=UserResponse)
+@router.post("/select", response_model=CompanySelectResponse)
 def select_company(
     company_select: CompanySelect,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Set the current active company for the authenticated user.
+    Returns a new access token carrying the selected company (nothing is written to the database).
+    """
+    return set_active_company(db, current_user, company_select.company_id)
+
+
+@router.post("/{company_id}/invitations", response_model=InvitationResponse, status_code=status.HTTP_201_CREATED)
+def invite_member(
+    company_id: int,
+    invitation_data: InvitationCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.MEMBERS_MANAGE))
+):
+    """
+    Invite someone to join the company with a role.
+    The invitation email is queued and delivered in the background.
     """
-    updated_user = set_active_company(db, current_user, company_select.company_id)
-    return updated_user
+    return create_invitation(db, company_id, invitation_data, current_user)
+
+
+@router.get("/{company_id}/audit", response_model=list[AuditLogResponse])
+def get_audit_log(
+    company_id: int,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    action: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.AUDIT_VIEW))
+):
+    """
+    Who changed what in the company, newest first.
+    Events are written in the background, so the last few seconds may not show yet.
+    """
+    return get_company_audit_log(db, company_id, since=since, until=until, action=action, limit=limit)
+
+
+@router.put("/{company_id}/logo", response_model=LogoUploadResponse)
+async def upload_company_logo(
+    company_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.COMPANY_UPDATE))
+):
+    """
+    Upload the company logo (PNG, JPEG or WebP) as the raw request body.
+    
+    Example:
+        curl -X PUT --data-binary @logo.png -H "Content-Type: image/png" .../companies/1/logo
+    
+    The body is streamed to disk, resized into invoice / header / thumbnail
+    renditions in a separate process, and stored under its SHA-256.
+    """
+    upload = await storage.receive_upload(request.stream(), settings.LOGO_MAX_BYTES)
+    try:
+        extension = detect_image_type(upload.head)
+        if extension is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Logo must be a PNG, JPEG or WebP image"
+            )
+        try:
+            await run_in_image_pool(render_logo_renditions, str(upload.temp_path), upload.digest)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+        
+        filename = f"{upload.digest}.{extension}"
+        is_new = storage.commit_upload(upload, "logos", filename)
+    finally:
+        storage.discard_upload(upload)
+    
+    logo_url = storage.object_url("logos", filename)
+    await run_in_threadpool(set_company_logo, db, company_id, logo_url, current_user.id)
+    return LogoUploadResponse(
+        logo_url=logo_url,
+        renditions={
+            name: storage.object_url("logos", rendition_filename(upload.digest, name))
+            for name in LOGO_RENDITIONS
+        },
+        sha256=upload.digest,
+        size_bytes=upload.size,
+        deduplicated=not is_new,
+    )
@@ -0,0 +1,61 @@
+# app/api/dashboard.py
+
+"""
+Dashboard API Endpoints
+Live push channel for company dashboards.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.config import settings
+from app.core.event_stream import broker
+from app.core.permissions import Permission, role_permissions
+from app.schemas.user import UserResponse
+from app.services import dashboard_service
+from app.services.company_service import get_company_member_role
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/dashboard",
+    tags=["Dashboard"]
+)
+
+
+# ===== LIVE STREAM =====
+@router.get("/stream")
+async def stream(
+    company_id: int,
+    cursor: Optional[str] = Query(None, max_length=40),
+    last_event_id: Optional[str] = Header(None, max_length=40),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.COMPANY_VIEW))
+):
+    """
+    Server-sent events with the company's changes, instead of polling.
+
+    Events (only those your role may see):
+        snapshot        current values: company, members, pending_invitations, sales_today
+        company         company profile updated
+        member_invited  a new member was invited
+        sales_today     today's POS sales count and total
+
+    Updates are batched: at most one write per DASHBOARD_PUSH_WINDOW_MS.
+    Reconnecting browsers resume with Last-Event-ID (or pass it as `cursor`).
+    """
+    if company_id == current_user.current_company_id:
+        role = current_user.current_role
+    else:
+        role = get_company_member_role(db, current_user.id, company_id)
+    permissions = int(role_permissions(role))
+    subscription = broker.subscribe(dashboard_service.topic(company_id), last_event_id or cursor, permissions)
+    # The stream can stay open for hours: don't hold a database connection
+    db.close()
+    return broker.response(
+        subscription,
+        lambda: dashboard_service.snapshot(company_id, permissions),
+        settings.DASHBOARD_PUSH_WINDOW_MS,
+    )
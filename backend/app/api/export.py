@@ -0,0 +1,69 @@
+# app/api/export.py
+
+"""
+Export API Endpoints
+Streaming CSV / JSONL / XLSX downloads of tenant data.
+"""
+
+from typing import Literal
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from app.dependencies import get_current_user, require_company_permission
+from app.schemas.user import UserResponse
+from app.services.export_service import (
+    EXPORT_FORMATS,
+    COMPANY_COLUMNS,
+    MEMBER_COLUMNS,
+    iter_company_members,
+    iter_user_companies,
+    stream_export,
+)
+from app.core.permissions import Permission
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/export",
+    tags=["Export"]
+)
+
+ExportFormat = Literal["csv", "jsonl", "xlsx"]
+
+
+def _download(columns: list[str], rows, export_format: str, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        stream_export(columns, rows, export_format),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
+
+
+# ===== ENDPOINT: EXPORT COMPANY MEMBERS =====
+@router.get("/companies/{company_id}/members")
+def export_company_members(
+    company_id: int,
+    format: ExportFormat = "csv",
+    current_user: UserResponse = Depends(require_company_permission(Permission.DATA_EXPORT | Permission.MEMBERS_VIEW))
+):
+    """
+    Download all users and memberships of a company.
+    
+    Query Parameters:
+        format: csv (default), jsonl or xlsx
+    """
+    return _download(MEMBER_COLUMNS, iter_company_members(company_id), format, f"company-{company_id}-members")
+
+
+# ===== ENDPOINT: EXPORT MY COMPANIES =====
+@router.get("/companies")
+def export_my_companies(
+    format: ExportFormat = "csv",
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """
+    Download every company the current user belongs to (e.g. all clients an accountant manages).
+    
+    Query Parameters:
+        format: csv (default), jsonl or xlsx
+    """
+    return _download(COMPANY_COLUMNS, iter_user_companies(current_user.id), format, "my-companies")
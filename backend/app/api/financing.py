@@ -0,0 +1,193 @@
+# app/api/financing.py
+
+"""
+Financing API Endpoints
+P2P financing pools, investors' capital and profit-sharing distributions.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.money import from_sen
+from app.core.permissions import Permission
+from app.models.financing import FinancingPool, PoolInvestment, ProfitDistribution
+from app.schemas.financing import (
+    FinancingPoolCreate,
+    FinancingPoolResponse,
+    PoolInvestmentCreate,
+    PoolInvestmentWithdraw,
+    PoolInvestmentResponse,
+    PoolInvestmentUploadResponse,
+    ProfitDistributionCreate,
+    ProfitDistributionResponse,
+    ProfitPayoutResponse,
+)
+from app.schemas.user import UserResponse
+from app.services import financing_service
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/financing",
+    tags=["Financing"]
+)
+
+
+def _pool_response(pool: FinancingPool, investor_count: int = 0, capital: int = 0) -> FinancingPoolResponse:
+    return FinancingPoolResponse(
+        id=pool.id,
+        name=pool.name,
+        contract_type=pool.contract_type,
+        investor_profit_ratio=pool.investor_profit_ratio,
+        company_capital=from_sen(pool.company_capital),
+        profit_account_id=pool.profit_account_id,
+        investor_account_id=pool.investor_account_id,
+        is_active=pool.is_active,
+        investor_count=investor_count,
+        capital=from_sen(capital),
+    )
+
+
+def _investment_response(investment: PoolInvestment) -> PoolInvestmentResponse:
+    return PoolInvestmentResponse(
+        id=investment.id,
+        pool_id=investment.pool_id,
+        investor_reference=investment.investor_reference,
+        investor_name=investment.investor_name,
+        capital=from_sen(investment.capital),
+        start_date=investment.start_date,
+        end_date=investment.end_date,
+    )
+
+
+def _distribution_response(distribution: ProfitDistribution) -> ProfitDistributionResponse:
+    return ProfitDistributionResponse(
+        id=distribution.id,
+        pool_id=distribution.pool_id,
+        period_start=distribution.period_start,
+        period_end=distribution.period_end,
+        profit=from_sen(distribution.profit),
+        investor_amount=from_sen(distribution.investor_amount),
+        company_amount=from_sen(distribution.company_amount),
+        investor_count=distribution.investor_count,
+        journal_entry_id=distribution.journal_entry_id,
+        created_at=distribution.created_at,
+    )
+
+
+# ===== POOLS =====
+@router.get("/pools", response_model=list[FinancingPoolResponse])
+def list_pools(
+    company_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_VIEW))
+):
+    """Financing pools with the investors and capital still invested."""
+    return [_pool_response(*row) for row in financing_service.list_pools(db, company_id)]
+
+
+@router.post("/pools", response_model=FinancingPoolResponse, status_code=status.HTTP_201_CREATED)
+def create_pool(
+    company_id: int,
+    pool_data: FinancingPoolCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """Open a mudarabah or musharakah pool."""
+    return _pool_response(financing_service.create_pool(db, company_id, pool_data, current_user.id))
+
+
+# ===== INVESTMENTS =====
+@router.get("/pools/{pool_id}/investments", response_model=list[PoolInvestmentResponse])
+def list_investments(
+    company_id: int,
+    pool_id: int,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_VIEW))
+):
+    """Investments in a pool, oldest first."""
+    investments = financing_service.list_investments(db, company_id, pool_id, limit, offset)
+    return [_investment_response(investment) for investment in investments]
+
+
+@router.post("/pools/{pool_id}/investments", response_model=PoolInvestmentUploadResponse, status_code=status.HTTP_201_CREATED)
+def add_investments(
+    company_id: int,
+    pool_id: int,
+    investments: list[PoolInvestmentCreate],
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """Add investors' capital to a pool (all or nothing)."""
+    if not 1 <= len(investments) <= 10_000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Add between 1 and 10000 investments per request"
+        )
+    added = financing_service.add_investments(db, company_id, pool_id, investments, current_user.id)
+    return PoolInvestmentUploadResponse(added=added)
+
+
+@router.post("/investments/{investment_id}/withdraw", response_model=PoolInvestmentResponse)
+def withdraw_investment(
+    company_id: int,
+    investment_id: int,
+    withdrawal: PoolInvestmentWithdraw,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """Stop an investment earning after `end_date` (must be after the last distributed period)."""
+    investment = financing_service.withdraw_investment(db, company_id, investment_id, withdrawal.end_date, current_user.id)
+    return _investment_response(investment)
+
+
+# ===== DISTRIBUTIONS =====
+@router.get("/pools/{pool_id}/distributions", response_model=list[ProfitDistributionResponse])
+def list_distributions(
+    company_id: int,
+    pool_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_VIEW))
+):
+    """Distributions of a pool, latest period first."""
+    return [_distribution_response(row) for row in financing_service.list_distributions(db, company_id, pool_id)]
+
+
+@router.post("/pools/{pool_id}/distributions", response_model=ProfitDistributionResponse, status_code=status.HTTP_201_CREATED)
+def distribute_profit(
+    company_id: int,
+    pool_id: int,
+    data: ProfitDistributionCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """
+    Share a period's profit (or loss) among the pool's investors by capital
+    and days invested, and post the investors' part to the ledger.
+    """
+    distribution = financing_service.distribute_profit(db, company_id, pool_id, data, current_user.id)
+    return _distribution_response(distribution)
+
+
+@router.get("/distributions/{distribution_id}/payouts", response_model=list[ProfitPayoutResponse])
+def list_payouts(
+    company_id: int,
+    distribution_id: int,
+    limit: int = Query(1000, ge=1, le=10_000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_VIEW))
+):
+    """Each investor's share of a distribution, by investment."""
+    return [
+        ProfitPayoutResponse(
+            investment_id=row.investment_id,
+            investor_reference=row.investor_reference,
+            capital_days=row.capital_days,
+            amount=from_sen(row.amount),
+        )
+        for row in financing_service.list_payouts(db, company_id, distribution_id, limit, offset)
+    ]
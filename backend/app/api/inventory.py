@@ -0,0 +1,274 @@
+# app/api/inventory.py
+
+"""
+Inventory API Endpoints
+Products, warehouses, stock movements, reservations and low-stock alerts.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.money import from_sen
+from app.core.permissions import Permission
+from app.models.product import Product
+from app.schemas.inventory import (
+    ProductCreate,
+    ProductUpdate,
+    ProductResponse,
+    WarehouseCreate,
+    WarehouseResponse,
+    StockMovementCreate,
+    StockTransferCreate,
+    StockMovementResponse,
+    StockPostResponse,
+    StockLevelResponse,
+    ReservationCreate,
+    ReservationResponse,
+    StockAlertResponse,
+    DemandForecastResponse,
+    ForecastRequestResponse,
+)
+from app.schemas.user import UserResponse
+from app.services import forecast_service, inventory_service
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/inventory",
+    tags=["Inventory"]
+)
+
+
+def _product_response(product: Product) -> ProductResponse:
+    return ProductResponse(
+        id=product.id,
+        sku=product.sku,
+        barcode=product.barcode,
+        name=product.name,
+        description=product.description,
+        category=product.category,
+        unit=product.unit,
+        price=from_sen(product.price),
+        cost=from_sen(product.cost) if product.cost is not None else None,
+        reorder_level=product.reorder_level,
+        is_stocked=product.is_stocked,
+        is_active=product.is_active,
+    )
+
+
+# ===== PRODUCTS =====
+@router.get("/products", response_model=list[ProductResponse])
+def list_products(
+    company_id: int,
+    category: Optional[str] = None,
+    search: Optional[str] = Query(None, max_length=100),
+    include_inactive: bool = False,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_VIEW))
+):
+    """Products by SKU. `search` matches SKU or name (partial) or barcode (exact)."""
+    products = inventory_service.list_products(db, company_id, category, search, include_inactive, limit, offset)
+    return [_product_response(product) for product in products]
+
+
+@router.post("/products", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
+def create_product(
+    company_id: int,
+    product_data: ProductCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_MANAGE))
+):
+    """Add a product."""
+    return _product_response(inventory_service.create_product(db, company_id, product_data, current_user.id))
+
+
+@router.get("/products/{product_id}", response_model=ProductResponse)
+def get_product(
+    company_id: int,
+    product_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_VIEW))
+):
+    return _product_response(inventory_service.get_product(db, company_id, product_id))
+
+
+@router.put("/products/{product_id}", response_model=ProductResponse)
+def update_product(
+    company_id: int,
+    product_id: int,
+    product_data: ProductUpdate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_MANAGE))
+):
+    """Update a product (only the fields sent)."""
+    product = inventory_service.update_product(db, company_id, product_id, product_data, current_user.id)
+    return _product_response(product)
+
+
+@router.get("/products/{product_id}/movements", response_model=list[StockMovementResponse])
+def list_movements(
+    company_id: int,
+    product_id: int,
+    warehouse_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_VIEW))
+):
+    """Stock card: movements of a product, newest first. Pass the last id as `before_id` for the next page."""
+    return inventory_service.list_movements(db, company_id, product_id, warehouse_id, limit, before_id)
+
+
+# ===== WAREHOUSES =====
+@router.get("/warehouses", response_model=list[WarehouseResponse])
+def list_warehouses(
+    company_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_VIEW))
+):
+    return inventory_service.list_warehouses(db, company_id)
+
+
+@router.post("/warehouses", response_model=WarehouseResponse, status_code=status.HTTP_201_CREATED)
+def create_warehouse(
+    company_id: int,
+    warehouse_data: WarehouseCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_MANAGE))
+):
+    """Add a warehouse or outlet store."""
+    return inventory_service.create_warehouse(db, company_id, warehouse_data, current_user.id)
+
+
+# ===== STOCK =====
+@router.get("/levels", response_model=list[StockLevelResponse])
+def get_stock_levels(
+    company_id: int,
+    product_id: Optional[int] = None,
+    warehouse_id: Optional[int] = None,
+    low_only: bool = False,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_VIEW))
+):
+    """Stock on hand, reserved and available per product and warehouse."""
+    return [
+        StockLevelResponse(
+            product_id=level.product_id,
+            warehouse_id=level.warehouse_id,
+            on_hand=level.on_hand,
+            reserved=level.reserved,
+            available=level.on_hand - level.reserved,
+            is_low=level.is_low,
+        )
+        for level in inventory_service.get_stock_levels(db, company_id, product_id, warehouse_id, low_only)
+    ]
+
+
+@router.post("/movements", response_model=StockPostResponse, status_code=status.HTTP_201_CREATED)
+def post_movements(
+    company_id: int,
+    movements: list[StockMovementCreate],
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_MANAGE))
+):
+    """
+    Record receipts, issues, sales, returns and adjustments (all or nothing).
+    Returns 409 if an outbound movement needs more than the available stock.
+    """
+    if not 1 <= len(movements) <= 1000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Post between 1 and 1000 movements per request"
+        )
+    movement_ids = inventory_service.post_movements(db, company_id, movements, current_user.id)
+    return StockPostResponse(movement_ids=movement_ids)
+
+
+@router.post("/transfers", response_model=StockPostResponse, status_code=status.HTTP_201_CREATED)
+def transfer_stock(
+    company_id: int,
+    transfer: StockTransferCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_MANAGE))
+):
+    """Move stock between warehouses."""
+    return StockPostResponse(movement_ids=inventory_service.transfer_stock(db, company_id, transfer, current_user.id))
+
+
+# ===== RESERVATIONS =====
+@router.post("/reservations", response_model=list[ReservationResponse], status_code=status.HTTP_201_CREATED)
+def reserve_stock(
+    company_id: int,
+    reservation_data: ReservationCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.POS_OPERATE))
+):
+    """
+    Hold stock for a cart or order (all lines or none).
+    Returns 409 with the short lines if there is not enough available stock.
+    """
+    return inventory_service.reserve_stock(db, company_id, reservation_data, current_user.id)
+
+
+@router.post("/reservations/{reference}/fulfill", response_model=StockPostResponse)
+def fulfill_reservations(
+    company_id: int,
+    reference: str,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.POS_OPERATE))
+):
+    """Check out: turn the reservations of `reference` into sales."""
+    return StockPostResponse(movement_ids=inventory_service.fulfill_reservations(db, company_id, reference, current_user.id))
+
+
+@router.delete("/reservations/{reference}", status_code=status.HTTP_204_NO_CONTENT)
+def release_reservations(
+    company_id: int,
+    reference: str,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.POS_OPERATE))
+):
+    """Cancel the reservations of `reference` and return the stock."""
+    inventory_service.release_reservations(db, company_id, reference)
+
+
+# ===== ALERTS =====
+@router.get("/alerts", response_model=list[StockAlertResponse])
+def list_alerts(
+    company_id: int,
+    include_resolved: bool = False,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_VIEW))
+):
+    """Products at or below their reorder level (open alerts only by default)."""
+    return inventory_service.list_alerts(db, company_id, include_resolved, limit)
+
+
+# ===== FORECASTS =====
+@router.get("/forecasts", response_model=list[DemandForecastResponse])
+def list_forecasts(
+    company_id: int,
+    product_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_VIEW))
+):
+    """Demand forecasts and reorder points from the last nightly forecast."""
+    return forecast_service.list_forecasts(db, company_id, product_id, limit, offset)
+
+
+@router.post("/forecasts/refresh", response_model=ForecastRequestResponse, status_code=status.HTTP_202_ACCEPTED)
+def refresh_forecasts(
+    company_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.INVENTORY_MANAGE))
+):
+    """Forecast the company again now instead of waiting for the night (runs on a worker)."""
+    job = forecast_service.request_forecast(db, company_id)
+    return ForecastRequestResponse(job_id=job.id, run_at=job.run_at)
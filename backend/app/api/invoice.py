@@ -0,0 +1,41 @@
+# app/api/invoice.py
+
+"""
+Invoice API Endpoints
+PDF rendering of invoices for a company.
+"""
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.permissions import Permission
+from app.schemas.invoice import InvoiceDocument
+from app.schemas.user import UserResponse
+from app.services.invoice_pdf_service import get_company_header, invoice_filename, render_invoice
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/invoices",
+    tags=["Invoices"]
+)
+
+
+@router.post("/render", response_class=Response)
+def render_invoice_pdf(
+    company_id: int,
+    invoice: InvoiceDocument,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_VIEW))
+):
+    """
+    Render an invoice as PDF with the company's letterhead.
+    Logo, address and contact lines come from the company profile.
+    """
+    pdf, _ = render_invoice(get_company_header(db, company_id), invoice)
+    return Response(
+        content=pdf,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'inline; filename="{invoice_filename(invoice.invoice_number)}"'},
+    )
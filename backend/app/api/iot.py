@@ -0,0 +1,198 @@
+# app/api/iot.py
+
+"""
+IoT API Endpoints
+Sensor registry, reading uploads from gateways, rollups for charts and alarms.
+"""
+
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.config import settings
+from app.core.event_stream import broker
+from app.core.permissions import Permission
+from app.models.iot import RollupPeriod
+from app.schemas.iot import (
+    SensorCreate,
+    SensorUpdate,
+    SensorResponse,
+    SensorReadingBatch,
+    SensorIngestResponse,
+    SensorRollupResponse,
+    AlarmRuleCreate,
+    AlarmRuleUpdate,
+    AlarmRuleResponse,
+    AlarmResponse,
+)
+from app.schemas.user import UserResponse
+from app.services import alarm_service, iot_service
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/iot",
+    tags=["IoT"]
+)
+
+
+# ===== SENSORS =====
+@router.post("/sensors", response_model=SensorResponse, status_code=status.HTTP_201_CREATED)
+def create_sensor(
+    company_id: int,
+    sensor_data: SensorCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_MANAGE))
+):
+    """Register a sensor. Its code is what gateways send readings for."""
+    return iot_service.create_sensor(db, company_id, sensor_data, current_user.id)
+
+
+@router.get("/sensors", response_model=list[SensorResponse])
+def list_sensors(
+    company_id: int,
+    kind: Optional[str] = Query(None, max_length=30),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_VIEW))
+):
+    """All sensors of the company with their latest reading."""
+    return iot_service.list_sensors(db, company_id, kind)
+
+
+@router.put("/sensors/{sensor_id}", response_model=SensorResponse)
+def update_sensor(
+    company_id: int,
+    sensor_id: int,
+    sensor_data: SensorUpdate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_MANAGE))
+):
+    """Update a sensor (set is_active=false to stop accepting its readings)."""
+    return iot_service.update_sensor(db, company_id, sensor_id, sensor_data, current_user.id)
+
+
+# ===== READINGS =====
+@router.post("/readings", response_model=SensorIngestResponse, status_code=status.HTTP_202_ACCEPTED)
+def upload_readings(
+    company_id: int,
+    batch: SensorReadingBatch,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_MANAGE))
+):
+    """
+    Upload a batch of readings.
+
+    Readings are written in the background (within IOT_FLUSH_INTERVAL_SECONDS).
+    Re-sending a batch is safe: readings already stored are ignored.
+    On 503, keep the batch and retry after the Retry-After delay.
+    """
+    if sum(len(series.points) for series in batch.series) > settings.IOT_MAX_READINGS_PER_REQUEST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Upload at most {settings.IOT_MAX_READINGS_PER_REQUEST} readings per request"
+        )
+    return iot_service.ingest(db, company_id, batch)
+
+
+# ===== ROLLUPS =====
+@router.get("/sensors/{sensor_id}/rollups", response_model=list[SensorRollupResponse])
+def get_rollups(
+    company_id: int,
+    sensor_id: int,
+    period: RollupPeriod = RollupPeriod.MINUTE,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(1440, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_VIEW))
+):
+    """
+    Count / min / max / average of a sensor per minute, hour or day.
+
+    Without `since`, returns the latest `limit` buckets.
+    """
+    return iot_service.get_rollups(db, company_id, sensor_id, period, since, until, limit)
+
+
+# ===== ALARM RULES =====
+@router.post("/alarm-rules", response_model=AlarmRuleResponse, status_code=status.HTTP_201_CREATED)
+def create_alarm_rule(
+    company_id: int,
+    rule_data: AlarmRuleCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_MANAGE))
+):
+    """Add a rule such as "temperature > 60 for 30s at Warehouse KL"."""
+    return alarm_service.create_rule(db, company_id, rule_data, current_user.id)
+
+
+@router.get("/alarm-rules", response_model=list[AlarmRuleResponse])
+def list_alarm_rules(
+    company_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_VIEW))
+):
+    """All alarm rules of the company."""
+    return alarm_service.list_rules(db, company_id)
+
+
+@router.put("/alarm-rules/{rule_id}", response_model=AlarmRuleResponse)
+def update_alarm_rule(
+    company_id: int,
+    rule_id: int,
+    rule_data: AlarmRuleUpdate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_MANAGE))
+):
+    """Change a rule (set is_active=false to disable it)."""
+    return alarm_service.update_rule(db, company_id, rule_id, rule_data, current_user.id)
+
+
+# ===== ALARMS =====
+@router.get("/alarms", response_model=list[AlarmResponse])
+def list_alarms(
+    company_id: int,
+    open_only: bool = True,
+    limit: int = Query(200, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_VIEW))
+):
+    """Alarms, newest first (only open ones unless open_only=false)."""
+    return alarm_service.list_alarms(db, company_id, open_only, limit)
+
+
+@router.post("/alarms/{alarm_id}/acknowledge", response_model=AlarmResponse)
+def acknowledge_alarm(
+    company_id: int,
+    alarm_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_VIEW))
+):
+    """Mark an alarm as seen. It closes by itself when readings are back to normal."""
+    return alarm_service.acknowledge_alarm(db, company_id, alarm_id, current_user.id)
+
+
+@router.get("/alarms/stream")
+async def alarm_stream(
+    company_id: int,
+    cursor: Optional[str] = Query(None, max_length=40),
+    last_event_id: Optional[str] = Header(None, max_length=40),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.IOT_VIEW))
+):
+    """
+    Server-sent events for alarm screens.
+
+    Events:
+        snapshot  {"alarms": [...]} - all open alarms; replace what is shown
+        alarm     one alarm's current state (remove it once resolved_at is set)
+
+    Resume with Last-Event-ID or `cursor` as for the kitchen stream.
+    """
+    subscription = broker.subscribe(alarm_service.topic(company_id), last_event_id or cursor)
+    # The stream can stay open for hours: don't hold a database connection
+    db.close()
+    # Alarms go out at once: no batching window
+    return broker.response(subscription, lambda: alarm_service.snapshot_open_alarms(company_id), window_ms=0)
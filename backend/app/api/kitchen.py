@@ -0,0 +1,87 @@
+# app/api/kitchen.py
+
+"""
+Kitchen Display API Endpoints
+Tickets for kitchen stations and the live stream their screens listen to.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.event_stream import broker
+from app.core.permissions import Permission
+from app.schemas.kitchen import KitchenTicketCreate, KitchenTicketStatusUpdate, KitchenTicketResponse
+from app.schemas.user import UserResponse
+from app.services import kitchen_service
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/kitchen",
+    tags=["Kitchen"]
+)
+
+
+# ===== TICKETS =====
+@router.post("/tickets", response_model=KitchenTicketResponse, status_code=status.HTTP_201_CREATED)
+def create_ticket(
+    company_id: int,
+    ticket_data: KitchenTicketCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.POS_OPERATE))
+):
+    """Send an order to a kitchen station."""
+    return kitchen_service.create_ticket(db, company_id, ticket_data, current_user.id)
+
+
+@router.get("/tickets", response_model=list[KitchenTicketResponse])
+def list_open_tickets(
+    company_id: int,
+    station: str = Query(..., min_length=1, max_length=30),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.KITCHEN_VIEW))
+):
+    """Open tickets of a station, oldest first."""
+    return kitchen_service.list_open_tickets(db, company_id, station)
+
+
+@router.put("/tickets/{ticket_id}/status", response_model=KitchenTicketResponse)
+def update_ticket_status(
+    company_id: int,
+    ticket_id: int,
+    status_data: KitchenTicketStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.KITCHEN_VIEW))
+):
+    """Bump a ticket (e.g. preparing -> ready). Returns 409 for served or cancelled tickets."""
+    return kitchen_service.update_ticket_status(db, company_id, ticket_id, status_data.status)
+
+
+# ===== LIVE STREAM =====
+@router.get("/stream")
+async def stream(
+    company_id: int,
+    station: str = Query(..., min_length=1, max_length=30),
+    cursor: Optional[str] = Query(None, max_length=40),
+    last_event_id: Optional[str] = Header(None, max_length=40),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.KITCHEN_VIEW))
+):
+    """
+    Server-sent events for a station's screen.
+
+    Events:
+        snapshot  {"tickets": [...]} - all open tickets; replace what is shown
+        ticket    one ticket's current state (remove it when served/cancelled)
+
+    Reconnecting browsers send Last-Event-ID automatically; other clients can
+    pass the last event id as `cursor`. Missed events are replayed, or a new
+    snapshot is sent if they are too old.
+    """
+    station = kitchen_service.normalize_station(station)
+    subscription = broker.subscribe(kitchen_service.topic(company_id, station), last_event_id or cursor)
+    # The stream can stay open for hours: don't hold a database connection
+    db.close()
+    return broker.response(subscription, lambda: kitchen_service.snapshot(company_id, station))
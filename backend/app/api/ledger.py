@@ -0,0 +1,110 @@
+# app/api/ledger.py
+
+"""
+Ledger API Endpoints
+Chart of accounts, journal postings and account balances for a company.
+"""
+
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.money import from_sen
+from app.core.permissions import Permission
+from app.models.account import Account, DEBIT_NORMAL_TYPES
+from app.schemas.ledger import (
+    AccountCreate,
+    AccountResponse,
+    JournalEntryCreate,
+    JournalPostResponse,
+    AccountBalanceResponse,
+)
+from app.schemas.user import UserResponse
+from app.services import ledger_service
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/ledger",
+    tags=["Ledger"]
+)
+
+
+# ===== ACCOUNTS =====
+@router.get("/accounts", response_model=list[AccountResponse])
+def list_accounts(
+    company_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_VIEW))
+):
+    """Chart of accounts, ordered by code."""
+    return ledger_service.list_accounts(db, company_id)
+
+
+@router.post("/accounts", response_model=AccountResponse, status_code=status.HTTP_201_CREATED)
+def create_account(
+    company_id: int,
+    account_data: AccountCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """Add an account to the chart of accounts."""
+    return ledger_service.create_account(db, company_id, account_data)
+
+
+@router.get("/accounts/{account_id}/balance", response_model=AccountBalanceResponse)
+def get_account_balance(
+    company_id: int,
+    account_id: int,
+    as_of: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_VIEW))
+):
+    """Balance at the end of `as_of` (default: today)."""
+    account = db.get(Account, account_id)
+    if account is None or account.company_id != company_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
+    as_of = as_of or date.today()
+    balance = ledger_service.get_account_balance(db, company_id, account_id, as_of)
+    return AccountBalanceResponse(
+        account_id=account_id,
+        as_of=as_of,
+        balance=from_sen(balance),
+        normal_balance=from_sen(balance if account.type in DEBIT_NORMAL_TYPES else -balance),
+    )
+
+
+# ===== JOURNAL =====
+@router.post("/entries", response_model=JournalPostResponse, status_code=status.HTTP_201_CREATED)
+def post_entries(
+    company_id: int,
+    entries: list[JournalEntryCreate],
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """
+    Post one or more balanced journal entries (all or nothing).
+    Entries cannot be edited afterwards - reverse them instead.
+    """
+    if not 1 <= len(entries) <= 1000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Post between 1 and 1000 entries per request"
+        )
+    entry_ids = ledger_service.post_entries(db, company_id, entries, created_by=current_user.id)
+    return JournalPostResponse(entry_ids=entry_ids, line_count=sum(len(entry.lines) for entry in entries))
+
+
+@router.post("/entries/{entry_id}/reverse", response_model=JournalPostResponse, status_code=status.HTTP_201_CREATED)
+def reverse_entry(
+    company_id: int,
+    entry_id: int,
+    entry_date: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """Cancel an entry by posting its mirror image (dated `entry_date`, default: the original date)."""
+    reversal_id, line_count = ledger_service.reverse_entry(db, company_id, entry_id, current_user.id, entry_date)
+    return JournalPostResponse(entry_ids=[reversal_id], line_count=line_count)
@@ -0,0 +1,38 @@
+# app/api/media.py
+
+"""
+Media API Endpoints
+Serves content-addressed files (see app/core/storage.py).
+
+A file's name is the hash of its bytes, so a URL always returns the same
+content and browsers / CDNs may cache it for a year without revalidating.
+"""
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+from app.core.config import settings
+from app.core import storage
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix=settings.MEDIA_URL,
+    tags=["Media"]
+)
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+MEDIA_TYPES = {"png": "image/png", "jpg": "image/jpeg", "webp": "image/webp"}
+
+
+@router.get("/logos/{filename}")
+def get_logo(filename: str):
+    """Serve a stored logo or logo rendition."""
+    match = storage.FILENAME_PATTERN.match(filename)
+    path = storage.object_path("logos", filename) if match else None
+    if path is None or not path.is_file():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    return FileResponse(
+        path,
+        media_type=MEDIA_TYPES[match.group("ext")],
+        headers={"Cache-Control": IMMUTABLE_CACHE, "ETag": f'"{match.group("digest")}{match.group("rendition") or ""}"'},
+    )
@@ -0,0 +1,50 @@
+# app/api/numbering.py
+
+"""
+Document Numbering API Endpoints
+View and configure a company's invoice / PO / receipt number sequences.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.permissions import Permission
+from app.models.document_sequence import DocumentType
+from app.schemas.numbering import DocumentSequenceUpdate, DocumentSequenceResponse
+from app.schemas.user import UserResponse
+from app.services import numbering_service
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/numbering",
+    tags=["Document Numbering"]
+)
+
+
+@router.get("", response_model=list[DocumentSequenceResponse])
+def list_sequences(
+    company_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.COMPANY_VIEW))
+):
+    """Number sequences of the company (one per document type and year)."""
+    return numbering_service.list_sequences(db, company_id)
+
+
+@router.put("/{document_type}", response_model=DocumentSequenceResponse)
+def update_sequence(
+    company_id: int,
+    document_type: DocumentType,
+    sequence_data: DocumentSequenceUpdate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.COMPANY_UPDATE))
+):
+    """
+    Set the prefix and number of digits for a document type.
+
+    Example: {"prefix": "INV", "padding": 6} -> INV-2026-000123
+    Applies from the current year on; issued numbers don't change.
+    """
+    return numbering_service.update_sequence(db, company_id, document_type, sequence_data, current_user.id)
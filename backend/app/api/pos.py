@@ -0,0 +1,72 @@
+# app/api/pos.py
+
+"""
+POS Sync API Endpoints
+Offline terminals upload queued sales and pull catalog changes. Reviewers
+go through the sales flagged by fraud scoring.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.config import settings
+from app.core.permissions import Permission
+from app.schemas.pos import FraudReview, FraudScoreResponse, PosSyncRequest, PosSyncResponse
+from app.schemas.user import UserResponse
+from app.services import fraud_service, pos_sync_service
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/pos",
+    tags=["POS"]
+)
+
+
+# ===== SYNC =====
+@router.post("/sync", response_model=PosSyncResponse)
+def sync(
+    company_id: int,
+    sync_request: PosSyncRequest,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.POS_OPERATE))
+):
+    """
+    Upload queued sales and get catalog changes since `cursor`.
+
+    Safe to retry: sales are stored once per idempotency key. Remove
+    accepted, duplicate and rejected keys from the terminal queue.
+    """
+    if len(sync_request.sales) > settings.POS_SYNC_MAX_SALES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Upload at most {settings.POS_SYNC_MAX_SALES} sales per sync"
+        )
+    return pos_sync_service.sync(db, company_id, sync_request, current_user.id)
+
+
+# ===== FRAUD REVIEW =====
+@router.get("/flagged-sales", response_model=list[FraudScoreResponse])
+def list_flagged_sales(
+    company_id: int,
+    min_score: float = Query(settings.FRAUD_FLAG_THRESHOLD, ge=0, le=1),
+    include_reviewed: bool = False,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.FRAUD_REVIEW))
+):
+    """Sales scored at least `min_score`, highest first (scores appear a few seconds after upload)."""
+    return fraud_service.list_flagged(db, company_id, min_score, include_reviewed, limit)
+
+
+@router.post("/fraud-scores/{score_id}/review", response_model=FraudScoreResponse)
+def review_fraud_score(
+    company_id: int,
+    score_id: int,
+    review: FraudReview,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.FRAUD_REVIEW))
+):
+    """Mark a scored sale as fraud or not (labels for retraining the model)."""
+    return fraud_service.review_score(db, company_id, score_id, review.is_fraud, current_user.id)
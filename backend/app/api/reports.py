@@ -0,0 +1,109 @@
+# app/api/reports.py
+
+"""
+Report API Endpoints
+Financial reports for a company, as JSON, CSV or XLSX.
+"""
+
+from datetime import date
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.permissions import Permission
+from app.schemas.user import UserResponse
+from app.services import report_service
+from app.services.report_service import REPORT_FORMATS, Report, ReportPeriod
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/reports",
+    tags=["Reports"]
+)
+
+ReportFormat = Literal["json", "csv", "xlsx"]
+
+
+def _respond(report: Report, report_format: str, filename: str) -> StreamingResponse:
+    headers = {}
+    if report_format != "json":
+        headers["Content-Disposition"] = f'attachment; filename="{filename}.{report_format}"'
+    return StreamingResponse(
+        report_service.stream_report(report, report_format),
+        media_type=REPORT_FORMATS[report_format],
+        headers=headers,
+    )
+
+
+def _parse_period(value: str) -> ReportPeriod:
+    """"2025-01-01..2025-12-31" -> ReportPeriod"""
+    try:
+        start, end = value.split("..")
+        return ReportPeriod(date.fromisoformat(start), date.fromisoformat(end))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid period '{value}', expected YYYY-MM-DD..YYYY-MM-DD"
+        )
+
+
+@router.get("/trial-balance")
+def get_trial_balance(
+    company_id: int,
+    as_of: list[date] = Query(..., description="Month-end dates, one column pair each"),
+    format: ReportFormat = "json",
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.REPORTS_VIEW))
+):
+    """
+    Trial balance at one or more month ends.
+    
+    Example: ?as_of=2025-12-31&as_of=2024-12-31
+    """
+    return _respond(report_service.trial_balance(db, company_id, as_of), format, "trial-balance")
+
+
+@router.get("/profit-and-loss")
+def get_profit_and_loss(
+    company_id: int,
+    period: list[str] = Query(..., description="Whole-month ranges, e.g. 2025-01-01..2025-12-31"),
+    by_cost_center: bool = False,
+    format: ReportFormat = "json",
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.REPORTS_VIEW))
+):
+    """
+    Profit and loss for one or more periods, computed in a single pass.
+    
+    Example: ?period=2025-01-01..2025-12-31&period=2024-01-01..2024-12-31
+    """
+    periods = [_parse_period(value) for value in period]
+    return _respond(report_service.profit_and_loss(db, company_id, periods, by_cost_center), format, "profit-and-loss")
+
+
+@router.get("/balance-sheet")
+def get_balance_sheet(
+    company_id: int,
+    as_of: list[date] = Query(..., description="Month-end dates, one column each"),
+    format: ReportFormat = "json",
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.REPORTS_VIEW))
+):
+    """Balance sheet at one or more month ends."""
+    return _respond(report_service.balance_sheet(db, company_id, as_of), format, "balance-sheet")
+
+
+@router.get("/aged-receivables")
+def get_aged_receivables(
+    company_id: int,
+    account_id: list[int] = Query(..., description="Receivable account(s)"),
+    as_of: date = Query(default_factory=date.today),
+    format: ReportFormat = "json",
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.REPORTS_VIEW))
+):
+    """Open receivables by document reference, in 30-day age buckets."""
+    return _respond(report_service.aged_receivables(db, company_id, as_of, account_id), format, "aged-receivables")
@@ -0,0 +1,127 @@
+# app/api/screening.py
+
+"""
+Screening API Endpoints
+Sharia-compliance rules and the journal entries and POS sales that break them.
+"""
+
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.dependencies import require_company_permission
+from app.core.money import from_sen
+from app.core.permissions import Permission
+from app.models.screening import ScreeningRule, ScreeningSource, ScreeningViolation
+from app.schemas.screening import (
+    ScreeningRuleCreate,
+    ScreeningRuleUpdate,
+    ScreeningRuleResponse,
+    ScreeningViolationResponse,
+    ScreeningSweepResponse,
+)
+from app.schemas.user import UserResponse
+from app.services import screening_service
+
+
+# ===== ROUTER SETUP =====
+router = APIRouter(
+    prefix="/api/v1/companies/{company_id}/screening",
+    tags=["Screening"]
+)
+
+
+def _rule_response(rule: ScreeningRule) -> ScreeningRuleResponse:
+    return ScreeningRuleResponse(
+        id=rule.id,
+        name=rule.name,
+        kind=rule.kind,
+        account_codes=rule.account_codes,
+        categories=rule.categories,
+        keywords=rule.keywords,
+        max_amount=from_sen(rule.max_amount) if rule.max_amount is not None else None,
+        is_active=rule.is_active,
+        created_at=rule.created_at,
+        updated_at=rule.updated_at,
+    )
+
+
+def _violation_response(violation: ScreeningViolation) -> ScreeningViolationResponse:
+    return ScreeningViolationResponse(
+        id=violation.id,
+        rule_id=violation.rule_id,
+        source=violation.source,
+        document_id=violation.document_id,
+        occurred_on=violation.occurred_on,
+        amount=from_sen(violation.amount),
+        line_count=violation.line_count,
+        found_by=violation.found_by,
+        detected_at=violation.detected_at,
+    )
+
+
+# ===== RULES =====
+@router.get("/rules", response_model=list[ScreeningRuleResponse])
+def list_rules(
+    company_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_VIEW))
+):
+    """The company's screening rules."""
+    return [_rule_response(rule) for rule in screening_service.list_rules(db, company_id)]
+
+
+@router.post("/rules", response_model=ScreeningRuleResponse, status_code=status.HTTP_201_CREATED)
+def create_rule(
+    company_id: int,
+    rule_data: ScreeningRuleCreate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """
+    Add a rule. It screens new postings and sales right away; use
+    POST /sweep to screen older ones.
+    """
+    return _rule_response(screening_service.create_rule(db, company_id, rule_data, current_user.id))
+
+
+@router.put("/rules/{rule_id}", response_model=ScreeningRuleResponse)
+def update_rule(
+    company_id: int,
+    rule_id: int,
+    rule_data: ScreeningRuleUpdate,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """Change or deactivate a rule."""
+    return _rule_response(screening_service.update_rule(db, company_id, rule_id, rule_data, current_user.id))
+
+
+# ===== VIOLATIONS =====
+@router.get("/violations", response_model=list[ScreeningViolationResponse])
+def list_violations(
+    company_id: int,
+    source: Optional[ScreeningSource] = None,
+    rule_id: Optional[int] = None,
+    since: Optional[date] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_VIEW))
+):
+    """Journal entries and POS sales that broke a rule, latest day first."""
+    violations = screening_service.list_violations(db, company_id, source, rule_id, since, limit, offset)
+    return [_violation_response(violation) for violation in violations]
+
+
+@router.post("/sweep", response_model=ScreeningSweepResponse, status_code=status.HTTP_202_ACCEPTED)
+def request_sweep(
+    company_id: int,
+    since: date,
+    db: Session = Depends(get_db),
+    current_user: UserResponse = Depends(require_company_permission(Permission.ACCOUNTING_POST))
+):
+    """Screen postings and sales from `since` with the current rules (background job)."""
+    job = screening_service.request_sweep(db, company_id, since)
+    return ScreeningSweepResponse(job_id=job.id, run_at=job.run_at)
@@ -0,0 +1,127 @@
+# app/core/cache.py
+
+"""
+In-Process Caches
+Small TTL caches for data that is read on almost every request
+(users, memberships, company profiles).
+
+Each worker process has its own copy of these caches. They are kept
+fresh across workers by the invalidation bus (app/core/invalidation.py):
+- While the bus listener is connected, entries live for CACHE_TTL_SECONDS
+- If the listener disconnects, entries expire after CACHE_FALLBACK_TTL_SECONDS
+"""
+
+import threading
+import time
+from typing import Any, Hashable
+from app.core.config import settings
+
+
+# Sentinel so we can cache "None" values (e.g. "user is not a member")
+MISSING = object()
+
+
+# ===== BUS CONNECTION STATE =====
+# Updated by the invalidation listener. When False, caches fall back
+# to a short TTL so stale entries cannot live long.
+_bus_connected = False
+
+
+def set_bus_connected(connected: bool) -> None:
+    """Record whether the invalidation listener is currently connected."""
+    global _bus_connected
+    _bus_connected = connected
+
+
+def is_bus_connected() -> bool:
+    """Return True if cross-process invalidation events are being received."""
+    return _bus_connected
+
+
+def current_ttl() -> float:
+    """TTL (seconds) that applies right now, based on bus connection state."""
+    if _bus_connected:
+        return settings.CACHE_TTL_SECONDS
+    return settings.CACHE_FALLBACK_TTL_SECONDS
+
+
+# ===== TTL CACHE =====
+class TTLCache:
+    """
+    Thread-safe dictionary cache with time-based expiry.
+
+    Example:
+        user_cache.set("user@example.com", user_response)
+        cached = user_cache.get("user@example.com")
+        if cached is MISSING:
+            # Not cached (or expired) - load from database
+    """
+
+    def __init__(self, name: str, maxsize: int = settings.CACHE_MAX_ENTRIES):
+        self.name = name
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return cached value, or MISSING if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+        value, stored_at = entry
+        if time.monotonic() - stored_at > current_ttl():
+            self.delete(key)
+            return MISSING
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value in the cache."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._data.pop(next(iter(self._data)), None)
+            self._data[key] = (value, time.monotonic())
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a single key (no error if missing)."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ===== SHARED CACHES =====
+# Keys:
+#   user_cache       -> user email
+#   membership_cache -> (user_id, company_id)
+#   company_cache    -> company_id
+#   invoice_header_cache -> company_id (rendered PDF header, see invoice_pdf_service)
+# catalog_service registers its product index as "product" -> (company_id, product_id)
+user_cache = TTLCache("user")
+membership_cache = TTLCache("membership")
+company_cache = TTLCache("company")
+invoice_header_cache = TTLCache("invoice_header")
+
+CACHES: dict[str, TTLCache] = {
+    user_cache.name: user_cache,
+    membership_cache.name: membership_cache,
+    company_cache.name: company_cache,
+    invoice_header_cache.name: invoice_header_cache,
+}
+
+# Caches built from another cache's data: an event for the key evicts them too
+DEPENDENT_CACHES: dict[str, list[TTLCache]] = {
+    company_cache.name: [invoice_header_cache],
+}
+
+
+def clear_all() -> None:
+    """Empty every cache (used after the listener reconnects and may have missed events)."""
+    for cache in CACHES.values():
+        cache.clear()
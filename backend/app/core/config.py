@@ -32,6 +32,117 @@ class Settings(BaseSettings):
     # ===== API SETTINGS =====
     API_V1_PREFIX: str = "/api/v1"  # API URL prefix
     
+    # ===== CACHE SETTINGS =====
+    CACHE_TTL_SECONDS: int = 300  # How long cached users/companies live while the invalidation bus is connected
+    CACHE_FALLBACK_TTL_SECONDS: int = 5  # Shorter TTL used when the invalidation listener is disconnected
+    CACHE_MAX_ENTRIES: int = 10000  # Maximum entries per in-process cache
+    CACHE_INVALIDATION_CHANNEL: str = "erp_cache_invalidation"  # Postgres NOTIFY channel
+    
+    # ===== BACKGROUND JOB SETTINGS =====
+    JOB_BATCH_SIZE: int = 50  # Jobs claimed per worker round trip
+    JOB_FAIRNESS_WINDOW: int = 1000  # Due jobs considered per claim when interleaving tenants
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0  # Sleep when the queue is empty
+    JOB_RETRY_BASE_SECONDS: int = 10  # Retry delay doubles each attempt: 10s, 20s, 40s...
+    JOB_RETRY_MAX_SECONDS: int = 3600  # Longest retry delay
+    JOB_LOCK_TIMEOUT_SECONDS: int = 600  # Running jobs older than this are assumed dead and requeued
+    
+    # ===== EMAIL SETTINGS =====
+    SMTP_HOST: str = "localhost"  # SMTP server (use benchmarks/smtp_sink.py locally)
+    SMTP_PORT: int = 1025
+    SMTP_USERNAME: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_USE_TLS: bool = False  # STARTTLS after connecting
+    SMTP_POOL_SIZE: int = 4  # Persistent SMTP connections per sender process
+    EMAIL_FROM: str = "ERP Platform <no-reply@localhost>"
+    EMAIL_BATCH_SIZE: int = 100  # Messages claimed from the outbox per round trip
+    EMAIL_RATE_PER_SECOND: float = 50.0  # Max messages sent per second per sender process
+    EMAIL_MAX_ATTEMPTS: int = 5
+    FRONTEND_URL: str = "http://localhost:5173"  # Used to build links in emails
+    EMAIL_VERIFICATION_EXPIRE_HOURS: int = 48
+    PASSWORD_RESET_EXPIRE_MINUTES: int = 60
+    INVITATION_EXPIRE_DAYS: int = 7
+    
+    # ===== AUDIT LOG SETTINGS =====
+    AUDIT_DURABILITY: str = "buffered"  # "buffered" (background batched writes) or "sync" (same transaction)
+    AUDIT_BUFFER_SIZE: int = 50000  # Max audit events held in memory (oldest dropped when full)
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0  # How often the buffer is written to the database
+    AUDIT_FLUSH_BATCH: int = 5000  # Max rows per write
+    
+    # ===== MEDIA SETTINGS =====
+    MEDIA_ROOT: str = "media"  # Folder for uploaded files (content-addressed)
+    MEDIA_URL: str = "/media"  # URL prefix the files are served from
+    LOGO_MAX_BYTES: int = 5 * 1024 * 1024  # Largest accepted logo upload
+    LOGO_MAX_PIXELS: int = 40_000_000  # Reject decompression bombs (width x height)
+    IMAGE_WORKERS: int = 2  # Processes used for resizing images
+    
+    # ===== INVOICE PDF SETTINGS =====
+    PDF_WORKERS: int = 4  # Processes used by batch invoice rendering
+    PDF_BATCH_CHUNK: int = 200  # Invoices sent to a worker process at a time
+    
+    # ===== DOCUMENT NUMBERING SETTINGS =====
+    NUMBER_BLOCK_SIZE: int = 100  # Numbers reserved per process at a time (types that allow gaps)
+    
+    # ===== INVENTORY SETTINGS =====
+    RESERVATION_TTL_MINUTES: int = 30  # Unfulfilled reservations are released after this
+    RESERVATION_SWEEP_BATCH: int = 500  # Expired reservations released per worker round
+    
+    # ===== CATALOG INDEX SETTINGS =====
+    CATALOG_MAX_ITEMS: int = 2_000_000  # Products indexed per process (least recently used companies evicted first)
+    CATALOG_IDLE_SECONDS: int = 3600  # Drop a company's index after this long without lookups
+    
+    # ===== POS SYNC SETTINGS =====
+    POS_SYNC_MAX_SALES: int = 5000  # Sales per upload batch
+    POS_SYNC_CATALOG_PAGE: int = 2000  # Changed products returned per sync (terminal syncs again if has_more)
+    POS_SYNC_CURSOR_LAG_SECONDS: int = 5  # Changes younger than this wait for the next sync (late commits)
+    
+    # ===== EVENT STREAM SETTINGS =====
+    EVENT_STREAM_REPLAY: int = 1000  # Recent events kept per topic for reconnecting screens
+    EVENT_STREAM_QUEUE_SIZE: int = 256  # Undelivered events per screen before it gets a fresh snapshot instead
+    EVENT_STREAM_COALESCE_MS: int = 100  # Wait this long after an event so rapid updates go out as one
+    EVENT_STREAM_HEARTBEAT_SECONDS: int = 15  # Keep-alive comment on idle streams
+    
+    # ===== DASHBOARD SETTINGS =====
+    DASHBOARD_PUSH_WINDOW_MS: int = 1000  # Dashboard updates are sent at most once per window
+    DASHBOARD_TIMEZONE: str = "Asia/Kuala_Lumpur"  # "Today" for sales totals
+    
+    # ===== IOT INGESTION SETTINGS =====
+    IOT_MAX_READINGS_PER_REQUEST: int = 50_000  # Readings per batch upload
+    IOT_BUFFER_SIZE: int = 2_000_000  # Readings held in memory before uploads are refused (503)
+    IOT_FLUSH_INTERVAL_SECONDS: float = 0.5  # How often buffered readings are written
+    IOT_FLUSH_BATCH: int = 100_000  # Max readings per write (a fuller buffer is flushed right away)
+    IOT_MAX_CLOCK_SKEW_SECONDS: int = 300  # Readings further in the future are rejected
+    IOT_RAW_RETENTION_DAYS: int = 14  # Raw readings older than this are deleted (rollups are kept)
+    
+    # ===== FORECAST SETTINGS =====
+    FORECAST_WORKERS: int = 4  # Processes used by the nightly forecast (one company at a time each)
+    FORECAST_RUN_HOUR: int = 2  # Local hour (DASHBOARD_TIMEZONE) the nightly forecast runs
+    FORECAST_HISTORY_DAYS: int = 364  # Days of sales the models are fitted on
+    FORECAST_HORIZON_DAYS: int = 28  # Days forecast ahead
+    FORECAST_SEASON_DAYS: int = 7  # Length of the sales cycle (weekly)
+    FORECAST_LEAD_TIME_DAYS: int = 7  # Days between ordering stock and receiving it
+    FORECAST_SERVICE_LEVEL_Z: float = 1.65  # Safety stock in forecast errors (1.65 = ~95% no stock-out)
+    FORECAST_APPLY_REORDER_LEVELS: bool = False  # Also copy reorder points into products' reorder levels
+    
+    # ===== FRAUD SCORING SETTINGS =====
+    FRAUD_SCORING_ENABLED: bool = True  # Score new POS sales on upload
+    FRAUD_MODEL_PATH: Optional[str] = None  # JSON logistic model (see fraud_service); built-in weights when unset
+    FRAUD_SCORE_BUDGET_MS: float = 5.0  # Time an upload may spend scoring; the rest of its sales are scored in the background
+    FRAUD_FLAG_THRESHOLD: float = 0.8  # Sales scoring at least this are flagged for review
+    FRAUD_SHORT_WINDOW_SECONDS: int = 300  # Velocity window (bursts of sales)
+    FRAUD_LONG_WINDOW_SECONDS: int = 3600  # Window for amounts, discount and off-hours ratios
+    FRAUD_OFF_HOURS_START: int = 0  # Local hours (DASHBOARD_TIMEZONE) counted as off-hours: START <= hour < END
+    FRAUD_OFF_HOURS_END: int = 6
+    FRAUD_BUFFER_SIZE: int = 100_000  # Scores held in memory before the oldest are dropped
+    FRAUD_FLUSH_INTERVAL_SECONDS: float = 2.0  # How often scores are written (and deferred sales scored)
+
+    # ===== SHARIA SCREENING SETTINGS =====
+    SCREENING_ENABLED: bool = True  # Screen journal postings and POS uploads as they are written
+    SCREENING_RUN_HOUR: int = 3  # Local hour (DASHBOARD_TIMEZONE) of the nightly sweep
+    SCREENING_SWEEP_DAYS: int = 35  # The nightly sweep re-screens the last N days (catches rule and catalog changes)
+    SCREENING_CHUNK_SIZE: int = 50_000  # Lines loaded per query during a sweep
+    SCREENING_BUFFER_SIZE: int = 50_000  # Violations held in memory before the oldest are dropped
+    SCREENING_FLUSH_INTERVAL_SECONDS: float = 2.0  # How often violations found while posting are written
+    
     class Config:
         """
         Pydantic configuration
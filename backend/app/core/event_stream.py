@@ -0,0 +1,361 @@
+# app/core/event_stream.py
+
+"""
+Event Stream Broker
+In-process pub/sub that pushes events to screens over server-sent events (SSE).
+
+Topics are (company_id, channel), e.g. (1, "kitchen:grill"). Services call
+broker.publish() after their transaction commits; every screen subscribed
+to the topic receives the event.
+
+Built so one worker can feed thousands of screens:
+- An event is serialized once (as a ready-to-send SSE frame) and shared by
+  all subscribers
+- Each subscriber has a bounded queue keyed by the event's `key` (e.g. a
+  ticket id). A newer event for the same key replaces the queued one, so
+  rapid status changes reach the screen as a single update
+- Events are sent in batches: after the first event the stream waits a
+  short window (per connection) and writes everything queued at once
+- An event can be limited to an audience (permission bits): subscribers
+  whose permissions don't include any of them never see it
+- Publishing never blocks on slow screens. If a screen falls more than
+  EVENT_STREAM_QUEUE_SIZE events behind, its queue is dropped and it is
+  sent a fresh snapshot instead
+- Every event has an id "<epoch>-<seq>". A screen that reconnects with the
+  last id it saw (the SSE Last-Event-ID header) gets the events it missed
+  from the last EVENT_STREAM_REPLAY events of the topic, or a snapshot if
+  they are no longer kept (or the worker restarted: the epoch changed)
+- An idle subscriber is a few small objects: its queue and waiter only
+  exist while there is something to deliver or someone waiting
+
+Events carry the full state of what changed (not a diff), so receiving an
+event twice, or after a snapshot that already includes it, is harmless.
+
+Each worker has its own broker: publishers and screens of a topic must be
+served by the same worker process.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Hashable, NamedTuple, Optional
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+
+
+TopicKey = tuple[int, str]  # (company_id, channel)
+
+EVERYONE = -1  # Subscriber permissions that accept every event
+
+
+class StreamEvent(NamedTuple):
+    seq: int
+    key: Hashable  # Events with the same key coalesce
+    audience: int  # Permission bits allowed to see it (0 = everyone)
+    frame: bytes  # Serialized SSE frame
+
+
+def format_frame(event_id: str, name: str, data: Any) -> bytes:
+    """One SSE message."""
+    return f"id: {event_id}\nevent: {name}\ndata: {json.dumps(data, default=str)}\n\n".encode()
+
+
+# ===== SUBSCRIPTION =====
+class Subscription:
+    """
+    One connected screen: a bounded, coalescing queue of undelivered events.
+
+    Filled from any thread (publishers), read by the screen's stream on the
+    event loop.
+    """
+
+    __slots__ = (
+        "topic", "permissions", "needs_snapshot", "snapshot_seq",
+        "_lock", "_loop", "_waiter", "_signaled", "_pending", "_maxsize",
+    )
+
+    def __init__(self, topic: TopicKey, lock: threading.Lock, loop: asyncio.AbstractEventLoop, maxsize: int, permissions: int = EVERYONE):
+        self.topic = topic
+        self.permissions = permissions
+        self.needs_snapshot = False
+        self.snapshot_seq = 0  # Last event included in the snapshot to send
+        self._lock = lock  # The topic's lock
+        self._loop = loop
+        self._waiter: Optional[asyncio.Future] = None  # While the reader waits
+        self._signaled = False  # Something to deliver (reader woken or about to be)
+        self._pending: Optional[dict[Hashable, StreamEvent]] = None  # In arrival order
+        self._maxsize = maxsize
+
+    def _push(self, event: StreamEvent, wake: list) -> int:
+        """
+        Queue an event (caller holds the topic lock).
+
+        The replaced event is removed and the new one goes to the back, so
+        delivered ids keep increasing and a screen's last id stays a valid
+        resume point.
+
+        Args:
+            wake: Collects subscriptions whose reader must be woken up
+
+        Returns:
+            1 if the event replaced a queued one, else 0
+        """
+        if event.audience and not event.audience & self.permissions:
+            return 0
+        if self.needs_snapshot:
+            self.snapshot_seq = event.seq  # The snapshot will include it
+            return 0
+        pending = self._pending
+        if pending is None:
+            pending = self._pending = {}
+        replaced = 0
+        if event.key in pending:
+            del pending[event.key]
+            replaced = 1
+        if len(pending) >= self._maxsize:
+            # Too far behind: a snapshot is cheaper than the backlog
+            self._pending = None
+            self.needs_snapshot = True
+            self.snapshot_seq = event.seq
+        else:
+            pending[event.key] = event
+        if not self._signaled:
+            self._signaled = True
+            wake.append(self)
+        return replaced
+
+    async def next_batch(self, timeout: float, window: float = 0) -> Optional[tuple[list[StreamEvent], Optional[int]]]:
+        """
+        Wait for events.
+
+        Args:
+            timeout: Seconds to wait before giving up
+            window: Seconds to wait after the first event for more updates
+
+        Returns:
+            (events, snapshot_seq), or None on timeout. snapshot_seq is set
+            if a snapshot must be sent first: the last event it has to include
+        """
+        if not self._signaled:
+            # Publishers set _signaled before scheduling _set_ready, so either
+            # we see it here or the waiter exists when _set_ready runs
+            self._waiter = self._loop.create_future()
+            try:
+                async with asyncio.timeout(timeout):
+                    await self._waiter
+            except TimeoutError:
+                return None
+            finally:
+                self._waiter = None
+        if window and not self.needs_snapshot:
+            await asyncio.sleep(window)
+        with self._lock:
+            events = list(self._pending.values()) if self._pending else []
+            self._pending = None
+            snapshot_seq = self.snapshot_seq if self.needs_snapshot else None
+            self.needs_snapshot = False
+            self._signaled = False
+        return events, snapshot_seq
+
+
+def _set_ready(subscriptions: list[Subscription]) -> None:
+    for subscription in subscriptions:
+        waiter = subscription._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+
+def _wake(subscriptions: list[Subscription]) -> None:
+    """Wake readers with one callback per event loop (not one per screen)."""
+    by_loop: dict[asyncio.AbstractEventLoop, list[Subscription]] = {}
+    for subscription in subscriptions:
+        by_loop.setdefault(subscription._loop, []).append(subscription)
+    for loop, batch in by_loop.items():
+        loop.call_soon_threadsafe(_set_ready, batch)
+
+
+class _Topic:
+    __slots__ = ("lock", "seq", "history", "subscribers")
+
+    def __init__(self, replay: int):
+        self.lock = threading.Lock()
+        self.seq = 0
+        self.history: deque[StreamEvent] = deque(maxlen=replay)
+        self.subscribers: set[Subscription] = set()
+
+
+# ===== BROKER =====
+class EventBroker:
+    """
+    Example:
+        broker.publish((company_id, "kitchen:grill"), "ticket", ticket_data, key=ticket_id)
+
+        subscription = broker.subscribe((company_id, "kitchen:grill"), last_event_id)
+        return broker.response(subscription, load_snapshot)
+    """
+
+    def __init__(self, replay: int = settings.EVENT_STREAM_REPLAY, queue_size: int = settings.EVENT_STREAM_QUEUE_SIZE):
+        self.replay = replay
+        self.queue_size = queue_size
+        # Sequence numbers restart with the process: ids from before are not resumable
+        self.epoch = format(time.time_ns() // 1_000_000, "x")
+        self._topics: dict[TopicKey, _Topic] = {}
+        self._lock = threading.Lock()
+        self.published = 0
+        self.coalesced = 0
+        self.snapshots = 0
+
+    def _topic(self, key: TopicKey) -> _Topic:
+        topic = self._topics.get(key)
+        if topic is None:
+            with self._lock:
+                topic = self._topics.setdefault(key, _Topic(self.replay))
+        return topic
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def _parse_event_id(self, event_id: Optional[str]) -> Optional[int]:
+        """Sequence number of an id from this process, else None."""
+        if not event_id:
+            return None
+        epoch, _, seq = event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def publish(self, topic_key: TopicKey, name: str, data: Any, key: Hashable = None, audience: int = 0) -> int:
+        """
+        Send an event to every subscriber of a topic. Safe from any thread.
+
+        Args:
+            name: SSE event name (e.g. "ticket")
+            data: JSON-serializable payload (full state of `key`)
+            key: What the event is about. Queued events with the same key are
+                 replaced by this one. None = never coalesce
+            audience: Permission bits; only subscribers with at least one of
+                      them receive the event. 0 = everyone
+
+        Returns:
+            Sequence number of the event
+        """
+        payload = json.dumps(data, default=str)
+        topic = self._topic(topic_key)
+        with topic.lock:
+            topic.seq += 1
+            seq = topic.seq
+            frame = f"id: {self.event_id(seq)}\nevent: {name}\ndata: {payload}\n\n".encode()
+            event = StreamEvent(seq, key if key is not None else ("seq", seq), int(audience), frame)
+            topic.history.append(event)
+            replaced = 0
+            wake: list[Subscription] = []
+            for subscription in topic.subscribers:
+                replaced += subscription._push(event, wake)
+        if wake:
+            _wake(wake)
+        self.published += 1
+        self.coalesced += replaced
+        return seq
+
+    def subscribe(self, topic_key: TopicKey, last_event_id: Optional[str] = None, permissions: int = EVERYONE) -> Subscription:
+        """
+        Register a screen. Must be called on the event loop that will read it.
+
+        Events after `last_event_id` are queued for replay. If they are no
+        longer available (or no id was given), subscription.needs_snapshot
+        is set: the screen must first receive the current state.
+
+        Args:
+            permissions: Permission bits of the viewer (see publish audience)
+        """
+        topic = self._topic(topic_key)
+        after = self._parse_event_id(last_event_id)
+        subscription = Subscription(topic_key, topic.lock, asyncio.get_running_loop(), self.queue_size, int(permissions))
+        with topic.lock:
+            oldest = topic.history[0].seq if topic.history else topic.seq + 1
+            if after is not None and oldest - 1 <= after <= topic.seq:
+                wake: list[Subscription] = []
+                for event in topic.history:
+                    if event.seq > after:
+                        subscription._push(event, wake)
+            else:
+                subscription.needs_snapshot = True
+                subscription.snapshot_seq = topic.seq
+                subscription._signaled = True
+            topic.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        topic = self._topics.get(subscription.topic)
+        if topic is None:
+            return
+        with topic.lock:
+            topic.subscribers.discard(subscription)
+
+    def stats(self) -> dict:
+        """Broker statistics for health checks."""
+        return {
+            "topics": len(self._topics),
+            "subscribers": sum(len(topic.subscribers) for topic in list(self._topics.values())),
+            "published": self.published,
+            "coalesced": self.coalesced,
+            "snapshots": self.snapshots,
+        }
+
+    # ===== STREAMING =====
+    async def stream(
+        self,
+        subscription: Subscription,
+        load_snapshot: Callable[[], Any],
+        window_ms: int = settings.EVENT_STREAM_COALESCE_MS,
+    ) -> AsyncIterator[bytes]:
+        """
+        SSE body for one screen.
+
+        Args:
+            load_snapshot: Returns the current state (sent as a "snapshot"
+                           event). Called in a worker thread, so it may use
+                           the database - with its own session.
+            window_ms: Batching window: events arriving within it go out together
+        """
+        heartbeat = settings.EVENT_STREAM_HEARTBEAT_SECONDS
+        window = window_ms / 1000
+        try:
+            yield b"retry: 3000\n\n"
+            while True:
+                batch = await subscription.next_batch(heartbeat, window)
+                if batch is None:
+                    yield b": ping\n\n"
+                    continue
+                events, snapshot_seq = batch
+                chunk = []
+                if snapshot_seq is not None:
+                    # Loaded after every event up to snapshot_seq was committed
+                    self.snapshots += 1
+                    snapshot = await run_in_threadpool(load_snapshot)
+                    chunk.append(format_frame(self.event_id(snapshot_seq), "snapshot", snapshot))
+                chunk.extend(event.frame for event in events)
+                if chunk:
+                    yield b"".join(chunk)
+        finally:
+            self.unsubscribe(subscription)
+
+    def response(
+        self,
+        subscription: Subscription,
+        load_snapshot: Callable[[], Any],
+        window_ms: int = settings.EVENT_STREAM_COALESCE_MS,
+    ) -> StreamingResponse:
+        """StreamingResponse for a subscription (see stream)."""
+        return StreamingResponse(
+            self.stream(subscription, load_snapshot, window_ms),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+
+# Single broker per worker process
+broker = EventBroker()
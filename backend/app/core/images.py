@@ -0,0 +1,106 @@
+# app/core/images.py
+
+"""
+Image Processing
+Resizing runs in a separate process pool so a large logo never blocks
+the API's event loop or competes with request threads for the GIL.
+
+The functions passed to the pool are plain top-level functions that
+take and return simple values (paths, strings), so they pickle cheaply.
+"""
+
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from app.core.config import settings
+from app.core import storage
+
+
+# ===== FILE TYPES =====
+# magic bytes -> file extension
+_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpg"),
+]
+
+
+def detect_image_type(head: bytes) -> Optional[str]:
+    """Return "png", "jpg" or "webp" from the first bytes of a file, else None."""
+    for signature, extension in _SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+# ===== LOGO RENDITIONS =====
+# name -> (max width, max height). Aspect ratio is kept; logos are never upscaled.
+LOGO_RENDITIONS = {
+    "invoice": (600, 200),
+    "header": (240, 80),
+    "thumbnail": (64, 64),
+}
+
+
+def rendition_filename(digest: str, rendition: str) -> str:
+    # Renditions are PNG so transparent logos stay transparent
+    return f"{digest}-{rendition}.png"
+
+
+def render_logo_renditions(source_path: str, digest: str) -> list[str]:
+    """
+    Build every logo rendition from an uploaded file (runs in the pool).
+
+    Raises:
+        ValueError: The file is not a readable image or is too large
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    missing = [
+        name for name in LOGO_RENDITIONS
+        if not storage.object_path("logos", rendition_filename(digest, name)).exists()
+    ]
+    if not missing:
+        return list(LOGO_RENDITIONS)  # same logo uploaded before
+
+    Image.MAX_IMAGE_PIXELS = settings.LOGO_MAX_PIXELS
+    try:
+        with Image.open(source_path) as image:
+            image.load()
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            for name in missing:
+                copy = image.copy()
+                copy.thumbnail(LOGO_RENDITIONS[name], Image.Resampling.LANCZOS)
+                output = io.BytesIO()
+                copy.save(output, format="PNG", optimize=True)
+                storage.write_object("logos", rendition_filename(digest, name), output.getvalue())
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as exc:
+        raise ValueError(f"Could not read image: {exc}") from exc
+    return list(LOGO_RENDITIONS)
+
+
+# ===== PROCESS POOL =====
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_image_pool() -> ProcessPoolExecutor:
+    """Process pool shared by the whole API process (created on first use)."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS)
+    return _pool
+
+
+def shutdown_image_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+async def run_in_image_pool(function, *args):
+    """Await a function running in the image process pool."""
+    return await asyncio.get_running_loop().run_in_executor(get_image_pool(), function, *args)
@@ -0,0 +1,195 @@
+# app/core/invalidation.py
+
+"""
+Cache Invalidation Bus
+Keeps the in-process caches (app/core/cache.py) consistent across workers and nodes.
+
+How it works:
+1. The service layer calls publish(db, "company", company.id) when it changes data
+2. Just before the session commits, one Postgres NOTIFY per event is sent
+   (NOTIFY is transactional - other workers only see it if the commit succeeds)
+3. After the commit, the key is evicted from this worker's caches immediately
+4. Every worker runs a background listener (LISTEN) that evicts keys from
+   events published by other workers
+
+If the listener loses its connection, caches fall back to a short TTL
+until it reconnects (see app/core/cache.py).
+"""
+
+import json
+import select
+import threading
+import time
+from typing import Hashable, Optional
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from app.core import cache
+from app.core.config import settings
+from app.database import SessionLocal, engine
+
+
+# Key used to store pending events on the session until commit
+_PENDING_KEY = "pending_invalidations"
+
+
+# ===== PUBLISHING =====
+def publish(db: Session, cache_name: str, key: Hashable) -> None:
+    """
+    Queue an invalidation event for the current transaction.
+
+    The event is only sent (and applied locally) if the transaction commits.
+
+    Example:
+        publish(db, "company", company.id)
+        db.commit()  # NOTIFY is sent, key is evicted everywhere
+
+    Args:
+        db: Database session making the change
+        cache_name: "user", "membership" or "company"
+        key: Cache key to evict (e.g. email, company_id, (user_id, company_id))
+    """
+    db.info.setdefault(_PENDING_KEY, []).append((cache_name, key))
+
+
+def _is_postgres() -> bool:
+    return engine.dialect.name == "postgresql"
+
+
+@event.listens_for(SessionLocal, "before_commit")
+def _send_notifications(session: Session) -> None:
+    """Send NOTIFY for pending events inside the committing transaction."""
+    pending = session.info.get(_PENDING_KEY)
+    if not pending or not _is_postgres():
+        return
+    sent_at = time.time()
+    for cache_name, key in pending:
+        payload = json.dumps({"cache": cache_name, "key": key, "ts": sent_at})
+        session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": settings.CACHE_INVALIDATION_CHANNEL, "payload": payload},
+        )
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _evict_local(session: Session) -> None:
+    """Apply committed events to this worker's caches right away."""
+    for cache_name, key in session.info.pop(_PENDING_KEY, []):
+        _evict(cache_name, key)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    """Rolled-back changes never happened - drop their events."""
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _evict(cache_name: str, key: Hashable) -> None:
+    target = cache.CACHES.get(cache_name)
+    if target is not None:
+        target.delete(key)
+    for dependent in cache.DEPENDENT_CACHES.get(cache_name, ()):
+        dependent.delete(key)
+
+
+# ===== LISTENING =====
+class InvalidationListener:
+    """
+    Background thread that LISTENs for invalidation events from other workers.
+
+    Also tracks propagation latency (publish time -> eviction time) so we can
+    see how quickly workers converge.
+    """
+
+    def __init__(self, channel: str = settings.CACHE_INVALIDATION_CHANNEL):
+        self.channel = channel
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # Latency statistics (milliseconds)
+        self.events_received = 0
+        self.last_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self._total_latency_ms = 0.0
+
+    def start(self) -> None:
+        """Start listening (no-op for non-Postgres databases)."""
+        if not _is_postgres() or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the listener thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        cache.set_bus_connected(False)
+
+    def stats(self) -> dict:
+        """Propagation statistics for health checks."""
+        average = self._total_latency_ms / self.events_received if self.events_received else 0.0
+        return {
+            "connected": cache.is_bus_connected(),
+            "events_received": self.events_received,
+            "last_latency_ms": round(self.last_latency_ms, 3),
+            "avg_latency_ms": round(average, 3),
+            "max_latency_ms": round(self.max_latency_ms, 3),
+        }
+
+    def _run(self) -> None:
+        backoff = 1
+        while not self._stop.is_set():
+            conn = None
+            try:
+                # Take a dedicated connection out of the pool for LISTEN
+                raw = engine.raw_connection()
+                raw.detach()
+                conn = raw.driver_connection
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+
+                # Events may have been missed while disconnected
+                cache.clear_all()
+                cache.set_bus_connected(True)
+                backoff = 1
+
+                while not self._stop.is_set():
+                    ready, _, _ = select.select([conn], [], [], 5)
+                    if not ready:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._handle(conn.notifies.pop(0).payload)
+            except Exception as exc:
+                cache.set_bus_connected(False)
+                print(f"⚠️  Cache invalidation listener disconnected: {exc}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    def _handle(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        key = message.get("key")
+        if isinstance(key, list):
+            key = tuple(key)  # JSON turns tuple keys into lists
+        _evict(message.get("cache"), key)
+
+        latency_ms = (time.time() - message.get("ts", time.time())) * 1000
+        self.events_received += 1
+        self.last_latency_ms = latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self._total_latency_ms += latency_ms
+
+
+# Single listener per worker process
+listener = InvalidationListener()
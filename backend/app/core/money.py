@@ -0,0 +1,30 @@
+# app/core/money.py
+
+"""
+Money Helpers
+The ledger stores amounts as integer sen (1/100 ringgit) so sums are
+exact and fast. The API speaks Decimal with 2 decimal places.
+"""
+
+from decimal import Decimal
+
+
+SEN_PER_UNIT = 100
+
+
+def to_sen(value: Decimal) -> int:
+    """
+    Decimal ringgit -> integer sen.
+    
+    Raises:
+        ValueError: The value has more than 2 decimal places
+    """
+    sen = Decimal(value) * SEN_PER_UNIT
+    if sen != sen.to_integral_value():
+        raise ValueError(f"{value} has more than 2 decimal places")
+    return int(sen)
+
+
+def from_sen(sen: int) -> Decimal:
+    """Integer sen -> Decimal ringgit with 2 decimal places."""
+    return (Decimal(sen) / SEN_PER_UNIT).quantize(Decimal("0.01"))
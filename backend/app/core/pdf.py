@@ -0,0 +1,178 @@
+# app/core/pdf.py
+
+"""
+Minimal PDF Writer
+Just enough of PDF 1.4 to produce business documents (invoices, statements):
+text in the built-in Helvetica fonts, lines, filled boxes and RGB images.
+
+No third-party dependency and no layout engine - callers position
+everything themselves in points (1/72 inch, origin at bottom-left).
+
+Example:
+    document = PDFDocument()
+    document.add_page(text(50, 800, "Hello", size=14, bold=True) + line(50, 795, 545, 795))
+    pdf_bytes = document.to_bytes()
+"""
+
+import zlib
+from typing import Optional
+
+
+# A4 in points
+A4_WIDTH = 595.28
+A4_HEIGHT = 841.89
+
+# Fonts every PDF viewer has built in (no embedding needed)
+REGULAR = b"F1"
+BOLD = b"F2"
+_FONTS = {REGULAR: b"Helvetica", BOLD: b"Helvetica-Bold"}
+
+# Helvetica advance widths (1/1000 em) for characters 32..126.
+# Digits, comma, period and space have the same width in Helvetica-Bold,
+# which is what right-aligned amounts need.
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+
+
+# ===== TEXT HELPERS =====
+def encode_text(value: str) -> bytes:
+    """Encode text for a PDF string literal (WinAnsi, with ( ) \\ escaped)."""
+    return (
+        value.encode("cp1252", errors="replace")
+        .replace(b"\\", b"\\\\")
+        .replace(b"(", b"\\(")
+        .replace(b")", b"\\)")
+    )
+
+
+def text_width(value: str, size: float) -> float:
+    """Approximate width of a string in points."""
+    total = 0
+    for character in value:
+        code = ord(character)
+        total += _HELVETICA_WIDTHS[code - 32] if 32 <= code <= 126 else 556
+    return total * size / 1000
+
+
+# ===== CONTENT OPERATORS =====
+# Each returns a fragment of a page content stream; join them with b"".
+def text(x: float, y: float, value: str, size: float = 10, bold: bool = False) -> bytes:
+    font = BOLD if bold else REGULAR
+    return b"BT /%s %.1f Tf %.2f %.2f Td (%s) Tj ET\n" % (font, size, x, y, encode_text(value))
+
+
+def text_right(x: float, y: float, value: str, size: float = 10, bold: bool = False) -> bytes:
+    """Text whose right edge is at x (for amounts)."""
+    return text(x - text_width(value, size), y, value, size, bold)
+
+
+def line(x1: float, y1: float, x2: float, y2: float, width: float = 0.5) -> bytes:
+    return b"%.2f w %.2f %.2f m %.2f %.2f l S\n" % (width, x1, y1, x2, y2)
+
+
+def filled_rect(x: float, y: float, width: float, height: float, gray: float = 0.9) -> bytes:
+    return b"q %.2f g %.2f %.2f %.2f %.2f re f Q\n" % (gray, x, y, width, height)
+
+
+def draw_image(name: str, x: float, y: float, width: float, height: float) -> bytes:
+    return b"q %.2f 0 0 %.2f %.2f %.2f cm /%s Do Q\n" % (width, height, x, y, name.encode())
+
+
+# ===== DOCUMENT =====
+class PDFImage:
+    """An RGB image ready to embed (pixels already zlib-compressed)."""
+
+    def __init__(self, width: int, height: int, compressed_rgb: bytes):
+        self.width = width
+        self.height = height
+        self.compressed_rgb = compressed_rgb
+
+    @classmethod
+    def from_rgb(cls, width: int, height: int, rgb: bytes) -> "PDFImage":
+        return cls(width, height, zlib.compress(rgb, 6))
+
+
+class PDFDocument:
+    """
+    Collects pages and writes a complete PDF file.
+
+    Images are stored once and can be drawn on every page by name.
+    """
+
+    def __init__(self, width: float = A4_WIDTH, height: float = A4_HEIGHT, compress: bool = True):
+        self.width = width
+        self.height = height
+        self.compress = compress
+        self._pages: list[bytes] = []
+        self._images: dict[str, PDFImage] = {}
+
+    def add_image(self, name: str, image: PDFImage) -> None:
+        self._images[name] = image
+
+    def add_page(self, content: bytes) -> None:
+        self._pages.append(content)
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    def to_bytes(self, title: Optional[str] = None) -> bytes:
+        objects: list[bytes] = []
+
+        def add(body: bytes) -> int:
+            objects.append(body)
+            return len(objects)
+
+        def add_stream(data: bytes, extra: bytes = b"") -> int:
+            if self.compress:
+                data = zlib.compress(data, 1)
+                extra += b" /Filter /FlateDecode"
+            return add(b"<< /Length %d%s >>\nstream\n%s\nendstream" % (len(data), extra, data))
+
+        catalog = add(b"")  # filled in below
+        pages = add(b"")
+        fonts = b" ".join(
+            b"/%s %d 0 R" % (key, add(b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>" % name))
+            for key, name in _FONTS.items()
+        )
+        images = b" ".join(
+            b"/%s %d 0 R" % (name.encode(), add(
+                b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceRGB "
+                b"/BitsPerComponent 8 /Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream"
+                % (image.width, image.height, len(image.compressed_rgb), image.compressed_rgb)
+            ))
+            for name, image in self._images.items()
+        )
+        resources = add(b"<< /Font << %s >> /XObject << %s >> >>" % (fonts, images))
+
+        page_ids = []
+        for content in self._pages:
+            content_id = add_stream(content)
+            page_ids.append(add(
+                b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.2f %.2f] /Resources %d 0 R /Contents %d 0 R >>"
+                % (pages, self.width, self.height, resources, content_id)
+            ))
+        objects[pages - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(page_ids)
+        )
+        objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages
+        info = add(b"<< /Producer (ERP Platform) /Title (%s) >>" % encode_text(title or ""))
+
+        output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        xref_at = len(output)
+        output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        output += b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(objects) + 1, catalog, info, xref_at
+        )
+        return bytes(output)
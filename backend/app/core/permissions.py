@@ -0,0 +1,146 @@
+# app/core/permissions.py
+
+"""
+Role-Based Access Control (RBAC)
+Maps each company role (UserRole) to a set of permissions.
+
+Permissions are bit flags, so a role's permissions fit in one integer
+and a check is a single dictionary lookup plus a bitwise AND:
+
+    role_has_permission("accountant", Permission.ACCOUNTING_POST)  # True
+    role_has_permission("pos_staff", Permission.COMPANY_UPDATE)    # False
+
+The role -> bitmask table is compiled once at startup (compile_permission_matrix).
+"""
+
+import enum
+from typing import Optional
+from app.models.user import UserRole
+
+
+# ===== PERMISSIONS =====
+class Permission(enum.IntFlag):
+    """Individual permissions. Each one is a single bit."""
+    # Company
+    COMPANY_VIEW = enum.auto()
+    COMPANY_UPDATE = enum.auto()
+    MEMBERS_VIEW = enum.auto()
+    MEMBERS_MANAGE = enum.auto()
+
+    # Accounting
+    ACCOUNTING_VIEW = enum.auto()
+    ACCOUNTING_POST = enum.auto()
+    REPORTS_VIEW = enum.auto()
+
+    # Inventory
+    INVENTORY_VIEW = enum.auto()
+    INVENTORY_MANAGE = enum.auto()
+
+    # POS & Kitchen
+    POS_OPERATE = enum.auto()
+    KITCHEN_VIEW = enum.auto()
+    FRAUD_REVIEW = enum.auto()  # See and label sales flagged by fraud scoring
+
+    # IoT
+    IOT_VIEW = enum.auto()
+    IOT_MANAGE = enum.auto()  # Register sensors, upload readings (gateways)
+
+    # Data
+    DATA_EXPORT = enum.auto()
+    AUDIT_VIEW = enum.auto()
+
+
+# Every permission combined (used for admins)
+ALL_PERMISSIONS = Permission(0)
+for _permission in Permission:
+    ALL_PERMISSIONS |= _permission
+
+
+# ===== ROLE DEFINITIONS =====
+# Edit this table to change what each role can do.
+ROLE_PERMISSIONS: dict[UserRole, Permission] = {
+    UserRole.ADMIN: ALL_PERMISSIONS,
+    UserRole.MANAGER: (
+        Permission.COMPANY_VIEW
+        | Permission.MEMBERS_VIEW
+        | Permission.MEMBERS_MANAGE
+        | Permission.ACCOUNTING_VIEW
+        | Permission.REPORTS_VIEW
+        | Permission.INVENTORY_VIEW
+        | Permission.INVENTORY_MANAGE
+        | Permission.POS_OPERATE
+        | Permission.KITCHEN_VIEW
+        | Permission.FRAUD_REVIEW
+        | Permission.IOT_VIEW
+        | Permission.IOT_MANAGE
+        | Permission.DATA_EXPORT
+    ),
+    UserRole.ACCOUNTANT: (
+        Permission.COMPANY_VIEW
+        | Permission.ACCOUNTING_VIEW
+        | Permission.ACCOUNTING_POST
+        | Permission.REPORTS_VIEW
+        | Permission.INVENTORY_VIEW
+        | Permission.DATA_EXPORT
+    ),
+    UserRole.INVENTORY_STAFF: (
+        Permission.COMPANY_VIEW
+        | Permission.INVENTORY_VIEW
+        | Permission.INVENTORY_MANAGE
+        | Permission.IOT_VIEW
+    ),
+    UserRole.POS_STAFF: (
+        Permission.COMPANY_VIEW
+        | Permission.INVENTORY_VIEW
+        | Permission.POS_OPERATE
+    ),
+    UserRole.KITCHEN_STAFF: (
+        Permission.COMPANY_VIEW
+        | Permission.KITCHEN_VIEW
+    ),
+    UserRole.VIEWER: (
+        Permission.COMPANY_VIEW
+        | Permission.REPORTS_VIEW
+    ),
+}
+
+
+# ===== COMPILED MATRIX =====
+# role string (e.g. "admin") -> plain int bitmask
+_matrix: dict[str, int] = {}
+
+
+def compile_permission_matrix() -> dict[str, int]:
+    """
+    Build the role -> bitmask lookup table.
+
+    Keys are the role strings stored on CompanyMember / in UserResponse.current_role,
+    values are plain ints so checks avoid enum overhead.
+    """
+    global _matrix
+    _matrix = {role.value: int(permissions) for role, permissions in ROLE_PERMISSIONS.items()}
+    return _matrix
+
+
+def role_has_permission(role: Optional[str], permission: Permission) -> bool:
+    """
+    Check whether a role grants a permission (O(1)).
+
+    Args:
+        role: Role string (e.g. "accountant"), or None if not a member
+        permission: Permission (or combination of permissions) required
+
+    Returns:
+        True if the role has every requested permission
+    """
+    required = int(permission)  # plain int math is much faster than IntFlag operators
+    return (_matrix.get(role, 0) & required) == required
+
+
+def role_permissions(role: Optional[str]) -> Permission:
+    """Return all permissions granted to a role."""
+    return Permission(_matrix.get(role, 0))
+
+
+# Compile on import so the table is always ready; startup recompiles it.
+compile_permission_matrix()
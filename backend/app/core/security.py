@@ -98,12 +98,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 def verify_token(token: str) -> Optional[dict]:
     """
-    Verify and decode a JWT token.
+    Verify and decode a JWT access token.
     
     This checks if:
     - Token is valid (not tampered with)
     - Token hasn't expired
     - Token was created with our SECRET_KEY
+    - Token is not a purpose token (email verification, password reset...):
+      those carry the same "sub" but must never authenticate requests
     
     Example:
         token_data = verify_token(token_from_user)
@@ -119,14 +121,62 @@ def verify_token(token: str) -> Optional[dict]:
     Returns:
         Decoded token data (dict) if valid, None if invalid
     """
+    payload = _decode(token)
+    if payload is None or "purpose" in payload:
+        return None
+    return payload
+
+
+def _decode(token: str) -> Optional[dict]:
+    """Decode any token signed with our SECRET_KEY (None if invalid or expired)."""
     try:
         # Decode the token using our SECRET_KEY
-        payload = jwt.decode(
+        return jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError:
         # Token is invalid, expired, or tampered with
-        return None
\ No newline at end of file
+        return None
+
+
+# ===== ONE-TIME PURPOSE TOKENS =====
+def create_purpose_token(email: str, purpose: str, expires_delta: timedelta, fingerprint: str = "") -> str:
+    """
+    Create a signed token for a single purpose (email verification, password reset...).
+    
+    The purpose is stored in the token, so a verification token can never be
+    used as a login token (verify_token refuses any token with a purpose)
+    or a password reset token.
+    
+    Example:
+        token = create_purpose_token("user@example.com", "verify_email", timedelta(days=2))
+    
+    Args:
+        email: User the token is for
+        purpose: What the token may be used for
+        expires_delta: How long the token is valid
+        fingerprint: Optional value that must still match when the token is used
+                     (e.g. a digest of the password hash, so a reset link works only once)
+        
+    Returns:
+        Encrypted JWT token string
+    """
+    return create_access_token(
+        data={"sub": email, "purpose": purpose, "fp": fingerprint},
+        expires_delta=expires_delta
+    )
+
+
+def verify_purpose_token(token: str, purpose: str) -> Optional[dict]:
+    """
+    Verify a token created by create_purpose_token().
+    
+    Returns:
+        Decoded token data if valid and made for this purpose, None otherwise
+    """
+    payload = _decode(token)
+    if payload is None or payload.get("purpose") != purpose or not payload.get("sub"):
+        return None
+    return payload
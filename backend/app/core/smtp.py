@@ -0,0 +1,144 @@
+# app/core/smtp.py
+
+"""
+SMTP Connection Pool and Rate Limiter
+Used by the email sender to deliver outbox messages.
+
+Opening an SMTP connection (TCP + greeting + STARTTLS + login) costs far more
+than sending one message, so connections are kept open and reused.
+"""
+
+import smtplib
+import threading
+import time
+from email.message import EmailMessage as MIMEMessage
+from queue import Empty, LifoQueue
+from typing import Optional
+from app.core.config import settings
+
+
+# ===== RATE LIMITER =====
+class RateLimiter:
+    """
+    Token bucket: allows `rate` operations per second on average,
+    with short bursts up to `burst`.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(int(rate), 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one operation is allowed."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# ===== CONNECTION POOL =====
+class SMTPConnectionPool:
+    """
+    Pool of persistent SMTP connections.
+
+    Example:
+        pool = SMTPConnectionPool()
+        pool.send(message)   # borrows a connection, reconnects if the server dropped it
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        host: str = settings.SMTP_HOST,
+        port: int = settings.SMTP_PORT,
+        username: Optional[str] = settings.SMTP_USERNAME,
+        password: Optional[str] = settings.SMTP_PASSWORD,
+        use_tls: bool = settings.SMTP_USE_TLS,
+        size: int = settings.SMTP_POOL_SIZE,
+        timeout: float = 30,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._idle: LifoQueue = LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self.connections_opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            connection.starttls()
+        if self.username:
+            connection.login(self.username, self.password or "")
+        self.connections_opened += 1
+        return connection
+
+    def _acquire(self) -> smtplib.SMTP:
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            try:
+                return self._connect()
+            except Exception:
+                self._slots.release()
+                raise
+
+    def _release(self, connection: Optional[smtplib.SMTP]) -> None:
+        if connection is not None:
+            self._idle.put(connection)
+        self._slots.release()
+
+    @staticmethod
+    def _discard(connection: smtplib.SMTP) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def send(self, message: MIMEMessage) -> None:
+        """
+        Send one message on a pooled connection.
+
+        If the server closed an idle connection, reconnect once and retry.
+        Other SMTP errors are raised to the caller (which decides on retries).
+        """
+        connection = self._acquire()
+        try:
+            try:
+                connection.send_message(message)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self._discard(connection)
+                connection = self._connect()
+                connection.send_message(message)
+        except Exception:
+            self._discard(connection)
+            self._release(None)
+            raise
+        self._release(connection)
+
+    def close(self) -> None:
+        """Politely close every idle connection."""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                return
+            try:
+                connection.quit()
+            except Exception:
+                self._discard(connection)
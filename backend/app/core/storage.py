@@ -0,0 +1,120 @@
+# app/core/storage.py
+
+"""
+Content-Addressed File Storage
+Files are stored under the SHA-256 of their bytes:
+
+    MEDIA_ROOT/logos/3f/3fa9...c1.png        <- original
+    MEDIA_ROOT/logos/3f/3fa9...c1-header.png <- rendition made from it
+
+Same bytes -> same name, so identical uploads are stored once, and a
+file never changes after it is written. That lets the URLs be cached
+forever (see app/api/media.py).
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from fastapi import HTTPException, status
+from app.core.config import settings
+
+
+CHUNK_SIZE = 64 * 1024
+
+# <sha256>[-<rendition>].<ext>
+FILENAME_PATTERN = re.compile(r"^(?P<digest>[0-9a-f]{64})(-(?P<rendition>[a-z]+))?\.(?P<ext>png|jpg|webp)$")
+
+
+@dataclass
+class Upload:
+    """A received upload waiting in a temp file until it is validated."""
+    temp_path: Path
+    digest: str
+    size: int
+    head: bytes  # first bytes, used to detect the file type
+
+
+def media_root() -> Path:
+    return Path(settings.MEDIA_ROOT)
+
+
+def object_path(collection: str, filename: str) -> Path:
+    """Where a stored file lives on disk (sharded by the first 2 hex digits)."""
+    return media_root() / collection / filename[:2] / filename
+
+
+def object_url(collection: str, filename: str) -> str:
+    return f"{settings.MEDIA_URL}/{collection}/{filename}"
+
+
+async def receive_upload(chunks: AsyncIterator[bytes], max_bytes: int) -> Upload:
+    """
+    Stream an upload to a temp file while hashing it.
+
+    Only one chunk is held in memory at a time. Raises 413 as soon as
+    the upload grows past max_bytes.
+    """
+    temp_dir = media_root() / "tmp"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    handle, name = tempfile.mkstemp(dir=temp_dir)
+    temp_path = Path(name)
+    digest = hashlib.sha256()
+    size = 0
+    head = b""
+    try:
+        with os.fdopen(handle, "wb") as file:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File is larger than {max_bytes // (1024 * 1024)} MB"
+                    )
+                if len(head) < 16:
+                    head += chunk[:16 - len(head)]
+                digest.update(chunk)
+                file.write(chunk)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    if size == 0:
+        temp_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty upload")
+    return Upload(temp_path=temp_path, digest=digest.hexdigest(), size=size, head=head)
+
+
+def commit_upload(upload: Upload, collection: str, filename: str) -> bool:
+    """
+    Move a validated upload into the store.
+
+    Returns:
+        True if the file was new, False if identical bytes were already stored
+    """
+    target = object_path(collection, filename)
+    if target.exists():
+        discard_upload(upload)
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(upload.temp_path, target)
+    return True
+
+
+def discard_upload(upload: Optional[Upload]) -> None:
+    if upload is not None:
+        upload.temp_path.unlink(missing_ok=True)
+
+
+def write_object(collection: str, filename: str, data: bytes) -> None:
+    """Write bytes to the store atomically (no-op if the file already exists)."""
+    target = object_path(collection, filename)
+    if target.exists():
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    handle, name = tempfile.mkstemp(dir=target.parent)
+    with os.fdopen(handle, "wb") as file:
+        file.write(data)
+    os.replace(name, target)
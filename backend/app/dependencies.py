@@ -9,6 +9,8 @@ from app.models.user import User # Import the User model
 from app.schemas.user import UserResponse # Import UserResponse schema
 from app.services import auth_service # Import auth_service to get user by email
 from app.services.company_service import get_company_member_role # Import to get user's role in a company
+from app.core.cache import MISSING, user_cache # Per-process cache, kept fresh by the invalidation bus
+from app.core.permissions import Permission, role_has_permission # RBAC permission matrix
 
 # This tells FastAPI how to expect the token (Bearer token in Authorization header)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login") # Corrected tokenUrl
@@ -40,6 +42,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     try:
         # Verify the token and get its payload
         payload = verify_token(token)
+        if payload is None:
+            raise credentials_exception
         email: str = payload.get("sub") # 'sub' (subject) usually holds the user's email
         if email is None:
             raise credentials_exception
@@ -47,25 +51,38 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         # If token is invalid or expired
         raise credentials_exception
     
-    # Fetch the user from the database using the email from the token
-    user_model = auth_service.get_user_by_email(db, email=email)
-    if user_model is None:
-        raise credentials_exception
+    # Fetch the user from the cache, or the database using the email from the token
+    cached = user_cache.get(email)
+    if cached is MISSING:
+        user_model = auth_service.get_user_by_email(db, email=email)
+        if user_model is None:
+            raise credentials_exception
+        cached = UserResponse.model_validate(user_model)
+        user_cache.set(email, cached)
+
+    # Build response with company context (copy so the cached object is never modified)
+    response = cached.model_copy()
 
-    # Build response with company context
-    response = UserResponse.model_validate(user_model)
+    # The active company comes from the token (set by POST /api/v1/companies/select)
+    token_company_id = payload.get("company_id")
+    if token_company_id is not None:
+        response.current_company_id = token_company_id
+        response.current_company_name = payload.get("company_name")
 
     # If no current company is set in the response, default to the user's registered company
     if response.current_company_id is None and response.default_company_id is not None:
         response.current_company_id = response.default_company_id
         response.current_company_name = response.default_company_name
-        # Note: We are updating the Pydantic response model, not the SQLAlchemy model here.
-        # If we wanted to persist this change to the database, it would need to be done
-        # on the user_model object and then committed. For now, this is just for the response.
     
     # Determine the current role based on the current company
     if response.current_company_id:
-        response.current_role = get_company_member_role(db, user_model.id, response.current_company_id)
+        response.current_role = get_company_member_role(db, response.id, response.current_company_id)
+        if response.current_role is None and response.current_company_id != response.default_company_id:
+            # Membership was removed after the token was issued - fall back to the default company
+            response.current_company_id = response.default_company_id
+            response.current_company_name = response.default_company_name
+            if response.current_company_id:
+                response.current_role = get_company_member_role(db, response.id, response.current_company_id)
     
     return response
 
@@ -78,3 +95,52 @@ async def get_current_active_user(current_user: UserResponse = Depends(get_curre
     if not current_user.is_active:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
     return current_user
+
+
+# ===== PERMISSION CHECKS (RBAC) =====
+def require_permission(permission: Permission):
+    """
+    Dependency factory: require a permission in the user's current company.
+    
+    Example:
+        @router.post("/journal")
+        def post_journal(current_user: UserResponse = Depends(require_permission(Permission.ACCOUNTING_POST))):
+            ...
+    
+    The role is already resolved (and cached) by get_current_user,
+    so the check is a dictionary lookup and a bitwise AND - no extra queries.
+    """
+    async def checker(current_user: UserResponse = Depends(get_current_user)) -> UserResponse:
+        if not role_has_permission(current_user.current_role, permission):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have permission to perform this action"
+            )
+        return current_user
+    return checker
+
+
+def require_company_permission(permission: Permission):
+    """
+    Dependency factory: require a permission in the company given by the
+    `company_id` path parameter (e.g. PUT /api/v1/companies/{company_id}).
+    
+    Uses the current role when the path company is the active one,
+    otherwise the cached membership role for that company.
+    """
+    async def checker(
+        company_id: int,
+        db: Session = Depends(get_db),
+        current_user: UserResponse = Depends(get_current_user)
+    ) -> UserResponse:
+        if company_id == current_user.current_company_id:
+            role = current_user.current_role
+        else:
+            role = get_company_member_role(db, current_user.id, company_id)
+        if not role_has_permission(role, permission):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have permission to perform this action"
+            )
+        return current_user
+    return checker
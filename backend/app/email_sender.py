@@ -0,0 +1,163 @@
+# app/email_sender.py
+
+"""
+Email Sender
+Delivers messages from the email outbox over pooled, persistent SMTP connections.
+
+Usage (from the backend folder):
+    python -m app.email_sender              # uses SMTP_* settings from .env
+    python -m app.email_sender --threads 4
+
+For local development run the SMTP stand-in first:
+    python -m benchmarks.smtp_sink --port 1025
+"""
+
+import argparse
+import threading
+import time
+from email.message import EmailMessage as MIMEMessage
+from email.utils import make_msgid
+from typing import Optional
+from app.core.config import settings
+from app.core.smtp import RateLimiter, SMTPConnectionPool
+from app.database import SessionLocal
+from app.services import email_service
+
+
+def build_message(row) -> MIMEMessage:
+    """Turn a claimed outbox row into a MIME message."""
+    message = MIMEMessage()
+    message["From"] = settings.EMAIL_FROM
+    message["To"] = row.to_email
+    message["Subject"] = row.subject
+    message["Message-ID"] = make_msgid(idstring=f"outbox-{row.id}")
+    message.set_content(row.body_text)
+    if row.body_html:
+        message.add_alternative(row.body_html, subtype="html")
+    return message
+
+
+class EmailSender:
+    """
+    Claims batches from the outbox and sends them.
+
+    All threads share one SMTP connection pool and one rate limiter,
+    so the process never exceeds EMAIL_RATE_PER_SECOND.
+    """
+
+    def __init__(
+        self,
+        threads: int = 1,
+        batch_size: int = settings.EMAIL_BATCH_SIZE,
+        rate_per_second: float = settings.EMAIL_RATE_PER_SECOND,
+        pool: Optional[SMTPConnectionPool] = None,
+        poll_interval: float = settings.JOB_POLL_INTERVAL_SECONDS,
+    ):
+        self.threads = threads
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.pool = pool or SMTPConnectionPool(size=max(threads, settings.SMTP_POOL_SIZE))
+        self.rate_limiter = RateLimiter(rate_per_second)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.started_at = time.monotonic()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> dict:
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "smtp_connections_opened": self.pool.connections_opened,
+            "messages_per_second": round(self.sent / elapsed, 1),
+        }
+
+    def run_once(self) -> int:
+        """
+        Claim and send one batch.
+
+        Returns:
+            Number of messages claimed (0 means the outbox was empty)
+        """
+        db = SessionLocal()
+        try:
+            rows = email_service.claim_emails(db, limit=self.batch_size)
+            sent_ids = []
+            retried = failed = 0
+            for row in rows:
+                self.rate_limiter.acquire()
+                try:
+                    self.pool.send(build_message(row))
+                    sent_ids.append(row.id)
+                except Exception as exc:
+                    if email_service.mark_email_failed(db, row, exc):
+                        retried += 1
+                    else:
+                        failed += 1
+            email_service.mark_emails_sent(db, sent_ids)
+            with self._lock:
+                self.sent += len(sent_ids)
+                self.retried += retried
+                self.failed += failed
+            return len(rows)
+        finally:
+            db.close()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                claimed = self.run_once()
+            except Exception as exc:
+                print(f"⚠️  Email sender error: {exc}")
+                claimed = 0
+            if claimed == 0:
+                self._stop.wait(self.poll_interval)
+
+    def run(self, report_every: float = 30.0) -> None:
+        """Run until stopped (Ctrl+C)."""
+        workers = [
+            threading.Thread(target=self._loop, name=f"email-sender-{index}", daemon=True)
+            for index in range(self.threads)
+        ]
+        for thread in workers:
+            thread.start()
+        last_report = time.monotonic()
+        try:
+            while not self._stop.wait(1):
+                if time.monotonic() - last_report >= report_every:
+                    db = SessionLocal()
+                    try:
+                        email_service.requeue_stale_emails(db)
+                    finally:
+                        db.close()
+                    print(f"📧 {self.stats()}")
+                    last_report = time.monotonic()
+        except KeyboardInterrupt:
+            self.stop()
+        for thread in workers:
+            thread.join(timeout=10)
+        self.pool.close()
+        print(f"🛑 Email sender stopped: {self.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send emails from the outbox")
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=settings.EMAIL_BATCH_SIZE)
+    parser.add_argument("--rate", type=float, default=settings.EMAIL_RATE_PER_SECOND, help="Max messages per second")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print(f"📧 Email sender -> {settings.SMTP_HOST}:{settings.SMTP_PORT} ({args.threads} threads, {args.rate}/s)")
+    print("=" * 50)
+    EmailSender(threads=args.threads, batch_size=args.batch_size, rate_per_second=args.rate).run()
+
+
+if __name__ == "__main__":
+    main()
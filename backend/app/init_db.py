@@ -9,6 +9,7 @@ Run this once to set up the database schema.
 
 from app.database import engine, Base
 from app.models.user import User  # Import all models here
+import app.models  # Registers every model on Base.metadata
 
 
 def init_db():
@@ -24,7 +25,8 @@ def init_db():
     Base.metadata.create_all(bind=engine)
     
     print("✅ Database tables created successfully!")
-    print(f"   - {User.__tablename__}")
+    for table_name in Base.metadata.tables:
+        print(f"   - {table_name}")
 
 
 if __name__ == "__main__":
@@ -5,11 +5,37 @@ Main FastAPI Application
 This is the entry point of your API server.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.auth import router as auth_router
 from app.api.company import router as company_router # Import the new company router
+from app.api.bootstrap import router as bootstrap_router
+from app.api.batch import router as batch_router
+from app.api.export import router as export_router
+from app.api.media import router as media_router
+from app.api.invoice import router as invoice_router
+from app.api.ledger import router as ledger_router
+from app.api.reports import router as reports_router
+from app.api.numbering import router as numbering_router
+from app.api.inventory import router as inventory_router
+from app.api.catalog import router as catalog_router
+from app.api.pos import router as pos_router
+from app.api.kitchen import router as kitchen_router
+from app.api.dashboard import router as dashboard_router
+from app.api.iot import router as iot_router
+from app.api.financing import router as financing_router
+from app.api.screening import router as screening_router
+from app.core.invalidation import listener as invalidation_listener
+from app.core.permissions import compile_permission_matrix
+from app.services.audit_service import client_ip as audit_client_ip, flusher as audit_flusher
+from app.services.catalog_service import catalog_indexes
+from app.services.iot_service import flusher as iot_flusher
+from app.services.alarm_service import alarm_engine
+from app.services.fraud_service import shipper as fraud_shipper
+from app.services.screening_service import writer as screening_writer
+from app.core.event_stream import broker as event_broker
+from app.core.images import shutdown_image_pool
 
 
 # ===== CREATE FASTAPI APPLICATION =====
@@ -32,9 +58,36 @@ app.add_middleware(
 )
 
 
+# ===== AUDIT CLIENT ADDRESS =====
+@app.middleware("http")
+async def audit_client_address(request: Request, call_next):
+    """Audit events recorded while handling a request get the caller's address."""
+    token = audit_client_ip.set(request.client.host if request.client else None)
+    try:
+        return await call_next(request)
+    finally:
+        audit_client_ip.reset(token)
+
+
 # ===== INCLUDE ROUTERS =====
 app.include_router(auth_router)
 app.include_router(company_router) # Include the new company router
+app.include_router(bootstrap_router)
+app.include_router(batch_router)
+app.include_router(export_router)
+app.include_router(media_router)
+app.include_router(invoice_router)
+app.include_router(ledger_router)
+app.include_router(reports_router)
+app.include_router(numbering_router)
+app.include_router(inventory_router)
+app.include_router(catalog_router)
+app.include_router(pos_router)
+app.include_router(kitchen_router)
+app.include_router(dashboard_router)
+app.include_router(iot_router)
+app.include_router(financing_router)
+app.include_router(screening_router)
 
 
 # ===== YOUR FIRST API ENDPOINT! =====
@@ -54,7 +107,15 @@ def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "app_name": settings.APP_NAME
+        "app_name": settings.APP_NAME,
+        "cache_invalidation": invalidation_listener.stats(),
+        "audit_log": audit_flusher.stats(),
+        "catalog": catalog_indexes.stats(),
+        "event_stream": event_broker.stats(),
+        "iot_ingestion": iot_flusher.stats(),
+        "alarms": alarm_engine.stats(),
+        "fraud_scoring": fraud_shipper.stats(),
+        "screening": screening_writer.stats()
     }
 
 
@@ -77,12 +138,36 @@ async def startup_event():
     print(f"🔍 Alternative Docs: http://localhost:8000/redoc")
     print(f"⚡ Version: {settings.APP_VERSION}")
     print("=" * 50)
+    
+    # Build the role -> permission bitmask table once
+    compile_permission_matrix()
+    
+    # Listen for cache invalidation events from other workers
+    invalidation_listener.start()
+    
+    # Write buffered audit events in the background
+    audit_flusher.start()
+    
+    # Write buffered sensor readings in the background
+    iot_flusher.start()
+    
+    # Write fraud scores (and score deferred sales) in the background
+    fraud_shipper.start()
+    
+    # Write screening violations found while posting in the background
+    screening_writer.start()
 
 
 # ===== SHUTDOWN EVENT =====
 @app.on_event("shutdown")
 async def shutdown_event():
     """Runs when the API server shuts down."""
+    invalidation_listener.stop()
+    audit_flusher.stop()  # final flush so buffered audit events are not lost
+    iot_flusher.stop()  # same for buffered sensor readings
+    fraud_shipper.stop()  # and for queued fraud scores
+    screening_writer.stop()  # and screening violations
+    shutdown_image_pool()
     print("=" * 50)
     print(f"🛑 {settings.APP_NAME} Shutting Down...")
     print("=" * 50)
@@ -11,3 +11,20 @@ from app.models.user import User, UserRole
 from app.models.company import Company
 from app.models.company_member import CompanyMember, MemberStatus
 from app.models.invitation import Invitation, InvitationStatus
+from app.models.job import Job, JobStatus
+from app.models.email_outbox import EmailMessage, EmailStatus, EmailKind
+from app.models.audit_log import AuditLog
+from app.models.account import Account, AccountType
+from app.models.journal import JournalEntry, JournalLine, AccountBalanceSnapshot
+from app.models.document_sequence import DocumentSequence, DocumentType
+from app.models.product import Product
+from app.models.warehouse import Warehouse
+from app.models.stock import StockMovement, StockLevel, StockReservation, StockAlert, MovementType, ReservationStatus
+from app.models.pos import PosSale, PosSaleLine
+from app.models.kitchen import KitchenTicket, TicketStatus
+from app.models.iot import Sensor, SensorReading, SensorRollup, RollupPeriod
+from app.models.alarm import AlarmRule, Alarm, AlarmOperator, AlarmSeverity
+from app.models.forecast import DemandForecast
+from app.models.fraud import FraudScore
+from app.models.financing import FinancingPool, PoolInvestment, ProfitDistribution, ProfitPayout, ContractType
+from app.models.screening import ScreeningRule, ScreeningViolation, ScreeningRuleKind, ScreeningSource
@@ -0,0 +1,42 @@
+# app/models/account.py
+
+"""
+Account Model - Chart of accounts (one per company)
+"""
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class AccountType(str, enum.Enum):
+    ASSET = "asset"
+    LIABILITY = "liability"
+    EQUITY = "equity"
+    INCOME = "income"
+    EXPENSE = "expense"
+
+
+# Account types whose balance is normally a debit (positive in the ledger)
+DEBIT_NORMAL_TYPES = {AccountType.ASSET, AccountType.EXPENSE}
+
+
+class Account(Base):
+    __tablename__ = "accounts"
+    
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    code = Column(String(20), nullable=False)  # e.g. "1000"
+    name = Column(String(255), nullable=False)  # e.g. "Cash at Bank"
+    type = Column(Enum(AccountType), nullable=False)
+    parent_id = Column(Integer, ForeignKey("accounts.id", ondelete="SET NULL"), nullable=True)  # For grouping in reports
+    is_active = Column(Boolean, default=True, nullable=False)  # Inactive accounts accept no new postings
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint("company_id", "code", name="uq_accounts_company_code"),
+    )
+    
+    def __repr__(self):
+        return f"<Account(company_id={self.company_id}, code={self.code}, name={self.name})>"
@@ -0,0 +1,78 @@
+# app/models/alarm.py
+
+"""
+Alarm Models - Rules evaluated on incoming sensor readings, and the alarms they raise
+
+A rule watches one sensor, or every sensor of a kind (optionally at one
+location), e.g. "temperature > 60 for 30s at Warehouse KL". Rules are
+compiled into in-memory evaluators and checked as readings arrive
+(see app/services/alarm_service.py).
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Boolean, DateTime, ForeignKey, Enum, Index
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class AlarmOperator(str, enum.Enum):
+    GT = "gt"  # value > threshold
+    GE = "ge"
+    LT = "lt"
+    LE = "le"
+
+
+class AlarmSeverity(str, enum.Enum):
+    INFO = "info"
+    WARNING = "warning"
+    CRITICAL = "critical"
+
+
+class AlarmRule(Base):
+    __tablename__ = "alarm_rules"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    name = Column(String(200), nullable=False)
+    # Target: one sensor, or every sensor of a kind (at `location` if set)
+    sensor_id = Column(Integer, ForeignKey("sensors.id", ondelete="CASCADE"), nullable=True)
+    sensor_kind = Column(String(30), nullable=True)
+    location = Column(String(200), nullable=True)
+    operator = Column(Enum(AlarmOperator), nullable=False)
+    threshold = Column(Float, nullable=False)
+    duration_seconds = Column(Integer, nullable=False, default=0)  # Condition must hold this long (0 = first reading)
+    severity = Column(Enum(AlarmSeverity), nullable=False, default=AlarmSeverity.WARNING)
+    is_active = Column(Boolean, default=True, nullable=False)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_alarm_rules_company", "company_id", "is_active"),
+    )
+    
+    def __repr__(self):
+        return f"<AlarmRule(id={self.id}, name={self.name}, operator={self.operator}, threshold={self.threshold})>"
+
+
+class Alarm(Base):
+    __tablename__ = "alarms"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    rule_id = Column(Integer, ForeignKey("alarm_rules.id", ondelete="CASCADE"), nullable=False)
+    sensor_id = Column(Integer, ForeignKey("sensors.id", ondelete="CASCADE"), nullable=False)
+    severity = Column(Enum(AlarmSeverity), nullable=False)  # Copied from the rule when raised
+    value = Column(Float, nullable=False)  # Reading that raised it
+    raised_at = Column(DateTime(timezone=True), nullable=False)  # Time of that reading (device clock)
+    resolved_at = Column(DateTime(timezone=True), nullable=True)  # First reading back to normal
+    acknowledged_at = Column(DateTime(timezone=True), nullable=True)
+    acknowledged_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    
+    __table_args__ = (
+        Index("ix_alarms_open", "company_id", "resolved_at"),
+        Index("ix_alarms_rule_sensor", "rule_id", "sensor_id"),
+    )
+    
+    def __repr__(self):
+        return f"<Alarm(id={self.id}, rule_id={self.rule_id}, sensor_id={self.sensor_id}, resolved_at={self.resolved_at})>"
@@ -0,0 +1,41 @@
+# app/models/audit_log.py
+
+"""
+Audit Log Model
+Who changed what, and when (company profiles, memberships, logins, roles).
+
+On PostgreSQL the table is partitioned by month on occurred_at, so queries
+for a date range only touch the matching partitions, and old months can
+be detached or archived cheaply. Monthly partitions are created on demand
+by app/services/audit_service.py.
+"""
+
+import uuid
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Uuid, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class AuditLog(Base):
+    __tablename__ = "audit_log"
+    
+    # Generated by the app, so rows can be bulk-inserted / COPY'd without a sequence round trip
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    # Partition key - must be part of the primary key on a partitioned table
+    occurred_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+    company_id = Column(Integer, nullable=True)  # No FK: audit rows outlive deleted companies
+    actor_user_id = Column(Integer, nullable=True)  # Who did it (None for system actions)
+    action = Column(String(100), nullable=False)  # e.g. "company.updated", "auth.login"
+    entity_type = Column(String(50), nullable=True)  # e.g. "company", "company_member"
+    entity_id = Column(String(100), nullable=True)
+    changes = Column(JSON, nullable=True)  # {"field": [before, after], ...}
+    ip_address = Column(String(45), nullable=True)
+    
+    __table_args__ = (
+        Index("ix_audit_log_company_time", "company_id", "occurred_at"),
+        Index("ix_audit_log_entity", "entity_type", "entity_id"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+    
+    def __repr__(self):
+        return f"<AuditLog(action={self.action}, entity={self.entity_type}:{self.entity_id})>"
@@ -0,0 +1,51 @@
+# app/models/document_sequence.py
+
+"""
+Document Sequence Model - Per-company document numbering (INV-2026-000123)
+One counter row per company, document type and year.
+See app/services/numbering_service.py for how numbers are handed out.
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Enum
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class DocumentType(str, enum.Enum):
+    INVOICE = "invoice"
+    CREDIT_NOTE = "credit_note"
+    PURCHASE_ORDER = "purchase_order"
+    RECEIPT = "receipt"
+
+
+# Default prefix for each document type (changeable per company)
+DEFAULT_PREFIXES = {
+    DocumentType.INVOICE: "INV",
+    DocumentType.CREDIT_NOTE: "CN",
+    DocumentType.PURCHASE_ORDER: "PO",
+    DocumentType.RECEIPT: "RCT",
+}
+
+# Document types that must be numbered without gaps (tax documents).
+# The others are handed out in blocks and may skip numbers.
+GAP_FREE_TYPES = {DocumentType.INVOICE, DocumentType.CREDIT_NOTE}
+
+
+class DocumentSequence(Base):
+    __tablename__ = "document_sequences"
+
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True)
+    document_type = Column(Enum(DocumentType), primary_key=True)
+    year = Column(Integer, primary_key=True)  # Numbering restarts every year
+    prefix = Column(String(20), nullable=False)  # e.g. "INV"
+    padding = Column(Integer, nullable=False, default=6)  # Digits: 6 -> 000123
+    next_value = Column(BigInteger, nullable=False, default=1)  # Next number not yet handed out
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    @property
+    def gap_free(self) -> bool:
+        return self.document_type in GAP_FREE_TYPES
+
+    def __repr__(self):
+        return f"<DocumentSequence(company_id={self.company_id}, type={self.document_type}, year={self.year}, next={self.next_value})>"
@@ -0,0 +1,54 @@
+# app/models/email_outbox.py
+
+"""
+Email Outbox Model
+Emails are written here inside the request's transaction and delivered
+later by the email sender (app/email_sender.py), so request latency
+never includes SMTP.
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, ForeignKey, Enum, Index
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class EmailStatus(str, enum.Enum):
+    PENDING = "pending"  # Waiting to be sent (or waiting for a retry)
+    SENDING = "sending"  # Claimed by a sender
+    SENT = "sent"
+    FAILED = "failed"  # Gave up after max_attempts
+
+
+class EmailKind(str, enum.Enum):
+    VERIFICATION = "verification"
+    PASSWORD_RESET = "password_reset"
+    INVITATION = "invitation"
+    OTHER = "other"
+
+
+class EmailMessage(Base):
+    __tablename__ = "email_outbox"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=True)
+    kind = Column(Enum(EmailKind), nullable=False, default=EmailKind.OTHER)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body_text = Column(Text, nullable=False)
+    body_html = Column(Text, nullable=True)
+    status = Column(Enum(EmailStatus), nullable=False, default=EmailStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_email_outbox_due", "status", "next_attempt_at"),
+    )
+    
+    def __repr__(self):
+        return f"<EmailMessage(id={self.id}, to={self.to_email}, status={self.status})>"
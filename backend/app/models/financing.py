@@ -0,0 +1,112 @@
+# app/models/financing.py
+
+"""
+Financing Models - P2P financing pools and their profit sharing
+
+- FinancingPool: money raised from investors under one contract
+  (mudarabah: investors provide the capital, the company manages it;
+  musharakah: the company invests alongside them)
+- PoolInvestment: one investor's capital in a pool, from start_date
+  until end_date (None = still invested)
+- ProfitDistribution: the profit (or loss) of a pool for one period,
+  shared out by app/services/financing_service.py
+- ProfitPayout: one investor's share of a distribution
+
+Amounts are integer sen like the ledger, so shares add up exactly to
+the amount distributed.
+"""
+
+from sqlalchemy import (
+    Column, Integer, BigInteger, String, Numeric, Boolean, Date, DateTime, ForeignKey, Enum, Index, UniqueConstraint
+)
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class ContractType(str, enum.Enum):
+    MUDARABAH = "mudarabah"  # Investors' capital, company's management; losses fall on capital
+    MUSHARAKAH = "musharakah"  # Partnership; losses shared by capital
+
+
+class FinancingPool(Base):
+    __tablename__ = "financing_pools"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    name = Column(String(255), nullable=False)
+    contract_type = Column(Enum(ContractType), nullable=False)
+    # Investors' part of a profit (agreed ratio, e.g. 0.7 = 70:30); the company keeps the rest
+    investor_profit_ratio = Column(Numeric(7, 6), nullable=False)
+    # Musharakah only: the company's own capital in the pool (sen), counted when sharing a loss
+    company_capital = Column(BigInteger, default=0, nullable=False)
+    # Profit is moved from profit_account_id to investor_account_id (investors' payable/capital)
+    profit_account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
+    investor_account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
+    is_active = Column(Boolean, default=True, nullable=False)  # Inactive pools take no new investments
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<FinancingPool(id={self.id}, name={self.name}, type={self.contract_type})>"
+
+
+class PoolInvestment(Base):
+    __tablename__ = "pool_investments"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    pool_id = Column(Integer, ForeignKey("financing_pools.id", ondelete="CASCADE"), nullable=False)
+    company_id = Column(Integer, nullable=False)  # Copied from the pool
+    investor_reference = Column(String(100), nullable=False)  # Investor's ID on the financing platform
+    investor_name = Column(String(255), nullable=True)
+    capital = Column(BigInteger, nullable=False)  # Sen
+    start_date = Column(Date, nullable=False)  # First day the capital earns
+    end_date = Column(Date, nullable=True)  # Last day the capital earns (None = still invested)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_pool_investments_pool", "pool_id", "start_date"),
+    )
+
+    def __repr__(self):
+        return f"<PoolInvestment(pool_id={self.pool_id}, investor={self.investor_reference}, capital={self.capital})>"
+
+
+class ProfitDistribution(Base):
+    __tablename__ = "profit_distributions"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    pool_id = Column(Integer, ForeignKey("financing_pools.id", ondelete="CASCADE"), nullable=False)
+    company_id = Column(Integer, nullable=False)
+    period_start = Column(Date, nullable=False)
+    period_end = Column(Date, nullable=False)  # Inclusive
+    profit = Column(BigInteger, nullable=False)  # Sen, whole pool (negative = loss)
+    investor_amount = Column(BigInteger, nullable=False)  # Sen, shared among the investors
+    company_amount = Column(BigInteger, nullable=False)  # Sen, profit - investor_amount
+    investor_count = Column(Integer, nullable=False)
+    journal_entry_id = Column(BigInteger().with_variant(Integer, "sqlite"), ForeignKey("journal_entries.id"), nullable=True)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("pool_id", "period_start", name="uq_profit_distributions_pool_period"),
+    )
+
+    def __repr__(self):
+        return f"<ProfitDistribution(pool_id={self.pool_id}, period={self.period_start}..{self.period_end}, profit={self.profit})>"
+
+
+class ProfitPayout(Base):
+    __tablename__ = "profit_payouts"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    distribution_id = Column(Integer, ForeignKey("profit_distributions.id", ondelete="CASCADE"), nullable=False)
+    investment_id = Column(BigInteger().with_variant(Integer, "sqlite"), ForeignKey("pool_investments.id", ondelete="CASCADE"), nullable=False)
+    capital_days = Column(BigInteger, nullable=False)  # Capital (sen) x days invested in the period: the investor's weight
+    amount = Column(BigInteger, nullable=False)  # Sen (negative = share of a loss)
+
+    __table_args__ = (
+        Index("ix_profit_payouts_distribution", "distribution_id", "investment_id"),
+    )
+
+    def __repr__(self):
+        return f"<ProfitPayout(distribution_id={self.distribution_id}, investment_id={self.investment_id}, amount={self.amount})>"
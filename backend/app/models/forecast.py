@@ -0,0 +1,37 @@
+# app/models/forecast.py
+
+"""
+Forecast Models - Demand forecasts and suggested reorder points
+
+One row per product, replaced in bulk for the whole company by the nightly
+forecasting job (see app/services/forecast_service.py). Quantities are in
+the product's unit, summed over all warehouses.
+"""
+
+from sqlalchemy import Column, Integer, Float, Numeric, DateTime, ForeignKey, JSON, Index
+from app.database import Base
+
+
+class DemandForecast(Base):
+    __tablename__ = "demand_forecasts"
+
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    generated_at = Column(DateTime(timezone=True), nullable=False)
+    daily = Column(JSON, nullable=False)  # Expected sales per day, starting tomorrow (FORECAST_HORIZON_DAYS values)
+    lead_time_demand = Column(Numeric(14, 3), nullable=False)  # Expected sales over FORECAST_LEAD_TIME_DAYS
+    safety_stock = Column(Numeric(14, 3), nullable=False)
+    reorder_point = Column(Numeric(14, 3), nullable=False)  # lead_time_demand + safety_stock
+    error = Column(Float, nullable=False)  # RMSE of the model's one-day-ahead forecasts on the history
+    # Smoothing parameters chosen for this product (level, trend, season)
+    alpha = Column(Float, nullable=False)
+    beta = Column(Float, nullable=False)
+    gamma = Column(Float, nullable=False)
+    history_days = Column(Integer, nullable=False)  # Days of history the model was fitted on
+
+    __table_args__ = (
+        Index("ix_demand_forecasts_company", "company_id", "product_id"),
+    )
+
+    def __repr__(self):
+        return f"<DemandForecast(product_id={self.product_id}, reorder_point={self.reorder_point})>"
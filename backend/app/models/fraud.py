@@ -0,0 +1,38 @@
+# app/models/fraud.py
+
+"""
+Fraud Models - Scores given to POS sales
+
+Every new sale is scored on upload (see app/services/fraud_service.py).
+Scores and the features they were computed from are written here in the
+background, so the table is both the review queue (high scores) and the
+training set for the next model (once reviewers label sales).
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Boolean, DateTime, ForeignKey, JSON, Index
+from app.database import Base
+
+
+class FraudScore(Base):
+    __tablename__ = "fraud_scores"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    sale_id = Column(BigInteger().with_variant(Integer, "sqlite"), ForeignKey("pos_sales.id", ondelete="CASCADE"), nullable=False)
+    scored_at = Column(DateTime(timezone=True), nullable=False)
+    score = Column(Float, nullable=False)  # 0-1, flagged at FRAUD_FLAG_THRESHOLD
+    model_version = Column(String(50), nullable=False)
+    features = Column(JSON, nullable=False)  # {feature name: value} as seen by the model
+    deferred = Column(Boolean, default=False, nullable=False)  # Scored in the background (upload was over its time budget)
+    # Reviewer's verdict (training label): None = not reviewed
+    is_fraud = Column(Boolean, nullable=True)
+    reviewed_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    reviewed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_fraud_scores_company_score", "company_id", "score"),
+        Index("ix_fraud_scores_sale", "sale_id"),
+    )
+
+    def __repr__(self):
+        return f"<FraudScore(sale_id={self.sale_id}, score={self.score})>"
@@ -0,0 +1,81 @@
+# app/models/iot.py
+
+"""
+IoT Models - Sensors, their raw readings and pre-aggregated rollups
+
+Readings arrive in high-rate batches and are written in bulk by a background
+flusher (see app/services/iot_service.py). Every flush also merges the new
+readings into per-minute, per-hour and per-day rollups, so charts and
+dashboards read a few hundred rollup rows instead of scanning raw readings.
+
+On PostgreSQL sensor_readings is partitioned by day on recorded_at: old
+readings are removed by dropping whole partitions (IOT_RAW_RETENTION_DAYS),
+rollups are kept.
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Boolean, DateTime, ForeignKey, Enum, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class RollupPeriod(str, enum.Enum):
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"  # Starts at midnight in DASHBOARD_TIMEZONE
+
+
+class Sensor(Base):
+    __tablename__ = "sensors"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    code = Column(String(64), nullable=False)  # Device identifier used when sending readings, e.g. "COLD-ROOM-1-TEMP"
+    name = Column(String(200), nullable=False)
+    kind = Column(String(30), nullable=False)  # e.g. "temperature", "humidity", "power"
+    unit = Column(String(20), nullable=True)  # e.g. "°C", "%", "kW"
+    location = Column(String(200), nullable=True)
+    is_active = Column(Boolean, default=True, nullable=False)  # Readings of inactive sensors are rejected
+    # Latest reading (updated by every flush)
+    last_value = Column(Float, nullable=True)
+    last_reading_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint("company_id", "code", name="uq_sensors_company_code"),
+    )
+    
+    def __repr__(self):
+        return f"<Sensor(id={self.id}, code={self.code}, kind={self.kind})>"
+
+
+class SensorReading(Base):
+    __tablename__ = "sensor_readings"
+    
+    # One reading per sensor and timestamp: a batch sent twice is stored once.
+    # recorded_at is the partition key, so it must be part of the primary key.
+    sensor_id = Column(Integer, primary_key=True)  # No FK: keeps bulk loads cheap
+    recorded_at = Column(DateTime(timezone=True), primary_key=True)  # Device clock
+    value = Column(Float, nullable=False)
+    
+    __table_args__ = (
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
+    )
+    
+    def __repr__(self):
+        return f"<SensorReading(sensor_id={self.sensor_id}, recorded_at={self.recorded_at}, value={self.value})>"
+
+
+class SensorRollup(Base):
+    __tablename__ = "sensor_rollups"
+    
+    sensor_id = Column(Integer, ForeignKey("sensors.id", ondelete="CASCADE"), primary_key=True)
+    period = Column(Enum(RollupPeriod), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    count = Column(BigInteger, nullable=False)
+    sum = Column(Float, nullable=False)  # Average = sum / count
+    min = Column(Float, nullable=False)
+    max = Column(Float, nullable=False)
+    
+    def __repr__(self):
+        return f"<SensorRollup(sensor_id={self.sensor_id}, period={self.period}, bucket_start={self.bucket_start})>"
@@ -0,0 +1,47 @@
+# app/models/job.py
+
+"""
+Job Model - Durable background job queue
+Work that should not run inside a request (emails, logo processing,
+reports, bulk imports) is stored here and picked up by workers (app/worker.py).
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, ForeignKey, Enum, JSON, Index
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"  # Waiting to run (or waiting for a retry)
+    RUNNING = "running"  # Claimed by a worker
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"  # Gave up after max_attempts
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    queue = Column(String(50), nullable=False, default="default")  # Lets workers specialise
+    kind = Column(String(100), nullable=False)  # Handler name, e.g. "email.send"
+    payload = Column(JSON, nullable=False, default=dict)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=True)  # Tenant (for fairness)
+    priority = Column(Integer, nullable=False, default=0)  # Higher runs first
+    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Not before this time
+    locked_by = Column(String(100), nullable=True)  # Worker ID holding the job
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        # Claim query: queued jobs in a queue, highest priority and oldest first
+        Index("ix_jobs_claim", "status", "queue", "priority", "run_at"),
+    )
+    
+    def __repr__(self):
+        return f"<Job(id={self.id}, kind={self.kind}, status={self.status})>"
@@ -0,0 +1,96 @@
+# app/models/journal.py
+
+"""
+Journal Models - Append-only double-entry ledger
+
+- JournalEntry: one business event (sale, payment, adjustment...)
+- JournalLine: one debit or credit of an entry. Amounts are integer sen,
+  positive = debit, negative = credit, so an entry balances when its
+  lines sum to zero.
+- AccountBalanceSnapshot: running totals per account and month, kept up
+  to date by every posting (see app/services/ledger_service.py) so a
+  balance never needs a scan of the whole journal.
+
+Entries are never updated or deleted: mistakes are fixed by posting a reversal.
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Date, DateTime, ForeignKey, Index, event
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class JournalEntry(Base):
+    __tablename__ = "journal_entries"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    entry_date = Column(Date, nullable=False)  # Accounting date
+    reference = Column(String(100), nullable=True)  # e.g. invoice number
+    description = Column(Text, nullable=True)
+    source = Column(String(50), nullable=False, default="manual")  # manual, pos, invoice, import...
+    reversal_of_id = Column(BigInteger().with_variant(Integer, "sqlite"), ForeignKey("journal_entries.id"), nullable=True)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_journal_entries_company_date", "company_id", "entry_date"),
+        # An entry is reversed at most once, even by concurrent requests
+        Index("uq_journal_entries_reversal_of", "reversal_of_id", unique=True),
+    )
+    
+    def __repr__(self):
+        return f"<JournalEntry(id={self.id}, company_id={self.company_id}, date={self.entry_date})>"
+
+
+class JournalLine(Base):
+    __tablename__ = "journal_lines"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    entry_id = Column(BigInteger().with_variant(Integer, "sqlite"), ForeignKey("journal_entries.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Copied from the entry so balance and report queries never need a join
+    company_id = Column(Integer, nullable=False)
+    entry_date = Column(Date, nullable=False)
+    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
+    amount = Column(BigInteger, nullable=False)  # Sen. Debit > 0, credit < 0
+    cost_center = Column(String(50), nullable=True)
+    description = Column(String(255), nullable=True)
+    
+    __table_args__ = (
+        # Balance delta: one account, a few days
+        Index("ix_journal_lines_account_date", "company_id", "account_id", "entry_date"),
+        # Reports: one company, a date range
+        Index("ix_journal_lines_company_date", "company_id", "entry_date"),
+    )
+    
+    def __repr__(self):
+        return f"<JournalLine(entry_id={self.entry_id}, account_id={self.account_id}, amount={self.amount})>"
+
+
+class AccountBalanceSnapshot(Base):
+    """
+    Totals for one account in one month.
+    
+    movement = sum of the month's lines
+    closing  = balance at the end of the month (all lines up to then)
+    """
+    __tablename__ = "account_balance_snapshots"
+    
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True)
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), primary_key=True)
+    period = Column(Date, primary_key=True)  # First day of the month
+    movement = Column(BigInteger, nullable=False, default=0)
+    closing = Column(BigInteger, nullable=False, default=0)
+    line_count = Column(BigInteger, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<AccountBalanceSnapshot(account_id={self.account_id}, period={self.period}, closing={self.closing})>"
+
+
+# ===== APPEND-ONLY GUARD =====
+def _reject_change(mapper, connection, target):
+    raise ValueError(f"{type(target).__name__} is append-only: post a reversal instead")
+
+
+for _model in (JournalEntry, JournalLine):
+    event.listen(_model, "before_update", _reject_change)
+    event.listen(_model, "before_delete", _reject_change)
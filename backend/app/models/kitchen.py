@@ -0,0 +1,49 @@
+# app/models/kitchen.py
+
+"""
+Kitchen Models - Tickets shown on Kitchen Display System (KDS) screens
+
+A POS order sends one ticket per kitchen station (grill, drinks, pastry...).
+Kitchen staff move it along: new -> preparing -> ready -> served.
+Every change is pushed to the station's screens (see app/services/kitchen_service.py).
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Enum, JSON, Index
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class TicketStatus(str, enum.Enum):
+    NEW = "new"
+    PREPARING = "preparing"
+    READY = "ready"  # Waiting at the pass
+    SERVED = "served"
+    CANCELLED = "cancelled"
+
+
+# Tickets still shown on the screens
+OPEN_STATUSES = (TicketStatus.NEW, TicketStatus.PREPARING, TicketStatus.READY)
+
+
+class KitchenTicket(Base):
+    __tablename__ = "kitchen_tickets"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    station = Column(String(30), nullable=False)  # e.g. "grill", "drinks"
+    order_reference = Column(String(50), nullable=False)  # POS receipt / order number
+    table_label = Column(String(30), nullable=True)  # e.g. "T12", "Takeaway"
+    items = Column(JSON, nullable=False)  # [{"name": ..., "quantity": ..., "note": ...}]
+    status = Column(Enum(TicketStatus), nullable=False, default=TicketStatus.NEW)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    __table_args__ = (
+        # Open tickets of a station (screen snapshot)
+        Index("ix_kitchen_tickets_station", "company_id", "station", "status"),
+    )
+    
+    def __repr__(self):
+        return f"<KitchenTicket(id={self.id}, station={self.station}, status={self.status})>"
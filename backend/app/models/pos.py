@@ -0,0 +1,55 @@
+# app/models/pos.py
+
+"""
+POS Models - Sales uploaded by POS terminals
+
+Terminals keep working offline and upload their sales later in batches
+(see app/services/pos_sync_service.py). Each sale carries an idempotency
+key generated on the terminal, so uploading the same sale twice (retry
+after a timeout, a terminal restored from backup...) stores it once.
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Numeric, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class PosSale(Base):
+    __tablename__ = "pos_sales"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    idempotency_key = Column(String(64), nullable=False)  # Generated by the terminal (e.g. a UUID)
+    terminal_code = Column(String(50), nullable=False)  # e.g. "KL-01-T3"
+    receipt_number = Column(String(50), nullable=False)  # Printed on the receipt by the terminal
+    warehouse_id = Column(Integer, ForeignKey("warehouses.id"), nullable=False)  # Stock taken from here
+    sold_at = Column(DateTime(timezone=True), nullable=False)  # Terminal clock
+    payment_method = Column(String(30), nullable=False, default="cash")
+    total = Column(BigInteger, nullable=False)  # Sen, sum of the lines
+    uploaded_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    received_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        # Dedupe on upload: INSERT ... ON CONFLICT DO NOTHING
+        UniqueConstraint("company_id", "idempotency_key", name="uq_pos_sales_idempotency"),
+        Index("ix_pos_sales_company_sold", "company_id", "sold_at"),
+    )
+    
+    def __repr__(self):
+        return f"<PosSale(id={self.id}, receipt={self.receipt_number}, total={self.total})>"
+
+
+class PosSaleLine(Base):
+    __tablename__ = "pos_sale_lines"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    sale_id = Column(BigInteger().with_variant(Integer, "sqlite"), ForeignKey("pos_sales.id", ondelete="CASCADE"), nullable=False, index=True)
+    company_id = Column(Integer, nullable=False)  # Copied from the sale for reports without a join
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    quantity = Column(Numeric(14, 3), nullable=False)
+    unit_price = Column(BigInteger, nullable=False)  # Sen
+    discount = Column(BigInteger, nullable=False, default=0)  # Sen, for the whole line
+    line_total = Column(BigInteger, nullable=False)  # Sen: quantity x unit_price - discount
+    
+    def __repr__(self):
+        return f"<PosSaleLine(sale_id={self.sale_id}, product_id={self.product_id}, quantity={self.quantity})>"
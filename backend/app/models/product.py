@@ -0,0 +1,39 @@
+# app/models/product.py
+
+"""
+Product Model - Items a company buys, stocks and sells
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Boolean, Numeric, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Product(Base):
+    __tablename__ = "products"
+    
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    sku = Column(String(50), nullable=False)  # Company's own code, e.g. "COF-LATTE-12"
+    barcode = Column(String(50), nullable=True)  # EAN / UPC
+    name = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    category = Column(String(100), nullable=True)  # e.g. "Beverages"
+    unit = Column(String(20), nullable=False, default="unit")  # unit, kg, litre, box...
+    price = Column(BigInteger, nullable=False, default=0)  # Selling price in sen
+    cost = Column(BigInteger, nullable=True)  # Standard cost in sen
+    reorder_level = Column(Numeric(14, 3), nullable=True)  # Low-stock threshold (per warehouse)
+    is_stocked = Column(Boolean, default=True, nullable=False)  # False for services: no stock tracking
+    is_active = Column(Boolean, default=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint("company_id", "sku", name="uq_products_company_sku"),
+        Index("ix_products_company_category", "company_id", "category"),
+        # Incremental catalog refresh: products changed since a timestamp
+        Index("ix_products_company_updated", "company_id", "updated_at"),
+    )
+    
+    def __repr__(self):
+        return f"<Product(company_id={self.company_id}, sku={self.sku}, name={self.name})>"
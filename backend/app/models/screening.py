@@ -0,0 +1,81 @@
+# app/models/screening.py
+
+"""
+Screening Models - Sharia-compliance rules and the violations they find
+
+A company configures its own rules, e.g.:
+- "No riba": postings to accounts whose name contains "interest"
+- "No prohibited goods": POS sales of products in the Alcohol category
+- "Gharar limit": postings above RM 10,000 to the deferred-consideration accounts
+
+Rules are compiled into lookup tables and checked as journal entries and
+POS sales are written, and again by a nightly sweep (see
+app/services/screening_service.py). Violations are reported, never
+blocking: the posting stays, and the violation is there to be reviewed.
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, Date, DateTime, ForeignKey, Enum, JSON, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class ScreeningRuleKind(str, enum.Enum):
+    PROHIBITED_ACCOUNT = "prohibited_account"  # Any posting to the matching accounts (e.g. interest income/expense)
+    PROHIBITED_CATEGORY = "prohibited_category"  # Any POS sale of the matching products (e.g. alcohol, pork)
+    AMOUNT_LIMIT = "amount_limit"  # Postings to the matching accounts above max_amount (gharar)
+
+
+class ScreeningSource(str, enum.Enum):
+    JOURNAL = "journal"  # document_id = journal entry
+    POS = "pos"  # document_id = POS sale
+
+
+class ScreeningRule(Base):
+    __tablename__ = "screening_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    name = Column(String(200), nullable=False)
+    kind = Column(Enum(ScreeningRuleKind), nullable=False)
+    # What the rule matches (any of):
+    account_codes = Column(JSON, nullable=False, default=list)  # Account code prefixes, e.g. ["41", "7150"]
+    categories = Column(JSON, nullable=False, default=list)  # Product categories (case-insensitive)
+    keywords = Column(JSON, nullable=False, default=list)  # Words in the account / product name (case-insensitive)
+    max_amount = Column(BigInteger, nullable=True)  # Sen per line (AMOUNT_LIMIT only)
+    is_active = Column(Boolean, default=True, nullable=False)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_screening_rules_company", "company_id", "is_active"),
+    )
+
+    def __repr__(self):
+        return f"<ScreeningRule(id={self.id}, name={self.name}, kind={self.kind})>"
+
+
+class ScreeningViolation(Base):
+    """One rule broken by one journal entry or POS sale (all its offending lines together)."""
+    __tablename__ = "screening_violations"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    rule_id = Column(Integer, ForeignKey("screening_rules.id", ondelete="CASCADE"), nullable=False)
+    source = Column(Enum(ScreeningSource), nullable=False)
+    document_id = Column(BigInteger, nullable=False)
+    occurred_on = Column(Date, nullable=False)  # Entry date / local day of the sale
+    amount = Column(BigInteger, nullable=False)  # Sen, sum of the offending lines (absolute values)
+    line_count = Column(Integer, nullable=False)
+    found_by = Column(String(20), nullable=False)  # "posting" or "sweep"
+    detected_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        # Found while posting and again by the sweep: stored once
+        UniqueConstraint("rule_id", "source", "document_id", name="uq_screening_violations_document"),
+        Index("ix_screening_violations_company_day", "company_id", "occurred_on"),
+    )
+
+    def __repr__(self):
+        return f"<ScreeningViolation(rule_id={self.rule_id}, source={self.source}, document_id={self.document_id})>"
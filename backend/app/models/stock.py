@@ -0,0 +1,133 @@
+# app/models/stock.py
+
+"""
+Stock Models - Append-only stock ledger
+
+- StockMovement: one change of stock (receipt, sale, adjustment, transfer...).
+  Quantity is signed: positive = into the warehouse, negative = out.
+- StockLevel: running quantities per (product, warehouse), kept up to date
+  by every movement and reservation (see app/services/inventory_service.py),
+  so stock on hand never needs a sum over the movements.
+- StockReservation: stock promised to a POS cart or sales order.
+- StockAlert: a product that fell to or below its reorder level in a
+  warehouse. Raised and resolved as levels change, never by scanning.
+
+Movements are never updated or deleted: corrections are new movements.
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, Numeric, DateTime, ForeignKey, Enum, Index, event
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class MovementType(str, enum.Enum):
+    RECEIPT = "receipt"  # Goods received (purchase)
+    ISSUE = "issue"  # Used internally (kitchen, samples)
+    SALE = "sale"  # Sold (usually fulfils a reservation)
+    RETURN = "return"  # Customer return
+    ADJUSTMENT = "adjustment"  # Stock count correction, damage, loss
+    TRANSFER_IN = "transfer_in"
+    TRANSFER_OUT = "transfer_out"
+
+
+class ReservationStatus(str, enum.Enum):
+    ACTIVE = "active"  # Holding stock
+    FULFILLED = "fulfilled"  # Turned into a sale
+    RELEASED = "released"  # Cancelled or expired
+
+
+class StockMovement(Base):
+    __tablename__ = "stock_movements"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    warehouse_id = Column(Integer, ForeignKey("warehouses.id"), nullable=False)
+    type = Column(Enum(MovementType), nullable=False)
+    quantity = Column(Numeric(14, 3), nullable=False)  # Signed: in > 0, out < 0
+    reference = Column(String(100), nullable=True)  # e.g. PO / receipt number
+    note = Column(String(255), nullable=True)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Stock card: one product's history in a warehouse
+        Index("ix_stock_movements_product", "company_id", "product_id", "warehouse_id", "created_at"),
+    )
+
+    def __repr__(self):
+        return f"<StockMovement(product_id={self.product_id}, warehouse_id={self.warehouse_id}, quantity={self.quantity})>"
+
+
+class StockLevel(Base):
+    """
+    Current stock of one product in one warehouse.
+
+    available = on_hand - reserved
+    """
+    __tablename__ = "stock_levels"
+
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    warehouse_id = Column(Integer, ForeignKey("warehouses.id", ondelete="CASCADE"), primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    on_hand = Column(Numeric(14, 3), nullable=False, default=0)
+    reserved = Column(Numeric(14, 3), nullable=False, default=0)
+    is_low = Column(Boolean, nullable=False, default=False)  # available <= reorder level (has an open alert)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<StockLevel(product_id={self.product_id}, warehouse_id={self.warehouse_id}, on_hand={self.on_hand}, reserved={self.reserved})>"
+
+
+class StockReservation(Base):
+    __tablename__ = "stock_reservations"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    warehouse_id = Column(Integer, ForeignKey("warehouses.id"), nullable=False)
+    quantity = Column(Numeric(14, 3), nullable=False)
+    reference = Column(String(100), nullable=True)  # e.g. POS cart or sales order number
+    status = Column(Enum(ReservationStatus), nullable=False, default=ReservationStatus.ACTIVE)
+    expires_at = Column(DateTime(timezone=True), nullable=True)  # Released automatically after this
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_stock_reservations_reference", "company_id", "reference"),
+        # Expiry sweep: active reservations by expiry time
+        Index("ix_stock_reservations_expiry", "status", "expires_at"),
+    )
+
+    def __repr__(self):
+        return f"<StockReservation(id={self.id}, product_id={self.product_id}, quantity={self.quantity}, status={self.status})>"
+
+
+class StockAlert(Base):
+    __tablename__ = "stock_alerts"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    warehouse_id = Column(Integer, ForeignKey("warehouses.id", ondelete="CASCADE"), nullable=False)
+    available = Column(Numeric(14, 3), nullable=False)  # When raised
+    reorder_level = Column(Numeric(14, 3), nullable=False)
+    raised_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    resolved_at = Column(DateTime(timezone=True), nullable=True)  # Stock went back above the level
+
+    __table_args__ = (
+        Index("ix_stock_alerts_open", "company_id", "resolved_at"),
+    )
+
+    def __repr__(self):
+        return f"<StockAlert(product_id={self.product_id}, warehouse_id={self.warehouse_id}, resolved_at={self.resolved_at})>"
+
+
+# ===== APPEND-ONLY GUARD =====
+def _reject_change(mapper, connection, target):
+    raise ValueError("StockMovement is append-only: record a correcting movement instead")
+
+
+event.listen(StockMovement, "before_update", _reject_change)
+event.listen(StockMovement, "before_delete", _reject_change)
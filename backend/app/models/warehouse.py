@@ -0,0 +1,28 @@
+# app/models/warehouse.py
+
+"""
+Warehouse Model - A place that holds stock (warehouse, outlet, kitchen store)
+"""
+
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Warehouse(Base):
+    __tablename__ = "warehouses"
+    
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    code = Column(String(20), nullable=False)  # e.g. "KL-01"
+    name = Column(String(255), nullable=False)
+    address = Column(Text, nullable=True)
+    is_active = Column(Boolean, default=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint("company_id", "code", name="uq_warehouses_company_code"),
+    )
+    
+    def __repr__(self):
+        return f"<Warehouse(company_id={self.company_id}, code={self.code})>"
@@ -12,7 +12,11 @@ from app.schemas.user import (
     UserResponse,
     UserUpdate,
     Token,
-    TokenData
+    TokenData,
+    CompanySelectResponse,
+    EmailVerify,
+    EmailRequest,
+    PasswordResetConfirm
 )
 
 from app.schemas.company import (
@@ -20,5 +24,93 @@ from app.schemas.company import (
     CompanyUpdate,
     CompanyResponse,
     UserCompanyRole,
-    CompanyMemberResponse
-)
\ No newline at end of file
+    CompanyMembershipResponse,
+    CompanyMemberResponse,
+    InvitationCreate,
+    InvitationResponse,
+    LogoUploadResponse
+)
+
+from app.schemas.bootstrap import BootstrapResponse
+from app.schemas.batch import (
+    BatchSubRequest,
+    BatchRequest,
+    BatchSubResponse,
+    BatchResponse
+)
+from app.schemas.audit import AuditLogResponse
+from app.schemas.invoice import InvoiceLine, InvoiceDocument
+from app.schemas.ledger import (
+    AccountCreate,
+    AccountResponse,
+    JournalLineCreate,
+    JournalEntryCreate,
+    JournalPostResponse,
+    AccountBalanceResponse
+)
+from app.schemas.numbering import DocumentSequenceUpdate, DocumentSequenceResponse
+from app.schemas.inventory import (
+    ProductCreate,
+    ProductUpdate,
+    ProductResponse,
+    WarehouseCreate,
+    WarehouseResponse,
+    StockMovementCreate,
+    StockTransferCreate,
+    StockMovementResponse,
+    StockPostResponse,
+    StockLevelResponse,
+    ReservationLine,
+    ReservationCreate,
+    ReservationResponse,
+    StockAlertResponse,
+    DemandForecastResponse,
+    ForecastRequestResponse
+)
+from app.schemas.catalog import CatalogItemResponse
+from app.schemas.pos import (
+    PosSaleLineCreate,
+    PosSaleCreate,
+    PosSyncRequest,
+    PosSyncRejected,
+    PosSyncResponse,
+    FraudScoreResponse,
+    FraudReview
+)
+from app.schemas.kitchen import (
+    KitchenTicketItem,
+    KitchenTicketCreate,
+    KitchenTicketStatusUpdate,
+    KitchenTicketResponse
+)
+from app.schemas.iot import (
+    SensorCreate,
+    SensorUpdate,
+    SensorResponse,
+    SensorSeries,
+    SensorReadingBatch,
+    SensorIngestResponse,
+    SensorRollupResponse,
+    AlarmRuleCreate,
+    AlarmRuleUpdate,
+    AlarmRuleResponse,
+    AlarmResponse
+)
+from app.schemas.financing import (
+    FinancingPoolCreate,
+    FinancingPoolResponse,
+    PoolInvestmentCreate,
+    PoolInvestmentWithdraw,
+    PoolInvestmentResponse,
+    PoolInvestmentUploadResponse,
+    ProfitDistributionCreate,
+    ProfitDistributionResponse,
+    ProfitPayoutResponse
+)
+from app.schemas.screening import (
+    ScreeningRuleCreate,
+    ScreeningRuleUpdate,
+    ScreeningRuleResponse,
+    ScreeningViolationResponse,
+    ScreeningSweepResponse
+)
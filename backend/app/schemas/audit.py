@@ -0,0 +1,26 @@
+# app/schemas/audit.py
+
+"""
+Audit Schemas
+Response shape for the company audit trail.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Optional, Any
+from pydantic import BaseModel
+
+
+class AuditLogResponse(BaseModel):
+    """One audit event."""
+    id: uuid.UUID
+    occurred_at: datetime
+    company_id: Optional[int] = None
+    actor_user_id: Optional[int] = None
+    action: str
+    entity_type: Optional[str] = None
+    entity_id: Optional[str] = None
+    changes: Optional[dict[str, Any]] = None
+    ip_address: Optional[str] = None
+
+    model_config = {"from_attributes": True}
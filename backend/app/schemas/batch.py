@@ -0,0 +1,39 @@
+# app/schemas/batch.py
+
+"""
+Batch Schemas - Several read requests in one HTTP call
+"""
+
+from pydantic import BaseModel, Field
+from typing import Any, Optional
+
+
+# ===== BATCH REQUEST SCHEMAS =====
+class BatchSubRequest(BaseModel):
+    """
+    One request inside a batch.
+    
+    Example:
+    {"id": "acme", "method": "GET", "path": "/api/v1/companies/5"}
+    """
+    id: Optional[str] = None  # Client-chosen ID, echoed back in the response
+    method: str = "GET"
+    path: str
+
+
+class BatchRequest(BaseModel):
+    """Schema for POST /api/v1/batch"""
+    requests: list[BatchSubRequest] = Field(..., min_length=1, max_length=100)
+
+
+# ===== BATCH RESPONSE SCHEMAS =====
+class BatchSubResponse(BaseModel):
+    """Result of one sub-request (same status/body the normal endpoint would return)"""
+    id: Optional[str] = None
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Responses in the same order as the submitted requests"""
+    responses: list[BatchSubResponse]
@@ -0,0 +1,25 @@
+# app/schemas/bootstrap.py
+
+"""
+Bootstrap Schemas - Everything the dashboard needs on startup
+"""
+
+from pydantic import BaseModel
+from typing import Optional
+from app.schemas.user import UserResponse
+from app.schemas.company import CompanyResponse, CompanyMembershipResponse
+
+
+# ===== BOOTSTRAP RESPONSE SCHEMA =====
+class BootstrapResponse(BaseModel):
+    """
+    Schema for GET /api/v1/bootstrap
+    
+    Replaces the /auth/me + /companies/ + current company calls
+    the frontend used to make after login.
+    """
+    user: UserResponse
+    current_company: Optional[CompanyResponse] = None
+    current_role: Optional[str] = None
+    permissions: list[str] = []  # Permission names granted by current_role (for role-based UI)
+    companies: list[CompanyMembershipResponse] = []
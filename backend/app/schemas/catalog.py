@@ -0,0 +1,21 @@
+# app/schemas/catalog.py
+
+"""
+Catalog Schemas
+Product lookups for POS scanning and search (see app/services/catalog_service.py).
+"""
+
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel
+
+
+class CatalogItemResponse(BaseModel):
+    """A product as shown at the POS"""
+    id: int
+    sku: str
+    barcode: Optional[str] = None
+    name: str
+    category: Optional[str] = None
+    unit: str
+    price: Decimal
@@ -8,6 +8,8 @@ from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
 from typing import Optional
 from datetime import datetime
 from app.models.company import BusinessStructure, Industry
+from app.models.user import UserRole
+from app.models.invitation import InvitationStatus
 
 
 # ===== COMPANY REGISTRATION SCHEMA =====
@@ -118,6 +120,15 @@ class CompanyResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class LogoUploadResponse(BaseModel):
+    """Result of a logo upload. All URLs are immutable and can be cached forever."""
+    logo_url: str
+    renditions: dict[str, str]  # "invoice" / "header" / "thumbnail" -> URL
+    sha256: str
+    size_bytes: int
+    deduplicated: bool  # True if the same file was already stored
+
+
 # ===== USER WITH COMPANY CONTEXT =====
 
 class UserCompanyRole(BaseModel):
@@ -128,6 +139,12 @@ class UserCompanyRole(BaseModel):
     is_owner: bool
 
 
+class CompanyMembershipResponse(CompanyResponse):
+    """Company profile together with the current user's membership in it"""
+    role: str
+    is_owner: bool
+
+
 class CompanyMemberResponse(BaseModel):
     """Company member info"""
     user_id: int
@@ -147,3 +164,24 @@ class CompanyListResponse(BaseModel):
 class CompanySelect(BaseModel):
     """Schema for selecting a company"""
     company_id: int
+
+
+# ===== INVITATION SCHEMAS =====
+
+class InvitationCreate(BaseModel):
+    """Schema for inviting someone to a company"""
+    email: EmailStr
+    role: UserRole = UserRole.VIEWER
+
+
+class InvitationResponse(BaseModel):
+    """Invitation info (the token is only sent by email)"""
+    id: int
+    company_id: int
+    email: str
+    role: UserRole
+    status: InvitationStatus
+    created_at: datetime
+    expires_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
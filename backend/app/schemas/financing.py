@@ -0,0 +1,138 @@
+# app/schemas/financing.py
+
+"""
+Financing Schemas
+P2P financing pools, investors' capital and profit distributions.
+
+Amounts are decimals in the API (e.g. "1500.00") and integer sen in the database.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from app.models.financing import ContractType
+
+
+Money = Field(..., gt=0, max_digits=16, decimal_places=2)
+
+
+# ===== POOLS =====
+class FinancingPoolCreate(BaseModel):
+    """
+    Schema for opening a financing pool.
+
+    Example (investors take 70% of any profit):
+    {
+        "name": "Working capital 2026-Q3",
+        "contract_type": "mudarabah",
+        "investor_profit_ratio": "0.70",
+        "profit_account_id": 12,
+        "investor_account_id": 21
+    }
+    """
+    name: str = Field(..., min_length=1, max_length=255)
+    contract_type: ContractType
+    investor_profit_ratio: Decimal = Field(..., gt=0, le=1, decimal_places=6)
+    company_capital: Decimal = Field(Decimal("0"), ge=0, max_digits=16, decimal_places=2)  # Musharakah only
+    profit_account_id: int
+    investor_account_id: int
+
+    @model_validator(mode="after")
+    def valid_terms(self):
+        if self.profit_account_id == self.investor_account_id:
+            raise ValueError("Profit and investor accounts must differ")
+        if self.contract_type == ContractType.MUDARABAH and self.company_capital:
+            raise ValueError("A mudarabah pool has no company capital")
+        return self
+
+
+class FinancingPoolResponse(BaseModel):
+    """Financing pool in API responses"""
+    id: int
+    name: str
+    contract_type: ContractType
+    investor_profit_ratio: Decimal
+    company_capital: Decimal
+    profit_account_id: int
+    investor_account_id: int
+    is_active: bool
+    investor_count: int
+    capital: Decimal  # Investors' capital still invested
+
+
+# ===== INVESTMENTS =====
+class PoolInvestmentCreate(BaseModel):
+    """One investor's capital. end_date is the last day it earns (leave empty while invested)."""
+    investor_reference: str = Field(..., min_length=1, max_length=100)
+    investor_name: Optional[str] = Field(None, max_length=255)
+    capital: Decimal = Money
+    start_date: date
+    end_date: Optional[date] = None
+
+    @model_validator(mode="after")
+    def valid_dates(self):
+        if self.end_date is not None and self.end_date < self.start_date:
+            raise ValueError("end_date is before start_date")
+        return self
+
+
+class PoolInvestmentWithdraw(BaseModel):
+    """Stop an investment earning after end_date"""
+    end_date: date
+
+
+class PoolInvestmentResponse(BaseModel):
+    """An investment in API responses"""
+    id: int
+    pool_id: int
+    investor_reference: str
+    investor_name: Optional[str] = None
+    capital: Decimal
+    start_date: date
+    end_date: Optional[date] = None
+
+
+class PoolInvestmentUploadResponse(BaseModel):
+    """Result of adding investments to a pool"""
+    added: int
+
+
+# ===== DISTRIBUTIONS =====
+class ProfitDistributionCreate(BaseModel):
+    """
+    Share a period's profit (negative for a loss) among the pool's investors.
+    The journal entry is dated entry_date (default: period_end).
+    """
+    period_start: date
+    period_end: date
+    profit: Decimal = Field(..., max_digits=16, decimal_places=2)
+    entry_date: Optional[date] = None
+
+    @model_validator(mode="after")
+    def valid_period(self):
+        if self.period_end < self.period_start:
+            raise ValueError("period_end is before period_start")
+        return self
+
+
+class ProfitDistributionResponse(BaseModel):
+    """A distribution; investor_amount + company_amount = profit to the sen"""
+    id: int
+    pool_id: int
+    period_start: date
+    period_end: date
+    profit: Decimal
+    investor_amount: Decimal
+    company_amount: Decimal
+    investor_count: int
+    journal_entry_id: Optional[int] = None
+    created_at: datetime
+
+
+class ProfitPayoutResponse(BaseModel):
+    """One investor's share of a distribution"""
+    investment_id: int
+    investor_reference: str
+    capital_days: int
+    amount: Decimal
@@ -0,0 +1,223 @@
+# app/schemas/inventory.py
+
+"""
+Inventory Schemas
+Products, warehouses, stock movements, reservations and low-stock alerts.
+
+Prices are decimals in the API (e.g. "12.50") and integer sen in the database.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from app.models.stock import MovementType, ReservationStatus
+
+
+Quantity = Field(..., gt=0, max_digits=14, decimal_places=3)
+
+
+# ===== PRODUCTS =====
+class ProductCreate(BaseModel):
+    """Schema for adding a product"""
+    sku: str = Field(..., min_length=1, max_length=50)
+    barcode: Optional[str] = Field(None, max_length=50)
+    name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    category: Optional[str] = Field(None, max_length=100)
+    unit: str = Field("unit", min_length=1, max_length=20)
+    price: Decimal = Field(Decimal("0"), ge=0, decimal_places=2)
+    cost: Optional[Decimal] = Field(None, ge=0, decimal_places=2)
+    reorder_level: Optional[Decimal] = Field(None, ge=0, decimal_places=3)
+    is_stocked: bool = True
+
+
+class ProductUpdate(BaseModel):
+    """Schema for updating a product (all fields optional)"""
+    barcode: Optional[str] = Field(None, max_length=50)
+    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    description: Optional[str] = None
+    category: Optional[str] = Field(None, max_length=100)
+    unit: Optional[str] = Field(None, min_length=1, max_length=20)
+    price: Optional[Decimal] = Field(None, ge=0, decimal_places=2)
+    cost: Optional[Decimal] = Field(None, ge=0, decimal_places=2)
+    reorder_level: Optional[Decimal] = Field(None, ge=0, decimal_places=3)
+    is_active: Optional[bool] = None
+
+
+class ProductResponse(BaseModel):
+    """Product in API responses"""
+    id: int
+    sku: str
+    barcode: Optional[str] = None
+    name: str
+    description: Optional[str] = None
+    category: Optional[str] = None
+    unit: str
+    price: Decimal
+    cost: Optional[Decimal] = None
+    reorder_level: Optional[Decimal] = None
+    is_stocked: bool
+    is_active: bool
+
+
+# ===== WAREHOUSES =====
+class WarehouseCreate(BaseModel):
+    """Schema for adding a warehouse or outlet store"""
+    code: str = Field(..., min_length=1, max_length=20)
+    name: str = Field(..., min_length=1, max_length=255)
+    address: Optional[str] = None
+
+
+class WarehouseResponse(BaseModel):
+    """Warehouse in API responses"""
+    id: int
+    code: str
+    name: str
+    address: Optional[str] = None
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ===== MOVEMENTS =====
+class StockMovementCreate(BaseModel):
+    """
+    One stock movement.
+
+    Quantity is always positive except for adjustments, where the sign says
+    which way the count was corrected:
+        {"product_id": 1, "warehouse_id": 1, "type": "receipt", "quantity": "24"}
+        {"product_id": 1, "warehouse_id": 1, "type": "adjustment", "quantity": "-2", "note": "Broken"}
+    """
+    product_id: int
+    warehouse_id: int
+    type: MovementType
+    quantity: Decimal = Field(..., max_digits=14, decimal_places=3)
+    reference: Optional[str] = Field(None, max_length=100)
+    note: Optional[str] = Field(None, max_length=255)
+
+    @model_validator(mode="after")
+    def check_quantity(self):
+        if self.type in (MovementType.TRANSFER_IN, MovementType.TRANSFER_OUT):
+            raise ValueError("Use the transfer endpoint to move stock between warehouses")
+        if self.quantity == 0 or (self.type != MovementType.ADJUSTMENT and self.quantity < 0):
+            raise ValueError("Quantity must be positive (or non-zero for adjustments)")
+        return self
+
+
+class StockTransferCreate(BaseModel):
+    """Move stock from one warehouse to another"""
+    product_id: int
+    from_warehouse_id: int
+    to_warehouse_id: int
+    quantity: Decimal = Quantity
+    reference: Optional[str] = Field(None, max_length=100)
+    note: Optional[str] = Field(None, max_length=255)
+
+    @model_validator(mode="after")
+    def different_warehouses(self):
+        if self.from_warehouse_id == self.to_warehouse_id:
+            raise ValueError("Source and destination warehouse must differ")
+        return self
+
+
+class StockMovementResponse(BaseModel):
+    """Movement in API responses (quantity signed: in > 0, out < 0)"""
+    id: int
+    product_id: int
+    warehouse_id: int
+    type: MovementType
+    quantity: Decimal
+    reference: Optional[str] = None
+    note: Optional[str] = None
+    created_by: Optional[int] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StockPostResponse(BaseModel):
+    """Result of recording movements (or checking out a reservation)"""
+    movement_ids: list[int]
+
+
+class StockLevelResponse(BaseModel):
+    """Stock of one product in one warehouse"""
+    product_id: int
+    warehouse_id: int
+    on_hand: Decimal
+    reserved: Decimal
+    available: Decimal
+    is_low: bool
+
+
+# ===== RESERVATIONS =====
+class ReservationLine(BaseModel):
+    product_id: int
+    warehouse_id: int
+    quantity: Decimal = Quantity
+
+
+class ReservationCreate(BaseModel):
+    """
+    Hold stock for a POS cart or sales order. All lines are reserved or none.
+
+    Example:
+    {
+        "reference": "POS-3-000512",
+        "lines": [{"product_id": 1, "warehouse_id": 1, "quantity": "2"}],
+        "expires_in_minutes": 30
+    }
+    """
+    reference: str = Field(..., min_length=1, max_length=100)
+    lines: list[ReservationLine] = Field(..., min_length=1, max_length=500)
+    expires_in_minutes: Optional[int] = Field(None, ge=1, le=60 * 24 * 30)  # Default: RESERVATION_TTL_MINUTES
+
+
+class ReservationResponse(BaseModel):
+    """Reservation in API responses"""
+    id: int
+    product_id: int
+    warehouse_id: int
+    quantity: Decimal
+    reference: Optional[str] = None
+    status: ReservationStatus
+    expires_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ===== ALERTS =====
+class StockAlertResponse(BaseModel):
+    """A product at or below its reorder level in a warehouse"""
+    id: int
+    product_id: int
+    warehouse_id: int
+    available: Decimal
+    reorder_level: Decimal
+    raised_at: datetime
+    resolved_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ===== FORECASTS =====
+class DemandForecastResponse(BaseModel):
+    """Expected sales of a product and the stock to reorder at"""
+    product_id: int
+    generated_at: datetime
+    daily: list[float]  # Expected sales per day, starting the day after generated_at
+    lead_time_demand: Decimal
+    safety_stock: Decimal
+    reorder_point: Decimal
+    error: float
+    history_days: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ForecastRequestResponse(BaseModel):
+    """A forecast queued as a background job"""
+    job_id: int
+    run_at: datetime
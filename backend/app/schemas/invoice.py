@@ -0,0 +1,42 @@
+# app/schemas/invoice.py
+
+"""
+Invoice Schemas
+Input for the invoice PDF renderer (app/services/invoice_pdf_service.py).
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class InvoiceLine(BaseModel):
+    """One line on an invoice"""
+    description: str = Field(..., min_length=1, max_length=200)
+    quantity: Decimal = Field(Decimal("1"), gt=0)
+    unit_price: Decimal
+
+
+class InvoiceDocument(BaseModel):
+    """
+    Everything printed on an invoice except the company header.
+    
+    Example:
+    {
+        "invoice_number": "INV-2025-0001",
+        "issue_date": "2025-01-31",
+        "bill_to_name": "Kedai Runcit Ali",
+        "lines": [{"description": "Consulting", "quantity": 2, "unit_price": "150.00"}]
+    }
+    """
+    invoice_number: str = Field(..., min_length=1, max_length=50)
+    issue_date: date
+    due_date: Optional[date] = None
+    currency: str = Field("MYR", min_length=3, max_length=3)
+    bill_to_name: str = Field(..., min_length=1, max_length=200)
+    bill_to_address: Optional[str] = None
+    bill_to_email: Optional[str] = None
+    lines: list[InvoiceLine] = Field(..., min_length=1, max_length=5000)
+    tax_rate: Decimal = Field(Decimal("0"), ge=0, le=100)  # Percent, e.g. 8 for 8% SST
+    notes: Optional[str] = Field(None, max_length=1000)
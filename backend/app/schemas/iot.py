@@ -0,0 +1,177 @@
+# app/schemas/iot.py
+
+"""
+IoT Schemas
+Sensors, reading batches sent by gateways, rollups read by dashboards and alarm rules.
+"""
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from app.models.alarm import AlarmOperator, AlarmSeverity
+from app.models.iot import RollupPeriod
+
+
+# ===== SENSORS =====
+class SensorCreate(BaseModel):
+    """
+    Schema for registering a sensor
+
+    Example:
+    {
+        "code": "COLD-ROOM-1-TEMP",
+        "name": "Cold room 1 temperature",
+        "kind": "temperature",
+        "unit": "°C",
+        "location": "Warehouse KL"
+    }
+    """
+    code: str = Field(..., min_length=1, max_length=64)
+    name: str = Field(..., min_length=1, max_length=200)
+    kind: str = Field(..., min_length=1, max_length=30)
+    unit: Optional[str] = Field(None, max_length=20)
+    location: Optional[str] = Field(None, max_length=200)
+
+
+class SensorUpdate(BaseModel):
+    """Schema for updating a sensor (all fields optional, the code cannot change)"""
+    name: Optional[str] = Field(None, min_length=1, max_length=200)
+    kind: Optional[str] = Field(None, min_length=1, max_length=30)
+    unit: Optional[str] = Field(None, max_length=20)
+    location: Optional[str] = Field(None, max_length=200)
+    is_active: Optional[bool] = None
+
+
+class SensorResponse(BaseModel):
+    """Sensor in API responses, with its latest reading"""
+    id: int
+    code: str
+    name: str
+    kind: str
+    unit: Optional[str] = None
+    location: Optional[str] = None
+    is_active: bool
+    last_value: Optional[float] = None
+    last_reading_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ===== READINGS =====
+class SensorSeries(BaseModel):
+    """Readings of one sensor: [[unix_seconds, value], ...]"""
+    sensor: str = Field(..., min_length=1, max_length=64)  # Sensor code
+    points: list[tuple[float, float]] = Field(..., min_length=1)
+
+
+class SensorReadingBatch(BaseModel):
+    """
+    Batch sent by a gateway. Timestamps are Unix seconds (UTC, fractions allowed).
+
+    Example:
+    {
+        "series": [
+            {"sensor": "COLD-ROOM-1-TEMP", "points": [[1767225600.0, 3.9], [1767225601.0, 4.0]]},
+            {"sensor": "COLD-ROOM-1-HUM", "points": [[1767225600.0, 81.5]]}
+        ]
+    }
+    """
+    series: list[SensorSeries] = Field(..., min_length=1)
+
+
+class SensorIngestResponse(BaseModel):
+    """
+    accepted: readings queued for writing (stored within IOT_FLUSH_INTERVAL_SECONDS)
+    rejected: readings of unknown/inactive sensors, or with a bad timestamp or value
+    unknown_sensors: codes that are not registered (or inactive) for this company
+    """
+    accepted: int
+    rejected: int
+    unknown_sensors: list[str]
+
+
+# ===== ROLLUPS =====
+class SensorRollupResponse(BaseModel):
+    """Aggregate of one sensor over one bucket"""
+    period: RollupPeriod
+    bucket_start: datetime
+    count: int
+    min: float
+    max: float
+    avg: float
+
+
+# ===== ALARMS =====
+class AlarmRuleCreate(BaseModel):
+    """
+    Schema for creating an alarm rule. Target either one sensor (sensor_id)
+    or every sensor of a kind, optionally at one location.
+
+    Example ("temperature > 60 for 30s at Warehouse KL"):
+    {
+        "name": "Warehouse KL fire",
+        "sensor_kind": "temperature",
+        "location": "Warehouse KL",
+        "operator": "gt",
+        "threshold": 60,
+        "duration_seconds": 30,
+        "severity": "critical"
+    }
+    """
+    name: str = Field(..., min_length=1, max_length=200)
+    sensor_id: Optional[int] = None
+    sensor_kind: Optional[str] = Field(None, min_length=1, max_length=30)
+    location: Optional[str] = Field(None, max_length=200)
+    operator: AlarmOperator
+    threshold: float
+    duration_seconds: int = Field(0, ge=0, le=86400)
+    severity: AlarmSeverity = AlarmSeverity.WARNING
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if (self.sensor_id is None) == (self.sensor_kind is None):
+            raise ValueError("Set either sensor_id or sensor_kind")
+        if self.sensor_id is not None and self.location is not None:
+            raise ValueError("location only applies to sensor_kind rules")
+        return self
+
+
+class AlarmRuleUpdate(BaseModel):
+    """Schema for updating a rule (the target cannot change)"""
+    name: Optional[str] = Field(None, min_length=1, max_length=200)
+    operator: Optional[AlarmOperator] = None
+    threshold: Optional[float] = None
+    duration_seconds: Optional[int] = Field(None, ge=0, le=86400)
+    severity: Optional[AlarmSeverity] = None
+    is_active: Optional[bool] = None
+
+
+class AlarmRuleResponse(BaseModel):
+    """Alarm rule in API responses"""
+    id: int
+    name: str
+    sensor_id: Optional[int] = None
+    sensor_kind: Optional[str] = None
+    location: Optional[str] = None
+    operator: AlarmOperator
+    threshold: float
+    duration_seconds: int
+    severity: AlarmSeverity
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AlarmResponse(BaseModel):
+    """Alarm in API responses and on the alarm stream (open while resolved_at is null)"""
+    id: int
+    rule_id: int
+    sensor_id: int
+    severity: AlarmSeverity
+    value: float
+    raised_at: datetime
+    resolved_at: Optional[datetime] = None
+    acknowledged_at: Optional[datetime] = None
+    acknowledged_by: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
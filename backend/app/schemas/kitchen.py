@@ -0,0 +1,54 @@
+# app/schemas/kitchen.py
+
+"""
+Kitchen Display Schemas
+Tickets sent from the POS to kitchen stations.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from app.models.kitchen import TicketStatus
+
+
+class KitchenTicketItem(BaseModel):
+    name: str = Field(..., min_length=1, max_length=255)
+    quantity: Decimal = Field(Decimal("1"), gt=0, max_digits=10, decimal_places=3)
+    note: Optional[str] = Field(None, max_length=255)  # e.g. "no onions"
+
+
+class KitchenTicketCreate(BaseModel):
+    """
+    Schema for sending an order to a station
+
+    Example:
+    {
+        "station": "grill",
+        "order_reference": "T3-000512",
+        "table_label": "T12",
+        "items": [{"name": "Chicken Chop", "quantity": "2", "note": "well done"}]
+    }
+    """
+    station: str = Field(..., min_length=1, max_length=30)
+    order_reference: str = Field(..., min_length=1, max_length=50)
+    table_label: Optional[str] = Field(None, max_length=30)
+    items: list[KitchenTicketItem] = Field(..., min_length=1, max_length=100)
+
+
+class KitchenTicketStatusUpdate(BaseModel):
+    status: TicketStatus
+
+
+class KitchenTicketResponse(BaseModel):
+    """Ticket in API responses and stream events"""
+    id: int
+    station: str
+    order_reference: str
+    table_label: Optional[str] = None
+    items: list[KitchenTicketItem]
+    status: TicketStatus
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
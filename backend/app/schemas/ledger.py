@@ -0,0 +1,92 @@
+# app/schemas/ledger.py
+
+"""
+Ledger Schemas
+Chart of accounts, journal postings and balances.
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from app.models.account import AccountType
+
+
+# ===== ACCOUNTS =====
+class AccountCreate(BaseModel):
+    """Schema for adding an account to the chart of accounts"""
+    code: str = Field(..., min_length=1, max_length=20)
+    name: str = Field(..., min_length=1, max_length=255)
+    type: AccountType
+    parent_id: Optional[int] = None
+
+
+class AccountResponse(BaseModel):
+    """Account in API responses"""
+    id: int
+    code: str
+    name: str
+    type: AccountType
+    parent_id: Optional[int] = None
+    is_active: bool
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ===== JOURNAL =====
+class JournalLineCreate(BaseModel):
+    """One debit or credit. Exactly one of debit / credit must be set."""
+    account_id: int
+    debit: Decimal = Field(Decimal("0"), ge=0, decimal_places=2)
+    credit: Decimal = Field(Decimal("0"), ge=0, decimal_places=2)
+    cost_center: Optional[str] = Field(None, max_length=50)
+    description: Optional[str] = Field(None, max_length=255)
+    
+    @model_validator(mode="after")
+    def one_side_only(self):
+        if (self.debit > 0) == (self.credit > 0):
+            raise ValueError("Each line needs either a debit or a credit amount")
+        return self
+
+
+class JournalEntryCreate(BaseModel):
+    """
+    A balanced journal entry.
+    
+    Example:
+    {
+        "entry_date": "2025-01-31",
+        "reference": "INV-2025-000123",
+        "lines": [
+            {"account_id": 1, "debit": "108.00"},
+            {"account_id": 7, "credit": "100.00"},
+            {"account_id": 9, "credit": "8.00"}
+        ]
+    }
+    """
+    entry_date: date
+    reference: Optional[str] = Field(None, max_length=100)
+    description: Optional[str] = None
+    lines: list[JournalLineCreate] = Field(..., min_length=2, max_length=1000)
+    
+    @model_validator(mode="after")
+    def balanced(self):
+        debits = sum(line.debit for line in self.lines)
+        credits = sum(line.credit for line in self.lines)
+        if debits != credits:
+            raise ValueError(f"Entry does not balance: debits {debits} != credits {credits}")
+        return self
+
+
+class JournalPostResponse(BaseModel):
+    """Result of posting one or more entries"""
+    entry_ids: list[int]
+    line_count: int
+
+
+class AccountBalanceResponse(BaseModel):
+    """Balance of an account at the end of a day"""
+    account_id: int
+    as_of: date
+    balance: Decimal  # Debit positive, credit negative
+    normal_balance: Decimal  # Sign flipped for credit-normal accounts (liability, equity, income)
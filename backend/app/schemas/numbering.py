@@ -0,0 +1,26 @@
+# app/schemas/numbering.py
+
+"""
+Document Numbering Schemas
+"""
+
+from pydantic import BaseModel, ConfigDict, Field
+from app.models.document_sequence import DocumentType
+
+
+class DocumentSequenceUpdate(BaseModel):
+    """Change how a document type is numbered (applies to the current and future years)"""
+    prefix: str = Field(..., min_length=1, max_length=20, pattern=r"^[A-Za-z0-9/_-]+$")
+    padding: int = Field(6, ge=1, le=12)
+
+
+class DocumentSequenceResponse(BaseModel):
+    """A numbering sequence in API responses"""
+    document_type: DocumentType
+    year: int
+    prefix: str
+    padding: int
+    next_value: int
+    gap_free: bool
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,95 @@
+# app/schemas/pos.py
+
+"""
+POS Sync Schemas
+Batch upload of offline sales and the catalog delta sent back, and the
+fraud scores of uploaded sales.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from app.schemas.catalog import CatalogItemResponse
+
+
+class PosSaleLineCreate(BaseModel):
+    product_id: int
+    quantity: Decimal = Field(..., gt=0, max_digits=14, decimal_places=3)
+    unit_price: Decimal = Field(..., ge=0, decimal_places=2)
+    discount: Decimal = Field(Decimal("0"), ge=0, decimal_places=2)  # For the whole line
+
+
+class PosSaleCreate(BaseModel):
+    """
+    One sale recorded by a terminal (possibly while offline).
+
+    Example:
+    {
+        "idempotency_key": "5f0c1d7e-8a3b-4c55-9e61-2b7f0d9a1c42",
+        "terminal_code": "KL-01-T3",
+        "receipt_number": "T3-000512",
+        "warehouse_id": 1,
+        "sold_at": "2026-03-01T12:30:05+08:00",
+        "payment_method": "card",
+        "lines": [{"product_id": 1, "quantity": "2", "unit_price": "9.90"}]
+    }
+    """
+    idempotency_key: str = Field(..., min_length=8, max_length=64)
+    terminal_code: str = Field(..., min_length=1, max_length=50)
+    receipt_number: str = Field(..., min_length=1, max_length=50)
+    warehouse_id: int
+    sold_at: datetime
+    payment_method: str = Field("cash", min_length=1, max_length=30)
+    lines: list[PosSaleLineCreate] = Field(..., min_length=1, max_length=500)
+
+
+class PosSyncRequest(BaseModel):
+    """
+    Upload queued sales and ask for catalog changes since `cursor`.
+    Send no cursor on the first sync to receive the whole catalog.
+    """
+    cursor: Optional[str] = Field(None, max_length=200)
+    sales: list[PosSaleCreate] = []
+
+
+class PosSyncRejected(BaseModel):
+    """A sale that could not be stored (it will never be accepted - don't retry)"""
+    idempotency_key: str
+    reason: str
+
+
+class PosSyncResponse(BaseModel):
+    """
+    accepted / duplicates: keys the terminal can delete from its queue
+    products / removed_product_ids: catalog changes since the request cursor
+    cursor: send it with the next sync; if has_more, sync again right away
+    """
+    accepted: list[str]
+    duplicates: list[str]
+    rejected: list[PosSyncRejected]
+    cursor: str
+    has_more: bool
+    products: list[CatalogItemResponse]
+    removed_product_ids: list[int]
+
+
+# ===== FRAUD REVIEW =====
+class FraudScoreResponse(BaseModel):
+    """A sale's fraud score and the features it was computed from"""
+    id: int
+    sale_id: int
+    score: float
+    model_version: str
+    features: dict[str, float]
+    deferred: bool
+    scored_at: datetime
+    is_fraud: Optional[bool] = None
+    reviewed_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class FraudReview(BaseModel):
+    """Reviewer's verdict on a flagged sale (used to retrain the model)"""
+    is_fraud: bool
@@ -0,0 +1,108 @@
+# app/schemas/screening.py
+
+"""
+Screening Schemas
+Sharia-compliance rules, the violations they find and sweep requests.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from app.models.screening import ScreeningRuleKind, ScreeningSource
+
+
+Terms = Field(default_factory=list, max_length=100)
+
+
+class ScreeningRuleCreate(BaseModel):
+    """
+    Schema for adding a screening rule. A line matches when its account
+    (or product) matches any of the codes, categories or keywords.
+
+    Examples:
+    {"name": "No riba", "kind": "prohibited_account", "keywords": ["interest", "riba"]}
+    {"name": "No alcohol", "kind": "prohibited_category", "categories": ["Alcohol"], "keywords": ["beer"]}
+    {"name": "Gharar limit", "kind": "amount_limit", "account_codes": ["2950"], "max_amount": "10000.00"}
+    """
+    name: str = Field(..., min_length=1, max_length=200)
+    kind: ScreeningRuleKind
+    account_codes: list[str] = Terms  # Code prefixes
+    categories: list[str] = Terms
+    keywords: list[str] = Terms
+    max_amount: Optional[Decimal] = Field(None, ge=0, max_digits=16, decimal_places=2)
+
+    @model_validator(mode="after")
+    def check_terms(self):
+        check_rule_terms(self.kind, self.account_codes, self.categories, self.keywords, self.max_amount)
+        return self
+
+
+class ScreeningRuleUpdate(BaseModel):
+    """Schema for updating a rule (the kind cannot change)"""
+    name: Optional[str] = Field(None, min_length=1, max_length=200)
+    account_codes: Optional[list[str]] = Field(None, max_length=100)
+    categories: Optional[list[str]] = Field(None, max_length=100)
+    keywords: Optional[list[str]] = Field(None, max_length=100)
+    max_amount: Optional[Decimal] = Field(None, ge=0, max_digits=16, decimal_places=2)
+    is_active: Optional[bool] = None
+
+
+def check_rule_terms(
+    kind: ScreeningRuleKind,
+    account_codes: list[str],
+    categories: list[str],
+    keywords: list[str],
+    max_amount,
+) -> None:
+    """
+    Raises:
+        ValueError: The terms don't fit the rule kind
+    """
+    if any(not term.strip() for term in (*account_codes, *categories, *keywords)):
+        raise ValueError("Codes, categories and keywords cannot be blank")
+    if kind == ScreeningRuleKind.PROHIBITED_CATEGORY:
+        if account_codes:
+            raise ValueError("Category rules match products: use categories or keywords")
+        if not (categories or keywords):
+            raise ValueError("Set categories or keywords")
+    else:
+        if categories:
+            raise ValueError("Account rules match accounts: use account_codes or keywords")
+        if not (account_codes or keywords):
+            raise ValueError("Set account_codes or keywords")
+    if (kind == ScreeningRuleKind.AMOUNT_LIMIT) != (max_amount is not None):
+        raise ValueError("max_amount is required for (and only for) amount_limit rules")
+
+
+class ScreeningRuleResponse(BaseModel):
+    """Screening rule in API responses"""
+    id: int
+    name: str
+    kind: ScreeningRuleKind
+    account_codes: list[str]
+    categories: list[str]
+    keywords: list[str]
+    max_amount: Optional[Decimal] = None
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class ScreeningViolationResponse(BaseModel):
+    """A journal entry or POS sale that broke a rule"""
+    id: int
+    rule_id: int
+    source: ScreeningSource
+    document_id: int  # Journal entry ID or POS sale ID
+    occurred_on: date
+    amount: Decimal  # Offending lines, absolute values
+    line_count: int
+    found_by: str
+    detected_at: datetime
+
+
+class ScreeningSweepResponse(BaseModel):
+    """A sweep queued as a background job"""
+    job_id: int
+    run_at: datetime
@@ -124,15 +124,67 @@ class Token(BaseModel):
     token_type: str = "bearer"
 
 
+# ===== COMPANY SWITCH RESPONSE SCHEMA =====
+class CompanySelectResponse(Token):
+    """
+    Schema for switching the active company.
+    
+    Used in: POST /api/v1/companies/select
+    
+    The new access token carries the selected company, so the client
+    must replace its stored token with this one.
+    
+    Example response:
+    {
+        "access_token": "eyJhbGciOiJIUzI1NiIsInR5...",
+        "token_type": "bearer",
+        "user": { ...UserResponse with current_company_id set... }
+    }
+    """
+    user: UserResponse
+
+
 # ===== TOKEN DATA SCHEMA =====
 class TokenData(BaseModel):
     """
     Schema for data stored inside JWT token.
     
-    The token contains the user's email.
+    The token contains the user's email and, after a company switch,
+    the selected company.
     When we decode the token, we get this data.
     """
     email: Optional[str] = None
+    company_id: Optional[int] = None
+    company_name: Optional[str] = None
+
+
+# ===== EMAIL VERIFICATION & PASSWORD RESET SCHEMAS =====
+class EmailVerify(BaseModel):
+    """
+    Schema for confirming an email address.
+    
+    Used in: POST /api/v1/auth/verify-email
+    """
+    token: str
+
+
+class EmailRequest(BaseModel):
+    """
+    Schema for endpoints that only need an email address.
+    
+    Used in: POST /api/v1/auth/password-reset/request, POST /api/v1/auth/verify-email/resend
+    """
+    email: EmailStr
+
+
+class PasswordResetConfirm(BaseModel):
+    """
+    Schema for setting a new password from a reset link.
+    
+    Used in: POST /api/v1/auth/password-reset/confirm
+    """
+    token: str
+    new_password: str = Field(..., min_length=8, max_length=100)
 
 
 # ===== USER UPDATE SCHEMA =====
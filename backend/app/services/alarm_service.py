@@ -0,0 +1,458 @@
+# app/services/alarm_service.py
+
+"""
+Alarm Service
+Rules such as "temperature > 60 for 30s at Warehouse KL -> critical alarm",
+checked against every reading as it is uploaded.
+
+Rules are compiled per company into evaluators indexed by sensor id (a
+rule on a sensor kind gets one evaluator per matching sensor). Each
+evaluator keeps its window state in memory: since when the condition has
+held, and whether its alarm is raised. An upload is checked before it
+is buffered (app/services/iot_service.py ingest):
+
+1. Readings of sensors without rules are dropped with one sorted lookup
+2. The rest are paired with the evaluators of their sensor and compared
+   to the thresholds in a few NumPy operations
+3. Only evaluators whose state can change (condition met, or a window or
+   alarm already open) are stepped through their readings in order
+4. Raised / resolved alarms are stored and pushed on the event broker,
+   topic (company_id, "alarms"), in the same request - milliseconds after
+   the reading arrived, independent of the raw reading flush
+
+Compiled rules are rebuilt after rule or sensor changes (invalidation bus,
+cache name "alarm_rules"). Evaluators of unchanged rules keep their state;
+new evaluators start from the open alarms stored in the database, so a
+restart does not raise the same alarm twice.
+
+State is per process: readings of a sensor must be uploaded to the same
+worker (as for the event stream).
+"""
+
+import math
+import threading
+from datetime import datetime, timezone
+from typing import Hashable, Optional
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+from app.core import cache
+from app.core.event_stream import TopicKey, broker
+from app.core.invalidation import publish
+from app.core.permissions import Permission
+from app.database import SessionLocal
+from app.models.alarm import Alarm, AlarmOperator, AlarmRule
+from app.models.iot import Sensor
+from app.schemas.iot import AlarmResponse, AlarmRuleCreate, AlarmRuleUpdate
+from app.services.audit_service import diff_changes, record_audit, snapshot
+
+
+def topic(company_id: int) -> TopicKey:
+    """Event broker topic of a company's alarm screens."""
+    return (company_id, "alarms")
+
+
+# ===== COMPILED RULES =====
+OPERATORS = list(AlarmOperator)  # Position = operator code in CompiledRules.operators
+
+
+class CompiledRules:
+    """
+    A company's active rules as evaluators, one per (rule, sensor).
+
+    Rule settings and window state are parallel arrays, with the evaluators
+    of each sensor next to each other, so an upload is matched against every
+    rule with a few array operations. Only evaluators whose state can change
+    (condition met, or a window or alarm already open) are then stepped
+    through their readings one at a time - usually a handful per upload.
+
+    Readings older than an evaluator's last one are ignored (re-sent batches,
+    late gateways), so its state only moves forward in time.
+    """
+
+    def __init__(self, targets: list[tuple], lock: Optional[threading.Lock] = None):
+        """
+        Args:
+            targets: (sensor_id, rule_id, operator, threshold, duration_seconds, severity)
+                     sorted by sensor_id
+        """
+        self.targets = targets
+        count = len(targets)
+        columns = list(zip(*targets)) if targets else [()] * 6
+        self.sensor_of = np.array(columns[0], dtype=np.int64)
+        self.rule_ids = np.array(columns[1], dtype=np.int64)
+        self.operators = np.array([OPERATORS.index(op) for op in columns[2]], dtype=np.int8)
+        self.thresholds = np.array(columns[3], dtype=np.float64)
+        self.durations = np.array(columns[4], dtype=np.float64)
+        # Window state
+        self.since = np.full(count, np.nan)  # Start of the current run of readings meeting the condition
+        self.firing = np.zeros(count, dtype=bool)  # Alarm raised and not resolved
+        self.last_at = np.full(count, -np.inf)
+        # Evaluators of sensor_ids[i] are offsets[i] .. offsets[i + 1] - 1
+        self.sensor_ids, first = np.unique(self.sensor_of, return_index=True)
+        self.offsets = np.append(first, count)
+        # Uploads of one company may run concurrently. Shared with the next
+        # compile, which takes over this state
+        self.lock = lock or threading.Lock()
+        self.stale = False
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def feed(self, sensor_ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> list[tuple]:
+        """
+        Apply an upload to every evaluator of its sensors.
+
+        Returns:
+            [(rule_id, sensor_id, severity, raised, time, value)] - raised=True
+            for a new alarm, False when the readings went back to normal
+        """
+        if not len(self.sensor_ids) or not len(sensor_ids):
+            return []
+        positions = np.minimum(np.searchsorted(self.sensor_ids, sensor_ids), len(self.sensor_ids) - 1)
+        watched = self.sensor_ids[positions] == sensor_ids
+        if not watched.any():
+            return []
+        positions, times, values = positions[watched], times[watched], values[watched]
+        order = np.lexsort((times, positions))
+        positions, times, values = positions[order], times[order], values[order]
+
+        # One pair per (reading, evaluator of its sensor), in time order per evaluator
+        counts = self.offsets[positions + 1] - self.offsets[positions]
+        reading = np.repeat(np.arange(len(positions)), counts)
+        evaluator = np.arange(len(reading)) + np.repeat(self.offsets[positions] - (np.cumsum(counts) - counts), counts)
+        at, value = times[reading], values[reading]
+        operator, threshold = self.operators[evaluator], self.thresholds[evaluator]
+        met = np.select(
+            [operator == 0, operator == 1, operator == 2],
+            [value > threshold, value >= threshold, value < threshold],
+            value <= threshold,
+        )
+        with self.lock:
+            fresh = at > self.last_at[evaluator]
+            opened = ~np.isnan(self.since[evaluator]) | self.firing[evaluator]
+            moving = np.unique(evaluator[fresh & (met | opened)])
+            transitions = []
+            if len(moving):
+                step = fresh & np.isin(evaluator, moving)
+                transitions = self._step(evaluator[step].tolist(), at[step].tolist(), value[step].tolist(), met[step].tolist())
+            # Pairs are in time order: the last write per evaluator is its newest reading
+            self.last_at[evaluator] = np.maximum(self.last_at[evaluator], at)
+        return transitions
+
+    def _step(self, evaluators: list[int], times: list[float], values: list[float], met: list[bool]) -> list[tuple]:
+        """Advance "condition held for duration seconds" one reading at a time."""
+        since, firing, durations, targets = self.since, self.firing, self.durations, self.targets
+        transitions = []
+        for index, at, value, ok in zip(evaluators, times, values, met):
+            if ok:
+                if math.isnan(since[index]):
+                    since[index] = at
+                if not firing[index] and at - since[index] >= durations[index]:
+                    firing[index] = True
+                    sensor_id, rule_id, _, _, _, severity = targets[index]
+                    transitions.append((rule_id, sensor_id, severity, True, at, value))
+            else:
+                since[index] = np.nan
+                if firing[index]:
+                    firing[index] = False
+                    sensor_id, rule_id, _, _, _, severity = targets[index]
+                    transitions.append((rule_id, sensor_id, severity, False, at, value))
+        return transitions
+
+
+class AlarmEngine:
+    """
+    Compiled rules of every company, built on first use.
+
+    Registered in cache.CACHES as "alarm_rules": the invalidation bus calls
+    delete(company_id) after a rule or sensor change, and clear() after a
+    reconnect.
+    """
+
+    name = "alarm_rules"
+
+    def __init__(self):
+        self._companies: dict[int, CompiledRules] = {}
+        self._lock = threading.Lock()
+        self.compiles = 0
+        self.raised = 0
+        self.resolved = 0
+
+    # ----- Cache interface -----
+    def delete(self, key: Hashable) -> None:
+        compiled = self._companies.get(key)
+        if compiled is not None:
+            compiled.stale = True
+
+    def clear(self) -> None:
+        for compiled in list(self._companies.values()):
+            compiled.stale = True
+
+    def __len__(self) -> int:
+        return len(self._companies)
+
+    # ----- Access -----
+    def get(self, db: Session, company_id: int) -> CompiledRules:
+        """The company's compiled rules, rebuilt if they changed."""
+        compiled = self._companies.get(company_id)
+        if compiled is None or compiled.stale:
+            with self._lock:
+                compiled = self._companies.get(company_id)
+                if compiled is None or compiled.stale:
+                    compiled = self._compile(db, company_id, compiled)
+                    self._companies[company_id] = compiled
+        return compiled
+
+    def _compile(self, db: Session, company_id: int, previous: Optional[CompiledRules]) -> CompiledRules:
+        rules = db.execute(
+            select(
+                AlarmRule.id, AlarmRule.sensor_id, AlarmRule.sensor_kind, AlarmRule.location,
+                AlarmRule.operator, AlarmRule.threshold, AlarmRule.duration_seconds, AlarmRule.severity,
+            )
+            .where(AlarmRule.company_id == company_id, AlarmRule.is_active.is_(True))
+        ).all()
+        sensors = db.execute(
+            select(Sensor.id, Sensor.kind, Sensor.location)
+            .where(Sensor.company_id == company_id, Sensor.is_active.is_(True))
+        ).all()
+        by_kind: dict[str, list[int]] = {}
+        by_site: dict[tuple[str, Optional[str]], list[int]] = {}
+        for sensor in sensors:
+            by_kind.setdefault(sensor.kind, []).append(sensor.id)
+            by_site.setdefault((sensor.kind, sensor.location), []).append(sensor.id)
+        active_ids = {sensor.id for sensor in sensors}
+
+        targets = []
+        for rule in rules:
+            if rule.sensor_id is not None:
+                sensor_ids = [rule.sensor_id] if rule.sensor_id in active_ids else []
+            elif rule.location is None:
+                sensor_ids = by_kind.get(rule.sensor_kind, [])
+            else:
+                sensor_ids = by_site.get((rule.sensor_kind, rule.location), [])
+            condition = (rule.operator, rule.threshold, rule.duration_seconds, rule.severity)
+            targets.extend((sensor_id, rule.id, *condition) for sensor_id in sensor_ids)
+        targets.sort(key=lambda target: (target[0], target[1]))
+        compiled = CompiledRules(targets, previous.lock if previous is not None else None)
+
+        # Unchanged evaluators keep their state, the others resume from open alarms
+        index = {(target[1], target[0]): position for position, target in enumerate(targets)}
+        kept = set()
+        if previous is not None:
+            with previous.lock:
+                for old, target in enumerate(previous.targets):
+                    position = index.get((target[1], target[0]))
+                    if position is not None and targets[position][2:] == target[2:]:
+                        compiled.since[position] = previous.since[old]
+                        compiled.firing[position] = previous.firing[old]
+                        compiled.last_at[position] = previous.last_at[old]
+                        kept.add(position)
+        if len(kept) < len(targets):
+            for rule_id, sensor_id, raised_at in db.execute(
+                select(Alarm.rule_id, Alarm.sensor_id, Alarm.raised_at)
+                .where(Alarm.company_id == company_id, Alarm.resolved_at.is_(None))
+            ):
+                position = index.get((rule_id, sensor_id))
+                if position is not None and position not in kept:
+                    compiled.firing[position] = True
+                    compiled.since[position] = _as_utc(raised_at).timestamp()
+        self.compiles += 1
+        return compiled
+
+    def stats(self) -> dict:
+        return {
+            "companies": len(self._companies),
+            "evaluators": sum(len(compiled) for compiled in list(self._companies.values())),
+            "compiles": self.compiles,
+            "raised": self.raised,
+            "resolved": self.resolved,
+        }
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # SQLite returns naive UTC datetimes
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+# Single engine per process
+alarm_engine = AlarmEngine()
+cache.CACHES[alarm_engine.name] = alarm_engine
+
+
+# ===== EVALUATION =====
+def evaluate(db: Session, company_id: int, sensor_ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> list[Alarm]:
+    """
+    Check readings against the company's rules; store and push alarm changes.
+
+    Returns:
+        Alarms raised or resolved by these readings
+    """
+    transitions = alarm_engine.get(db, company_id).feed(sensor_ids, times, values)
+    if not transitions:
+        return []
+    return record_transitions(db, company_id, transitions)
+
+
+def record_transitions(db: Session, company_id: int, transitions: list[tuple]) -> list[Alarm]:
+    """Store raised / resolved alarms (see CompiledRules.feed), then push them to alarm screens."""
+    resolving = {(rule_id, sensor_id) for rule_id, sensor_id, _, raised, _, _ in transitions if not raised}
+    open_alarms: dict[tuple[int, int], Alarm] = {}
+    if resolving:
+        open_alarms = {
+            (alarm.rule_id, alarm.sensor_id): alarm
+            for alarm in db.scalars(
+                select(Alarm).where(
+                    Alarm.company_id == company_id,
+                    Alarm.resolved_at.is_(None),
+                    tuple_(Alarm.rule_id, Alarm.sensor_id).in_(resolving),
+                )
+            )
+        }
+    # Raised and resolved within one upload: the second change updates the new row
+    changed: dict[int, Alarm] = {}
+    for rule_id, sensor_id, severity, raised, at, value in transitions:
+        key = (rule_id, sensor_id)
+        moment = datetime.fromtimestamp(at, timezone.utc)
+        if raised:
+            alarm = Alarm(
+                company_id=company_id, rule_id=rule_id, sensor_id=sensor_id,
+                severity=severity, value=value, raised_at=moment,
+            )
+            db.add(alarm)
+            open_alarms[key] = alarm
+            alarm_engine.raised += 1
+        else:
+            alarm = open_alarms.pop(key, None)
+            if alarm is None:
+                continue  # Already resolved elsewhere
+            alarm.resolved_at = moment
+            alarm_engine.resolved += 1
+        changed[id(alarm)] = alarm
+    db.commit()
+    alarms = list(changed.values())
+    for alarm in alarms:
+        db.refresh(alarm)
+        _publish(alarm)
+    return alarms
+
+
+def _publish(alarm: Alarm) -> None:
+    """Push a committed alarm to the company's alarm screens."""
+    data = AlarmResponse.model_validate(alarm).model_dump(mode="json")
+    broker.publish(topic(alarm.company_id), "alarm", data, key=alarm.id, audience=Permission.IOT_VIEW)
+
+
+# ===== RULES =====
+def create_rule(db: Session, company_id: int, rule_data: AlarmRuleCreate, actor_user_id: Optional[int] = None) -> AlarmRule:
+    """
+    Add an alarm rule. It applies to readings uploaded from now on.
+
+    Raises:
+        HTTPException 400: sensor_id is not a sensor of this company
+    """
+    if rule_data.sensor_id is not None and db.scalar(
+        select(Sensor.id).where(Sensor.id == rule_data.sensor_id, Sensor.company_id == company_id)
+    ) is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown sensor {rule_data.sensor_id}"
+        )
+    rule = AlarmRule(company_id=company_id, created_by=actor_user_id, **rule_data.model_dump())
+    db.add(rule)
+    db.flush()
+    record_audit(db, "alarm_rule.created", "alarm_rule", rule.id, company_id=company_id, actor_user_id=actor_user_id)
+    publish(db, alarm_engine.name, company_id)
+    db.commit()
+    db.refresh(rule)
+    return rule
+
+
+def get_rule(db: Session, company_id: int, rule_id: int) -> AlarmRule:
+    """
+    Raises:
+        HTTPException 404: No such rule in this company
+    """
+    rule = db.scalar(select(AlarmRule).where(AlarmRule.id == rule_id, AlarmRule.company_id == company_id))
+    if rule is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Alarm rule not found"
+        )
+    return rule
+
+
+def list_rules(db: Session, company_id: int) -> list[AlarmRule]:
+    return list(db.scalars(select(AlarmRule).where(AlarmRule.company_id == company_id).order_by(AlarmRule.id)))
+
+
+def update_rule(
+    db: Session,
+    company_id: int,
+    rule_id: int,
+    rule_data: AlarmRuleUpdate,
+    actor_user_id: Optional[int] = None,
+) -> AlarmRule:
+    """Change a rule. Changing its condition restarts its evaluation window."""
+    rule = get_rule(db, company_id, rule_id)
+    update_dict = rule_data.model_dump(exclude_unset=True)
+    before = snapshot(rule, update_dict.keys())
+    for field, value in update_dict.items():
+        setattr(rule, field, value)
+    changes = diff_changes(before, snapshot(rule, update_dict.keys()))
+    if changes:
+        record_audit(
+            db, "alarm_rule.updated", "alarm_rule", rule.id,
+            company_id=company_id, actor_user_id=actor_user_id, changes=changes
+        )
+        publish(db, alarm_engine.name, company_id)
+    db.commit()
+    db.refresh(rule)
+    return rule
+
+
+# ===== ALARMS =====
+def list_alarms(db: Session, company_id: int, open_only: bool = True, limit: int = 200) -> list[Alarm]:
+    """Alarms of a company, newest first."""
+    query = select(Alarm).where(Alarm.company_id == company_id)
+    if open_only:
+        query = query.where(Alarm.resolved_at.is_(None))
+    return list(db.scalars(query.order_by(Alarm.id.desc()).limit(limit)))
+
+
+def acknowledge_alarm(db: Session, company_id: int, alarm_id: int, user_id: int) -> Alarm:
+    """
+    Mark an alarm as seen (it stays open until its readings are back to normal).
+
+    Raises:
+        HTTPException 404: No such alarm in this company
+    """
+    alarm = db.scalar(select(Alarm).where(Alarm.id == alarm_id, Alarm.company_id == company_id))
+    if alarm is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Alarm not found"
+        )
+    if alarm.acknowledged_at is None:
+        alarm.acknowledged_at = datetime.now(timezone.utc)
+        alarm.acknowledged_by = user_id
+        record_audit(db, "alarm.acknowledged", "alarm", alarm.id, company_id=company_id, actor_user_id=user_id)
+        db.commit()
+        db.refresh(alarm)
+        _publish(alarm)
+    return alarm
+
+
+def snapshot_open_alarms(company_id: int) -> dict:
+    """
+    Open alarms for a (re)connecting alarm screen.
+
+    Runs outside the request (in a worker thread), so it uses its own session.
+    """
+    db = SessionLocal()
+    try:
+        alarms = list_alarms(db, company_id)
+        return {"alarms": [AlarmResponse.model_validate(alarm).model_dump(mode="json") for alarm in alarms]}
+    finally:
+        db.close()
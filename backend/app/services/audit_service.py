@@ -0,0 +1,323 @@
+# app/services/audit_service.py
+
+"""
+Audit Service
+Records who changed what without adding a database write to every request.
+
+How it works (AUDIT_DURABILITY = "buffered", the default):
+1. The service layer calls record_audit(db, ...) next to its change
+2. When that session commits, the event moves into an in-memory ring buffer
+   (rolled-back changes are never audited)
+3. A background thread (AuditFlusher) writes the buffer every
+   AUDIT_FLUSH_INTERVAL_SECONDS using COPY (PostgreSQL) or a multi-row INSERT
+
+The buffer is bounded (AUDIT_BUFFER_SIZE): if the database is down for long,
+the oldest events are dropped and counted instead of exhausting memory.
+
+With AUDIT_DURABILITY = "sync" the audit row is written in the caller's
+transaction instead - slower, but it commits or fails together with the change.
+"""
+
+import csv
+import io
+import json
+import threading
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Optional
+from sqlalchemy import event, insert, select, text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal, engine
+from app.models.audit_log import AuditLog
+
+
+_PENDING_KEY = "pending_audit_events"
+
+# Address of the client whose request is being handled (set by the API
+# middleware in main.py; None in jobs and background threads)
+client_ip: ContextVar[Optional[str]] = ContextVar("audit_client_ip", default=None)
+
+
+# ===== DIFF HELPERS =====
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def snapshot(obj: Any, fields: Iterable[str]) -> dict:
+    """
+    Copy selected attributes of a model into a plain dict.
+
+    Example:
+        before = snapshot(company, update_dict.keys())
+    """
+    return {field: _json_safe(getattr(obj, field, None)) for field in fields}
+
+
+def diff_changes(before: dict, after: dict) -> dict:
+    """
+    Compare two snapshots.
+
+    Returns:
+        {"field": [old, new]} for every field whose value changed
+    """
+    return {
+        field: [before.get(field), after.get(field)]
+        for field in after
+        if before.get(field) != after.get(field)
+    }
+
+
+# ===== RING BUFFER =====
+class AuditBuffer:
+    """Bounded, thread-safe queue of audit rows waiting to be written."""
+
+    def __init__(self, maxsize: int = settings.AUDIT_BUFFER_SIZE):
+        self._events: deque = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def extend(self, rows: list[dict]) -> None:
+        with self._lock:
+            overflow = len(self._events) + len(rows) - self._events.maxlen
+            if overflow > 0:
+                self.dropped += overflow
+            self._events.extend(rows)
+
+    def drain(self, limit: int) -> list[dict]:
+        with self._lock:
+            count = min(limit, len(self._events))
+            return [self._events.popleft() for _ in range(count)]
+
+    def requeue(self, rows: list[dict]) -> None:
+        """Put rows back at the front after a failed write (dropping if full)."""
+        with self._lock:
+            space = self._events.maxlen - len(self._events)
+            if len(rows) > space:
+                self.dropped += len(rows) - space
+                rows = rows[len(rows) - space:] if space else []
+            self._events.extendleft(reversed(rows))
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+buffer = AuditBuffer()
+
+
+# ===== RECORDING =====
+def record_audit(
+    db: Optional[Session],
+    action: str,
+    entity_type: Optional[str] = None,
+    entity_id: Any = None,
+    company_id: Optional[int] = None,
+    actor_user_id: Optional[int] = None,
+    changes: Optional[dict] = None,
+    ip_address: Optional[str] = None,
+) -> None:
+    """
+    Record an audit event.
+
+    Args:
+        db: Session making the change. The event is kept only if it commits.
+            Pass None for events with no transaction (e.g. logins).
+        action: What happened, e.g. "company.updated"
+        entity_type / entity_id: What it happened to
+        company_id: Tenant
+        actor_user_id: Who did it
+        changes: {"field": [before, after]} (see diff_changes)
+        ip_address: Client address (default: the current request's)
+    """
+    row = {
+        "id": uuid.uuid4(),
+        "occurred_at": datetime.now(timezone.utc),
+        "company_id": company_id,
+        "actor_user_id": actor_user_id,
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": None if entity_id is None else str(entity_id),
+        "changes": changes,
+        "ip_address": ip_address or client_ip.get(),
+    }
+
+    if db is None:
+        buffer.extend([row])
+    elif settings.AUDIT_DURABILITY == "sync":
+        ensure_partition(row["occurred_at"])
+        db.add(AuditLog(**row))
+    else:
+        db.info.setdefault(_PENDING_KEY, []).append(row)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _buffer_committed(session: Session) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        buffer.extend(rows)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ===== QUERIES =====
+def get_company_audit_log(
+    db: Session,
+    company_id: int,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    action: Optional[str] = None,
+    limit: int = 100,
+) -> list[AuditLog]:
+    """
+    Newest audit events of a company.
+
+    Always pass a time range for large tenants: `occurred_at` bounds let
+    PostgreSQL skip every monthly partition outside the range.
+    """
+    query = select(AuditLog).where(AuditLog.company_id == company_id)
+    if since is not None:
+        query = query.where(AuditLog.occurred_at >= since)
+    if until is not None:
+        query = query.where(AuditLog.occurred_at < until)
+    if action is not None:
+        query = query.where(AuditLog.action == action)
+    return list(db.scalars(query.order_by(AuditLog.occurred_at.desc()).limit(limit)))
+
+
+# ===== PARTITIONS =====
+_ensured_months: set[tuple[int, int]] = set()
+
+
+def ensure_partition(moment: datetime) -> None:
+    """
+    Create the monthly partition for `moment` if it does not exist (PostgreSQL only).
+    
+    Runs in its own short transaction so the partition exists even if the
+    caller's transaction later rolls back.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    month = (moment.year, moment.month)
+    if month in _ensured_months:
+        return
+    start = date(moment.year, moment.month, 1)
+    end = date(moment.year + (moment.month == 12), moment.month % 12 + 1, 1)
+    try:
+        with engine.begin() as connection:
+            connection.execute(text(
+                f"CREATE TABLE IF NOT EXISTS audit_log_y{start.year}m{start.month:02d} "
+                f"PARTITION OF audit_log FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+    except Exception as exc:
+        # Another worker may have created it at the same moment
+        print(f"⚠️  Could not create audit partition {start:%Y-%m}: {exc}")
+        return
+    _ensured_months.add(month)
+
+
+# ===== WRITING =====
+_COLUMNS = ["id", "occurred_at", "company_id", "actor_user_id", "action",
+            "entity_type", "entity_id", "changes", "ip_address"]
+
+
+def _copy_rows(connection, rows: list[dict]) -> None:
+    """Write rows with PostgreSQL COPY (fastest bulk load)."""
+    data = io.StringIO()
+    writer = csv.writer(data)
+    for row in rows:
+        writer.writerow([
+            "" if row[column] is None else (
+                json.dumps(row[column]) if column == "changes" else
+                row[column].isoformat() if column == "occurred_at" else row[column]
+            )
+            for column in _COLUMNS
+        ])
+    data.seek(0)
+    with connection.connection.driver_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY audit_log ({', '.join(_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", data
+        )
+
+
+def write_rows(rows: list[dict]) -> None:
+    """Write audit rows in one transaction (COPY on PostgreSQL, multi-row INSERT elsewhere)."""
+    if not rows:
+        return
+    for year, month in {(row["occurred_at"].year, row["occurred_at"].month) for row in rows}:
+        ensure_partition(datetime(year, month, 1))
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            _copy_rows(connection, rows)
+        else:
+            connection.execute(insert(AuditLog), rows)
+
+
+class AuditFlusher:
+    """Background thread that empties the audit buffer into the database."""
+
+    def __init__(self, interval: float = settings.AUDIT_FLUSH_INTERVAL_SECONDS):
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.written = 0
+        self.failures = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and write whatever is still buffered."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        """Write everything currently buffered. Returns rows written."""
+        total = 0
+        while len(buffer):
+            rows = buffer.drain(settings.AUDIT_FLUSH_BATCH)
+            try:
+                write_rows(rows)
+            except Exception as exc:
+                self.failures += 1
+                buffer.requeue(rows)
+                print(f"⚠️  Audit flush failed ({len(rows)} rows kept in memory): {exc}")
+                break
+            total += len(rows)
+        self.written += total
+        return total
+
+    def stats(self) -> dict:
+        return {
+            "buffered": len(buffer),
+            "written": self.written,
+            "dropped": buffer.dropped,
+            "flush_failures": self.failures,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+
+# Single flusher per process
+flusher = AuditFlusher()
@@ -5,12 +5,16 @@ Authentication Service
 Business logic for user authentication and management.
 """
 
+import hmac
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.user import UserCreate
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import hash_password, verify_password, create_access_token, verify_purpose_token
 from app.services.company_service import create_company_with_owner
+from app.services.email_service import enqueue_verification_email, enqueue_password_reset_email, password_fingerprint
+from app.core.invalidation import publish
+from app.services.audit_service import record_audit
 
 
 # ===== CREATE NEW USER =====
@@ -53,7 +57,7 @@ def create_user(db: Session, user_data: UserCreate) -> tuple[User, int]:
         full_name=user_data.full_name,
         hashed_password=hashed_pwd,
         is_active=True,
-        is_verified=False  # Will implement email verification later
+        is_verified=False  # Verified when the user opens the emailed link
     )
     
     # Add user to database
@@ -72,6 +76,12 @@ def create_user(db: Session, user_data: UserCreate) -> tuple[User, int]:
     db_user.default_company_id = company.id
     db_user.default_company_name = company.display_name
     db.add(db_user)
+    
+    # Queue the verification email (sent by app/email_sender.py, not in this request)
+    enqueue_verification_email(db, db_user)
+    
+    record_audit(db, "user.registered", "user", db_user.id, company_id=company.id, actor_user_id=db_user.id)
+    publish(db, "user", db_user.email)
     db.commit()
     db.refresh(db_user)
     
@@ -106,6 +116,7 @@ def authenticate_user(db: Session, email: str, password: str) -> User:
     
     # Check if user exists
     if not user:
+        record_audit(None, "auth.login_failed", "user", email, changes={"reason": "unknown_email"})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -114,6 +125,7 @@ def authenticate_user(db: Session, email: str, password: str) -> User:
     
     # Verify password
     if not verify_password(password, user.hashed_password):
+        record_audit(None, "auth.login_failed", "user", user.id, actor_user_id=user.id, changes={"reason": "bad_password"})
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -127,6 +139,9 @@ def authenticate_user(db: Session, email: str, password: str) -> User:
             detail="Account is disabled"
         )
     
+    # Logins have no transaction to ride on, so they go straight to the audit buffer
+    record_audit(None, "auth.login", "user", user.id, actor_user_id=user.id)
+    
     return user
 
 
@@ -158,3 +173,77 @@ def get_user_by_id(db: Session, user_id: int) -> User:
         User object or None if not found
     """
     return db.query(User).filter(User.id == user_id).first()
+
+
+# ===== VERIFY EMAIL =====
+def verify_email(db: Session, token: str) -> User:
+    """
+    Mark a user's email as verified using the emailed token.
+    
+    Raises:
+        HTTPException: If the token is invalid or expired
+    """
+    payload = verify_purpose_token(token, "verify_email")
+    user = get_user_by_email(db, payload["sub"]) if payload else None
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired verification link"
+        )
+    
+    if not user.is_verified:
+        user.is_verified = True
+        record_audit(db, "user.email_verified", "user", user.id, actor_user_id=user.id)
+        publish(db, "user", user.email)
+        db.commit()
+        db.refresh(user)
+    
+    return user
+
+
+def resend_verification_email(db: Session, email: str) -> None:
+    """Queue another verification email if the user exists and is not verified yet."""
+    user = get_user_by_email(db, email)
+    if user and not user.is_verified:
+        enqueue_verification_email(db, user)
+        db.commit()
+
+
+# ===== PASSWORD RESET =====
+def request_password_reset(db: Session, email: str) -> None:
+    """
+    Queue a password reset email.
+    
+    Does nothing (and reveals nothing) if the email is unknown.
+    """
+    user = get_user_by_email(db, email)
+    if user and user.is_active:
+        enqueue_password_reset_email(db, user)
+        db.commit()
+
+
+def reset_password(db: Session, token: str, new_password: str) -> User:
+    """
+    Set a new password using a reset token.
+    
+    The token carries a fingerprint of the old password hash,
+    so each link works only once.
+    
+    Raises:
+        HTTPException: If the token is invalid, expired or already used
+    """
+    payload = verify_purpose_token(token, "password_reset")
+    user = get_user_by_email(db, payload["sub"]) if payload else None
+    if user is None or not hmac.compare_digest(str(payload.get("fp", "")), password_fingerprint(user)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired password reset link"
+        )
+    
+    user.hashed_password = hash_password(new_password)
+    record_audit(db, "user.password_reset", "user", user.id, actor_user_id=user.id)
+    publish(db, "user", user.email)
+    db.commit()
+    db.refresh(user)
+    
+    return user
@@ -0,0 +1,467 @@
+# app/services/catalog_service.py
+
+"""
+Catalog Service
+In-process product index for POS scanning and product search.
+
+Each API process keeps one CatalogIndex per company, loaded from the
+products table on first use:
+- Scan:   barcode or SKU -> product (one dict lookup)
+- Prefix: "lat" -> products whose SKU or a name word starts with it
+          (bisect on a sorted list of words)
+- Fuzzy:  "latee" -> "Latte" (trigram similarity, counted with NumPy)
+
+Keeping it fresh without reloading:
+- inventory_service publishes a "product" event for every change
+  (app/core/invalidation.py). The index only marks that product stale and
+  re-reads it on the next lookup.
+- Events can be missed while the bus is disconnected (or on SQLite), so
+  every CACHE_TTL_SECONDS / CACHE_FALLBACK_TTL_SECONDS the index also
+  re-reads products whose updated_at moved past its watermark.
+
+Memory: products are stored as tuples with shared (interned) strings,
+posting lists as int32 arrays. Replaced products leave a dead slot that is
+skipped; the index compacts itself when a quarter of the slots are dead.
+Whole companies are evicted when idle for CATALOG_IDLE_SECONDS (checked
+on access, at most every IDLE_CHECK_SECONDS) or, least recently used
+first, when CATALOG_MAX_ITEMS is exceeded.
+"""
+
+import bisect
+import heapq
+import re
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from typing import Hashable, Iterable, NamedTuple, Optional, Union
+import numpy as np
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+from app.core import cache
+from app.core.config import settings
+from app.models.product import Product
+
+
+FUZZY_THRESHOLD = 0.5  # Share of the query's trigrams a name must contain
+IDLE_CHECK_SECONDS = 30  # Longest gap between two looks for idle companies
+
+_WORD = re.compile(r"[0-9a-z]+")
+
+
+class CatalogItem(NamedTuple):
+    id: int
+    sku: str
+    barcode: Optional[str]
+    name: str
+    category: Optional[str]
+    unit: str
+    price: int  # Sen
+
+
+# ===== TEXT HELPERS =====
+def normalize(text: str) -> str:
+    """Lowercase and strip accents: "Café Latte" -> "cafe latte" """
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def words(text: str) -> list[str]:
+    return _WORD.findall(normalize(text))
+
+
+def trigrams(text: str) -> set[str]:
+    """pg_trgm style: each word padded with two spaces in front and one behind."""
+    grams = set()
+    for word in words(text):
+        padded = f"  {word} "
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+def _item_words(item: "CatalogItem") -> set[str]:
+    """Words a product can be found by: the whole SKU and the name words."""
+    return {normalize(item.sku), *words(item.name)}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+# ===== INDEX (one company) =====
+class CatalogIndex:
+    """
+    Product lookups for one company.
+
+    Products live in numbered slots; every other structure points at slots.
+    Changing a product kills its slot and appends a new one, so posting
+    lists are append-only (dead slots are filtered out at query time).
+    """
+
+    def __init__(self, company_id: int):
+        self.company_id = company_id
+        self.lock = threading.RLock()
+        self.stale: set[int] = set()  # Product ids changed since loaded (from events)
+        self.watermark: Optional[datetime] = None  # Latest updated_at seen
+        self.checked_at = time.monotonic()  # Last poll for changes
+        self.last_used = time.monotonic()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._items: list[Optional[CatalogItem]] = []  # slot -> item (None = dead)
+        self._alive = bytearray()  # slot -> 1 / 0 (for NumPy masks)
+        self._trigram_counts = array("H")  # slot -> number of name trigrams
+        self._slot_of: dict[int, int] = {}  # product id -> slot
+        self._barcodes: dict[str, int] = {}
+        self._skus: dict[str, int] = {}  # normalized SKU -> slot
+        self._words: list[str] = []  # Sorted, unique
+        self._word_slots: dict[str, Union[int, array]] = {}  # word -> slot, or array of slots
+        self._trigram_slots: dict[str, array] = {}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    # ----- Changes -----
+    def build(self, items: Iterable[CatalogItem]) -> None:
+        """Index many products at once (sorts the word list once at the end)."""
+        with self.lock:
+            self._reset()
+            for item in items:
+                self._add(item, bulk=True)
+            self._words.sort()
+
+    def upsert(self, item: CatalogItem) -> None:
+        with self.lock:
+            self._remove(item.id)
+            self._add(item)
+            self._compact_if_needed()
+
+    def remove(self, product_id: int) -> None:
+        with self.lock:
+            self._remove(product_id)
+            self._compact_if_needed()
+
+    def _add(self, item: CatalogItem, bulk: bool = False) -> None:
+        item = item._replace(
+            sku=sys.intern(item.sku), category=_intern(item.category), unit=sys.intern(item.unit)
+        )
+        slot = len(self._items)
+        self._items.append(item)
+        self._alive.append(1)
+        self._slot_of[item.id] = slot
+        if item.barcode:
+            self._barcodes[item.barcode] = slot
+        self._skus[sys.intern(normalize(item.sku))] = slot
+
+        for word in map(sys.intern, _item_words(item)):
+            postings = self._word_slots.get(word)
+            if postings is None:
+                # Most SKU words belong to one product: store the bare slot until a second one shows up
+                self._word_slots[word] = slot
+                if bulk:
+                    self._words.append(word)
+                else:
+                    bisect.insort(self._words, word)
+            elif isinstance(postings, int):
+                self._word_slots[word] = array("i", (postings, slot))
+            else:
+                postings.append(slot)
+
+        grams = trigrams(item.name)
+        self._trigram_counts.append(min(len(grams), 65535))
+        for gram in grams:
+            postings = self._trigram_slots.get(gram)
+            if postings is None:
+                postings = self._trigram_slots[gram] = array("i")
+            postings.append(slot)
+
+    def _remove(self, product_id: int) -> None:
+        slot = self._slot_of.pop(product_id, None)
+        if slot is None:
+            return
+        item = self._items[slot]
+        if item.barcode and self._barcodes.get(item.barcode) == slot:
+            del self._barcodes[item.barcode]
+        sku = normalize(item.sku)
+        if self._skus.get(sku) == slot:
+            del self._skus[sku]
+        self._items[slot] = None
+        self._alive[slot] = 0
+        self._dead += 1
+
+    def _compact_if_needed(self) -> None:
+        if self._dead > 1000 and self._dead * 4 > len(self._items):
+            self.build([item for item in self._items if item is not None])
+
+    # ----- Lookups -----
+    def scan(self, code: str) -> Optional[CatalogItem]:
+        """Exact barcode, else exact SKU (case-insensitive)."""
+        with self.lock:
+            slot = self._barcodes.get(code)
+            if slot is None:
+                slot = self._skus.get(normalize(code.strip()))
+            return self._items[slot] if slot is not None else None
+
+    def prefix_search(self, query: str, limit: int = 20) -> list[CatalogItem]:
+        """
+        Products with a word (or the SKU) starting with every word of `query`.
+        "lat bea" matches "Latte Beans 1kg".
+        """
+        query_words = words(query)
+        if not query_words:
+            return []
+        with self.lock:
+            # Rarest word first; each further word either intersects its slots
+            # or, if it is very common, is checked on the remaining items
+            ranges = sorted((self._word_range(word), word) for word in set(query_words))
+            (count, start, end), _ = ranges[0]
+            candidates = self._collect(start, end)
+            for (count, start, end), word in ranges[1:]:
+                if not candidates:
+                    break
+                if count <= len(candidates) * 20:
+                    candidates &= self._collect(start, end)
+                else:
+                    candidates = {
+                        slot for slot in candidates
+                        if self._alive[slot] and any(text.startswith(word) for text in _item_words(self._items[slot]))
+                    }
+            items = [self._items[slot] for slot in candidates if self._alive[slot]]
+        # Shortest names first: "Latte" before "Latte Art Pitcher 600ml"
+        return heapq.nsmallest(limit, items, key=lambda item: (len(item.name), item.name))
+
+    def _word_range(self, prefix: str) -> tuple[int, int, int]:
+        """(estimated product count, start, end) of the sorted words starting with `prefix`."""
+        start = bisect.bisect_left(self._words, prefix)
+        end = bisect.bisect_left(self._words, prefix + "\uffff", lo=start)
+        sample = self._words[start:min(end, start + 100)]  # Very short prefixes: extrapolate
+        count = sum(1 if isinstance(self._word_slots[word], int) else len(self._word_slots[word]) for word in sample)
+        return count * (end - start) // max(len(sample), 1), start, end
+
+    def _collect(self, start: int, end: int) -> set[int]:
+        slots = set()
+        for word in self._words[start:end]:
+            postings = self._word_slots[word]
+            if isinstance(postings, int):
+                slots.add(postings)
+            else:
+                slots.update(postings)
+        return slots
+
+    def fuzzy_search(self, query: str, limit: int = 20, threshold: float = FUZZY_THRESHOLD) -> list[tuple[CatalogItem, float]]:
+        """
+        Products whose name contains something close to `query` (typos, swapped letters).
+
+        match = shared trigrams / query trigrams  (like pg_trgm word_similarity,
+                so "mocah" finds "Mocha Syrup 750ml")
+        Ties go to the closer whole name: shared / (query + name - shared).
+
+        Returns:
+            [(item, match)], best first
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        with self.lock:
+            postings = [self._trigram_slots[gram] for gram in grams if gram in self._trigram_slots]
+            if not postings:
+                return []
+            # array("i") -> zero-copy NumPy views
+            shared = np.bincount(
+                np.concatenate([np.frombuffer(posting, dtype=np.int32) for posting in postings]),
+                minlength=len(self._items),
+            )
+            # Copies: the arrays keep growing and must not stay exported to NumPy
+            alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+            name_counts = np.frombuffer(self._trigram_counts, dtype=np.uint16).astype(np.int32)
+            match = np.where(alive, shared / len(grams), 0.0)
+            matches = np.flatnonzero(match >= threshold)
+            whole = shared[matches] / np.maximum(len(grams) + name_counts[matches] - shared[matches], 1)
+            score = match[matches] + whole / 10
+            order = np.argpartition(-score, limit - 1)[:limit] if len(score) > limit else np.arange(len(score))
+            order = order[np.argsort(-score[order], kind="stable")]
+            return [(self._items[slot], float(match[slot])) for slot in matches[order]]
+
+    def search(self, query: str, limit: int = 20) -> list[CatalogItem]:
+        """Exact code, then prefix matches, then fuzzy matches to fill up `limit`."""
+        results: list[CatalogItem] = []
+        exact = self.scan(query)
+        if exact is not None:
+            results.append(exact)
+        seen = {item.id for item in results}
+        for item in self.prefix_search(query, limit):
+            if item.id not in seen:
+                results.append(item)
+                seen.add(item.id)
+        if len(results) < limit:
+            for item, _ in self.fuzzy_search(query, limit):
+                if item.id not in seen:
+                    results.append(item)
+                    seen.add(item.id)
+        return results[:limit]
+
+
+# ===== INDEXES (all companies in this process) =====
+_COLUMNS = (
+    Product.id, Product.sku, Product.barcode, Product.name, Product.category,
+    Product.unit, Product.price, Product.is_active, Product.updated_at,
+)
+
+
+def _item(row) -> CatalogItem:
+    return CatalogItem(row.id, row.sku, row.barcode, row.name, row.category, row.unit, row.price)
+
+
+class CatalogIndexes:
+    """
+    One CatalogIndex per company, loaded on demand.
+
+    Registered in cache.CACHES as "product", so the invalidation bus calls
+    delete((company_id, product_id)) for every product change, and clear()
+    after a reconnect (events may have been missed).
+    """
+
+    name = "product"
+
+    def __init__(self, max_items: int = settings.CATALOG_MAX_ITEMS, idle_seconds: int = settings.CATALOG_IDLE_SECONDS):
+        self.max_items = max_items
+        self.idle_seconds = idle_seconds
+        self._indexes: OrderedDict[int, CatalogIndex] = OrderedDict()  # Least recently used first
+        self._lock = threading.Lock()
+        self._load_locks: dict[int, threading.Lock] = {}  # Loads in progress only
+        self._evicted_at = time.monotonic()
+        self.loads = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    # ----- Cache interface -----
+    def delete(self, key: Hashable) -> None:
+        company_id, product_id = key
+        index = self._indexes.get(company_id)
+        if index is not None:
+            index.stale.add(product_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    # ----- Access -----
+    def get(self, db: Session, company_id: int) -> CatalogIndex:
+        """The company's index, loaded or refreshed as needed."""
+        index = self._indexes.get(company_id)
+        if index is None:
+            index = self._load(db, company_id)
+        elif index.stale or time.monotonic() - index.checked_at > cache.current_ttl():
+            self._refresh(db, index)
+        now = index.last_used = time.monotonic()
+        with self._lock:
+            if company_id in self._indexes:
+                self._indexes.move_to_end(company_id)
+            if now - self._evicted_at >= min(IDLE_CHECK_SECONDS, self.idle_seconds):
+                self._evict()
+        return index
+
+    def _load(self, db: Session, company_id: int) -> CatalogIndex:
+        with self._lock:
+            load_lock = self._load_locks.setdefault(company_id, threading.Lock())
+        try:
+            with load_lock:
+                index = self._indexes.get(company_id)
+                if index is not None:  # Loaded by another thread meanwhile
+                    return index
+                index = CatalogIndex(company_id)
+                watermark = None
+                items = []
+                rows = db.execute(
+                    select(*_COLUMNS).where(Product.company_id == company_id).execution_options(yield_per=10_000)
+                )
+                for row in rows:
+                    if watermark is None or row.updated_at > watermark:
+                        watermark = row.updated_at
+                    if row.is_active:
+                        items.append(_item(row))
+                index.build(items)
+                index.watermark = watermark
+                with self._lock:
+                    self._indexes[company_id] = index
+                    self.loads += 1
+                    self._evict()
+                return index
+        finally:
+            # Later callers find the index (or load again if it was evicted meanwhile)
+            with self._lock:
+                if self._load_locks.get(company_id) is load_lock:
+                    del self._load_locks[company_id]
+
+    def _refresh(self, db: Session, index: CatalogIndex) -> None:
+        """Re-read only the products that changed."""
+        with index.lock:
+            stale, index.stale = index.stale, set()
+            poll = time.monotonic() - index.checked_at > cache.current_ttl()
+            conditions = []
+            if stale:
+                conditions.append(Product.id.in_(stale))
+            if poll and index.watermark is not None:
+                conditions.append(Product.updated_at >= index.watermark)
+            if poll:
+                index.checked_at = time.monotonic()
+            if not conditions:
+                return
+            seen = set()
+            for row in db.execute(select(*_COLUMNS).where(Product.company_id == index.company_id, or_(*conditions))):
+                seen.add(row.id)
+                if index.watermark is None or row.updated_at > index.watermark:
+                    index.watermark = row.updated_at
+                if row.is_active:
+                    index.upsert(_item(row))
+                else:
+                    index.remove(row.id)
+            for product_id in stale - seen:  # Deleted
+                index.remove(product_id)
+            self.refreshes += 1
+
+    def _evict(self) -> None:
+        """Drop idle companies, then least recently used ones over the item budget. Caller holds _lock."""
+        now = self._evicted_at = time.monotonic()
+        for company_id in [cid for cid, index in self._indexes.items() if now - index.last_used > self.idle_seconds]:
+            del self._indexes[company_id]
+            self.evictions += 1
+        total = sum(len(index) for index in self._indexes.values())
+        while total > self.max_items and len(self._indexes) > 1:
+            _, index = self._indexes.popitem(last=False)
+            total -= len(index)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Index statistics for health checks."""
+        return {
+            "companies": len(self._indexes),
+            "products": sum(len(index) for index in self._indexes.values()),
+            "loads": self.loads,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+        }
+
+
+catalog_indexes = CatalogIndexes()
+cache.CACHES[catalog_indexes.name] = catalog_indexes
+
+
+# ===== PUBLIC API =====
+def scan(db: Session, company_id: int, code: str) -> Optional[CatalogItem]:
+    """Resolve a scanned barcode (or typed SKU) to a product."""
+    return catalog_indexes.get(db, company_id).scan(code)
+
+
+def search(db: Session, company_id: int, query: str, limit: int = 20) -> list[CatalogItem]:
+    """Search products by code, SKU / name prefix, then fuzzy name."""
+    return catalog_indexes.get(db, company_id).search(query, limit)
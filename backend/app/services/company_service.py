@@ -9,7 +9,13 @@ from typing import Optional # Import Optional
 from app.models.company import Company
 from app.models.company_member import CompanyMember, MemberStatus
 from app.models.user import User, UserRole
-from app.schemas.company import CompanyRegister, CompanyUpdate, CompanyResponse # Added CompanyResponse
+from app.schemas.company import CompanyRegister, CompanyUpdate, CompanyResponse, CompanyMembershipResponse # Added CompanyResponse
+from app.schemas.user import UserResponse, CompanySelectResponse
+from app.core.security import create_access_token
+from app.core.cache import MISSING, membership_cache, company_cache
+from app.core.invalidation import publish
+from app.services.audit_service import record_audit, snapshot, diff_changes
+from app.services.dashboard_service import publish_company
 import re
 
 
@@ -81,6 +87,13 @@ def create_company_with_owner(
     )
     
     db.add(member)
+    publish(db, "membership", (user.id, company.id))
+    record_audit(db, "company.created", "company", company.id, company_id=company.id, actor_user_id=user.id)
+    record_audit(
+        db, "member.added", "company_member", f"{company.id}:{user.id}",
+        company_id=company.id, actor_user_id=user.id,
+        changes={"role": [None, UserRole.ADMIN.value], "is_owner": [None, True]}
+    )
     db.commit()
     db.refresh(company)
     db.refresh(member)
@@ -99,6 +112,63 @@ def get_company_by_id(db: Session, company_id: int) -> Company:
     return company
 
 
+def get_company_profile(db: Session, company_id: int) -> CompanyResponse:
+    """
+    Get a company profile as a response schema, served from the company cache when possible.
+    
+    Raises 404 if the company does not exist.
+    """
+    profile = company_cache.get(company_id)
+    if profile is MISSING:
+        profile = CompanyResponse.model_validate(get_company_by_id(db, company_id))
+        company_cache.set(company_id, profile)
+    return profile
+
+
+def get_member_company_profiles(
+    db: Session, 
+    user_id: int, 
+    company_ids: set[int]
+) -> dict[int, tuple[CompanyResponse, str]]:
+    """
+    Get many company profiles at once, limited to companies the user is an active member of.
+    
+    Cached profiles/roles are used first; everything else is loaded
+    with a single `IN (...)` join query.
+    
+    Returns:
+        Dict of company_id -> (CompanyResponse, role). Companies that do not exist
+        or that the user cannot access are simply missing from the result.
+    """
+    found = {}
+    missing_ids = set()
+    for company_id in company_ids:
+        profile = company_cache.get(company_id)
+        role = membership_cache.get((user_id, company_id))
+        if profile is MISSING or role is MISSING:
+            missing_ids.add(company_id)
+        elif role is not None:
+            found[company_id] = (profile, role)
+    
+    if missing_ids:
+        results = db.query(Company, CompanyMember.role).join(
+            CompanyMember,
+            Company.id == CompanyMember.company_id
+        ).filter(
+            Company.id.in_(missing_ids),
+            CompanyMember.user_id == user_id,
+            CompanyMember.status == MemberStatus.ACTIVE
+        ).all()
+        
+        for company, role in results:
+            profile = CompanyResponse.model_validate(company)
+            company_cache.set(company.id, profile)
+            membership_cache.set((user_id, company.id), role.value)
+            found[company.id] = (profile, role.value)
+    
+    return found
+
+
 def get_user_companies(db: Session, user_id: int):
     """
     Get all companies a user belongs to.
@@ -138,10 +208,40 @@ def get_user_companies_detailed(db: Session, user_id: int) -> list[CompanyRespon
     return companies_data
 
 
+def get_user_memberships(db: Session, user_id: int) -> list[CompanyMembershipResponse]:
+    """
+    Get every active membership of a user with the full company profile, in one query.
+    
+    Also warms the membership and company caches, since callers
+    (e.g. the bootstrap endpoint) usually need them right after.
+    """
+    results = db.query(Company, CompanyMember.role, CompanyMember.is_owner).join(
+        CompanyMember,
+        Company.id == CompanyMember.company_id
+    ).filter(
+        CompanyMember.user_id == user_id,
+        CompanyMember.status == MemberStatus.ACTIVE
+    ).order_by(Company.display_name).all()
+    
+    memberships = []
+    for company, role, is_owner in results:
+        profile = CompanyResponse.model_validate(company)
+        company_cache.set(company.id, profile)
+        membership_cache.set((user_id, company.id), role.value)
+        memberships.append(CompanyMembershipResponse(
+            **profile.model_dump(),
+            role=role.value,
+            is_owner=is_owner
+        ))
+    
+    return memberships
+
+
 def update_company(
     db: Session, 
     company: Company, # Changed from company_id to company object
-    update_data: CompanyUpdate
+    update_data: CompanyUpdate,
+    actor_user_id: Optional[int] = None
 ) -> Company:
     """
     Update company details.
@@ -150,6 +250,7 @@ def update_company(
         db: Database session
         company_id: Company to update
         update_data: Fields to update
+        actor_user_id: User making the change (for the audit log)
         
     Returns:
         Updated Company object
@@ -171,12 +272,52 @@ def update_company(
         update_dict["slug"] = slug
     
     # Apply updates
+    before = snapshot(company, update_dict.keys())
     for key, value in update_dict.items():
         setattr(company, key, value)
     
+    changes = diff_changes(before, snapshot(company, update_dict.keys()))
+    if changes:
+        record_audit(
+            db, "company.updated", "company", company.id,
+            company_id=company.id, actor_user_id=actor_user_id, changes=changes
+        )
+    publish(db, "company", company.id)
     db.commit()
     db.refresh(company)
+    publish_company(company)
+    
+    return company
+
+
+def set_company_logo(
+    db: Session,
+    company_id: int,
+    logo_url: str,
+    actor_user_id: Optional[int] = None
+) -> Company:
+    """
+    Point a company at a newly uploaded logo (see app/api/media.py).
     
+    Raises:
+        HTTPException 404: Company does not exist
+    """
+    company = get_company_by_id(db, company_id)
+    if not company:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found"
+        )
+    if company.logo_url != logo_url:
+        record_audit(
+            db, "company.logo_updated", "company", company.id,
+            company_id=company.id, actor_user_id=actor_user_id,
+            changes={"logo_url": [company.logo_url, logo_url]}
+        )
+        company.logo_url = logo_url
+        publish(db, "company", company.id)
+        db.commit()
+        publish_company(company)
     return company
 
 
@@ -206,9 +347,13 @@ def check_user_company_access(
     return member
 
 
-def set_active_company(db: Session, user: User, company_id: int) -> User:
+def set_active_company(db: Session, user: UserResponse, company_id: int) -> CompanySelectResponse:
     """
-    Set the active company for a user.
+    Switch the active company for a user.
+    
+    The selected company is carried in a freshly issued access token,
+    so switching never writes to the database. A single membership + company
+    name join confirms access.
     
     Args:
         db: Database session
@@ -216,33 +361,59 @@ def set_active_company(db: Session, user: User, company_id: int) -> User:
         company_id: The ID of the company to set as active
         
     Returns:
-        The updated User object
+        New access token and the user with the selected company context
         
     Raises:
         HTTPException: If the user does not have access to the company
     """
-    member = check_user_company_access(db, user.id, company_id)
+    row = db.query(CompanyMember.role, Company.display_name).join(
+        Company,
+        Company.id == CompanyMember.company_id
+    ).filter(
+        CompanyMember.user_id == user.id,
+        CompanyMember.company_id == company_id,
+        CompanyMember.status == MemberStatus.ACTIVE
+    ).first()
+    
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="No access to this company"
+        )
     
-    user.current_company_id = company_id
-    user.current_company_name = db.query(Company).filter(Company.id == company_id).first().display_name
-    user.current_role = member.role.value # Store the string value of the enum
+    role, company_name = row
+    membership_cache.set((user.id, company_id), role.value)
     
-    db.commit()
-    db.refresh(user)
+    access_token = create_access_token(data={
+        "sub": user.email,
+        "company_id": company_id,
+        "company_name": company_name,
+    })
+    
+    selected_user = user.model_copy(update={
+        "current_company_id": company_id,
+        "current_company_name": company_name,
+        "current_role": role.value,
+    })
     
-    return user
+    return CompanySelectResponse(access_token=access_token, user=selected_user)
 
 
 def get_company_member_role(db: Session, user_id: int, company_id: int) -> Optional[str]:
     """
     Get the role of a user within a specific company.
+    Cached per (user_id, company_id); evicted when the membership changes.
     """
+    role = membership_cache.get((user_id, company_id))
+    if role is not MISSING:
+        return role
+    
     member = db.query(CompanyMember).filter(
         CompanyMember.user_id == user_id,
         CompanyMember.company_id == company_id,
         CompanyMember.status == MemberStatus.ACTIVE
     ).first()
     
-    if member:
-        return member.role.value
-    return None
+    role = member.role.value if member else None
+    membership_cache.set((user_id, company_id), role)
+    return role
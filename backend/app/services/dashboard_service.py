@@ -0,0 +1,113 @@
+# app/services/dashboard_service.py
+
+"""
+Dashboard Service
+Live updates for company dashboards, pushed over the event broker
+(app/core/event_stream.py) instead of polled.
+
+Each company has one dashboard topic. Services call the publish_* helpers
+after committing; every event names the permission needed to see it, so a
+viewer's stream only carries what their CompanyMember.role allows:
+
+    company           profile changed           COMPANY_VIEW
+    member_invited    someone was invited       MEMBERS_VIEW
+    sales_today       today's POS sales totals  REPORTS_VIEW
+
+Events are whole values (the full profile, today's totals), so a burst of
+changes reaches the dashboard as its latest value once per batching window.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.event_stream import TopicKey, broker
+from app.core.money import from_sen
+from app.core.permissions import Permission
+from app.database import SessionLocal
+from app.models.company import Company
+from app.models.company_member import CompanyMember, MemberStatus
+from app.models.invitation import Invitation, InvitationStatus
+from app.models.pos import PosSale
+from app.schemas.company import CompanyResponse
+
+
+def topic(company_id: int) -> TopicKey:
+    """Event broker topic of a company's dashboards."""
+    return (company_id, "dashboard")
+
+
+# ===== PUBLISHING =====
+def publish_company(company: Company) -> None:
+    """Push a committed company profile."""
+    data = CompanyResponse.model_validate(company).model_dump(mode="json")
+    broker.publish(topic(company.id), "company", data, key="company", audience=Permission.COMPANY_VIEW)
+
+
+def publish_member_invited(invitation: Invitation) -> None:
+    """Push a new invitation (a member-to-be)."""
+    data = {
+        "email": invitation.email,
+        "role": invitation.role.value,
+        "expires_at": invitation.expires_at.isoformat(),
+    }
+    broker.publish(
+        topic(invitation.company_id), "member_invited", data,
+        key=("invitation", invitation.email), audience=Permission.MEMBERS_VIEW
+    )
+
+
+def publish_sales_today(db: Session, company_id: int) -> None:
+    """Push today's POS sales totals (after new sales were committed)."""
+    broker.publish(
+        topic(company_id), "sales_today", sales_today(db, company_id),
+        key="sales_today", audience=Permission.REPORTS_VIEW
+    )
+
+
+# ===== CURRENT STATE =====
+def _today_bounds(day: Optional[date] = None) -> tuple[date, datetime, datetime]:
+    zone = ZoneInfo(settings.DASHBOARD_TIMEZONE)
+    day = day or datetime.now(zone).date()
+    start = datetime.combine(day, time.min, tzinfo=zone).astimezone(timezone.utc)
+    return day, start, start + timedelta(days=1)
+
+
+def sales_today(db: Session, company_id: int) -> dict:
+    """Number and total of today's POS sales (in DASHBOARD_TIMEZONE)."""
+    day, start, end = _today_bounds()
+    count, total = db.execute(
+        select(func.count(PosSale.id), func.coalesce(func.sum(PosSale.total), 0))
+        .where(PosSale.company_id == company_id, PosSale.sold_at >= start, PosSale.sold_at < end)
+    ).one()
+    return {"date": day.isoformat(), "count": count, "total": str(from_sen(total))}
+
+
+def snapshot(company_id: int, permissions: int) -> dict:
+    """
+    Everything a dashboard shows, limited to what the viewer may see.
+
+    Runs outside the request (in a worker thread), so it uses its own session.
+    """
+    db = SessionLocal()
+    try:
+        data = {}
+        if permissions & Permission.COMPANY_VIEW:
+            company = db.get(Company, company_id)
+            data["company"] = CompanyResponse.model_validate(company).model_dump(mode="json") if company else None
+        if permissions & Permission.MEMBERS_VIEW:
+            data["members"] = db.scalar(
+                select(func.count(CompanyMember.id))
+                .where(CompanyMember.company_id == company_id, CompanyMember.status == MemberStatus.ACTIVE)
+            )
+            data["pending_invitations"] = db.scalar(
+                select(func.count(Invitation.id))
+                .where(Invitation.company_id == company_id, Invitation.status == InvitationStatus.PENDING)
+            )
+        if permissions & Permission.REPORTS_VIEW:
+            data["sales_today"] = sales_today(db, company_id)
+        return data
+    finally:
+        db.close()
@@ -0,0 +1,216 @@
+# app/services/email_service.py
+
+"""
+Email Service
+Writes emails to the outbox (app/models/email_outbox.py) and provides the
+claim / result functions used by the email sender (app/email_sender.py).
+
+Enqueue functions only add rows to the caller's session. The email
+exists only if the caller commits, and nothing here talks to SMTP.
+"""
+
+import hashlib
+import hmac
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import select, update, func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.security import create_purpose_token
+from app.models.email_outbox import EmailMessage, EmailStatus, EmailKind
+from app.models.invitation import Invitation
+from app.models.user import User
+from app.services.job_service import retry_delay
+
+
+# ===== ENQUEUE =====
+def enqueue_email(
+    db: Session,
+    to_email: str,
+    subject: str,
+    body_text: str,
+    kind: EmailKind = EmailKind.OTHER,
+    body_html: Optional[str] = None,
+    company_id: Optional[int] = None,
+) -> EmailMessage:
+    """
+    Add an email to the outbox (sent after the caller commits).
+
+    Args:
+        db: Database session
+        to_email: Recipient address
+        subject: Subject line
+        body_text: Plain text body
+        kind: What the email is for (used for reporting)
+        body_html: Optional HTML body
+        company_id: Company the email belongs to, if any
+
+    Returns:
+        The new EmailMessage (not yet committed)
+    """
+    message = EmailMessage(
+        to_email=to_email,
+        subject=subject,
+        body_text=body_text,
+        body_html=body_html,
+        kind=kind,
+        company_id=company_id,
+        status=EmailStatus.PENDING,
+        max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+    )
+    db.add(message)
+    return message
+
+
+def enqueue_verification_email(db: Session, user: User) -> EmailMessage:
+    """Queue the "confirm your email address" message for a new user."""
+    token = create_purpose_token(
+        user.email, "verify_email", timedelta(hours=settings.EMAIL_VERIFICATION_EXPIRE_HOURS)
+    )
+    link = f"{settings.FRONTEND_URL}/verify-email?token={token}"
+    return enqueue_email(
+        db,
+        to_email=user.email,
+        subject=f"Confirm your email for {settings.APP_NAME}",
+        body_text=(
+            f"Hi {user.full_name},\n\n"
+            f"Please confirm your email address by opening this link:\n{link}\n\n"
+            f"The link expires in {settings.EMAIL_VERIFICATION_EXPIRE_HOURS} hours."
+        ),
+        kind=EmailKind.VERIFICATION,
+        company_id=user.default_company_id,
+    )
+
+
+def password_fingerprint(user: User) -> str:
+    """
+    Keyed digest of the password hash - changes whenever the password changes.
+    Token payloads are readable by anyone, so the hash itself never goes in one.
+    """
+    digest = hmac.new(settings.SECRET_KEY.encode(), user.hashed_password.encode(), hashlib.sha256)
+    return digest.hexdigest()[:16]
+
+
+def enqueue_password_reset_email(db: Session, user: User) -> EmailMessage:
+    """Queue a password reset link. The link stops working once the password changes."""
+    token = create_purpose_token(
+        user.email,
+        "password_reset",
+        timedelta(minutes=settings.PASSWORD_RESET_EXPIRE_MINUTES),
+        fingerprint=password_fingerprint(user),
+    )
+    link = f"{settings.FRONTEND_URL}/reset-password?token={token}"
+    return enqueue_email(
+        db,
+        to_email=user.email,
+        subject=f"Reset your {settings.APP_NAME} password",
+        body_text=(
+            f"Hi {user.full_name},\n\n"
+            f"Someone asked to reset your password. If it was you, open this link:\n{link}\n\n"
+            f"The link expires in {settings.PASSWORD_RESET_EXPIRE_MINUTES} minutes. "
+            "If you did not ask for this, you can ignore this email."
+        ),
+        kind=EmailKind.PASSWORD_RESET,
+    )
+
+
+def enqueue_invitation_email(
+    db: Session,
+    invitation: Invitation,
+    company_name: str,
+    inviter_name: str
+) -> EmailMessage:
+    """Queue the invitation email for a new company member."""
+    link = f"{settings.FRONTEND_URL}/accept-invitation?token={invitation.token}"
+    return enqueue_email(
+        db,
+        to_email=invitation.email,
+        subject=f"{inviter_name} invited you to {company_name}",
+        body_text=(
+            f"Hi,\n\n{inviter_name} invited you to join {company_name} on {settings.APP_NAME} "
+            f"as {invitation.role.value}.\n\nAccept the invitation here:\n{link}\n\n"
+            f"The invitation expires in {settings.INVITATION_EXPIRE_DAYS} days."
+        ),
+        kind=EmailKind.INVITATION,
+        company_id=invitation.company_id,
+    )
+
+
+# ===== SENDER SIDE =====
+def claim_emails(db: Session, limit: int = settings.EMAIL_BATCH_SIZE) -> list:
+    """
+    Claim a batch of due emails (FOR UPDATE SKIP LOCKED) and commit the claim.
+
+    Several senders can run at once without sending the same email twice.
+
+    Returns:
+        Rows with id, to_email, subject, body_text, body_html, attempts, max_attempts
+    """
+    due = select(EmailMessage.id).where(
+        EmailMessage.status == EmailStatus.PENDING,
+        EmailMessage.next_attempt_at <= func.now()
+    ).order_by(
+        EmailMessage.next_attempt_at
+    ).limit(limit).with_for_update(skip_locked=True).cte("due")
+
+    claimed = db.execute(
+        update(EmailMessage).where(
+            EmailMessage.id.in_(select(due.c.id))
+        ).values(
+            status=EmailStatus.SENDING,
+            attempts=EmailMessage.attempts + 1,
+            locked_at=func.now()
+        ).returning(
+            EmailMessage.id, EmailMessage.to_email, EmailMessage.subject,
+            EmailMessage.body_text, EmailMessage.body_html,
+            EmailMessage.attempts, EmailMessage.max_attempts
+        )
+    ).all()
+    db.commit()
+    return claimed
+
+
+def mark_emails_sent(db: Session, message_ids: list[int]) -> None:
+    """Mark many messages as sent in one UPDATE."""
+    if not message_ids:
+        return
+    db.execute(
+        update(EmailMessage).where(EmailMessage.id.in_(message_ids)).values(
+            status=EmailStatus.SENT,
+            sent_at=func.now(),
+            last_error=None
+        )
+    )
+    db.commit()
+
+
+def mark_email_failed(db: Session, message, error: BaseException) -> bool:
+    """
+    Record a failed delivery attempt (retried with backoff until max_attempts).
+
+    Returns:
+        True if the message will be retried
+    """
+    will_retry = message.attempts < message.max_attempts
+    values = {"last_error": str(error)[:2000]}
+    if will_retry:
+        values["status"] = EmailStatus.PENDING
+        values["next_attempt_at"] = datetime.now(timezone.utc) + timedelta(seconds=retry_delay(message.attempts))
+    else:
+        values["status"] = EmailStatus.FAILED
+    db.execute(update(EmailMessage).where(EmailMessage.id == message.id).values(**values))
+    db.commit()
+    return will_retry
+
+
+def requeue_stale_emails(db: Session, timeout_seconds: int = settings.JOB_LOCK_TIMEOUT_SECONDS) -> int:
+    """Put messages stuck in SENDING (sender crashed) back in the outbox."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=timeout_seconds)
+    result = db.execute(
+        update(EmailMessage).where(
+            EmailMessage.status == EmailStatus.SENDING,
+            EmailMessage.locked_at < cutoff
+        ).values(status=EmailStatus.PENDING)
+    )
+    db.commit()
+    return result.rowcount
@@ -0,0 +1,152 @@
+# app/services/export_service.py
+
+"""
+Export Service
+Streams tenant data (members, companies) as CSV, JSONL or XLSX.
+
+Rows are read with a server-side cursor (yield_per) and written out in
+chunks, so memory stays flat for millions of rows and the client gets
+the first bytes right away.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator
+from sqlalchemy import select
+from app.database import SessionLocal
+from app.models.company import Company
+from app.models.company_member import CompanyMember, MemberStatus
+from app.models.user import User
+from app.core.xlsx import XLSX_MEDIA_TYPE, stream_xlsx
+
+
+# Rows fetched from the database per round trip
+FETCH_SIZE = 1000
+
+# Rows written per chunk sent to the client
+CHUNK_ROWS = 500
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "xlsx": XLSX_MEDIA_TYPE,
+}
+
+
+# ===== ROW SOURCES =====
+MEMBER_COLUMNS = ["user_id", "email", "full_name", "role", "is_owner", "status", "joined_at"]
+
+
+def iter_company_members(company_id: int) -> Iterator[tuple]:
+    """
+    Yield every member of a company as a tuple (see MEMBER_COLUMNS).
+    
+    Opens its own session because streaming continues after the
+    request handler has returned.
+    """
+    statement = select(
+        User.id, User.email, User.full_name,
+        CompanyMember.role, CompanyMember.is_owner, CompanyMember.status, CompanyMember.joined_at
+    ).join(
+        CompanyMember, CompanyMember.user_id == User.id
+    ).where(
+        CompanyMember.company_id == company_id
+    ).order_by(CompanyMember.id).execution_options(yield_per=FETCH_SIZE)
+    
+    db = SessionLocal()
+    try:
+        for row in db.execute(statement):
+            yield tuple(row)
+    finally:
+        db.close()
+
+
+COMPANY_COLUMNS = [
+    "company_id", "display_name", "legal_name", "business_registration_number",
+    "tax_id", "email", "phone_number", "role", "is_owner", "is_active",
+]
+
+
+def iter_user_companies(user_id: int) -> Iterator[tuple]:
+    """Yield every company the user is an active member of (see COMPANY_COLUMNS)."""
+    statement = select(
+        Company.id, Company.display_name, Company.legal_name, Company.business_registration_number,
+        Company.tax_id, Company.email, Company.phone_number,
+        CompanyMember.role, CompanyMember.is_owner, Company.is_active
+    ).join(
+        CompanyMember, CompanyMember.company_id == Company.id
+    ).where(
+        CompanyMember.user_id == user_id,
+        CompanyMember.status == MemberStatus.ACTIVE
+    ).order_by(Company.id).execution_options(yield_per=FETCH_SIZE)
+    
+    db = SessionLocal()
+    try:
+        for row in db.execute(statement):
+            yield tuple(row)
+    finally:
+        db.close()
+
+
+# ===== FORMATTERS =====
+def _plain(value: Any) -> Any:
+    """Convert database values into JSON/CSV friendly values."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _stream_csv(columns: list[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow([_plain(value) for value in row])
+        if count % CHUNK_ROWS == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def _stream_jsonl(columns: list[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({column: _plain(value) for column, value in zip(columns, row)}))
+        if len(lines) == CHUNK_ROWS:
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def _stream_xlsx(columns: list[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    def with_header():
+        yield columns
+        for row in rows:
+            yield [_plain(value) for value in row]
+    return stream_xlsx(with_header(), sheet_name="Export", flush_every=CHUNK_ROWS)
+
+
+def stream_export(columns: list[str], rows: Iterable[tuple], export_format: str) -> Iterator[bytes]:
+    """
+    Turn rows into a byte stream in the requested format.
+    
+    Args:
+        columns: Header names
+        rows: Row tuples (usually from iter_company_members / iter_user_companies)
+        export_format: "csv", "jsonl" or "xlsx"
+    """
+    if export_format == "csv":
+        return _stream_csv(columns, rows)
+    if export_format == "jsonl":
+        return _stream_jsonl(columns, rows)
+    return _stream_xlsx(columns, rows)
@@ -0,0 +1,500 @@
+# app/services/financing_service.py
+
+"""
+Financing Service
+P2P financing pools (mudarabah / musharakah) and their profit sharing.
+
+Sharing a period's profit:
+1. Each investor's weight is capital x days invested in the period
+   (capital_days), so money that came in mid-period earns for the days
+   it was there
+2. The investors' part of the profit is set by the contract:
+   - profit: investor_profit_ratio of it (the agreed split)
+   - loss, mudarabah: all of it (the manager loses only its effort)
+   - loss, musharakah: in proportion to capital, company capital included
+3. That amount is split by weight with the largest remainder method:
+   everyone gets floor(amount x weight / total weight) sen, and the few
+   sen left over go one each to the largest remainders. Shares always add
+   up exactly to the amount - no rounding drift, no balancing line.
+4. Payouts are written in one bulk insert (COPY on PostgreSQL) and the
+   pool total is posted to the ledger as one journal entry, in the same
+   transaction.
+
+All of it runs on numpy int64 arrays (exact integer sen), falling back
+to Python integers only when a product could overflow 64 bits, so a pool
+of 100k investors is shared out in milliseconds.
+"""
+
+import io
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
+from zoneinfo import ZoneInfo
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.money import from_sen, to_sen
+from app.models.account import Account
+from app.models.financing import ContractType, FinancingPool, PoolInvestment, ProfitDistribution, ProfitPayout
+from app.schemas.financing import FinancingPoolCreate, PoolInvestmentCreate, ProfitDistributionCreate
+from app.schemas.ledger import JournalEntryCreate, JournalLineCreate
+from app.services.audit_service import diff_changes, record_audit, snapshot
+from app.services.ledger_service import post_entries
+
+
+INT64_LIMIT = 2 ** 63
+
+
+# ===== ALLOCATION =====
+def capital_days(
+    capital: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    period_start: date,
+    period_end: date,
+) -> np.ndarray:
+    """
+    Weight of each investment in a period: capital (sen) x days invested.
+
+    Args:
+        start, end: First and last earning day of each investment as
+            date.toordinal() (use the period end for open investments)
+    """
+    days = np.minimum(end, period_end.toordinal()) - np.maximum(start, period_start.toordinal()) + 1
+    return capital * np.maximum(days, 0)
+
+
+def _exact_sum(values: np.ndarray) -> int:
+    if not len(values):
+        return 0
+    if values.dtype != object and int(values.max()) * len(values) < INT64_LIMIT:
+        return int(values.sum())
+    return sum(values.tolist())
+
+
+def allocate(amount: int, weights: np.ndarray) -> np.ndarray:
+    """
+    Split `amount` sen in proportion to non-negative `weights`, exactly.
+
+    Largest remainder method: floor shares first, then the sen left over
+    (fewer than the number of weights) go one each to the largest
+    remainders; ties go to the earlier position. A negative amount (a loss)
+    is split the same way with the sign flipped.
+
+    Returns:
+        int64 shares, summing to `amount` (all zero if the weights are)
+    """
+    weights = np.asarray(weights)
+    shares = np.zeros(len(weights), dtype=np.int64)
+    total = _exact_sum(weights)
+    if amount == 0 or total == 0:
+        return shares
+    size = abs(amount)
+    if weights.dtype != object:
+        # Smaller numbers keep more pools on the int64 path
+        divisor = int(np.gcd.reduce(weights))
+        weights = weights // divisor
+        total //= divisor
+    if weights.dtype != object and size * int(weights.max()) < INT64_LIMIT and total < INT64_LIMIT:
+        floors, remainders = np.divmod(weights * size, total)
+    else:
+        products = weights.astype(object) * size
+        floors, remainders = products // total, products % total
+    left = size - _exact_sum(floors)
+    if left:
+        # The `left` largest remainders without a full sort: everything above
+        # the left-th largest value, then the first ties at that value
+        threshold = np.partition(remainders, len(remainders) - left)[len(remainders) - left]
+        above = np.flatnonzero(remainders > threshold)
+        floors[above] += 1
+        floors[np.flatnonzero(remainders == threshold)[:left - len(above)]] += 1
+    shares[:] = floors
+    return shares if amount > 0 else -shares
+
+
+def investor_amount(pool: FinancingPool, profit: int, investor_weight: int, period_days: int) -> int:
+    """The investors' part of a period's profit (sen); the company keeps the rest."""
+    if profit >= 0:
+        share = Decimal(profit) * Decimal(pool.investor_profit_ratio)
+        return int(share.to_integral_value(rounding=ROUND_HALF_UP))
+    if pool.contract_type == ContractType.MUDARABAH:
+        return profit
+    weights = np.array([investor_weight, pool.company_capital * period_days], dtype=object)
+    return int(allocate(profit, weights)[0])
+
+
+# ===== POOLS =====
+def _check_accounts(db: Session, company_id: int, account_ids: set[int]) -> None:
+    found = set(db.scalars(
+        select(Account.id).where(Account.company_id == company_id, Account.id.in_(account_ids), Account.is_active.is_(True))
+    ))
+    if found != account_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown or inactive accounts: {sorted(account_ids - found)}"
+        )
+
+
+def create_pool(db: Session, company_id: int, pool_data: FinancingPoolCreate, created_by: Optional[int] = None) -> FinancingPool:
+    """
+    Open a financing pool.
+
+    Raises:
+        HTTPException 400: Profit or investor account not found / inactive
+    """
+    _check_accounts(db, company_id, {pool_data.profit_account_id, pool_data.investor_account_id})
+    pool = FinancingPool(
+        company_id=company_id,
+        **pool_data.model_dump(exclude={"company_capital"}),
+        company_capital=to_sen(pool_data.company_capital),
+    )
+    db.add(pool)
+    db.flush()
+    record_audit(
+        db, "financing.pool_created", "financing_pool", pool.id,
+        company_id=company_id, actor_user_id=created_by,
+        changes={"contract_type": pool.contract_type.value, "investor_profit_ratio": str(pool.investor_profit_ratio)}
+    )
+    db.commit()
+    db.refresh(pool)
+    return pool
+
+
+def get_pool(db: Session, company_id: int, pool_id: int, lock: bool = False) -> FinancingPool:
+    """
+    Raises:
+        HTTPException 404: Pool not found in this company
+    """
+    query = select(FinancingPool).where(FinancingPool.id == pool_id, FinancingPool.company_id == company_id)
+    if lock:
+        query = query.with_for_update()
+    pool = db.scalar(query)
+    if pool is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Financing pool not found")
+    return pool
+
+
+def list_pools(db: Session, company_id: int) -> list[tuple[FinancingPool, int, int]]:
+    """
+    Returns:
+        [(pool, investors still invested, their capital in sen)]
+    """
+    today = datetime.now(ZoneInfo(settings.DASHBOARD_TIMEZONE)).date()
+    totals = (
+        select(
+            PoolInvestment.pool_id,
+            func.count().label("investors"),
+            func.sum(PoolInvestment.capital).label("capital"),
+        )
+        .where(
+            PoolInvestment.company_id == company_id,
+            or_(PoolInvestment.end_date.is_(None), PoolInvestment.end_date >= today),
+        )
+        .group_by(PoolInvestment.pool_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(FinancingPool, totals.c.investors, totals.c.capital)
+        .outerjoin(totals, totals.c.pool_id == FinancingPool.id)
+        .where(FinancingPool.company_id == company_id)
+        .order_by(FinancingPool.id)
+    ).all()
+    return [(pool, investors or 0, int(capital or 0)) for pool, investors, capital in rows]
+
+
+def _last_distributed_day(db: Session, pool_id: int) -> Optional[date]:
+    return db.scalar(select(func.max(ProfitDistribution.period_end)).where(ProfitDistribution.pool_id == pool_id))
+
+
+# ===== INVESTMENTS =====
+def add_investments(
+    db: Session,
+    company_id: int,
+    pool_id: int,
+    investments: list[PoolInvestmentCreate],
+    created_by: Optional[int] = None,
+) -> int:
+    """
+    Add investors' capital to a pool (one multi-row INSERT).
+
+    Raises:
+        HTTPException 404: Pool not found
+        HTTPException 409: Pool closed, or an investment starts in a period already distributed
+    """
+    pool = get_pool(db, company_id, pool_id, lock=True)
+    if not pool.is_active:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Financing pool is closed")
+    last = _last_distributed_day(db, pool_id)
+    if last is not None:
+        early = [item.investor_reference for item in investments if item.start_date <= last]
+        if early:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Profit is already distributed up to {last}; investments must start later ({early[:10]})"
+            )
+    db.execute(insert(PoolInvestment), [
+        {
+            "pool_id": pool_id,
+            "company_id": company_id,
+            "investor_reference": item.investor_reference,
+            "investor_name": item.investor_name,
+            "capital": to_sen(item.capital),
+            "start_date": item.start_date,
+            "end_date": item.end_date,
+        }
+        for item in investments
+    ])
+    record_audit(
+        db, "financing.investments_added", "financing_pool", pool_id,
+        company_id=company_id, actor_user_id=created_by,
+        changes={"investments": len(investments), "capital": str(sum(item.capital for item in investments))}
+    )
+    db.commit()
+    return len(investments)
+
+
+def list_investments(db: Session, company_id: int, pool_id: int, limit: int = 100, offset: int = 0) -> list[PoolInvestment]:
+    get_pool(db, company_id, pool_id)
+    return list(db.scalars(
+        select(PoolInvestment).where(PoolInvestment.pool_id == pool_id)
+        .order_by(PoolInvestment.id).limit(limit).offset(offset)
+    ))
+
+
+def withdraw_investment(
+    db: Session,
+    company_id: int,
+    investment_id: int,
+    end_date: date,
+    created_by: Optional[int] = None,
+) -> PoolInvestment:
+    """
+    Set the last day an investment earns.
+
+    Raises:
+        HTTPException 404: Investment not found
+        HTTPException 400: end_date before the investment started
+        HTTPException 409: The change would alter a period already distributed
+    """
+    investment = db.get(PoolInvestment, investment_id)
+    if investment is None or investment.company_id != company_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Investment not found")
+    get_pool(db, company_id, investment.pool_id, lock=True)
+    if end_date < investment.start_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end_date is before the investment started")
+    last = _last_distributed_day(db, investment.pool_id)
+    if last is not None and (end_date <= last or (investment.end_date is not None and investment.end_date <= last)):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Profit is already distributed up to {last}"
+        )
+    before = snapshot(investment, ["end_date"])
+    investment.end_date = end_date
+    record_audit(
+        db, "financing.investment_withdrawn", "pool_investment", investment.id,
+        company_id=company_id, actor_user_id=created_by,
+        changes=diff_changes(before, snapshot(investment, ["end_date"]))
+    )
+    db.commit()
+    db.refresh(investment)
+    return investment
+
+
+# ===== DISTRIBUTION =====
+def load_investments(
+    db: Session,
+    pool_id: int,
+    period_start: date,
+    period_end: date,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Investments earning in the period, as arrays.
+
+    Returns:
+        (investment IDs, capital_days), investments with no days in the period left out
+    """
+    rows = db.execute(
+        select(PoolInvestment.id, PoolInvestment.capital, PoolInvestment.start_date, PoolInvestment.end_date)
+        .where(
+            PoolInvestment.pool_id == pool_id,
+            PoolInvestment.start_date <= period_end,
+            or_(PoolInvestment.end_date.is_(None), PoolInvestment.end_date >= period_start),
+        )
+        .order_by(PoolInvestment.id)
+    ).all()
+    count = len(rows)
+    last = period_end.toordinal()
+    ids = np.fromiter((row[0] for row in rows), np.int64, count)
+    capital = np.fromiter((row[1] for row in rows), np.int64, count)
+    start = np.fromiter((row[2].toordinal() for row in rows), np.int64, count)
+    end = np.fromiter((row[3].toordinal() if row[3] else last for row in rows), np.int64, count)
+    weights = capital_days(capital, start, end, period_start, period_end)
+    earning = weights > 0
+    return ids[earning], weights[earning]
+
+
+def _write_payouts(db: Session, distribution_id: int, investment_ids: np.ndarray, weights: np.ndarray, amounts: np.ndarray) -> None:
+    """All payouts of a distribution in one statement (COPY on PostgreSQL, multi-row INSERT elsewhere)."""
+    connection = db.connection()
+    if connection.dialect.name == "postgresql":
+        data = io.StringIO("".join(map(
+            f"{distribution_id}\t{{}}\t{{}}\t{{}}\n".format, investment_ids.tolist(), weights.tolist(), amounts.tolist()
+        )))
+        with connection.connection.driver_connection.cursor() as cursor:
+            cursor.copy_expert(
+                "COPY profit_payouts (distribution_id, investment_id, capital_days, amount) FROM STDIN", data
+            )
+    else:
+        connection.execute(insert(ProfitPayout.__table__), [
+            {"distribution_id": distribution_id, "investment_id": investment_id, "capital_days": weight, "amount": amount}
+            for investment_id, weight, amount in zip(investment_ids.tolist(), weights.tolist(), amounts.tolist())
+        ])
+
+
+def _journal_entry(pool: FinancingPool, distribution: ProfitDistribution, entry_date: date) -> JournalEntryCreate:
+    """Move the investors' part from the profit account to the investors' account (reversed for a loss)."""
+    amount = from_sen(abs(distribution.investor_amount))
+    debit, credit = pool.profit_account_id, pool.investor_account_id
+    if distribution.investor_amount < 0:
+        debit, credit = credit, debit
+    return JournalEntryCreate.model_construct(
+        entry_date=entry_date,
+        reference=f"PSD-{distribution.id}",
+        description=f"Profit sharing {pool.name} {distribution.period_start} - {distribution.period_end}",
+        lines=[
+            JournalLineCreate.model_construct(
+                account_id=debit, debit=amount, credit=Decimal("0"), cost_center=None, description=None
+            ),
+            JournalLineCreate.model_construct(
+                account_id=credit, debit=Decimal("0"), credit=amount, cost_center=None,
+                description=f"{distribution.investor_count} investors"
+            ),
+        ],
+    )
+
+
+def distribute_profit(
+    db: Session,
+    company_id: int,
+    pool_id: int,
+    data: ProfitDistributionCreate,
+    created_by: Optional[int] = None,
+) -> ProfitDistribution:
+    """
+    Share a period's profit among the pool's investors and post it (commits).
+
+    The distribution, every payout and the journal entry are written in
+    one transaction; the pool row is locked so two distributions of the
+    same pool never interleave.
+
+    Raises:
+        HTTPException 404: Pool not found
+        HTTPException 400: No capital invested during the period
+        HTTPException 409: The period overlaps one already distributed
+    """
+    pool = get_pool(db, company_id, pool_id, lock=True)
+    overlap = db.scalar(
+        select(ProfitDistribution.id).where(
+            ProfitDistribution.pool_id == pool_id,
+            ProfitDistribution.period_start <= data.period_end,
+            ProfitDistribution.period_end >= data.period_start,
+        ).limit(1)
+    )
+    if overlap is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Period overlaps distribution {overlap}"
+        )
+
+    investment_ids, weights = load_investments(db, pool_id, data.period_start, data.period_end)
+    if not len(investment_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No capital was invested in the pool during the period"
+        )
+    profit = to_sen(data.profit)
+    period_days = (data.period_end - data.period_start).days + 1
+    to_investors = investor_amount(pool, profit, _exact_sum(weights), period_days)
+    amounts = allocate(to_investors, weights)
+
+    distribution = ProfitDistribution(
+        pool_id=pool_id,
+        company_id=company_id,
+        period_start=data.period_start,
+        period_end=data.period_end,
+        profit=profit,
+        investor_amount=to_investors,
+        company_amount=profit - to_investors,
+        investor_count=len(investment_ids),
+        created_by=created_by,
+    )
+    db.add(distribution)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Profit for the period starting {data.period_start} is already distributed"
+        )
+    _write_payouts(db, distribution.id, investment_ids, weights, amounts)
+    if to_investors:
+        entry = _journal_entry(pool, distribution, data.entry_date or data.period_end)
+        distribution.journal_entry_id = post_entries(
+            db, company_id, [entry], created_by=created_by, source="profit_sharing", commit=False
+        )[0]
+    record_audit(
+        db, "financing.profit_distributed", "profit_distribution", distribution.id,
+        company_id=company_id, actor_user_id=created_by,
+        changes={
+            "pool_id": pool_id,
+            "period": f"{data.period_start}..{data.period_end}",
+            "profit": str(data.profit),
+            "investor_amount": str(from_sen(to_investors)),
+            "investors": len(investment_ids),
+        }
+    )
+    db.commit()
+    db.refresh(distribution)
+    return distribution
+
+
+def list_distributions(db: Session, company_id: int, pool_id: int) -> list[ProfitDistribution]:
+    get_pool(db, company_id, pool_id)
+    return list(db.scalars(
+        select(ProfitDistribution).where(ProfitDistribution.pool_id == pool_id)
+        .order_by(ProfitDistribution.period_start.desc())
+    ))
+
+
+def list_payouts(
+    db: Session,
+    company_id: int,
+    distribution_id: int,
+    limit: int = 1000,
+    offset: int = 0,
+) -> list:
+    """
+    Payouts of a distribution by investment, with the investor reference.
+
+    Raises:
+        HTTPException 404: Distribution not found in this company
+    """
+    distribution = db.get(ProfitDistribution, distribution_id)
+    if distribution is None or distribution.company_id != company_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Distribution not found")
+    return db.execute(
+        select(
+            ProfitPayout.investment_id,
+            PoolInvestment.investor_reference,
+            ProfitPayout.capital_days,
+            ProfitPayout.amount,
+        )
+        .join(PoolInvestment, PoolInvestment.id == ProfitPayout.investment_id)
+        .where(ProfitPayout.distribution_id == distribution_id)
+        .order_by(ProfitPayout.investment_id)
+        .limit(limit).offset(offset)
+    ).all()
@@ -0,0 +1,456 @@
+# app/services/forecast_service.py
+
+"""
+Forecast Service
+Nightly demand forecasts and reorder points for every stocked product.
+
+How it works:
+1. Sales (SALE stock movements, all warehouses; POS sync dates them at
+   the sale, not the upload) are summed per product per local day (each
+   at its own UTC offset) and loaded into one NumPy matrix:
+   products x FORECAST_HISTORY_DAYS
+2. Holt-Winters exponential smoothing (damped additive trend, additive
+   weekly season) runs over that matrix one day at a time, for every
+   product and every candidate set of smoothing parameters at once - the
+   Python loop is over days, never over products
+3. Each product keeps the parameters with the smallest one-day-ahead
+   error. The forecast gives the demand over the lead time, the error the
+   safety stock:
+       reorder point = lead time demand + z * RMSE * sqrt(lead time)
+4. The products' forecasts are replaced with one bulk INSERT (and, with
+   FORECAST_APPLY_REORDER_LEVELS, products' reorder levels with one bulk
+   UPDATE)
+
+The nightly job spreads companies over a process pool (FORECAST_WORKERS):
+each process forecasts whole companies with its own database connection.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, time as day_time, timedelta, timezone
+from decimal import Decimal
+from itertools import repeat
+from typing import Optional
+from zoneinfo import ZoneInfo
+import numpy as np
+from sqlalchemy import Integer, cast, delete, extract, func, insert, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal, engine
+from app.models.forecast import DemandForecast
+from app.models.job import Job, JobStatus
+from app.models.product import Product
+from app.models.stock import MovementType, StockMovement
+from app.services.inventory_service import set_reorder_levels
+from app.services.iot_service import utc_offsets
+from app.services.job_service import enqueue_job, job_handler
+
+
+NIGHTLY_JOB = "forecasts.nightly"
+COMPANY_JOB = "forecasts.company"
+
+# Candidate smoothing parameters: every product tries every combination
+ALPHAS = (0.05, 0.15, 0.3, 0.5)  # Level
+BETAS = (0.0, 0.05)  # Trend
+GAMMAS = (0.05, 0.15, 0.3)  # Season
+DAMPING = 0.9  # The trend fades out: a few good weeks don't forecast growth forever
+
+# Products fitted together: keeps the arrays of the day loop small enough for the CPU cache
+FIT_BLOCK = 1024
+
+
+# ===== MODEL =====
+@dataclass
+class ForecastFit:
+    """Holt-Winters results, one entry per product (row of the sales matrix)."""
+    forecast: np.ndarray  # (products, horizon) expected sales per day, starting tomorrow
+    error: np.ndarray  # RMSE of one-day-ahead forecasts over the history
+    alpha: np.ndarray
+    beta: np.ndarray
+    gamma: np.ndarray
+    history_days: np.ndarray  # Days from the first sale to the end of the history
+
+
+def _parameter_grid() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Every (alpha, beta, gamma) combination as (combinations, 1) columns."""
+    alpha, beta, gamma = np.meshgrid(ALPHAS, BETAS, GAMMAS, indexing="ij")
+    return alpha.reshape(-1, 1), beta.reshape(-1, 1), gamma.reshape(-1, 1)
+
+
+def _fit_block(sales: np.ndarray, season: int, horizon: int) -> ForecastFit:
+    products, days = sales.shape
+    rows = np.arange(products)
+    alpha, beta, gamma = _parameter_grid()
+    combinations = len(alpha)
+
+    # Each product's model starts at its first sale, from the mean of its first season
+    start = np.argmax(sales > 0, axis=1)
+    totals = np.zeros((products, days + 1))
+    np.cumsum(sales, axis=1, out=totals[:, 1:])
+    first_end = np.minimum(start + season, days)
+    initial = (totals[rows, first_end] - totals[rows, start]) / (first_end - start)
+
+    level = np.repeat(initial[np.newaxis, :], combinations, axis=0)
+    trend = np.zeros((combinations, products))
+    seasonal = np.zeros((season, combinations, products))
+    squared = np.zeros((combinations, products))
+    error = np.empty((combinations, products))
+    step = np.empty((combinations, products))
+    alpha_beta = alpha * beta
+    # In place: no new arrays per day
+    for day in range(days):
+        seasonal_day = seasonal[day % season]
+        trend *= DAMPING
+        level += trend  # Expected level today
+        np.subtract(sales[:, day], level, out=error)
+        error -= seasonal_day
+        error *= day >= start  # No updates before the first sale
+        np.multiply(error, error, out=step)
+        squared += step
+        np.multiply(alpha, error, out=step)
+        level += step
+        np.multiply(alpha_beta, error, out=step)
+        trend += step
+        np.multiply(gamma, error, out=step)
+        seasonal_day += step
+
+    # Best parameters per product
+    best = np.argmin(squared, axis=0)
+    history_days = days - start
+    steps = np.arange(1, horizon + 1)
+    damped_steps = np.cumsum(DAMPING ** steps)
+    future_season = seasonal[(days + steps - 1) % season][:, best, rows].T
+    forecast = level[best, rows][:, np.newaxis] + trend[best, rows][:, np.newaxis] * damped_steps + future_season
+    return ForecastFit(
+        forecast=np.maximum(forecast, 0),
+        error=np.sqrt(squared[best, rows] / np.maximum(history_days, 1)),
+        alpha=alpha[best, 0],
+        beta=beta[best, 0],
+        gamma=gamma[best, 0],
+        history_days=history_days,
+    )
+
+
+def fit_holt_winters(
+    sales: np.ndarray,
+    season: int = settings.FORECAST_SEASON_DAYS,
+    horizon: int = settings.FORECAST_HORIZON_DAYS,
+) -> ForecastFit:
+    """
+    Fit damped additive Holt-Winters to many products at once.
+
+    Args:
+        sales: (products, days) sales per day, oldest first, ending yesterday
+        season: Length of the sales cycle in days
+        horizon: Days to forecast
+
+    Returns:
+        ForecastFit with one entry per row of `sales`
+    """
+    sales = np.asarray(sales, dtype=np.float64)
+    # At least one (possibly empty) block, so a company without sales gets empty results
+    blocks = [_fit_block(sales[index:index + FIT_BLOCK], season, horizon) for index in range(0, len(sales) or 1, FIT_BLOCK)]
+    if len(blocks) == 1:
+        return blocks[0]
+    return ForecastFit(*(
+        np.concatenate([getattr(block, field) for block in blocks])
+        for field in ForecastFit.__dataclass_fields__
+    ))
+
+
+def reorder_points(
+    fit: ForecastFit,
+    lead_time: int = settings.FORECAST_LEAD_TIME_DAYS,
+    z: float = settings.FORECAST_SERVICE_LEVEL_Z,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns:
+        (lead_time_demand, safety_stock, reorder_point) per product
+    """
+    demand = fit.forecast[:, :lead_time].sum(axis=1)
+    safety = z * fit.error * np.sqrt(lead_time)
+    return demand, safety, demand + safety
+
+
+# ===== SALES HISTORY =====
+def _local_day_number(column, dialect: str):
+    """
+    Days since 1970-01-01 in DASHBOARD_TIMEZONE, computed by the database
+    with each value's own UTC offset. SQLite has no time zones: there it is
+    the UTC quarter hour instead (every offset is whole quarter hours), which
+    _local_days turns into the local day.
+    """
+    if dialect == "sqlite":
+        return cast(func.strftime("%s", column), Integer) // 900
+    return cast(func.floor(extract("epoch", func.timezone(settings.DASHBOARD_TIMEZONE, column)) / 86400), Integer)
+
+
+def _local_days(numbers: np.ndarray, dialect: str) -> np.ndarray:
+    """Local day numbers from _local_day_number values."""
+    if dialect != "sqlite":
+        return numbers
+    moments = numbers * 900
+    return (moments + utc_offsets(moments, ZoneInfo(settings.DASHBOARD_TIMEZONE))) // 86400
+
+
+def _history_window(today: date, days: int) -> tuple[int, datetime, datetime]:
+    """(first day number, start, end) of the `days` local days before `today`."""
+    zone = ZoneInfo(settings.DASHBOARD_TIMEZONE)
+    first_day = today - timedelta(days=days)
+    start = datetime.combine(first_day, day_time.min, tzinfo=zone).astimezone(timezone.utc)
+    end = datetime.combine(today, day_time.min, tzinfo=zone).astimezone(timezone.utc)
+    return (first_day - date(1970, 1, 1)).days, start, end
+
+
+def load_sales_history(
+    db: Session,
+    company_id: int,
+    today: date,
+    days: int = settings.FORECAST_HISTORY_DAYS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Daily sales of the company's active stocked products over the `days`
+    days before `today`.
+
+    Returns:
+        (product_ids, sales): product ids with at least one sale, and a
+        (products, days) matrix of quantities sold, oldest day first
+    """
+    first_day, start, end = _history_window(today, days)
+    dialect = db.get_bind().dialect.name
+    day = _local_day_number(StockMovement.created_at, dialect)
+    rows = db.execute(
+        select(StockMovement.product_id, day, -func.sum(StockMovement.quantity))
+        .join(Product, Product.id == StockMovement.product_id)
+        .where(
+            StockMovement.company_id == company_id,
+            StockMovement.type == MovementType.SALE,
+            StockMovement.created_at >= start,
+            StockMovement.created_at < end,
+            Product.is_active.is_(True),
+            Product.is_stocked.is_(True),
+        )
+        .group_by(StockMovement.product_id, day)
+    ).all()
+    if not rows:
+        return np.zeros(0, dtype=np.int64), np.zeros((0, days))
+
+    columns = list(zip(*rows))
+    count = len(rows)
+    product_column = np.fromiter(columns[0], dtype=np.int64, count=count)
+    day_column = _local_days(np.fromiter(columns[1], dtype=np.int64, count=count), dialect) - first_day
+    quantities = np.fromiter(columns[2], dtype=np.float64, count=count)
+    product_ids, product_rows = np.unique(product_column, return_inverse=True)
+    sales = np.zeros((len(product_ids), days))
+    inside = (day_column >= 0) & (day_column < days)
+    np.add.at(sales, (product_rows[inside], day_column[inside]), quantities[inside])
+    return product_ids, sales
+
+
+# ===== WRITE BACK =====
+def _quantity(value: float) -> Decimal:
+    return Decimal(f"{value:.3f}")
+
+
+def write_forecasts(db: Session, company_id: int, product_ids: np.ndarray, fit: ForecastFit, generated_at: datetime) -> int:
+    """
+    Replace the forecasts of `product_ids` in bulk (does not commit).
+
+    With FORECAST_APPLY_REORDER_LEVELS the reorder points also become the
+    products' reorder levels.
+
+    Returns:
+        Number of products whose reorder level changed
+    """
+    demand, safety, reorder_point = reorder_points(fit)
+    daily = np.round(fit.forecast, 3).tolist()
+    rows = [
+        {
+            "product_id": product_id,
+            "company_id": company_id,
+            "generated_at": generated_at,
+            "daily": daily[index],
+            "lead_time_demand": _quantity(demand[index]),
+            "safety_stock": _quantity(safety[index]),
+            "reorder_point": _quantity(reorder_point[index]),
+            "error": round(error, 4),
+            "alpha": alpha,
+            "beta": beta,
+            "gamma": gamma,
+            "history_days": history_days,
+        }
+        for index, (product_id, error, alpha, beta, gamma, history_days) in enumerate(zip(
+            product_ids.tolist(), fit.error.tolist(), fit.alpha.tolist(), fit.beta.tolist(),
+            fit.gamma.tolist(), fit.history_days.tolist(),
+        ))
+    ]
+    db.execute(delete(DemandForecast).where(
+        DemandForecast.company_id == company_id,
+        DemandForecast.product_id.in_(product_ids.tolist()),
+    ))
+    if rows:
+        db.execute(insert(DemandForecast), rows)
+    if not settings.FORECAST_APPLY_REORDER_LEVELS or not rows:
+        return 0
+    return set_reorder_levels(db, company_id, {row["product_id"]: row["reorder_point"] for row in rows})
+
+
+# ===== RUNNING =====
+def _local_today() -> date:
+    return datetime.now(ZoneInfo(settings.DASHBOARD_TIMEZONE)).date()
+
+
+def forecast_company(db: Session, company_id: int, today: Optional[date] = None) -> dict:
+    """
+    Forecast every product of a company and store the results (commits).
+
+    Returns:
+        {"company_id", "products", "reorder_levels_changed", "seconds"}
+    """
+    started = time.perf_counter()
+    today = today or _local_today()
+    product_ids, sales = load_sales_history(db, company_id, today)
+    fit = fit_holt_winters(sales)
+    changed = write_forecasts(db, company_id, product_ids, fit, datetime.now(timezone.utc))
+    db.commit()
+    return {
+        "company_id": company_id,
+        "products": len(product_ids),
+        "reorder_levels_changed": changed,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def _init_process() -> None:
+    """Forked pool processes must not share the parent's database connections."""
+    engine.dispose(close=False)
+
+
+def _forecast_in_process(company_id: int, today: date) -> dict:
+    """Forecast one company (runs in a pool process, with its own session)."""
+    db = SessionLocal()
+    try:
+        return forecast_company(db, company_id, today)
+    except Exception as exc:
+        db.rollback()
+        return {"company_id": company_id, "error": str(exc)}
+    finally:
+        db.close()
+
+
+def companies_with_sales(db: Session, today: date, days: int = settings.FORECAST_HISTORY_DAYS) -> list[int]:
+    """Companies with sales in the history window, busiest first (so big tenants don't start last)."""
+    _, start, end = _history_window(today, days)
+    return list(db.scalars(
+        select(StockMovement.company_id)
+        .where(StockMovement.type == MovementType.SALE, StockMovement.created_at >= start, StockMovement.created_at < end)
+        .group_by(StockMovement.company_id)
+        .order_by(func.count().desc())
+    ))
+
+
+def run_forecasts(
+    company_ids: Optional[list[int]] = None,
+    workers: int = settings.FORECAST_WORKERS,
+    today: Optional[date] = None,
+) -> dict:
+    """
+    Forecast many companies, one company per task across a process pool.
+
+    Args:
+        company_ids: Companies to forecast (default: every company with sales)
+        workers: Processes to use (1 = run in this process)
+
+    Returns:
+        {"companies", "products", "failed", "seconds"}
+    """
+    started = time.perf_counter()
+    today = today or _local_today()
+    if company_ids is None:
+        db = SessionLocal()
+        try:
+            company_ids = companies_with_sales(db, today)
+        finally:
+            db.close()
+    if workers <= 1 or len(company_ids) <= 1:
+        results = [_forecast_in_process(company_id, today) for company_id in company_ids]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(company_ids)), initializer=_init_process) as pool:
+            results = list(pool.map(_forecast_in_process, company_ids, repeat(today)))
+    failed = [result for result in results if "error" in result]
+    for result in failed:
+        print(f"⚠️  Forecast failed for company {result['company_id']}: {result['error']}")
+    return {
+        "companies": len(results) - len(failed),
+        "products": sum(result.get("products", 0) for result in results),
+        "failed": len(failed),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+# ===== SCHEDULING =====
+def schedule_nightly_forecast(db: Session) -> Optional[Job]:
+    """
+    Queue the next nightly forecast (at FORECAST_RUN_HOUR local time)
+    unless one is already queued or running. Called by the worker's
+    maintenance loop, so the job re-queues itself after every run.
+
+    Returns:
+        The new job, or None if one was already pending
+    """
+    pending = db.scalar(
+        select(Job.id).where(Job.kind == NIGHTLY_JOB, Job.status.in_((JobStatus.QUEUED, JobStatus.RUNNING))).limit(1)
+    )
+    if pending is not None:
+        return None
+    zone = ZoneInfo(settings.DASHBOARD_TIMEZONE)
+    now = datetime.now(zone)
+    run_at = datetime.combine(now.date(), day_time(settings.FORECAST_RUN_HOUR), tzinfo=zone)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    job = enqueue_job(db, NIGHTLY_JOB, run_at=run_at.astimezone(timezone.utc), max_attempts=3)
+    db.commit()
+    return job
+
+
+def request_forecast(db: Session, company_id: int) -> Job:
+    """Queue a forecast of one company now (e.g. after importing sales history)."""
+    job = enqueue_job(db, COMPANY_JOB, company_id=company_id, priority=1, max_attempts=3)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def list_forecasts(
+    db: Session,
+    company_id: int,
+    product_id: Optional[int] = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> list[DemandForecast]:
+    query = select(DemandForecast).where(DemandForecast.company_id == company_id)
+    if product_id is not None:
+        query = query.where(DemandForecast.product_id == product_id)
+    return list(db.scalars(query.order_by(DemandForecast.product_id).limit(limit).offset(offset)))
+
+
+# ===== JOB HANDLERS =====
+@job_handler(NIGHTLY_JOB)
+def nightly_forecast_job(db: Session, job) -> None:
+    """
+    Every company with sales, spread over FORECAST_WORKERS processes.
+    Any failed company fails the job, so it is retried (the others are
+    simply forecast again).
+    """
+    stats = run_forecasts()
+    print(f"📈 Nightly forecast: {stats}")
+    if stats["failed"]:
+        raise RuntimeError(f"Forecast failed for {stats['failed']} companies")
+
+
+@job_handler(COMPANY_JOB)
+def company_forecast_job(db: Session, job) -> None:
+    """One company, in the worker thread."""
+    stats = forecast_company(db, job.company_id)
+    print(f"📈 Forecast for company {job.company_id}: {stats}")
@@ -0,0 +1,647 @@
+# app/services/fraud_service.py
+
+"""
+Fraud Service
+Scores every new POS sale on upload, from in-memory sliding-window activity
+of its company, terminal and user.
+
+How it works:
+1. pos_sync_service stores a batch of sales and hands the new ones to
+   scorer.score() before committing
+2. Each sale is added to time-bucketed sliding windows kept per company,
+   per terminal and per user: sale counts (velocity), amounts, discounts
+   and off-hours sales (by the sale's local hour in DASHBOARD_TIMEZONE)
+   over FRAUD_SHORT_WINDOW_SECONDS and FRAUD_LONG_WINDOW_SECONDS. Adding
+   a sale and reading a window are O(1), no queries. Features are built
+   on a copy of the windows; the sales join the shared windows only when
+   the upload commits (a rolled-back upload leaves no trace)
+3. The batch's features are scored with one matrix product by a logistic
+   model compiled at startup (normalization folded into the weights).
+   Sales scoring FRAUD_FLAG_THRESHOLD or more get an audit event
+4. After commit, scores and features go to a background thread
+   (FraudShipper) that writes them to fraud_scores in bulk: the review
+   queue, and the training set for the next model once reviewers label it
+
+Latency budget: an upload spends at most FRAUD_SCORE_BUDGET_MS on scoring.
+Sales left when the budget runs out are scored by the shipper thread
+instead, so a large upload never waits on scoring.
+
+Windows use the sale's own time (sold_at): a terminal uploading an hour of
+offline sales at once does not look like a burst. State lives in each API
+worker process, so a company's windows see the sales uploaded through
+that worker.
+"""
+
+import json
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+from zoneinfo import ZoneInfo
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal, engine
+from app.models.fraud import FraudScore
+from app.services.audit_service import record_audit
+
+
+# Model inputs, in the order of the feature matrix columns
+FEATURES = (
+    "amount",  # log(1 + sale total in RM)
+    "discount_ratio",  # Discount / amount before discount, of the sale
+    "lines",
+    "off_hours",  # 1 if sold during off-hours
+    "amount_vs_terminal",  # Sale total / the terminal's average sale (long window)
+    "terminal_velocity",  # Terminal's sales in the short window
+    "terminal_count",  # Terminal's sales in the long window
+    "terminal_discount_ratio",
+    "terminal_off_hours_ratio",
+    "user_velocity",
+    "user_discount_ratio",
+    "company_velocity",
+    "terminal_share",  # Terminal's share of the company's sales (long window)
+)
+
+# Used when FRAUD_MODEL_PATH is not set. A model file has the same shape;
+# features it leaves out get weight 0 (mean 0, scale 1).
+BUILTIN_MODEL = {
+    "version": "builtin-1",
+    "bias": -7.0,
+    "weights": {
+        "amount": 0.6, "discount_ratio": 1.2, "lines": 0.1, "off_hours": 0.8,
+        "amount_vs_terminal": 0.5, "terminal_velocity": 0.8, "terminal_count": 0.2,
+        "terminal_discount_ratio": 1.0, "terminal_off_hours_ratio": 0.5,
+        "user_velocity": 0.5, "user_discount_ratio": 0.8,
+    },
+    "mean": {
+        "amount": 3.5, "discount_ratio": 0.02, "lines": 3, "off_hours": 0.05,
+        "amount_vs_terminal": 1.0, "terminal_velocity": 5, "terminal_count": 30,
+        "terminal_discount_ratio": 0.02, "terminal_off_hours_ratio": 0.05,
+        "user_velocity": 5, "user_discount_ratio": 0.02,
+    },
+    "scale": {
+        "amount": 1.0, "discount_ratio": 0.1, "lines": 3, "off_hours": 0.2,
+        "amount_vs_terminal": 1.0, "terminal_velocity": 5, "terminal_count": 30,
+        "terminal_discount_ratio": 0.1, "terminal_off_hours_ratio": 0.2,
+        "user_velocity": 5, "user_discount_ratio": 0.1,
+    },
+}
+
+# Window sums: sales, total (sen), discount (sen), before discount (sen), off-hours sales
+COUNT, AMOUNT, DISCOUNT, GROSS, OFF_HOURS = range(5)
+FIELDS = 5
+
+# Sales checked between two looks at the clock
+BUDGET_CHECK_EVERY = 8
+
+# Session.info key: (scorer, company_id, transactions, draft) to add to the windows on commit
+_PENDING_KEY = "pending_fraud_windows"
+
+
+class Transaction(NamedTuple):
+    """A new sale as the scorer sees it."""
+    sale_id: int
+    terminal: str
+    user_id: Optional[int]
+    moment: float  # sold_at, epoch seconds
+    gross: int  # Sen, before discounts
+    discount: int  # Sen
+    lines: int
+
+
+class ScoredBatch(NamedTuple):
+    """Result of scoring one upload, and the sales left for the background."""
+    company_id: int
+    sale_ids: list[int]
+    scores: np.ndarray
+    features: np.ndarray  # (sales, len(FEATURES))
+    deferred: list[Transaction]  # Not scored yet (over the time budget)
+    background: bool = False  # Scored by the shipper thread
+
+
+# ===== MODEL =====
+class CompiledModel:
+    """
+    Logistic regression with normalization folded in:
+        score = sigmoid(features @ weights + bias)
+    """
+
+    def __init__(self, spec: dict):
+        unknown = set(spec.get("weights", {})) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"Fraud model uses unknown features: {sorted(unknown)}")
+        weights = np.array([float(spec["weights"].get(name, 0.0)) for name in FEATURES])
+        mean = np.array([float(spec.get("mean", {}).get(name, 0.0)) for name in FEATURES])
+        scale = np.array([float(spec.get("scale", {}).get(name, 1.0)) for name in FEATURES])
+        self.weights = weights / scale
+        self.bias = float(spec.get("bias", 0.0)) - float(mean @ self.weights)
+        self.version = str(spec.get("version", "custom"))[:50]
+
+    def score(self, features: np.ndarray) -> np.ndarray:
+        """Scores (0-1) for a (sales, len(FEATURES)) matrix."""
+        logits = np.clip(features @ self.weights + self.bias, -50, 50)
+        return 1.0 / (1.0 + np.exp(-logits))
+
+
+def load_model(path: Optional[str] = settings.FRAUD_MODEL_PATH) -> CompiledModel:
+    if not path:
+        return CompiledModel(BUILTIN_MODEL)
+    with open(path) as file:
+        return CompiledModel(json.load(file))
+
+
+# ===== SLIDING WINDOWS =====
+class SlidingWindow:
+    """
+    Sums over the last `span` seconds, kept in `slots` time buckets (a ring).
+
+    Adding a sale touches one bucket; moving forward in time clears the
+    buckets that fell out of the window. Sales older than the window are
+    ignored.
+    """
+
+    __slots__ = ("width", "slots", "latest", "buckets", "totals")
+
+    def __init__(self, span: float, slots: int):
+        self.width = span / slots
+        self.slots = slots
+        self.latest: Optional[int] = None  # Newest bucket number
+        self.buckets = [[0] * FIELDS for _ in range(slots)]
+        self.totals = [0] * FIELDS
+
+    def _advance(self, bucket: int) -> None:
+        if self.latest is None or bucket - self.latest >= self.slots:
+            for values in self.buckets:
+                values[:] = [0] * FIELDS
+            self.totals = [0] * FIELDS
+        else:
+            totals = self.totals
+            for number in range(self.latest + 1, bucket + 1):
+                values = self.buckets[number % self.slots]
+                for field in range(FIELDS):
+                    totals[field] -= values[field]
+                    values[field] = 0
+        self.latest = bucket
+
+    def add(self, moment: float, values: tuple) -> None:
+        bucket = int(moment // self.width)
+        if self.latest is None or bucket > self.latest:
+            self._advance(bucket)
+        elif bucket <= self.latest - self.slots:
+            return  # Older than the window
+        count, amount, discount, gross, off_hours = values
+        slot = self.buckets[bucket % self.slots]
+        slot[COUNT] += count
+        slot[AMOUNT] += amount
+        slot[DISCOUNT] += discount
+        slot[GROSS] += gross
+        slot[OFF_HOURS] += off_hours
+        totals = self.totals
+        totals[COUNT] += count
+        totals[AMOUNT] += amount
+        totals[DISCOUNT] += discount
+        totals[GROSS] += gross
+        totals[OFF_HOURS] += off_hours
+
+    def is_idle(self, moment: float) -> bool:
+        """Nothing left in the window at `moment`."""
+        return self.latest is None or int(moment // self.width) - self.latest >= self.slots
+
+    def copy(self) -> "SlidingWindow":
+        window = SlidingWindow.__new__(SlidingWindow)
+        window.width, window.slots, window.latest = self.width, self.slots, self.latest
+        window.buckets = list(map(list, self.buckets))
+        window.totals = list(self.totals)
+        return window
+
+
+class Activity:
+    """Short and long windows of one company, terminal or user."""
+
+    __slots__ = ("short", "long")
+
+    def __init__(self):
+        self.short = SlidingWindow(settings.FRAUD_SHORT_WINDOW_SECONDS, 10)
+        self.long = SlidingWindow(settings.FRAUD_LONG_WINDOW_SECONDS, 12)
+
+    def add(self, moment: float, values: tuple) -> None:
+        self.short.add(moment, values)
+        self.long.add(moment, values)
+
+    def copy(self) -> "Activity":
+        activity = Activity.__new__(Activity)
+        activity.short, activity.long = self.short.copy(), self.long.copy()
+        return activity
+
+
+def _member(members: dict, shared: Optional[dict], key) -> Activity:
+    """members[key], created on first use (as a copy of shared[key] if there is one)."""
+    activity = members.get(key)
+    if activity is None:
+        source = shared.get(key) if shared is not None else None
+        activity = members[key] = source.copy() if source is not None else Activity()
+    return activity
+
+
+def _ratio(part: float, whole: float) -> float:
+    return part / whole if whole else 0.0
+
+
+class CompanyActivity:
+    """Windows of one company and of its terminals and users."""
+
+    __slots__ = ("lock", "company", "terminals", "users", "base", "version")
+
+    def __init__(self, base: Optional["CompanyActivity"] = None):
+        self.lock = threading.Lock()
+        self.base = base
+        self.version = base.version if base is not None else 0  # Bumped by every apply
+        self.company = base.company.copy() if base is not None else Activity()
+        self.terminals: dict[str, Activity] = {}
+        self.users: dict[int, Activity] = {}
+
+    def draft(self) -> "CompanyActivity":
+        """
+        Copy-on-write view of the windows to build an upload's features on
+        before it commits (hold this object's lock while using it).
+        Terminals and users are copied when a sale first touches them.
+        """
+        return CompanyActivity(self)
+
+    def add(self, transaction: Transaction, off_hours: bool) -> tuple[Activity, Optional[Activity]]:
+        """Add a sale to the windows (caller holds the lock). Returns its terminal's and user's windows."""
+        amount = transaction.gross - transaction.discount
+        values = (1, amount, transaction.discount, transaction.gross, int(off_hours))
+        moment = transaction.moment
+        base = self.base
+        terminal = _member(self.terminals, base.terminals if base is not None else None, transaction.terminal)
+        terminal.add(moment, values)
+        self.company.add(moment, values)
+        user = None
+        if transaction.user_id is not None:
+            user = _member(self.users, base.users if base is not None else None, transaction.user_id)
+            user.add(moment, values)
+        return terminal, user
+
+    def observe(self, transaction: Transaction, off_hours: bool) -> list[float]:
+        """Add a sale to the windows (caller holds the lock) and return its features."""
+        terminal, user = self.add(transaction, off_hours)
+        amount = transaction.gross - transaction.discount
+        user_velocity = user_discount_ratio = 0.0
+        if user is not None:
+            user_velocity = user.short.totals[COUNT]
+            user_discount_ratio = _ratio(user.long.totals[DISCOUNT], user.long.totals[GROSS])
+
+        recent = terminal.long.totals
+        return [
+            math.log1p(amount / 100),
+            _ratio(transaction.discount, transaction.gross),
+            float(transaction.lines),
+            float(off_hours),
+            _ratio(amount * recent[COUNT], recent[AMOUNT]),
+            terminal.short.totals[COUNT],
+            recent[COUNT],
+            _ratio(recent[DISCOUNT], recent[GROSS]),
+            _ratio(recent[OFF_HOURS], recent[COUNT]),
+            user_velocity,
+            user_discount_ratio,
+            self.company.short.totals[COUNT],
+            _ratio(recent[COUNT], self.company.long.totals[COUNT]),
+        ]
+
+    def sweep(self, moment: float) -> int:
+        """Forget terminals and users with nothing in their windows. Returns how many."""
+        with self.lock:
+            idle_terminals = [key for key, activity in self.terminals.items() if activity.long.is_idle(moment)]
+            idle_users = [key for key, activity in self.users.items() if activity.long.is_idle(moment)]
+            for key in idle_terminals:
+                del self.terminals[key]
+            for key in idle_users:
+                del self.users[key]
+        return len(idle_terminals) + len(idle_users)
+
+
+# ===== SCORER =====
+def epoch(moment: datetime) -> float:
+    """Epoch seconds of a sale time (naive times are taken as UTC)."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class FraudScorer:
+    """
+    Example:
+        batch = scorer.score(db, company_id, transactions)  # before commit
+        db.commit()  # the sales join the windows
+        shipper.ship(batch)
+    """
+
+    def __init__(self, model: Optional[CompiledModel] = None):
+        self.model = model or load_model()
+        self._companies: dict[int, CompanyActivity] = {}
+        self._lock = threading.Lock()
+        self.scored = 0
+        self.deferred = 0
+        self.flagged = 0
+
+    def _activity(self, company_id: int) -> CompanyActivity:
+        activity = self._companies.get(company_id)
+        if activity is None:
+            with self._lock:
+                activity = self._companies.setdefault(company_id, CompanyActivity())
+        return activity
+
+    def _is_off_hours(self, moment: float) -> bool:
+        # The sale's own offset, so DST changes are respected
+        hour = datetime.fromtimestamp(moment, ZoneInfo(settings.DASHBOARD_TIMEZONE)).hour
+        start, end = settings.FRAUD_OFF_HOURS_START, settings.FRAUD_OFF_HOURS_END
+        return start <= hour < end if start <= end else (hour >= start or hour < end)
+
+    def features(
+        self,
+        company_id: int,
+        transactions: list[Transaction],
+        deadline: Optional[float] = None,
+    ) -> tuple[np.ndarray, CompanyActivity]:
+        """
+        Build the feature rows of sales, in order, as if each was added to
+        the windows after the ones before it. The windows themselves are
+        not changed (see apply).
+
+        Args:
+            deadline: time.perf_counter() value to stop at (the rest is not touched)
+
+        Returns:
+            (features, draft): (sales handled, len(FEATURES)) matrix - fewer
+            rows than transactions if the deadline passed - and the draft
+            windows holding the sales handled
+        """
+        activity = self._activity(company_id)
+        rows = []
+        with activity.lock:
+            draft = activity.draft()
+            for index, transaction in enumerate(transactions):
+                if deadline is not None and index % BUDGET_CHECK_EVERY == 0 and index and time.perf_counter() > deadline:
+                    break
+                rows.append(draft.observe(transaction, self._is_off_hours(transaction.moment)))
+        return np.array(rows, dtype=np.float64).reshape(len(rows), len(FEATURES)), draft
+
+    def apply(self, company_id: int, transactions: list[Transaction], draft: CompanyActivity) -> None:
+        """
+        Add committed sales to the company's windows. The draft they were
+        scored on is taken as is if nothing changed the windows since;
+        otherwise the sales are added again.
+        """
+        activity = self._activity(company_id)
+        with activity.lock:
+            if draft.base is activity and draft.version == activity.version:
+                activity.company = draft.company
+                activity.terminals.update(draft.terminals)
+                activity.users.update(draft.users)
+            else:
+                for transaction in transactions:
+                    activity.add(transaction, self._is_off_hours(transaction.moment))
+            activity.version += 1
+
+    def _flag(self, db: Optional[Session], company_id: int, sale_ids: list[int], scores: np.ndarray) -> None:
+        flagged = np.flatnonzero(scores >= settings.FRAUD_FLAG_THRESHOLD)
+        for index in flagged.tolist():
+            record_audit(
+                db, "pos.sale_flagged", "pos_sale", sale_ids[index], company_id=company_id,
+                changes={"score": round(float(scores[index]), 4), "model": self.model.version}
+            )
+        self.flagged += len(flagged)
+
+    def score(
+        self,
+        db: Session,
+        company_id: int,
+        transactions: list[Transaction],
+        budget_ms: float = settings.FRAUD_SCORE_BUDGET_MS,
+    ) -> ScoredBatch:
+        """
+        Score new sales within the time budget (call before commit: flagged
+        sales are audited in the caller's transaction, and the scored sales
+        join the windows when it commits - right away without a session).
+
+        Returns:
+            ScoredBatch - pass it to shipper.ship() after commit
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        features, draft = self.features(company_id, transactions, deadline)
+        scores = self.model.score(features)
+        count = len(features)
+        sale_ids = [transaction.sale_id for transaction in transactions[:count]]
+        self._flag(db, company_id, sale_ids, scores)
+        if db is None:
+            self.apply(company_id, transactions[:count], draft)
+        else:
+            db.info.setdefault(_PENDING_KEY, []).append((self, company_id, transactions[:count], draft))
+        self.scored += count
+        self.deferred += len(transactions) - count
+        return ScoredBatch(company_id, sale_ids, scores, features, transactions[count:])
+
+    def score_deferred(self, company_id: int, transactions: list[Transaction]) -> ScoredBatch:
+        """Score sales an upload had no time for (shipper thread, no budget; already committed)."""
+        features, draft = self.features(company_id, transactions)
+        self.apply(company_id, transactions, draft)
+        scores = self.model.score(features)
+        sale_ids = [transaction.sale_id for transaction in transactions]
+        self._flag(None, company_id, sale_ids, scores)
+        self.scored += len(transactions)
+        return ScoredBatch(company_id, sale_ids, scores, features, [], background=True)
+
+    def sweep(self) -> int:
+        """Drop idle terminals, users and companies. Returns entries dropped."""
+        moment = time.time()
+        dropped = 0
+        for company_id, activity in list(self._companies.items()):
+            dropped += activity.sweep(moment)
+            if not activity.terminals and activity.company.long.is_idle(moment):
+                with self._lock:
+                    self._companies.pop(company_id, None)
+                dropped += 1
+        return dropped
+
+    def stats(self) -> dict:
+        return {
+            "model": self.model.version,
+            "companies": len(self._companies),
+            "scored": self.scored,
+            "deferred": self.deferred,
+            "flagged": self.flagged,
+        }
+
+
+# ===== SHIPPING =====
+class FraudShipper:
+    """
+    Background thread: scores deferred sales and writes scores to
+    fraud_scores in bulk.
+
+    Uploads only queue their ScoredBatch; turning it into rows happens here.
+    At most FRAUD_BUFFER_SIZE scores are held: if the database is down for
+    long, the oldest batches are dropped and counted.
+    """
+
+    def __init__(self, scorer: FraudScorer, interval: float = settings.FRAUD_FLUSH_INTERVAL_SECONDS):
+        self.scorer = scorer
+        self.interval = interval
+        self.maxsize = settings.FRAUD_BUFFER_SIZE
+        self._batches: deque[tuple[datetime, ScoredBatch]] = deque()
+        self._queued = 0  # Scores in _batches
+        self._deferred: deque[tuple[int, list[Transaction]]] = deque()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.written = 0
+        self.dropped = 0
+        self.failures = 0
+
+    def _trim(self) -> None:
+        """Drop the oldest batches beyond maxsize (caller holds the lock)."""
+        while self._queued > self.maxsize and self._batches:
+            _, batch = self._batches.popleft()
+            self._queued -= len(batch.sale_ids)
+            self.dropped += len(batch.sale_ids)
+
+    def ship(self, batch: ScoredBatch) -> None:
+        """Queue a scored upload (after its transaction committed)."""
+        with self._lock:
+            if batch.sale_ids:
+                self._batches.append((datetime.now(timezone.utc), batch))
+                self._queued += len(batch.sale_ids)
+                self._trim()
+            if batch.deferred:
+                self._deferred.append((batch.company_id, batch.deferred))
+
+    def flush(self) -> int:
+        """Score deferred sales, then write everything queued. Returns rows written."""
+        while self._deferred:
+            with self._lock:
+                company_id, transactions = self._deferred.popleft()
+            self.ship(self.scorer.score_deferred(company_id, transactions))
+
+        with self._lock:
+            batches = list(self._batches)
+            self._batches.clear()
+            self._queued = 0
+        if not batches:
+            return 0
+        version = self.scorer.model.version
+        rows = [
+            {
+                "company_id": batch.company_id, "sale_id": sale_id, "scored_at": scored_at,
+                "score": score, "model_version": version,
+                "features": dict(zip(FEATURES, features)), "deferred": batch.background,
+            }
+            for scored_at, batch in batches
+            for sale_id, score, features in zip(batch.sale_ids, batch.scores.tolist(), batch.features.tolist())
+        ]
+        try:
+            with engine.begin() as connection:
+                connection.execute(insert(FraudScore), rows)
+        except Exception as exc:
+            self.failures += 1
+            with self._lock:
+                self._batches.extendleft(reversed(batches))
+                self._queued += len(rows)
+                self._trim()
+            print(f"⚠️  Fraud score write failed ({len(rows)} scores kept in memory): {exc}")
+            return 0
+        self.written += len(rows)
+        return len(rows)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="fraud-shipper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and write whatever is still queued."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> dict:
+        return {
+            **self.scorer.stats(),
+            "queued": self._queued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "write_failures": self.failures,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+            self.scorer.sweep()
+
+
+# Single scorer and shipper per process
+scorer = FraudScorer()
+shipper = FraudShipper(scorer)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_committed(session: Session) -> None:
+    """Sales of a committed upload join the windows."""
+    for owner, company_id, transactions, draft in session.info.pop(_PENDING_KEY, ()):
+        owner.apply(company_id, transactions, draft)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    """Rolled-back uploads never happened - keep them out of the windows."""
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ===== REVIEW =====
+def list_flagged(
+    db: Session,
+    company_id: int,
+    min_score: float = settings.FRAUD_FLAG_THRESHOLD,
+    include_reviewed: bool = False,
+    limit: int = 100,
+) -> list[FraudScore]:
+    """Highest-scoring sales first."""
+    query = select(FraudScore).where(FraudScore.company_id == company_id, FraudScore.score >= min_score)
+    if not include_reviewed:
+        query = query.where(FraudScore.is_fraud.is_(None))
+    return list(db.scalars(query.order_by(FraudScore.score.desc()).limit(limit)))
+
+
+def review_score(db: Session, company_id: int, score_id: int, is_fraud: bool, reviewer_id: int) -> FraudScore:
+    """
+    Record a reviewer's verdict (the label used to retrain the model).
+
+    Raises:
+        HTTPException 404: No such score in this company
+    """
+    row = db.get(FraudScore, score_id)
+    if row is None or row.company_id != company_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Fraud score not found"
+        )
+    previous = row.is_fraud
+    row.is_fraud = is_fraud
+    row.reviewed_by = reviewer_id
+    row.reviewed_at = datetime.now(timezone.utc)
+    record_audit(
+        db, "pos.sale_reviewed", "pos_sale", row.sale_id, company_id=company_id,
+        actor_user_id=reviewer_id, changes={"is_fraud": [previous, is_fraud]}
+    )
+    db.commit()
+    db.refresh(row)
+    return row
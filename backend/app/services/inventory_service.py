@@ -0,0 +1,687 @@
+# app/services/inventory_service.py
+
+"""
+Inventory Service
+Products, warehouses and the stock ledger.
+
+Stock:
+- Every change is an append-only StockMovement
+- StockLevel keeps on_hand / reserved per (product, warehouse) and is updated
+  in the same transaction with one UPDATE per touched level
+
+Reservations (POS carts, sales orders) never read-then-write. Each line is a
+conditional UPDATE:
+
+    UPDATE stock_levels SET reserved = reserved + :qty
+    WHERE product_id = :p AND warehouse_id = :w AND on_hand - reserved >= :qty
+
+so the check and the change are one atomic step, locking only that one
+(product, warehouse) row until commit. Lines are applied in (product,
+warehouse) order, so two carts sharing products never deadlock.
+
+Low-stock alerts:
+    Each level carries an is_low flag. Whenever a level changes, the new
+    available quantity is compared with the product's reorder level and
+    an alert is raised or resolved only when the flag flips - no scans.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.invalidation import publish
+from app.core.money import to_sen
+from app.models.product import Product
+from app.models.warehouse import Warehouse
+from app.models.stock import (
+    MovementType,
+    ReservationStatus,
+    StockAlert,
+    StockLevel,
+    StockMovement,
+    StockReservation,
+)
+from app.schemas.inventory import (
+    ProductCreate,
+    ProductUpdate,
+    ReservationCreate,
+    StockMovementCreate,
+    StockTransferCreate,
+    WarehouseCreate,
+)
+from app.services.audit_service import diff_changes, record_audit, snapshot
+from app.services.screening_service import screening_engine
+
+
+# Movement types that take stock out (the API sends positive quantities)
+OUTBOUND_TYPES = {MovementType.ISSUE, MovementType.SALE, MovementType.TRANSFER_OUT}
+
+_levels = StockLevel.__table__
+_alerts = StockAlert.__table__
+
+LevelKey = tuple[int, int]  # (product_id, warehouse_id)
+
+
+# ===== PRODUCTS =====
+def create_product(db: Session, company_id: int, product_data: ProductCreate, actor_user_id: Optional[int] = None) -> Product:
+    """
+    Add a product to the company's catalogue.
+
+    Raises:
+        HTTPException 409: SKU already used in this company
+    """
+    values = product_data.model_dump()
+    values["price"] = to_sen(values["price"])
+    if values["cost"] is not None:
+        values["cost"] = to_sen(values["cost"])
+    product = Product(company_id=company_id, **values)
+    db.add(product)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"SKU {product_data.sku} already exists"
+        )
+    record_audit(db, "product.created", "product", product.id, company_id=company_id, actor_user_id=actor_user_id)
+    publish(db, "product", (company_id, product.id))  # POS catalog index (catalog_service)
+    publish(db, screening_engine.name, company_id)  # Screening rules may match it
+    db.commit()
+    db.refresh(product)
+    return product
+
+
+def get_product(db: Session, company_id: int, product_id: int) -> Product:
+    """
+    Raises:
+        HTTPException 404: No such product in this company
+    """
+    product = db.get(Product, product_id)
+    if product is None or product.company_id != company_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product not found"
+        )
+    return product
+
+
+def list_products(
+    db: Session,
+    company_id: int,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    include_inactive: bool = False,
+    limit: int = 100,
+    offset: int = 0,
+) -> list[Product]:
+    """Products ordered by SKU, optionally filtered by category or a SKU / name / barcode search."""
+    query = select(Product).where(Product.company_id == company_id)
+    if category is not None:
+        query = query.where(Product.category == category)
+    if search:
+        pattern = f"%{search}%"
+        query = query.where(or_(Product.sku.ilike(pattern), Product.name.ilike(pattern), Product.barcode == search))
+    if not include_inactive:
+        query = query.where(Product.is_active.is_(True))
+    return list(db.scalars(query.order_by(Product.sku).limit(limit).offset(offset)))
+
+
+def update_product(
+    db: Session,
+    company_id: int,
+    product_id: int,
+    update_data: ProductUpdate,
+    actor_user_id: Optional[int] = None
+) -> Product:
+    """
+    Update a product. A new reorder level re-checks the product's alerts
+    in every warehouse.
+    """
+    product = get_product(db, company_id, product_id)
+    update_dict = update_data.model_dump(exclude_unset=True)
+    for field in ("price", "cost"):
+        if update_dict.get(field) is not None:
+            update_dict[field] = to_sen(update_dict[field])
+
+    before = snapshot(product, update_dict.keys())
+    for key, value in update_dict.items():
+        setattr(product, key, value)
+    changes = diff_changes(before, snapshot(product, update_dict.keys()))
+    if changes:
+        db.flush()
+        if "reorder_level" in changes:
+            _recheck_product_alerts(db, company_id, product)
+        record_audit(
+            db, "product.updated", "product", product.id,
+            company_id=company_id, actor_user_id=actor_user_id, changes=changes
+        )
+        publish(db, "product", (company_id, product.id))
+        if "name" in changes or "category" in changes:
+            publish(db, screening_engine.name, company_id)
+    db.commit()
+    db.refresh(product)
+    return product
+
+
+def _load_products(db: Session, company_id: int, product_ids: set[int]) -> dict[int, Optional[Decimal]]:
+    """
+    Check products exist, belong to the company and track stock.
+
+    Returns:
+        {product_id: reorder_level}
+    """
+    rows = db.execute(
+        select(Product.id, Product.reorder_level).where(
+            Product.company_id == company_id,
+            Product.id.in_(product_ids),
+            Product.is_active.is_(True),
+            Product.is_stocked.is_(True),
+        )
+    ).all()
+    found = dict(rows)
+    missing = product_ids - found.keys()
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown, inactive or non-stocked products: {sorted(missing)}"
+        )
+    return found
+
+
+# ===== WAREHOUSES =====
+def create_warehouse(db: Session, company_id: int, warehouse_data: WarehouseCreate, actor_user_id: Optional[int] = None) -> Warehouse:
+    """
+    Add a warehouse.
+
+    Raises:
+        HTTPException 409: Code already used in this company
+    """
+    warehouse = Warehouse(company_id=company_id, **warehouse_data.model_dump())
+    db.add(warehouse)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Warehouse code {warehouse_data.code} already exists"
+        )
+    record_audit(db, "warehouse.created", "warehouse", warehouse.id, company_id=company_id, actor_user_id=actor_user_id)
+    db.commit()
+    db.refresh(warehouse)
+    return warehouse
+
+
+def list_warehouses(db: Session, company_id: int) -> list[Warehouse]:
+    return list(db.scalars(
+        select(Warehouse).where(Warehouse.company_id == company_id).order_by(Warehouse.code)
+    ))
+
+
+def _check_warehouses(db: Session, company_id: int, warehouse_ids: set[int]) -> None:
+    found = set(db.scalars(
+        select(Warehouse.id).where(
+            Warehouse.company_id == company_id,
+            Warehouse.id.in_(warehouse_ids),
+            Warehouse.is_active.is_(True),
+        )
+    ))
+    missing = warehouse_ids - found
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown or inactive warehouses: {sorted(missing)}"
+        )
+
+
+# ===== STOCK LEVELS =====
+def _update_level(db: Session, key: LevelKey, on_hand_delta: Decimal, reserved_delta: Decimal, enforce: bool):
+    """
+    One conditional UPDATE. With `enforce`, a change that lowers the
+    available quantity only applies if enough stock is available.
+
+    Returns:
+        (on_hand, reserved, is_low) after the change, or None if the level
+        doesn't exist or stock is short
+    """
+    product_id, warehouse_id = key
+    statement = (
+        update(_levels)
+        .where(_levels.c.product_id == product_id, _levels.c.warehouse_id == warehouse_id)
+        .values(on_hand=_levels.c.on_hand + on_hand_delta, reserved=_levels.c.reserved + reserved_delta)
+        .returning(_levels.c.on_hand, _levels.c.reserved, _levels.c.is_low)
+    )
+    available_change = on_hand_delta - reserved_delta
+    if enforce and available_change < 0:
+        # Re-evaluated on the latest row version if another transaction changed it first
+        statement = statement.where(_levels.c.on_hand - _levels.c.reserved + available_change >= 0)
+    return db.execute(statement).first()
+
+
+def _create_level(db: Session, company_id: int, key: LevelKey) -> None:
+    try:
+        with db.begin_nested():
+            db.execute(insert(_levels).values(
+                product_id=key[0], warehouse_id=key[1], company_id=company_id,
+                on_hand=0, reserved=0, is_low=False
+            ))
+    except IntegrityError:
+        pass  # Created by a concurrent transaction
+
+
+def apply_level_changes(
+    db: Session,
+    company_id: int,
+    changes: dict[LevelKey, tuple[Decimal, Decimal]],
+    reorder_levels: dict[int, Optional[Decimal]],
+    enforce: set[LevelKey] = frozenset(),
+) -> list[dict]:
+    """
+    Add (on_hand, reserved) deltas to stock levels and update alerts.
+
+    Args:
+        changes: {(product_id, warehouse_id): (on_hand_delta, reserved_delta)}
+        reorder_levels: {product_id: reorder level} (see _load_products)
+        enforce: Levels that must not go below zero available
+
+    Returns:
+        Shortages [{"product_id", "warehouse_id", "requested"}]. If any, nothing
+        is consistent and the caller must roll back.
+    """
+    shortages = []
+    changed = {}
+    for key in sorted(changes):
+        on_hand_delta, reserved_delta = changes[key]
+        row = _update_level(db, key, on_hand_delta, reserved_delta, key in enforce)
+        if row is None:
+            _create_level(db, company_id, key)
+            row = _update_level(db, key, on_hand_delta, reserved_delta, key in enforce)
+        if row is None:
+            shortages.append({
+                "product_id": key[0], "warehouse_id": key[1],
+                "requested": str(reserved_delta - on_hand_delta),
+            })
+        else:
+            changed[key] = row
+    if not shortages:
+        for key, (on_hand, reserved, is_low) in changed.items():
+            _sync_alert(db, company_id, key, on_hand - reserved, is_low, reorder_levels.get(key[0]))
+    return shortages
+
+
+def _sync_alert(
+    db: Session,
+    company_id: int,
+    key: LevelKey,
+    available: Decimal,
+    is_low: bool,
+    reorder_level: Optional[Decimal],
+) -> None:
+    """Raise or resolve the alert of one level if it crossed the reorder level."""
+    low = reorder_level is not None and available <= reorder_level
+    if low == is_low:
+        return
+    product_id, warehouse_id = key
+    db.execute(
+        update(_levels)
+        .where(_levels.c.product_id == product_id, _levels.c.warehouse_id == warehouse_id)
+        .values(is_low=low)
+    )
+    if low:
+        db.execute(insert(_alerts).values(
+            company_id=company_id, product_id=product_id, warehouse_id=warehouse_id,
+            available=available, reorder_level=reorder_level
+        ))
+    else:
+        db.execute(
+            update(_alerts)
+            .where(
+                _alerts.c.product_id == product_id,
+                _alerts.c.warehouse_id == warehouse_id,
+                _alerts.c.resolved_at.is_(None),
+            )
+            .values(resolved_at=datetime.now(timezone.utc))
+        )
+
+
+def _recheck_product_alerts(db: Session, company_id: int, product: Product) -> None:
+    levels = db.execute(
+        select(_levels.c.warehouse_id, _levels.c.on_hand, _levels.c.reserved, _levels.c.is_low)
+        .where(_levels.c.product_id == product.id)
+        .order_by(_levels.c.warehouse_id)
+        .with_for_update()
+    ).all()
+    for warehouse_id, on_hand, reserved, is_low in levels:
+        _sync_alert(db, company_id, (product.id, warehouse_id), on_hand - reserved, is_low, product.reorder_level)
+
+
+def set_reorder_levels(db: Session, company_id: int, levels: dict[int, Decimal]) -> int:
+    """
+    Set the reorder level of many products at once (e.g. from demand
+    forecasts) and re-check their alerts. Does not commit.
+
+    Products that are missing, don't track stock or already have the level
+    are skipped.
+
+    Returns:
+        Number of products changed
+    """
+    current = dict(db.execute(
+        select(Product.id, Product.reorder_level).where(
+            Product.company_id == company_id,
+            Product.id.in_(levels),
+            Product.is_stocked.is_(True),
+        )
+    ).all())
+    changed = {product_id: level for product_id, level in levels.items() if product_id in current and current[product_id] != level}
+    if not changed:
+        return 0
+
+    products = Product.__table__
+    # updated_at is kept: reorder levels are not in the POS catalog, terminals need not re-download the products
+    db.execute(
+        update(products)
+        .where(products.c.id == bindparam("product_id"))
+        .values(reorder_level=bindparam("level"), updated_at=products.c.updated_at),
+        [{"product_id": product_id, "level": level} for product_id, level in changed.items()],
+    )
+    levels_rows = db.execute(
+        select(_levels.c.product_id, _levels.c.warehouse_id, _levels.c.on_hand, _levels.c.reserved, _levels.c.is_low)
+        .where(_levels.c.product_id.in_(changed))
+        .order_by(_levels.c.product_id, _levels.c.warehouse_id)
+        .with_for_update()
+    ).all()
+    for product_id, warehouse_id, on_hand, reserved, is_low in levels_rows:
+        _sync_alert(db, company_id, (product_id, warehouse_id), on_hand - reserved, is_low, changed[product_id])
+    for product_id, level in changed.items():
+        record_audit(
+            db, "product.updated", "product", product_id, company_id=company_id,
+            changes={"reorder_level": [str(current[product_id]) if current[product_id] is not None else None, str(level)]}
+        )
+    return len(changed)
+
+
+def _raise_shortage(db: Session, shortages: list[dict]) -> None:
+    """Roll back and report which lines are short, with what is available now."""
+    for shortage in shortages:
+        level = db.get(StockLevel, (shortage["product_id"], shortage["warehouse_id"]))
+        shortage["available"] = str(level.on_hand - level.reserved) if level else "0"
+    db.rollback()
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail={"message": "Not enough stock", "shortages": shortages}
+    )
+
+
+def get_stock_levels(
+    db: Session,
+    company_id: int,
+    product_id: Optional[int] = None,
+    warehouse_id: Optional[int] = None,
+    low_only: bool = False,
+) -> list[StockLevel]:
+    query = select(StockLevel).where(StockLevel.company_id == company_id)
+    if product_id is not None:
+        query = query.where(StockLevel.product_id == product_id)
+    if warehouse_id is not None:
+        query = query.where(StockLevel.warehouse_id == warehouse_id)
+    if low_only:
+        query = query.where(StockLevel.is_low.is_(True))
+    return list(db.scalars(query.order_by(StockLevel.product_id, StockLevel.warehouse_id)))
+
+
+# ===== MOVEMENTS =====
+def _post_movements(db: Session, company_id: int, rows: list[dict], created_by: Optional[int]) -> list[int]:
+    """
+    Insert movements (quantities already signed) and apply them to the levels.
+    Outbound movements must not take available stock below zero; adjustments may.
+    """
+    reorder_levels = _load_products(db, company_id, {row["product_id"] for row in rows})
+    _check_warehouses(db, company_id, {row["warehouse_id"] for row in rows})
+
+    changes: dict[LevelKey, list] = defaultdict(lambda: [Decimal(0), Decimal(0)])
+    enforce = set()
+    for row in rows:
+        key = (row["product_id"], row["warehouse_id"])
+        changes[key][0] += row["quantity"]
+        if row["type"] != MovementType.ADJUSTMENT:
+            enforce.add(key)
+    shortages = apply_level_changes(
+        db, company_id, {key: tuple(value) for key, value in changes.items()}, reorder_levels, enforce
+    )
+    if shortages:
+        _raise_shortage(db, shortages)
+
+    movement_ids = list(db.scalars(
+        insert(StockMovement).returning(StockMovement.id, sort_by_parameter_order=True),
+        [{"company_id": company_id, "created_by": created_by, **row} for row in rows]
+    ))
+    record_audit(
+        db, "stock.moved", "stock_movement", movement_ids[0],
+        company_id=company_id, actor_user_id=created_by, changes={"movements": len(movement_ids)}
+    )
+    return movement_ids
+
+
+def post_movements(
+    db: Session,
+    company_id: int,
+    movements: list[StockMovementCreate],
+    created_by: Optional[int] = None,
+) -> list[int]:
+    """
+    Record receipts, issues, sales, returns and adjustments (all or nothing).
+
+    Raises:
+        HTTPException 400: Unknown product or warehouse
+        HTTPException 409: Not enough available stock for an outbound movement
+
+    Returns:
+        Movement ids, in input order
+    """
+    rows = [
+        {
+            "product_id": movement.product_id,
+            "warehouse_id": movement.warehouse_id,
+            "type": movement.type,
+            "quantity": -movement.quantity if movement.type in OUTBOUND_TYPES else movement.quantity,
+            "reference": movement.reference,
+            "note": movement.note,
+        }
+        for movement in movements
+    ]
+    movement_ids = _post_movements(db, company_id, rows, created_by)
+    db.commit()
+    return movement_ids
+
+
+def transfer_stock(
+    db: Session,
+    company_id: int,
+    transfer: StockTransferCreate,
+    created_by: Optional[int] = None,
+) -> list[int]:
+    """Move stock between two warehouses (a transfer_out and a transfer_in movement)."""
+    common = {"product_id": transfer.product_id, "reference": transfer.reference, "note": transfer.note}
+    rows = [
+        {**common, "warehouse_id": transfer.from_warehouse_id, "type": MovementType.TRANSFER_OUT, "quantity": -transfer.quantity},
+        {**common, "warehouse_id": transfer.to_warehouse_id, "type": MovementType.TRANSFER_IN, "quantity": transfer.quantity},
+    ]
+    movement_ids = _post_movements(db, company_id, rows, created_by)
+    db.commit()
+    return movement_ids
+
+
+def list_movements(
+    db: Session,
+    company_id: int,
+    product_id: int,
+    warehouse_id: Optional[int] = None,
+    limit: int = 100,
+    before_id: Optional[int] = None,
+) -> list[StockMovement]:
+    """Stock card: a product's movements, newest first (page with before_id)."""
+    query = select(StockMovement).where(
+        StockMovement.company_id == company_id, StockMovement.product_id == product_id
+    )
+    if warehouse_id is not None:
+        query = query.where(StockMovement.warehouse_id == warehouse_id)
+    if before_id is not None:
+        query = query.where(StockMovement.id < before_id)
+    return list(db.scalars(query.order_by(StockMovement.id.desc()).limit(limit)))
+
+
+# ===== RESERVATIONS =====
+def reserve_stock(
+    db: Session,
+    company_id: int,
+    reservation_data: ReservationCreate,
+    created_by: Optional[int] = None,
+) -> list[StockReservation]:
+    """
+    Reserve every line of a cart / order, or nothing.
+
+    Raises:
+        HTTPException 409: Some lines are short (detail lists them with what is available)
+    """
+    lines = reservation_data.lines
+    reorder_levels = _load_products(db, company_id, {line.product_id for line in lines})
+    _check_warehouses(db, company_id, {line.warehouse_id for line in lines})
+
+    changes: dict[LevelKey, list] = defaultdict(lambda: [Decimal(0), Decimal(0)])
+    for line in lines:
+        changes[(line.product_id, line.warehouse_id)][1] += line.quantity
+    shortages = apply_level_changes(
+        db, company_id, {key: tuple(value) for key, value in changes.items()}, reorder_levels, set(changes)
+    )
+    if shortages:
+        _raise_shortage(db, shortages)
+
+    minutes = reservation_data.expires_in_minutes or settings.RESERVATION_TTL_MINUTES
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=minutes)
+    reservations = [
+        StockReservation(
+            company_id=company_id, product_id=line.product_id, warehouse_id=line.warehouse_id,
+            quantity=line.quantity, reference=reservation_data.reference,
+            expires_at=expires_at, created_by=created_by
+        )
+        for line in lines
+    ]
+    db.add_all(reservations)
+    db.commit()
+    for reservation in reservations:
+        db.refresh(reservation)
+    return reservations
+
+
+def _lock_active_reservations(db: Session, company_id: int, reference: str) -> list[StockReservation]:
+    reservations = list(db.scalars(
+        select(StockReservation).where(
+            StockReservation.company_id == company_id,
+            StockReservation.reference == reference,
+            StockReservation.status == ReservationStatus.ACTIVE,
+        ).order_by(StockReservation.id).with_for_update()
+    ))
+    if not reservations:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No active reservations for {reference}"
+        )
+    return reservations
+
+
+def _release(db: Session, company_id: int, reservations: list[StockReservation]) -> None:
+    changes: dict[LevelKey, list] = defaultdict(lambda: [Decimal(0), Decimal(0)])
+    for reservation in reservations:
+        changes[(reservation.product_id, reservation.warehouse_id)][1] -= reservation.quantity
+        reservation.status = ReservationStatus.RELEASED
+    reorder_levels = dict(db.execute(
+        select(Product.id, Product.reorder_level).where(Product.id.in_({key[0] for key in changes}))
+    ).all())
+    apply_level_changes(db, company_id, {key: tuple(value) for key, value in changes.items()}, reorder_levels)
+
+
+def fulfill_reservations(
+    db: Session,
+    company_id: int,
+    reference: str,
+    created_by: Optional[int] = None,
+) -> list[int]:
+    """
+    Turn a cart's / order's reservations into sale movements (checkout).
+
+    Returns:
+        Sale movement ids
+    """
+    reservations = _lock_active_reservations(db, company_id, reference)
+    rows = [
+        {
+            "product_id": reservation.product_id,
+            "warehouse_id": reservation.warehouse_id,
+            "type": MovementType.SALE,
+            "quantity": -reservation.quantity,
+            "reference": reference,
+            "note": None,
+        }
+        for reservation in reservations
+    ]
+    changes: dict[LevelKey, list] = defaultdict(lambda: [Decimal(0), Decimal(0)])
+    for reservation in reservations:
+        key = (reservation.product_id, reservation.warehouse_id)
+        changes[key][0] -= reservation.quantity
+        changes[key][1] -= reservation.quantity
+        reservation.status = ReservationStatus.FULFILLED
+    reorder_levels = dict(db.execute(
+        select(Product.id, Product.reorder_level).where(Product.id.in_({key[0] for key in changes}))
+    ).all())
+    # Available doesn't change: the stock was already set aside
+    apply_level_changes(db, company_id, {key: tuple(value) for key, value in changes.items()}, reorder_levels)
+    movement_ids = list(db.scalars(
+        insert(StockMovement).returning(StockMovement.id, sort_by_parameter_order=True),
+        [{"company_id": company_id, "created_by": created_by, **row} for row in rows]
+    ))
+    db.commit()
+    return movement_ids
+
+
+def release_reservations(db: Session, company_id: int, reference: str) -> int:
+    """Cancel a cart's / order's reservations. Returns how many were released."""
+    reservations = _lock_active_reservations(db, company_id, reference)
+    _release(db, company_id, reservations)
+    db.commit()
+    return len(reservations)
+
+
+def release_expired_reservations(db: Session, limit: int = settings.RESERVATION_SWEEP_BATCH) -> int:
+    """
+    Release reservations past their expiry (run periodically by the worker).
+    SKIP LOCKED lets several workers sweep at once.
+    """
+    reservations = list(db.scalars(
+        select(StockReservation).where(
+            StockReservation.status == ReservationStatus.ACTIVE,
+            StockReservation.expires_at < datetime.now(timezone.utc),
+        ).order_by(StockReservation.id).limit(limit).with_for_update(skip_locked=True)
+    ))
+    by_company = defaultdict(list)
+    for reservation in reservations:
+        by_company[reservation.company_id].append(reservation)
+    for company_id, company_reservations in by_company.items():
+        _release(db, company_id, company_reservations)
+    db.commit()
+    return len(reservations)
+
+
+# ===== ALERTS =====
+def list_alerts(db: Session, company_id: int, include_resolved: bool = False, limit: int = 100) -> list[StockAlert]:
+    """Low-stock alerts, newest first (open ones only by default)."""
+    query = select(StockAlert).where(StockAlert.company_id == company_id)
+    if not include_resolved:
+        query = query.where(StockAlert.resolved_at.is_(None))
+    return list(db.scalars(query.order_by(StockAlert.id.desc()).limit(limit)))
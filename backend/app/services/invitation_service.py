@@ -0,0 +1,68 @@
+"""
+Invitation Service
+Business logic for inviting users to a company.
+"""
+
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.models.invitation import Invitation, InvitationStatus
+from app.schemas.company import InvitationCreate
+from app.schemas.user import UserResponse
+from app.services.company_service import get_company_by_id
+from app.services.email_service import enqueue_invitation_email
+from app.services.audit_service import record_audit
+from app.services.dashboard_service import publish_member_invited
+
+
+def create_invitation(
+    db: Session,
+    company_id: int,
+    invitation_data: InvitationCreate,
+    inviter: UserResponse
+) -> Invitation:
+    """
+    Invite someone to a company and queue the invitation email.
+    
+    The invitation and its email are committed together, so an email
+    is never sent for an invitation that failed to save.
+    
+    Raises:
+        HTTPException: If a pending invitation for this email already exists
+    """
+    company = get_company_by_id(db, company_id)
+    
+    existing = db.query(Invitation).filter(
+        Invitation.company_id == company_id,
+        Invitation.email == invitation_data.email,
+        Invitation.status == InvitationStatus.PENDING,
+        Invitation.expires_at > datetime.now(timezone.utc)
+    ).first()
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This email already has a pending invitation"
+        )
+    
+    invitation = Invitation(
+        company_id=company_id,
+        invited_by_user_id=inviter.id,
+        email=invitation_data.email,
+        role=invitation_data.role,
+        token=Invitation.generate_token(),
+        status=InvitationStatus.PENDING,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=settings.INVITATION_EXPIRE_DAYS)
+    )
+    db.add(invitation)
+    enqueue_invitation_email(db, invitation, company.display_name, inviter.full_name)
+    record_audit(
+        db, "member.invited", "invitation", invitation.email,
+        company_id=company_id, actor_user_id=inviter.id,
+        changes={"role": [None, invitation.role.value]}
+    )
+    db.commit()
+    db.refresh(invitation)
+    publish_member_invited(invitation)
+    
+    return invitation
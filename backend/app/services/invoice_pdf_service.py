@@ -0,0 +1,397 @@
+# app/services/invoice_pdf_service.py
+
+"""
+Invoice PDF Service
+Renders invoices to PDF (see app/core/pdf.py).
+
+Three things keep rendering fast:
+1. The page layout is compiled once (InvoiceTemplate): every fixed label,
+   rule and column heading is turned into PDF bytes at import time.
+2. The company header (logo, address, contact lines chosen by the
+   show_*_on_invoice flags) is rendered once per company and cached.
+   Updating the company profile evicts it (DEPENDENT_CACHES in app/core/cache.py).
+3. Batch mode sends chunks of invoices to a process pool. The header
+   is built once in the parent and shipped with each chunk.
+"""
+
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from itertools import repeat
+from pathlib import Path
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.cache import MISSING, invoice_header_cache
+from app.core import storage
+from app.core.images import rendition_filename
+from app.core.pdf import (
+    A4_HEIGHT,
+    A4_WIDTH,
+    PDFDocument,
+    PDFImage,
+    draw_image,
+    filled_rect,
+    line,
+    text,
+    text_right,
+    text_width,
+)
+from app.schemas.company import CompanyResponse
+from app.schemas.invoice import InvoiceDocument
+from app.services.company_service import get_company_profile
+from app.services.job_service import job_handler
+
+
+CENT = Decimal("0.01")
+
+
+# ===== COMPANY HEADER =====
+@dataclass
+class CompanyHeader:
+    """Pre-rendered top-left block of every invoice page for one company."""
+    content: bytes
+    logo: Optional[PDFImage] = None
+
+
+def _load_logo(logo_url: Optional[str]) -> Optional[PDFImage]:
+    """Read the company's invoice logo rendition as RGB pixels (white background)."""
+    if not logo_url:
+        return None
+    match = storage.FILENAME_PATTERN.match(logo_url.rsplit("/", 1)[-1])
+    if match is None:
+        return None
+    path = storage.object_path("logos", rendition_filename(match.group("digest"), "invoice"))
+    if not path.is_file():
+        return None
+
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image = image.convert("RGBA")
+        background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+        rgb = Image.alpha_composite(background, image).convert("RGB")
+        return PDFImage.from_rgb(rgb.width, rgb.height, rgb.tobytes())
+
+
+def _contact_lines(company: CompanyResponse) -> list[str]:
+    """Contact details the company chose to show on invoices."""
+    lines = []
+    if company.show_email_on_invoice and company.email:
+        lines.append(f"Email: {company.email}")
+    if company.show_phone_on_invoice and company.phone_number:
+        lines.append(f"Tel: {company.phone_country_code or ''} {company.phone_number}".replace("  ", " "))
+    if company.show_mobile_on_invoice and company.mobile_number:
+        lines.append(f"Mobile: {company.mobile_country_code or ''} {company.mobile_number}".replace("  ", " "))
+    if company.show_fax_on_invoice and company.fax:
+        lines.append(f"Fax: {company.fax}")
+    if company.show_website_on_invoice and company.website:
+        lines.append(company.website)
+    if company.show_social_media_on_invoice:
+        social = [value for value in (company.facebook, company.instagram, company.linkedin, company.twitter) if value]
+        if social:
+            lines.append(" | ".join(social))
+    return lines
+
+
+def build_company_header(company: CompanyResponse) -> CompanyHeader:
+    """Render the company block (logo, names, address, contacts) once."""
+    template = TEMPLATE
+    parts = []
+    y = template.top
+
+    logo = _load_logo(company.logo_url)
+    if logo is not None:
+        # Fit inside 180 x 50 pt, keeping the aspect ratio
+        scale = min(180 / logo.width, 50 / logo.height, 1.0)
+        width, height = logo.width * scale, logo.height * scale
+        parts.append(draw_image("Logo", template.left, y - height, width, height))
+        y -= height + 16
+    else:
+        y -= 12
+
+    parts.append(text(template.left, y, company.display_name, size=14, bold=True))
+    y -= 13
+    detail_lines = [f"{company.legal_name} ({company.business_registration_number})"]
+    if company.tax_id:
+        detail_lines.append(f"Tax ID: {company.tax_id}")
+    # Billing address unless the company bills from its mailing address
+    address = company.mailing_address
+    if not company.billing_same_as_mailing and company.billing_address:
+        address = company.billing_address
+    if address:
+        detail_lines.extend(part.strip() for part in address.splitlines() if part.strip())
+    detail_lines.extend(_contact_lines(company))
+
+    for detail in detail_lines:
+        if y < template.header_bottom:
+            break
+        parts.append(text(template.left, y, detail, size=8))
+        y -= 10
+
+    return CompanyHeader(content=b"".join(parts), logo=logo)
+
+
+def get_company_header(db: Session, company_id: int) -> CompanyHeader:
+    """Cached company header (evicted whenever the company profile changes)."""
+    cached = invoice_header_cache.get(company_id)
+    if cached is not MISSING:
+        return cached
+    header = build_company_header(get_company_profile(db, company_id))
+    invoice_header_cache.set(company_id, header)
+    return header
+
+
+# ===== COMPILED TEMPLATE =====
+class InvoiceTemplate:
+    """
+    Invoice layout with all fixed parts pre-rendered to PDF bytes.
+
+    Page 1: header, invoice details, "Bill to", then line items.
+    Later pages: header, invoice details, line items.
+    The last page always ends with the totals block at the bottom.
+    """
+
+    def __init__(self, width: float = A4_WIDTH, height: float = A4_HEIGHT):
+        self.width = width
+        self.height = height
+        self.left = 40
+        self.right = width - 40
+        self.top = height - 40
+        self.header_bottom = height - 190
+
+        # Invoice details (top right)
+        self.label_x = self.right - 175
+        self.detail_ys = [self.top - 40, self.top - 54, self.top - 68]
+
+        # Line item table
+        self.row_height = 15
+        self.description_x = self.left + 6
+        self.description_width = 260
+        self.quantity_x = self.right - 190
+        self.price_x = self.right - 100
+        self.amount_x = self.right - 6
+        self.first_table_top = height - 277
+        self.next_table_top = height - 202
+        self.rows_bottom = 60   # lowest row on a normal page
+        self.totals_top = 150   # rows on the last page stay above the totals
+
+        # Bill to (page 1 only)
+        self.bill_to_y = self.first_table_top + 75
+
+        def rows_between(table_top: float, bottom: float) -> int:
+            first_row = table_top - 30
+            return int((first_row - bottom) // self.row_height) + 1
+
+        self.first_page_rows = rows_between(self.first_table_top, self.rows_bottom)
+        self.first_page_last_rows = rows_between(self.first_table_top, self.totals_top)
+        self.next_page_rows = rows_between(self.next_table_top, self.rows_bottom)
+        self.next_page_last_rows = rows_between(self.next_table_top, self.totals_top)
+
+        # ----- Pre-rendered fragments -----
+        self.detail_labels = (
+            text_right(self.right, self.top - 14, "INVOICE", size=20, bold=True)
+            + text(self.label_x, self.detail_ys[0], "Invoice no.", size=9, bold=True)
+            + text(self.label_x, self.detail_ys[1], "Date", size=9, bold=True)
+            + text(self.label_x, self.detail_ys[2], "Due date", size=9, bold=True)
+            + line(self.left, self.header_bottom - 6, self.right, self.header_bottom - 6)
+        )
+        self.bill_to_label = text(self.left, self.bill_to_y, "Bill to", size=9, bold=True)
+        self.table_heads = {
+            True: self._table_head(self.first_table_top),
+            False: self._table_head(self.next_table_top),
+        }
+        totals_x = self.price_x - 60
+        self.totals_labels = (
+            line(totals_x, self.totals_top - 10, self.right, self.totals_top - 10)
+            + text(totals_x, self.totals_top - 26, "Subtotal", size=9)
+            + text(totals_x, self.totals_top - 42, "Tax", size=9)
+            + filled_rect(totals_x - 6, self.totals_top - 68, self.right - totals_x + 6, 18)
+            + text(totals_x, self.totals_top - 62, "Total", size=10, bold=True)
+        )
+
+    def _table_head(self, top: float) -> bytes:
+        baseline = top - 12
+        return (
+            filled_rect(self.left, top - 17, self.right - self.left, 17)
+            + text(self.description_x, baseline, "Description", size=9, bold=True)
+            + text_right(self.quantity_x, baseline, "Qty", size=9, bold=True)
+            + text_right(self.price_x, baseline, "Unit price", size=9, bold=True)
+            + text_right(self.amount_x, baseline, "Amount", size=9, bold=True)
+        )
+
+    def paginate(self, row_count: int) -> list[tuple[int, int]]:
+        """Split line items into pages: [(start, end), ...]."""
+        pages = []
+        start, capacity = 0, self.first_page_rows
+        while True:
+            end = min(row_count, start + capacity)
+            pages.append((start, end))
+            start, capacity = end, self.next_page_rows
+            if start >= row_count:
+                break
+        # The totals block needs room at the bottom of the last page
+        last_start, last_end = pages[-1]
+        last_capacity = self.first_page_last_rows if len(pages) == 1 else self.next_page_last_rows
+        if last_end - last_start > last_capacity:
+            pages[-1] = (last_start, last_start + last_capacity)
+            pages.append((last_start + last_capacity, last_end))
+        return pages
+
+    def fit_description(self, value: str) -> str:
+        if text_width(value, 9) <= self.description_width:
+            return value
+        while value and text_width(value + "...", 9) > self.description_width:
+            value = value[:-1]
+        return value + "..."
+
+
+# Compiled once per process
+TEMPLATE = InvoiceTemplate()
+
+
+# ===== RENDERING =====
+def _money(value: Decimal) -> str:
+    return f"{value:,.2f}"
+
+
+def _quantity(value: Decimal) -> str:
+    return f"{value.normalize():f}"
+
+
+def render_invoice(header: CompanyHeader, invoice: InvoiceDocument) -> tuple[bytes, int]:
+    """
+    Render one invoice.
+
+    Returns:
+        (PDF bytes, number of pages)
+    """
+    template = TEMPLATE
+    rows = []
+    subtotal = Decimal("0")
+    for item in invoice.lines:
+        amount = (item.quantity * item.unit_price).quantize(CENT, ROUND_HALF_UP)
+        subtotal += amount
+        rows.append((template.fit_description(item.description), _quantity(item.quantity), _money(item.unit_price), _money(amount)))
+    tax = (subtotal * invoice.tax_rate / 100).quantize(CENT, ROUND_HALF_UP)
+    total = subtotal + tax
+
+    document = PDFDocument(template.width, template.height)
+    if header.logo is not None:
+        document.add_image("Logo", header.logo)
+
+    # Parts shared by every page of this invoice
+    details = (
+        text_right(template.right, template.detail_ys[0], invoice.invoice_number, size=9)
+        + text_right(template.right, template.detail_ys[1], invoice.issue_date.strftime("%d %b %Y"), size=9)
+        + text_right(template.right, template.detail_ys[2], invoice.due_date.strftime("%d %b %Y") if invoice.due_date else "-", size=9)
+    )
+    page_top = header.content + template.detail_labels + details
+
+    pages = template.paginate(len(rows))
+    for page_number, (start, end) in enumerate(pages, start=1):
+        first = page_number == 1
+        parts = [page_top]
+        if first:
+            parts.append(template.bill_to_label)
+            y = template.bill_to_y - 13
+            parts.append(text(template.left, y, invoice.bill_to_name, size=10, bold=True))
+            address = (invoice.bill_to_address or "").splitlines()[:3]
+            for detail in [part for part in address if part.strip()] + ([invoice.bill_to_email] if invoice.bill_to_email else []):
+                y -= 11
+                parts.append(text(template.left, y, detail.strip(), size=8))
+
+        parts.append(template.table_heads[first])
+        y = (template.first_table_top if first else template.next_table_top) - 30
+        for description, quantity, price, amount in rows[start:end]:
+            parts.append(text(template.description_x, y, description, size=9))
+            parts.append(text_right(template.quantity_x, y, quantity, size=9))
+            parts.append(text_right(template.price_x, y, price, size=9))
+            parts.append(text_right(template.amount_x, y, amount, size=9))
+            y -= template.row_height
+
+        if page_number == len(pages):
+            parts.append(template.totals_labels)
+            parts.append(text_right(template.amount_x, template.totals_top - 26, _money(subtotal), size=9))
+            parts.append(text_right(template.amount_x, template.totals_top - 42, _money(tax), size=9))
+            parts.append(text_right(template.amount_x, template.totals_top - 62, f"{invoice.currency} {_money(total)}", size=10, bold=True))
+            if invoice.tax_rate:
+                parts.append(text(template.price_x - 30, template.totals_top - 42, f"({_quantity(invoice.tax_rate)}%)", size=8))
+            if invoice.notes:
+                y = template.totals_top - 26
+                for note in invoice.notes.splitlines()[:5]:
+                    parts.append(text(template.left, y, note, size=8))
+                    y -= 10
+
+        parts.append(text(template.left, 30, invoice.invoice_number, size=7))
+        parts.append(text_right(template.right, 30, f"Page {page_number} of {len(pages)}", size=7))
+        document.add_page(b"".join(parts))
+
+    return document.to_bytes(title=f"Invoice {invoice.invoice_number}"), document.page_count
+
+
+# ===== BATCH MODE =====
+def invoice_filename(invoice_number: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", "_", invoice_number) + ".pdf"
+
+
+def _render_chunk(header: CompanyHeader, invoices: list[InvoiceDocument], output_dir: str) -> tuple[int, int]:
+    """Render a chunk of invoices to files (runs in a worker process)."""
+    pages = 0
+    for invoice in invoices:
+        data, page_count = render_invoice(header, invoice)
+        (Path(output_dir) / invoice_filename(invoice.invoice_number)).write_bytes(data)
+        pages += page_count
+    return len(invoices), pages
+
+
+def render_invoice_batch(
+    header: CompanyHeader,
+    invoices: list[InvoiceDocument],
+    output_dir: Path,
+    workers: int = settings.PDF_WORKERS,
+    chunk_size: int = settings.PDF_BATCH_CHUNK,
+) -> dict:
+    """
+    Render many invoices of one company to `output_dir` (one PDF each).
+
+    Args:
+        header: From get_company_header() (built once, sent to every worker)
+        workers: Processes to use (1 = render in this process)
+
+    Returns:
+        {"invoices", "pages", "seconds", "pages_per_second"}
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    chunks = [invoices[index:index + chunk_size] for index in range(0, len(invoices), chunk_size)]
+    started = time.perf_counter()
+    if workers <= 1 or len(chunks) <= 1:
+        results = [_render_chunk(header, chunk, str(output_dir)) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_render_chunk, repeat(header), chunks, repeat(str(output_dir))))
+    elapsed = time.perf_counter() - started
+    pages = sum(page_count for _, page_count in results)
+    return {
+        "invoices": sum(count for count, _ in results),
+        "pages": pages,
+        "seconds": round(elapsed, 3),
+        "pages_per_second": round(pages / max(elapsed, 1e-9), 1),
+    }
+
+
+@job_handler("invoices.render_batch")
+def render_invoice_batch_job(db: Session, job) -> None:
+    """
+    Month-end batch: payload {"batch": "2025-01", "invoices": [InvoiceDocument, ...]}.
+
+    PDFs are written to MEDIA_ROOT/invoices/<company_id>/<batch>/.
+    """
+    header = get_company_header(db, job.company_id)
+    invoices = [InvoiceDocument.model_validate(item) for item in job.payload["invoices"]]
+    batch_name = re.sub(r"[^A-Za-z0-9._-]", "_", str(job.payload.get("batch", job.id)))
+    output_dir = storage.media_root() / "invoices" / str(job.company_id) / batch_name
+    stats = render_invoice_batch(header, invoices, output_dir)
+    print(f"🧾 Rendered invoice batch {batch_name} for company {job.company_id}: {stats}")
@@ -0,0 +1,652 @@
+# app/services/iot_service.py
+
+"""
+IoT Ingestion Service
+Accepts high-rate sensor readings without a database write per request.
+
+How it works:
+1. A gateway uploads a batch of readings (HTTP, see app/api/iot.py).
+   Sensor codes are resolved through a cache, bad readings are dropped, and
+   the rest are appended to an in-memory buffer as NumPy arrays
+2. A background thread (IngestFlusher) writes the buffer every
+   IOT_FLUSH_INTERVAL_SECONDS, or as soon as IOT_FLUSH_BATCH readings wait.
+   One flush = one transaction:
+   - Readings are loaded with COPY (PostgreSQL) into a temporary table and
+     moved with INSERT ... ON CONFLICT DO NOTHING RETURNING, so a batch
+     uploaded twice is stored once and only new readings reach the rollups
+   - The new readings are grouped per (sensor, minute) with NumPy, minutes
+     per hour and hours per day, and merged into sensor_rollups with one
+     upsert per period (count and sum added, min / max kept)
+   - Each sensor's latest value is updated
+3. Charts and dashboards read sensor_rollups, never the raw readings
+
+The buffer is bounded (IOT_BUFFER_SIZE): if the database falls behind,
+uploads are refused with 503 so gateways keep the readings and retry,
+instead of the API running out of memory.
+
+Buffered readings are lost if the process is killed (a normal shutdown
+flushes them). Gateways that need stronger guarantees can re-send recent
+batches: duplicates are ignored.
+"""
+
+import io
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, delete, func, or_, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core import cache
+from app.core.config import settings
+from app.core.invalidation import publish
+from app.database import engine
+from app.models.iot import RollupPeriod, Sensor, SensorReading, SensorRollup
+from app.schemas.iot import (
+    SensorCreate,
+    SensorIngestResponse,
+    SensorReadingBatch,
+    SensorRollupResponse,
+    SensorUpdate,
+)
+from app.services import alarm_service
+from app.services.audit_service import diff_changes, record_audit, snapshot
+
+
+# (company_id, sensor code) -> sensor id, or None for unknown / inactive codes
+sensor_cache = cache.TTLCache("sensor")
+cache.CACHES[sensor_cache.name] = sensor_cache
+
+PERIOD_SECONDS = {
+    RollupPeriod.MINUTE: 60,
+    RollupPeriod.HOUR: 3600,
+    RollupPeriod.DAY: 86400,
+}
+
+
+# ===== SENSORS =====
+def create_sensor(db: Session, company_id: int, sensor_data: SensorCreate, actor_user_id: Optional[int] = None) -> Sensor:
+    """
+    Register a sensor.
+
+    Raises:
+        HTTPException 409: Code already used in this company
+    """
+    sensor = Sensor(company_id=company_id, **sensor_data.model_dump())
+    db.add(sensor)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Sensor code {sensor_data.code} already exists"
+        )
+    record_audit(db, "sensor.created", "sensor", sensor.id, company_id=company_id, actor_user_id=actor_user_id)
+    # Readings sent before the sensor existed cached the code as unknown
+    publish(db, "sensor", (company_id, sensor.code))
+    # Rules on its kind now cover it too
+    publish(db, alarm_service.alarm_engine.name, company_id)
+    db.commit()
+    db.refresh(sensor)
+    return sensor
+
+
+def get_sensor(db: Session, company_id: int, sensor_id: int) -> Sensor:
+    """
+    Raises:
+        HTTPException 404: No such sensor in this company
+    """
+    sensor = db.scalar(select(Sensor).where(Sensor.id == sensor_id, Sensor.company_id == company_id))
+    if sensor is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sensor not found"
+        )
+    return sensor
+
+
+def list_sensors(db: Session, company_id: int, kind: Optional[str] = None) -> list[Sensor]:
+    query = select(Sensor).where(Sensor.company_id == company_id)
+    if kind is not None:
+        query = query.where(Sensor.kind == kind)
+    return list(db.scalars(query.order_by(Sensor.code)))
+
+
+def update_sensor(
+    db: Session,
+    company_id: int,
+    sensor_id: int,
+    sensor_data: SensorUpdate,
+    actor_user_id: Optional[int] = None,
+) -> Sensor:
+    """Update a sensor. Deactivating it makes further readings rejected."""
+    sensor = get_sensor(db, company_id, sensor_id)
+    update_dict = sensor_data.model_dump(exclude_unset=True)
+    before = snapshot(sensor, update_dict.keys())
+    for field, value in update_dict.items():
+        setattr(sensor, field, value)
+    changes = diff_changes(before, snapshot(sensor, update_dict.keys()))
+    if changes:
+        record_audit(
+            db, "sensor.updated", "sensor", sensor.id,
+            company_id=company_id, actor_user_id=actor_user_id, changes=changes
+        )
+        if "is_active" in changes:
+            publish(db, "sensor", (company_id, sensor.code))
+        if changes.keys() & {"kind", "location", "is_active"}:
+            publish(db, alarm_service.alarm_engine.name, company_id)
+    db.commit()
+    db.refresh(sensor)
+    return sensor
+
+
+def resolve_sensors(db: Session, company_id: int, codes: set[str]) -> dict[str, Optional[int]]:
+    """
+    Map sensor codes to ids (None = unknown or inactive), one query for all cache misses.
+    """
+    found: dict[str, Optional[int]] = {}
+    missing = []
+    for code in codes:
+        sensor_id = sensor_cache.get((company_id, code))
+        if sensor_id is cache.MISSING:
+            missing.append(code)
+        else:
+            found[code] = sensor_id
+    if missing:
+        rows = dict(db.execute(
+            select(Sensor.code, Sensor.id).where(
+                Sensor.company_id == company_id,
+                Sensor.code.in_(missing),
+                Sensor.is_active.is_(True),
+            )
+        ).all())
+        for code in missing:
+            found[code] = rows.get(code)
+            sensor_cache.set((company_id, code), found[code])
+    return found
+
+
+# ===== BUFFER =====
+class ReadingBuffer:
+    """
+    Bounded, thread-safe queue of readings waiting to be written.
+
+    Readings are kept as chunks of three parallel arrays (sensor id, Unix
+    time, value): appending an upload and draining a batch cost a few array
+    operations, not one Python object per reading.
+    """
+
+    def __init__(self, maxsize: int = settings.IOT_BUFFER_SIZE):
+        self.maxsize = maxsize
+        self._chunks: deque[tuple[np.ndarray, np.ndarray, np.ndarray]] = deque()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.ready = threading.Event()  # Set once a full flush batch is waiting
+        self.refused = 0
+
+    def add(self, sensor_ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> bool:
+        """Append readings. Returns False (nothing added) if the buffer is full."""
+        count = len(sensor_ids)
+        with self._lock:
+            if self._size + count > self.maxsize:
+                self.refused += count
+                return False
+            self._chunks.append((sensor_ids, times, values))
+            self._size += count
+            full = self._size >= settings.IOT_FLUSH_BATCH
+        if full:
+            self.ready.set()
+        return True
+
+    def drain(self, limit: int) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Remove up to `limit` readings (oldest first), or None if empty."""
+        taken = []
+        with self._lock:
+            count = 0
+            while self._chunks and count < limit:
+                chunk = self._chunks.popleft()
+                room = limit - count
+                if len(chunk[0]) > room:
+                    self._chunks.appendleft(tuple(column[room:] for column in chunk))
+                    chunk = tuple(column[:room] for column in chunk)
+                taken.append(chunk)
+                count += len(chunk[0])
+            self._size -= count
+        if not taken:
+            return None
+        return tuple(np.concatenate(columns) for columns in zip(*taken))
+
+    def requeue(self, chunk: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+        """
+        Put readings back at the front after a failed write.
+
+        They were already accepted, so they are kept even beyond maxsize;
+        new uploads are refused until the buffer drains.
+        """
+        with self._lock:
+            self._chunks.appendleft(chunk)
+            self._size += len(chunk[0])
+
+    def __len__(self) -> int:
+        return self._size
+
+
+buffer = ReadingBuffer()
+
+
+# ===== INGESTION =====
+def ingest(db: Session, company_id: int, batch: SensorReadingBatch) -> SensorIngestResponse:
+    """
+    Validate a batch of readings and queue it for writing.
+
+    Readings are rejected (not retried) if their sensor is unknown or
+    inactive, the value is not a finite number, or the timestamp is older
+    than IOT_RAW_RETENTION_DAYS or more than IOT_MAX_CLOCK_SKEW_SECONDS ahead.
+
+    Accepted readings are checked against the company's alarm rules right
+    away, so alarms don't wait for the flush.
+
+    Raises:
+        HTTPException 503: Buffer full - retry after a short wait
+    """
+    sensor_ids = resolve_sensors(db, company_id, {series.sensor for series in batch.series})
+    unknown = sorted(code for code, sensor_id in sensor_ids.items() if sensor_id is None)
+    known = [series for series in batch.series if sensor_ids[series.sensor] is not None]
+    total = sum(len(series.points) for series in batch.series)
+    if not known:
+        return SensorIngestResponse(accepted=0, rejected=total, unknown_sensors=unknown)
+
+    points = np.array([point for series in known for point in series.points], dtype=np.float64)
+    ids = np.repeat(
+        np.array([sensor_ids[series.sensor] for series in known], dtype=np.int64),
+        [len(series.points) for series in known],
+    )
+    times, values = points[:, 0], points[:, 1]
+    now = time.time()
+    valid = (
+        np.isfinite(values)
+        & (times >= now - settings.IOT_RAW_RETENTION_DAYS * 86400)
+        & (times <= now + settings.IOT_MAX_CLOCK_SKEW_SECONDS)
+    )
+    if not valid.all():
+        ids, times, values = ids[valid], times[valid], values[valid]
+
+    if len(ids) and not buffer.add(ids, times, values):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Ingestion buffer is full, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    if len(ids):
+        alarm_service.evaluate(db, company_id, ids, times, values)
+    return SensorIngestResponse(accepted=len(ids), rejected=total - len(ids), unknown_sensors=unknown)
+
+
+# ===== ROLLUPS =====
+def utc_offsets(moments: np.ndarray, zone: ZoneInfo) -> np.ndarray:
+    """
+    UTC offset of `zone` (seconds) at each epoch second - the offset in force
+    at that moment, so DST changes are respected. Looked up once per quarter
+    hour (every transition falls on one), not per reading.
+    """
+    slots, inverse = np.unique(np.floor_divide(moments, 900).astype(np.int64), return_inverse=True)
+    offsets = np.array(
+        [int(datetime.fromtimestamp(slot * 900, zone).utcoffset().total_seconds()) for slot in slots.tolist()],
+        dtype=np.int64,
+    )
+    return offsets[inverse.reshape(-1)]
+
+
+def local_bucket_starts(buckets: np.ndarray, width: int, zone: ZoneInfo) -> np.ndarray:
+    """Epoch seconds at which local buckets (local wall time // width) begin in `zone`."""
+    unique, inverse = np.unique(buckets, return_inverse=True)
+    epoch = datetime(1970, 1, 1)
+    starts = np.array(
+        [int((epoch + timedelta(seconds=bucket * width)).replace(tzinfo=zone).timestamp()) for bucket in unique.tolist()],
+        dtype=np.int64,
+    )
+    return starts[inverse.reshape(-1)]
+
+
+def aggregate(
+    sensor_ids: np.ndarray,
+    starts: np.ndarray,
+    counts: np.ndarray,
+    sums: np.ndarray,
+    mins: np.ndarray,
+    maxs: np.ndarray,
+    width: int,
+    zone: Optional[ZoneInfo] = None,
+) -> tuple[np.ndarray, ...]:
+    """
+    Merge rows (raw readings or finer rollups) into buckets of `width` seconds.
+
+    Raw readings are passed as starts=times, counts=1, sums=mins=maxs=values.
+    A coarser period can be built from a finer one whose buckets nest in
+    it (every hour, and every local day, is made of whole minutes).
+
+    With `zone`, buckets follow local wall time there (day rollups start at
+    local midnight, using each row's own UTC offset across DST changes).
+
+    Returns:
+        (sensor_ids, bucket starts, counts, sums, mins, maxs), one row per (sensor, bucket)
+    """
+    local = starts if zone is None else starts + utc_offsets(starts, zone)
+    buckets = np.floor(local / width).astype(np.int64)
+    keys = (sensor_ids.astype(np.int64) << 32) | buckets
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    first = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    group_keys = keys[first]
+    group_buckets = group_keys & 0xFFFFFFFF
+    return (
+        group_keys >> 32,
+        group_buckets * width if zone is None else local_bucket_starts(group_buckets, width, zone),
+        np.add.reduceat(counts[order], first),
+        np.add.reduceat(sums[order], first),
+        np.minimum.reduceat(mins[order], first),
+        np.maximum.reduceat(maxs[order], first),
+    )
+
+
+def build_rollups(sensor_ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> dict[RollupPeriod, tuple[np.ndarray, ...]]:
+    """
+    Minute, hour and day aggregates of new readings, all built from the
+    minutes. Local days don't always start on a UTC hour (e.g. +05:30),
+    but every UTC offset is whole minutes, so minutes nest in both.
+    """
+    zone = ZoneInfo(settings.DASHBOARD_TIMEZONE)
+    minutes = aggregate(sensor_ids, times, np.ones(len(times), dtype=np.int64), values, values, values,
+                        PERIOD_SECONDS[RollupPeriod.MINUTE])
+    return {
+        RollupPeriod.MINUTE: minutes,
+        RollupPeriod.HOUR: aggregate(*minutes, PERIOD_SECONDS[RollupPeriod.HOUR]),
+        RollupPeriod.DAY: aggregate(*minutes, PERIOD_SECONDS[RollupPeriod.DAY], zone),
+    }
+
+
+def _merge_rollups(connection, rollups: dict[RollupPeriod, tuple[np.ndarray, ...]]) -> None:
+    """Add aggregates to sensor_rollups: one upsert per period."""
+    table = SensorRollup.__table__
+    is_postgres = connection.dialect.name == "postgresql"
+    statement = (postgresql if is_postgres else sqlite).insert(table)
+    # Two-argument min()/max() are scalar functions on SQLite
+    lowest, highest = (func.least, func.greatest) if is_postgres else (func.min, func.max)
+    statement = statement.on_conflict_do_update(
+        index_elements=["sensor_id", "period", "bucket_start"],
+        set_={
+            "count": table.c["count"] + statement.excluded["count"],
+            "sum": table.c["sum"] + statement.excluded["sum"],
+            "min": lowest(table.c["min"], statement.excluded["min"]),
+            "max": highest(table.c["max"], statement.excluded["max"]),
+        },
+    )
+    for period, (sensor_ids, starts, counts, sums, mins, maxs) in rollups.items():
+        connection.execute(statement, [
+            {
+                "sensor_id": sensor_id, "period": period,
+                "bucket_start": datetime.fromtimestamp(start, timezone.utc),
+                "count": count, "sum": total, "min": low, "max": high,
+            }
+            for sensor_id, start, count, total, low, high in zip(
+                sensor_ids.tolist(), starts.tolist(), counts.tolist(),
+                sums.tolist(), mins.tolist(), maxs.tolist(),
+            )
+        ])
+
+
+def _update_latest(connection, sensor_ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> None:
+    """Store each sensor's newest reading (unless a newer one is already stored)."""
+    order = np.lexsort((times, sensor_ids))
+    sensor_ids, times, values = sensor_ids[order], times[order], values[order]
+    last = np.flatnonzero(np.concatenate((sensor_ids[1:] != sensor_ids[:-1], [True])))
+    connection.execute(
+        update(Sensor.__table__)
+        .where(
+            Sensor.__table__.c.id == bindparam("b_id"),
+            or_(
+                Sensor.__table__.c.last_reading_at.is_(None),
+                Sensor.__table__.c.last_reading_at < bindparam("b_at"),
+            ),
+        )
+        .values(last_value=bindparam("b_value"), last_reading_at=bindparam("b_at")),
+        [
+            {"b_id": sensor_id, "b_at": datetime.fromtimestamp(moment, timezone.utc), "b_value": value}
+            for sensor_id, moment, value in zip(
+                sensor_ids[last].tolist(), times[last].tolist(), values[last].tolist()
+            )
+        ],
+    )
+
+
+def get_rollups(
+    db: Session,
+    company_id: int,
+    sensor_id: int,
+    period: RollupPeriod,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = 1440,
+) -> list[SensorRollupResponse]:
+    """
+    Aggregates of a sensor, oldest bucket first.
+
+    Without `since`, returns the last `limit` buckets up to `until` (or now).
+    """
+    get_sensor(db, company_id, sensor_id)
+    if until is None:
+        until = datetime.now(timezone.utc)
+    if since is None:
+        since = until - timedelta(seconds=PERIOD_SECONDS[period] * limit)
+    rows = db.scalars(
+        select(SensorRollup)
+        .where(
+            SensorRollup.sensor_id == sensor_id,
+            SensorRollup.period == period,
+            SensorRollup.bucket_start >= since,
+            SensorRollup.bucket_start < until,
+        )
+        .order_by(SensorRollup.bucket_start)
+        .limit(limit)
+    )
+    return [
+        SensorRollupResponse(
+            period=row.period, bucket_start=row.bucket_start, count=row.count,
+            min=row.min, max=row.max, avg=row.sum / row.count,
+        )
+        for row in rows
+    ]
+
+
+# ===== PARTITIONS =====
+_ensured_days: set[date] = set()
+
+
+def _partition_name(day: date) -> str:
+    return f"sensor_readings_p{day:%Y%m%d}"
+
+
+def ensure_partitions(days: set[date]) -> None:
+    """Create the daily (UTC) partitions of sensor_readings that don't exist yet (PostgreSQL only)."""
+    if engine.dialect.name != "postgresql":
+        return
+    for day in days - _ensured_days:
+        try:
+            with engine.begin() as connection:
+                connection.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {_partition_name(day)} PARTITION OF sensor_readings "
+                    f"FOR VALUES FROM ('{day.isoformat()} 00:00+00') TO ('{(day + timedelta(days=1)).isoformat()} 00:00+00')"
+                ))
+        except Exception as exc:
+            # Another worker may have created it at the same moment
+            print(f"⚠️  Could not create sensor reading partition {day}: {exc}")
+            continue
+        _ensured_days.add(day)
+
+
+def delete_expired_readings() -> int:
+    """
+    Remove raw readings older than IOT_RAW_RETENTION_DAYS (rollups are kept).
+
+    PostgreSQL drops whole daily partitions; elsewhere rows are deleted.
+
+    Returns:
+        Partitions dropped (PostgreSQL) or rows deleted
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.IOT_RAW_RETENTION_DAYS)
+    if engine.dialect.name != "postgresql":
+        with engine.begin() as connection:
+            return connection.execute(delete(SensorReading).where(SensorReading.recorded_at < cutoff)).rowcount
+    oldest_kept = _partition_name(cutoff.date())
+    dropped = 0
+    with engine.begin() as connection:
+        partitions = connection.execute(text(
+            "SELECT inhrelid::regclass::text FROM pg_inherits "
+            "WHERE inhparent = 'sensor_readings'::regclass"
+        )).scalars().all()
+        for name in partitions:
+            # Names sort by date: sensor_readings_pYYYYMMDD
+            if name.startswith("sensor_readings_p") and name < oldest_kept:
+                connection.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                _ensured_days.discard(datetime.strptime(name[-8:], "%Y%m%d").date())
+                dropped += 1
+    return dropped
+
+
+# ===== WRITING =====
+def _copy_readings(connection, sensor_ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> list[tuple]:
+    """COPY readings into a temporary table, then keep the new ones (PostgreSQL)."""
+    data = io.StringIO("".join(map(
+        "{}\t{!r}\t{!r}\n".format, sensor_ids.tolist(), times.tolist(), values.tolist()
+    )))
+    with connection.connection.driver_connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS sensor_readings_incoming "
+            "(sensor_id integer, ts double precision, value double precision) ON COMMIT DELETE ROWS"
+        )
+        cursor.copy_expert("COPY sensor_readings_incoming FROM STDIN", data)
+        cursor.execute(
+            "INSERT INTO sensor_readings (sensor_id, recorded_at, value) "
+            "SELECT sensor_id, to_timestamp(ts), value FROM sensor_readings_incoming "
+            "ON CONFLICT DO NOTHING "
+            "RETURNING sensor_id, extract(epoch FROM recorded_at)::float8, value"
+        )
+        return cursor.fetchall()
+
+
+def _insert_readings(connection, sensor_ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> list[tuple]:
+    """Multi-row INSERT that skips stored readings (SQLite)."""
+    table = SensorReading.__table__
+    rows = connection.execute(
+        sqlite.insert(table).on_conflict_do_nothing().returning(table.c.sensor_id, table.c.recorded_at, table.c.value),
+        [
+            {"sensor_id": sensor_id, "recorded_at": datetime.fromtimestamp(moment, timezone.utc), "value": value}
+            for sensor_id, moment, value in zip(sensor_ids.tolist(), times.tolist(), values.tolist())
+        ],
+    ).all()
+    # SQLite returns naive UTC datetimes
+    return [(sensor_id, recorded_at.replace(tzinfo=timezone.utc).timestamp(), value) for sensor_id, recorded_at, value in rows]
+
+
+def write_readings(sensor_ids: np.ndarray, times: np.ndarray, values: np.ndarray) -> int:
+    """
+    Store readings and merge them into the rollups, in one transaction.
+
+    Returns:
+        Readings stored (the rest were already stored)
+    """
+    ensure_partitions({
+        datetime.fromtimestamp(day * 86400, timezone.utc).date()
+        for day in np.unique(np.floor(times / 86400).astype(np.int64)).tolist()
+    })
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            stored = _copy_readings(connection, sensor_ids, times, values)
+        else:
+            stored = _insert_readings(connection, sensor_ids, times, values)
+        if not stored:
+            return 0
+        columns = np.array(stored, dtype=np.float64)
+        new_ids, new_times, new_values = columns[:, 0].astype(np.int64), columns[:, 1], columns[:, 2]
+        _merge_rollups(connection, build_rollups(new_ids, new_times, new_values))
+        _update_latest(connection, new_ids, new_times, new_values)
+    return len(stored)
+
+
+class IngestFlusher:
+    """Background thread that empties the reading buffer into the database."""
+
+    def __init__(self, interval: float = settings.IOT_FLUSH_INTERVAL_SECONDS):
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.written = 0
+        self.duplicates = 0
+        self.failures = 0
+        self.last_flush_seconds = 0.0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="iot-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and write whatever is still buffered."""
+        self._stop.set()
+        buffer.ready.set()
+        if self._thread is not None:
+            self._thread.join(timeout=30)
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        """Write everything currently buffered. Returns readings stored."""
+        total = 0
+        started = time.perf_counter()
+        while True:
+            chunk = buffer.drain(settings.IOT_FLUSH_BATCH)
+            if chunk is None:
+                break
+            try:
+                stored = write_readings(*chunk)
+            except Exception as exc:
+                self.failures += 1
+                buffer.requeue(chunk)
+                print(f"⚠️  Sensor reading flush failed ({len(chunk[0])} readings kept in memory): {exc}")
+                break
+            total += stored
+            self.duplicates += len(chunk[0]) - stored
+        if total:
+            self.last_flush_seconds = time.perf_counter() - started
+        self.written += total
+        return total
+
+    def stats(self) -> dict:
+        return {
+            "buffered": len(buffer),
+            "written": self.written,
+            "duplicates": self.duplicates,
+            "refused": buffer.refused,
+            "flush_failures": self.failures,
+            "last_flush_seconds": round(self.last_flush_seconds, 3),
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            buffer.ready.wait(self.interval)
+            buffer.ready.clear()
+            if self._stop.is_set():
+                break
+            self.flush()
+
+
+# Single flusher per process
+flusher = IngestFlusher()
@@ -0,0 +1,255 @@
+# app/services/job_service.py
+
+"""
+Job Service
+Business logic for the background job queue (see app/models/job.py).
+
+Producers call enqueue_job() inside their normal transaction, so a job
+only exists if the change that created it was committed.
+
+Workers (app/worker.py) call claim_jobs() which uses
+`SELECT ... FOR UPDATE SKIP LOCKED`: many workers can claim at the same
+time without blocking each other or getting the same job twice.
+"""
+
+import random
+import traceback
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+from sqlalchemy import and_, select, update, func, insert
+from sqlalchemy.orm import Session
+from app.models.job import Job, JobStatus
+from app.core.config import settings
+
+
+# ===== HANDLER REGISTRY =====
+# kind -> function(db, job_row). Filled in by @job_handler in each service.
+JOB_HANDLERS: dict[str, Callable] = {}
+
+
+def job_handler(kind: str):
+    """
+    Register a function as the handler for a job kind.
+
+    Example:
+        @job_handler("email.send")
+        def send_email_job(db: Session, job):
+            ...  # job.payload, job.company_id, job.attempts
+
+    The worker commits after the handler returns, so every job is its own
+    transaction. Raising an exception rolls the job's writes back and marks
+    the attempt as failed (it will be retried).
+    """
+    def decorator(function: Callable) -> Callable:
+        JOB_HANDLERS[kind] = function
+        return function
+    return decorator
+
+
+# ===== ENQUEUE =====
+def enqueue_job(
+    db: Session,
+    kind: str,
+    payload: Optional[dict] = None,
+    company_id: Optional[int] = None,
+    priority: int = 0,
+    queue: str = "default",
+    run_at: Optional[datetime] = None,
+    max_attempts: int = 5,
+) -> Job:
+    """
+    Add a job to the queue (committed together with the caller's transaction).
+
+    Args:
+        db: Database session
+        kind: Handler name (see @job_handler)
+        payload: JSON-serialisable data for the handler
+        company_id: Tenant the job belongs to (used for fair scheduling)
+        priority: Higher numbers run first
+        queue: Queue name (workers can listen to specific queues)
+        run_at: Earliest time to run (default: now)
+        max_attempts: How many times to try before giving up
+
+    Returns:
+        The new Job (not yet committed)
+    """
+    job = Job(
+        kind=kind,
+        payload=payload or {},
+        company_id=company_id,
+        priority=priority,
+        queue=queue,
+        max_attempts=max_attempts,
+        status=JobStatus.QUEUED,
+    )
+    if run_at is not None:
+        job.run_at = run_at
+    db.add(job)
+    return job
+
+
+def enqueue_jobs(db: Session, jobs: list[dict[str, Any]]) -> None:
+    """
+    Add many jobs with one multi-row INSERT.
+
+    Each dict uses the same keys as enqueue_job() arguments, e.g.
+    {"kind": "report.build", "payload": {...}, "company_id": 3}
+    """
+    if not jobs:
+        return
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "kind": job["kind"],
+            "payload": job.get("payload") or {},
+            "company_id": job.get("company_id"),
+            "priority": job.get("priority", 0),
+            "queue": job.get("queue", "default"),
+            "max_attempts": job.get("max_attempts", 5),
+            "status": JobStatus.QUEUED,
+            "attempts": 0,
+            "run_at": job.get("run_at") or now,
+        }
+        for job in jobs
+    ]
+    db.execute(insert(Job), rows)
+
+
+# ===== CLAIM =====
+def claim_jobs(
+    db: Session,
+    worker_id: str,
+    queue: str = "default",
+    batch_size: int = settings.JOB_BATCH_SIZE,
+    fairness_window: int = settings.JOB_FAIRNESS_WINDOW,
+) -> list:
+    """
+    Claim a batch of due jobs for a worker and commit the claim.
+
+    Fairness: the next `fairness_window` due jobs are ranked inside each
+    company, and the batch takes every company's 1st job, then every
+    company's 2nd job, and so on. A company with a huge backlog therefore
+    shares each batch with the others instead of blocking them.
+
+    Returns:
+        List of rows with id, kind, payload, company_id, attempts, max_attempts
+    """
+    # Look at a bounded window of due jobs (highest priority, oldest first),
+    # skipping rows other workers are claiming so the ranking only sees free jobs
+    candidates = select(
+        Job.id, Job.company_id, Job.priority, Job.run_at
+    ).where(
+        Job.status == JobStatus.QUEUED,
+        Job.queue == queue,
+        Job.run_at <= func.now()
+    ).order_by(
+        Job.priority.desc(), Job.run_at
+    ).limit(max(fairness_window, batch_size)).with_for_update(skip_locked=True).cte("candidates")
+
+    # Rank jobs within each tenant
+    ranked = select(
+        candidates,
+        func.row_number().over(
+            partition_by=candidates.c.company_id,
+            order_by=(candidates.c.priority.desc(), candidates.c.run_at, candidates.c.id)
+        ).label("tenant_rank")
+    ).cte("ranked")
+
+    # Lock the chosen rows, skipping rows other workers already hold
+    picked = select(Job.id).join(
+        ranked, ranked.c.id == Job.id
+    ).where(
+        Job.status == JobStatus.QUEUED
+    ).order_by(
+        ranked.c.tenant_rank, ranked.c.priority.desc(), ranked.c.run_at
+    ).limit(batch_size).with_for_update(skip_locked=True, of=Job).cte("picked")
+
+    claimed = db.execute(
+        update(Job).where(
+            Job.id.in_(select(picked.c.id))
+        ).values(
+            status=JobStatus.RUNNING,
+            attempts=Job.attempts + 1,
+            locked_by=worker_id,
+            locked_at=func.now()
+        ).returning(
+            Job.id, Job.kind, Job.payload, Job.company_id, Job.attempts, Job.max_attempts
+        )
+    ).all()
+    db.commit()
+    return claimed
+
+
+# ===== RESULTS =====
+def complete_jobs(db: Session, job_ids: list[int]) -> None:
+    """Mark many jobs as succeeded in one UPDATE."""
+    if not job_ids:
+        return
+    db.execute(
+        update(Job).where(Job.id.in_(job_ids)).values(
+            status=JobStatus.SUCCEEDED,
+            finished_at=func.now(),
+            locked_by=None,
+            last_error=None
+        )
+    )
+    db.commit()
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter: base * 2^(attempts-1), capped."""
+    delay = settings.JOB_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    delay = min(delay, settings.JOB_RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def fail_job(db: Session, job, error: BaseException) -> bool:
+    """
+    Record a failed attempt.
+
+    The job is requeued with backoff until max_attempts is reached,
+    then marked FAILED.
+
+    Returns:
+        True if the job will be retried
+    """
+    will_retry = job.attempts < job.max_attempts
+    values = {
+        "locked_by": None,
+        "last_error": "".join(traceback.format_exception(error))[-4000:],
+    }
+    if will_retry:
+        values["status"] = JobStatus.QUEUED
+        values["run_at"] = datetime.now(timezone.utc) + timedelta(seconds=retry_delay(job.attempts))
+    else:
+        values["status"] = JobStatus.FAILED
+        values["finished_at"] = func.now()
+
+    db.execute(update(Job).where(Job.id == job.id).values(**values))
+    db.commit()
+    return will_retry
+
+
+def requeue_stale_jobs(db: Session, timeout_seconds: int = settings.JOB_LOCK_TIMEOUT_SECONDS) -> tuple[int, int]:
+    """
+    Put RUNNING jobs whose worker died back in the queue.
+
+    The lost run counts as an attempt (it was counted when claimed), so,
+    as with fail_job, a job that has used up max_attempts is marked FAILED
+    instead - a job that kills its worker isn't retried forever.
+
+    Returns:
+        (jobs requeued, jobs failed)
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=timeout_seconds)
+    stale = and_(Job.status == JobStatus.RUNNING, Job.locked_at < cutoff)
+    last_error = f"Worker lost: no progress for {timeout_seconds}s"
+    failed = db.execute(
+        update(Job).where(stale, Job.attempts >= Job.max_attempts)
+        .values(status=JobStatus.FAILED, locked_by=None, last_error=last_error, finished_at=func.now())
+    ).rowcount
+    requeued = db.execute(
+        update(Job).where(stale).values(status=JobStatus.QUEUED, locked_by=None, last_error=last_error)
+    ).rowcount
+    db.commit()
+    return requeued, failed
@@ -0,0 +1,124 @@
+# app/services/kitchen_service.py
+
+"""
+Kitchen Service
+Kitchen Display System (KDS) tickets and their live updates.
+
+Every committed change is published to the station's topic on the event
+broker (app/core/event_stream.py) with the ticket id as the event key, so a
+screen that is behind only receives the latest state of each ticket.
+Screens that connect (or fall too far behind) first get a snapshot of the
+station's open tickets.
+"""
+
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.event_stream import TopicKey, broker
+from app.database import SessionLocal
+from app.models.kitchen import KitchenTicket, OPEN_STATUSES, TicketStatus
+from app.schemas.kitchen import KitchenTicketCreate, KitchenTicketResponse
+
+
+# Status changes kitchen staff can make (served and cancelled tickets are final)
+TRANSITIONS: dict[TicketStatus, set[TicketStatus]] = {
+    TicketStatus.NEW: {TicketStatus.PREPARING, TicketStatus.READY, TicketStatus.CANCELLED},
+    TicketStatus.PREPARING: {TicketStatus.NEW, TicketStatus.READY, TicketStatus.CANCELLED},
+    TicketStatus.READY: {TicketStatus.PREPARING, TicketStatus.SERVED, TicketStatus.CANCELLED},
+    TicketStatus.SERVED: set(),
+    TicketStatus.CANCELLED: set(),
+}
+
+
+def topic(company_id: int, station: str) -> TopicKey:
+    """Event broker topic of a station's screens."""
+    return (company_id, f"kitchen:{station}")
+
+
+def normalize_station(station: str) -> str:
+    return station.strip().lower()
+
+
+def _publish(ticket: KitchenTicket) -> None:
+    """Push a committed ticket to its station's screens."""
+    data = KitchenTicketResponse.model_validate(ticket).model_dump(mode="json")
+    broker.publish(topic(ticket.company_id, ticket.station), "ticket", data, key=ticket.id)
+
+
+# ===== TICKETS =====
+def create_ticket(db: Session, company_id: int, ticket_data: KitchenTicketCreate, actor_user_id: Optional[int] = None) -> KitchenTicket:
+    """Send an order to a station."""
+    ticket = KitchenTicket(
+        company_id=company_id,
+        station=normalize_station(ticket_data.station),
+        order_reference=ticket_data.order_reference,
+        table_label=ticket_data.table_label,
+        items=[item.model_dump(mode="json") for item in ticket_data.items],
+        status=TicketStatus.NEW,
+        created_by=actor_user_id,
+    )
+    db.add(ticket)
+    db.commit()
+    db.refresh(ticket)
+    _publish(ticket)
+    return ticket
+
+
+def update_ticket_status(db: Session, company_id: int, ticket_id: int, new_status: TicketStatus) -> KitchenTicket:
+    """
+    Move a ticket along (e.g. preparing -> ready).
+
+    Raises:
+        HTTPException 404: Ticket not found in this company
+        HTTPException 409: Not allowed from the current status
+    """
+    ticket = db.scalar(
+        select(KitchenTicket)
+        .where(KitchenTicket.id == ticket_id, KitchenTicket.company_id == company_id)
+        .with_for_update()
+    )
+    if ticket is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found"
+        )
+    if new_status == ticket.status:
+        return ticket  # Double tap on the screen
+    if new_status not in TRANSITIONS[ticket.status]:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Cannot change a {ticket.status.value} ticket to {new_status.value}"
+        )
+    ticket.status = new_status
+    db.commit()
+    db.refresh(ticket)
+    _publish(ticket)
+    return ticket
+
+
+def list_open_tickets(db: Session, company_id: int, station: str) -> list[KitchenTicket]:
+    """Tickets still shown on a station's screens, oldest first."""
+    return list(db.scalars(
+        select(KitchenTicket)
+        .where(
+            KitchenTicket.company_id == company_id,
+            KitchenTicket.station == normalize_station(station),
+            KitchenTicket.status.in_(OPEN_STATUSES),
+        )
+        .order_by(KitchenTicket.id)
+    ))
+
+
+def snapshot(company_id: int, station: str) -> dict:
+    """
+    Current state of a station for a (re)connecting screen.
+
+    Runs outside the request (in a worker thread), so it uses its own session.
+    """
+    db = SessionLocal()
+    try:
+        tickets = list_open_tickets(db, company_id, station)
+        return {"tickets": [KitchenTicketResponse.model_validate(ticket).model_dump(mode="json") for ticket in tickets]}
+    finally:
+        db.close()
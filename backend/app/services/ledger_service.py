@@ -0,0 +1,454 @@
+# app/services/ledger_service.py
+
+"""
+Ledger Service
+Posting to the double-entry journal and reading account balances.
+
+Postings:
+- Every entry must balance (lines sum to zero sen)
+- Entries and lines are inserted with multi-row INSERTs
+- The new lines are screened against the company's Sharia-compliance
+  rules (screening_service); violations are reported, never refused
+- The month snapshots of every touched account are updated in the same
+  transaction (AccountBalanceSnapshot), so balances stay correct without
+  any batch job
+
+Balances:
+    balance(account, day) = closing of the last snapshot before day's month
+                          + lines from the start of that month up to day
+  The second part scans at most one month of one account's lines.
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Iterable, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import Date, bindparam, cast, select, update, insert, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.money import to_sen, from_sen
+from app.models.account import Account
+from app.models.journal import JournalEntry, JournalLine, AccountBalanceSnapshot
+from app.schemas.ledger import AccountCreate, JournalEntryCreate, JournalLineCreate
+from app.core.invalidation import publish
+from app.models.screening import ScreeningSource
+from app.services.audit_service import record_audit
+from app.services.screening_service import screen, screening_engine
+
+
+Snapshot = AccountBalanceSnapshot
+
+# Core statements for the bulk paths (skip ORM bookkeeping per row)
+_snapshots = AccountBalanceSnapshot.__table__
+_update_snapshot = update(_snapshots).where(
+    _snapshots.c.company_id == bindparam("key_company_id"),
+    _snapshots.c.account_id == bindparam("key_account_id"),
+    _snapshots.c.period == bindparam("key_period"),
+).values(
+    movement=bindparam("movement"),
+    closing=bindparam("closing"),
+    line_count=bindparam("line_count"),
+)
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def is_month_end(day: date) -> bool:
+    return (day + timedelta(days=1)).day == 1
+
+
+# ===== ACCOUNTS =====
+def create_account(db: Session, company_id: int, account_data: AccountCreate) -> Account:
+    """
+    Add an account to a company's chart of accounts.
+
+    Raises:
+        HTTPException 400: Parent account belongs to another company
+        HTTPException 409: Account code already used in this company
+    """
+    if account_data.parent_id is not None:
+        parent = db.get(Account, account_data.parent_id)
+        if parent is None or parent.company_id != company_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Parent account not found"
+            )
+    account = Account(company_id=company_id, **account_data.model_dump())
+    db.add(account)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Account code {account_data.code} already exists"
+        )
+    record_audit(db, "account.created", "account", account.id, company_id=company_id)
+    publish(db, screening_engine.name, company_id)  # Rules may match the new account
+    db.commit()
+    db.refresh(account)
+    return account
+
+
+def list_accounts(db: Session, company_id: int) -> list[Account]:
+    return list(db.scalars(
+        select(Account).where(Account.company_id == company_id).order_by(Account.code)
+    ))
+
+
+# ===== POSTING =====
+def _lock_accounts(db: Session, company_id: int, account_ids: set[int]) -> None:
+    """
+    Check the accounts exist, are active and belong to the company, and lock them.
+
+    Locks are taken in id order (no deadlocks) with FOR NO KEY UPDATE, which
+    does not block the foreign key checks of concurrent inserts. Holding them
+    until commit serialises snapshot updates per account.
+    """
+    rows = db.execute(
+        select(Account.id, Account.is_active).where(
+            Account.company_id == company_id,
+            Account.id.in_(sorted(account_ids))
+        ).order_by(Account.id).with_for_update(key_share=True)
+    ).all()
+    found = {row.id: row.is_active for row in rows}
+    missing = account_ids - found.keys()
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown accounts: {sorted(missing)}"
+        )
+    inactive = [account_id for account_id, active in found.items() if not active]
+    if inactive:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Accounts are inactive: {sorted(inactive)}"
+        )
+
+
+def apply_snapshot_deltas(
+    db: Session,
+    company_id: int,
+    deltas: dict[tuple[int, date], tuple[int, int]]
+) -> None:
+    """
+    Add posted amounts to the month snapshots.
+
+    Args:
+        deltas: {(account_id, period): (amount_sen, line_count)}
+
+    Works in a fixed number of statements however many accounts and
+    months are touched: read the affected snapshots, work out the new
+    totals in Python, then one bulk UPDATE and one bulk INSERT.
+    Caller must hold the account locks (see _lock_accounts).
+    """
+    if not deltas:
+        return
+    by_account: dict[int, dict[date, tuple[int, int]]] = defaultdict(dict)
+    for (account_id, period), value in deltas.items():
+        by_account[account_id][period] = value
+    account_ids = sorted(by_account)
+    earliest = min(period for _, period in deltas)
+
+    # Existing snapshots from the earliest touched month on...
+    existing: dict[int, dict[date, tuple[int, int, int]]] = defaultdict(dict)
+    for row in db.execute(
+        select(Snapshot.account_id, Snapshot.period, Snapshot.movement, Snapshot.closing, Snapshot.line_count)
+        .where(Snapshot.company_id == company_id, Snapshot.account_id.in_(account_ids), Snapshot.period >= earliest)
+    ):
+        existing[row.account_id][row.period] = (row.movement, row.closing, row.line_count)
+    # ...and the closing balance just before it
+    latest_before = select(
+        Snapshot.account_id,
+        Snapshot.closing,
+        func.row_number().over(partition_by=Snapshot.account_id, order_by=Snapshot.period.desc()).label("recency")
+    ).where(
+        Snapshot.company_id == company_id, Snapshot.account_id.in_(account_ids), Snapshot.period < earliest
+    ).subquery()
+    opening = dict(db.execute(
+        select(latest_before.c.account_id, latest_before.c.closing).where(latest_before.c.recency == 1)
+    ).all())
+
+    updates, inserts = [], []
+    for account_id in account_ids:
+        account_deltas = by_account[account_id]
+        rows = existing[account_id]
+        first = min(account_deltas)
+        # Closing of the last month before `first`
+        closing = opening.get(account_id, 0)
+        for period in sorted(rows):
+            if period < first:
+                closing = rows[period][1]
+        added = 0
+        for period in sorted(set(account_deltas) | {p for p in rows if p >= first}):
+            amount, count = account_deltas.get(period, (0, 0))
+            added += amount
+            if period in rows:
+                movement, old_closing, line_count = rows[period]
+                closing = old_closing + added
+                updates.append({
+                    "key_company_id": company_id, "key_account_id": account_id, "key_period": period,
+                    "movement": movement + amount, "closing": closing, "line_count": line_count + count,
+                })
+            else:
+                closing += amount
+                inserts.append({
+                    "company_id": company_id, "account_id": account_id, "period": period,
+                    "movement": amount, "closing": closing, "line_count": count,
+                })
+    if updates:
+        db.execute(_update_snapshot, updates)
+    if inserts:
+        db.execute(insert(_snapshots), inserts)
+
+
+def post_entries(
+    db: Session,
+    company_id: int,
+    entries: list[JournalEntryCreate],
+    created_by: Optional[int] = None,
+    source: str = "manual",
+    reversal_of_id: Optional[int] = None,
+    commit: bool = True,
+) -> list[int]:
+    """
+    Post balanced journal entries in one transaction.
+
+    Args:
+        db: Database session
+        company_id: Company whose ledger is posted to
+        entries: Validated entries (JournalEntryCreate checks balance)
+        created_by: User posting
+        source: Where the entries come from (manual, pos, invoice...)
+        commit: False to leave the transaction open for the caller
+
+    Returns:
+        IDs of the new entries, in input order
+    """
+    if not entries:
+        return []
+    # Amounts in sen, checked before anything is written
+    amounts = []
+    for entry in entries:
+        entry_amounts = [to_sen(line.debit) - to_sen(line.credit) for line in entry.lines]
+        if sum(entry_amounts) != 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Entry dated {entry.entry_date} does not balance"
+            )
+        amounts.append(entry_amounts)
+
+    account_ids = {line.account_id for entry in entries for line in entry.lines}
+    _lock_accounts(db, company_id, account_ids)
+
+    entry_ids = db.execute(
+        insert(JournalEntry).returning(JournalEntry.id, sort_by_parameter_order=True),
+        [
+            {
+                "company_id": company_id,
+                "entry_date": entry.entry_date,
+                "reference": entry.reference,
+                "description": entry.description,
+                "source": source,
+                "reversal_of_id": reversal_of_id,
+                "created_by": created_by,
+            }
+            for entry in entries
+        ]
+    ).scalars().all()
+
+    line_rows = []
+    deltas: dict[tuple[int, date], list[int]] = defaultdict(lambda: [0, 0])
+    for entry_id, entry, entry_amounts in zip(entry_ids, entries, amounts):
+        period = month_start(entry.entry_date)
+        for line, amount in zip(entry.lines, entry_amounts):
+            line_rows.append({
+                "entry_id": entry_id,
+                "company_id": company_id,
+                "entry_date": entry.entry_date,
+                "account_id": line.account_id,
+                "amount": amount,
+                "cost_center": line.cost_center,
+                "description": line.description,
+            })
+            delta = deltas[(line.account_id, period)]
+            delta[0] += amount
+            delta[1] += 1
+
+    db.execute(insert(JournalLine.__table__), line_rows)
+    apply_snapshot_deltas(db, company_id, {key: tuple(value) for key, value in deltas.items()})
+    screen(
+        db, company_id, ScreeningSource.JOURNAL,
+        [row["entry_id"] for row in line_rows],
+        [row["account_id"] for row in line_rows],
+        [row["amount"] for row in line_rows],
+        lambda: {entry_id: entry.entry_date for entry_id, entry in zip(entry_ids, entries)},
+    )
+    record_audit(
+        db, "journal.posted", "journal_entry", entry_ids[0],
+        company_id=company_id, actor_user_id=created_by,
+        changes={"entries": len(entry_ids), "lines": len(line_rows), "source": source}
+    )
+    if commit:
+        db.commit()
+    return list(entry_ids)
+
+
+def reverse_entry(
+    db: Session,
+    company_id: int,
+    entry_id: int,
+    created_by: Optional[int] = None,
+    entry_date: Optional[date] = None,
+) -> tuple[int, int]:
+    """
+    Cancel an entry by posting its mirror image (the original is kept).
+
+    Returns:
+        (reversal entry ID, number of lines)
+
+    Raises:
+        HTTPException 404: Entry not found in this company
+        HTTPException 409: Entry was already reversed
+    """
+    entry = db.get(JournalEntry, entry_id)
+    if entry is None or entry.company_id != company_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Journal entry not found")
+    already = db.scalar(select(JournalEntry.id).where(JournalEntry.reversal_of_id == entry_id).limit(1))
+    if already is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Entry {entry_id} was already reversed by entry {already}"
+        )
+    lines = db.execute(
+        select(JournalLine.account_id, JournalLine.amount, JournalLine.cost_center, JournalLine.description)
+        .where(JournalLine.entry_id == entry_id)
+    ).all()
+    reversal = JournalEntryCreate.model_construct(
+        entry_date=entry_date or entry.entry_date,
+        reference=entry.reference,
+        description=f"Reversal of entry {entry_id}",
+        lines=[
+            # Swap sides: a debit becomes a credit and vice versa
+            JournalLineCreate.model_construct(
+                account_id=line.account_id,
+                debit=from_sen(max(-line.amount, 0)),
+                credit=from_sen(max(line.amount, 0)),
+                cost_center=line.cost_center,
+                description=line.description,
+            )
+            for line in lines
+        ],
+    )
+    try:
+        reversal_id = post_entries(
+            db, company_id, [reversal], created_by=created_by, source="reversal", reversal_of_id=entry_id
+        )[0]
+    except IntegrityError:
+        # Another request reversed it between the check above and the insert
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Entry {entry_id} was already reversed"
+        )
+    return reversal_id, len(lines)
+
+
+# ===== BALANCES =====
+def get_account_balances(
+    db: Session,
+    company_id: int,
+    as_of: date,
+    account_ids: Optional[Iterable[int]] = None,
+) -> dict[int, int]:
+    """
+    Balances (sen, debit positive) at the end of `as_of`.
+
+    Uses the nearest month snapshot plus the lines posted since, so the
+    cost does not grow with the size of the journal.
+
+    Returns:
+        {account_id: balance}. Accounts with no postings are left out.
+    """
+    start = month_start(as_of)
+    ids = None if account_ids is None else sorted(set(account_ids))
+
+    # At a month end the month's own snapshot is already the answer
+    use_own_month = is_month_end(as_of)
+    snapshot_filter = [Snapshot.company_id == company_id]
+    snapshot_filter.append(Snapshot.period <= start if use_own_month else Snapshot.period < start)
+    if ids is not None:
+        snapshot_filter.append(Snapshot.account_id.in_(ids))
+    latest = select(
+        Snapshot.account_id,
+        Snapshot.closing,
+        func.row_number().over(
+            partition_by=Snapshot.account_id, order_by=Snapshot.period.desc()
+        ).label("recency")
+    ).where(*snapshot_filter).subquery()
+    balances = {
+        row.account_id: row.closing
+        for row in db.execute(select(latest.c.account_id, latest.c.closing).where(latest.c.recency == 1))
+    }
+    if use_own_month:
+        return balances
+
+    line_filter = [
+        JournalLine.company_id == company_id,
+        JournalLine.entry_date >= start,
+        JournalLine.entry_date <= as_of,
+    ]
+    if ids is not None:
+        line_filter.append(JournalLine.account_id.in_(ids))
+    for account_id, delta in db.execute(
+        select(JournalLine.account_id, func.sum(JournalLine.amount))
+        .where(*line_filter).group_by(JournalLine.account_id)
+    ):
+        balances[account_id] = balances.get(account_id, 0) + int(delta)
+    return balances
+
+
+def get_account_balance(db: Session, company_id: int, account_id: int, as_of: date) -> int:
+    """Balance of one account (sen, debit positive) at the end of `as_of`."""
+    return get_account_balances(db, company_id, as_of, [account_id]).get(account_id, 0)
+
+
+def rebuild_snapshots(db: Session, company_id: int) -> int:
+    """
+    Recompute every snapshot of a company from the journal (repair / import tool).
+
+    Returns:
+        Number of snapshot rows written
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        period = cast(func.date_trunc("month", JournalLine.entry_date), Date)
+    else:
+        period = func.date(JournalLine.entry_date, "start of month")
+    rows = db.execute(
+        select(JournalLine.account_id, period.label("period"), func.sum(JournalLine.amount), func.count())
+        .where(JournalLine.company_id == company_id)
+        .group_by(JournalLine.account_id, period)
+        .order_by(JournalLine.account_id, period)
+    ).all()
+    if rows:
+        _lock_accounts(db, company_id, {row[0] for row in rows})
+    db.execute(Snapshot.__table__.delete().where(Snapshot.company_id == company_id))
+
+    snapshots = []
+    closing, current_account = 0, None
+    for account_id, month, movement, count in rows:
+        if account_id != current_account:
+            closing, current_account = 0, account_id
+        closing += int(movement)
+        if isinstance(month, str):  # SQLite returns dates as text
+            month = date.fromisoformat(month)
+        snapshots.append({
+            "company_id": company_id, "account_id": account_id, "period": month,
+            "movement": int(movement), "closing": closing, "line_count": count,
+        })
+    if snapshots:
+        db.execute(insert(Snapshot), snapshots)
+    db.commit()
+    return len(snapshots)
@@ -0,0 +1,275 @@
+# app/services/numbering_service.py
+
+"""
+Numbering Service
+Per-company, per-document-type sequential numbers such as INV-2026-000123.
+
+Counters live in document_sequences, one row per (company, type, year),
+so terminals of different companies or document types never wait on each
+other. There is no SELECT max()+1 and no lock held while a document is built.
+
+Gap-free types (invoices, credit notes - see GAP_FREE_TYPES):
+    Numbers are taken with a single `UPDATE ... SET next_value = next_value + n
+    RETURNING` in the caller's transaction, so they commit or roll back with
+    the document. The counter row stays locked until that commit, so either:
+    - call allocate_gap_free() as the last statement before commit, or
+    - use assign_on_commit(): the numbers are allocated in before_commit,
+      after all other work, with one UPDATE per sequence for the whole batch
+
+Other types (purchase orders, receipts):
+    Each process reserves NUMBER_BLOCK_SIZE numbers at a time in its own short
+    transaction (NumberBlocks) and hands them out from memory. Numbers are
+    unique, but the unused rest of a block is skipped when the process stops,
+    and numbers from different processes interleave.
+"""
+
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Any, Optional
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.document_sequence import DocumentSequence, DocumentType, DEFAULT_PREFIXES, GAP_FREE_TYPES
+from app.schemas.numbering import DocumentSequenceUpdate
+from app.services.audit_service import record_audit
+
+
+_PENDING_KEY = "pending_document_numbers"
+_sequences = DocumentSequence.__table__
+
+
+def format_number(prefix: str, year: int, value: int, padding: int = 6) -> str:
+    """format_number("INV", 2026, 123) -> "INV-2026-000123" """
+    return f"{prefix}-{year}-{value:0{padding}d}"
+
+
+# ===== COUNTERS =====
+def _create_sequence(db: Session, company_id: int, document_type: DocumentType, year: int) -> None:
+    """
+    Create the counter row for a new year.
+    Prefix and padding are copied from the company's latest year, if any.
+    """
+    latest = db.execute(
+        select(_sequences.c.prefix, _sequences.c.padding)
+        .where(_sequences.c.company_id == company_id, _sequences.c.document_type == document_type)
+        .order_by(_sequences.c.year.desc())
+        .limit(1)
+    ).first()
+    prefix, padding = latest if latest else (DEFAULT_PREFIXES[document_type], 6)
+    try:
+        with db.begin_nested():
+            db.execute(insert(_sequences).values(
+                company_id=company_id, document_type=document_type, year=year,
+                prefix=prefix, padding=padding, next_value=1
+            ))
+    except IntegrityError:
+        pass  # A concurrent transaction created it first
+
+
+def _advance(db: Session, company_id: int, document_type: DocumentType, year: int, count: int) -> tuple[int, str, int]:
+    """
+    Take `count` consecutive values from a counter (creating it if needed).
+
+    Returns:
+        (first value, prefix, padding)
+    """
+    statement = (
+        update(_sequences)
+        .where(
+            _sequences.c.company_id == company_id,
+            _sequences.c.document_type == document_type,
+            _sequences.c.year == year,
+        )
+        .values(next_value=_sequences.c.next_value + count)
+        .returning(_sequences.c.next_value, _sequences.c.prefix, _sequences.c.padding)
+    )
+    row = db.execute(statement).first()
+    if row is None:
+        _create_sequence(db, company_id, document_type, year)
+        row = db.execute(statement).first()
+    next_value, prefix, padding = row
+    return next_value - count, prefix, padding
+
+
+# ===== GAP-FREE =====
+def allocate_gap_free(
+    db: Session,
+    company_id: int,
+    document_type: DocumentType,
+    year: int,
+    count: int = 1,
+) -> list[str]:
+    """
+    Take the next `count` numbers inside the caller's transaction.
+
+    The counter row is locked until the caller commits or rolls back, so
+    call this as late as possible (ideally right before db.commit()).
+
+    Returns:
+        Formatted numbers, e.g. ["INV-2026-000123", "INV-2026-000124"]
+    """
+    first, prefix, padding = _advance(db, company_id, document_type, year, count)
+    return [format_number(prefix, year, value, padding) for value in range(first, first + count)]
+
+
+def assign_on_commit(
+    db: Session,
+    target: Any,
+    attribute: str,
+    company_id: int,
+    document_type: DocumentType,
+    on_date: Optional[date] = None,
+) -> None:
+    """
+    Set `target.<attribute>` to the next gap-free number when `db` commits.
+
+    Numbers are allocated at the very end of the transaction, all documents
+    of the same sequence with one UPDATE, so the counter is locked only
+    for the commit itself. If the column is NOT NULL, don't flush `target`
+    before committing.
+
+    Example:
+        invoice = Invoice(...)
+        db.add(invoice)
+        assign_on_commit(db, invoice, "number", company_id, DocumentType.INVOICE, invoice.issue_date)
+        db.commit()  # invoice.number == "INV-2026-000124"
+    """
+    year = (on_date or date.today()).year
+    db.info.setdefault(_PENDING_KEY, []).append(((company_id, document_type, year), target, attribute))
+
+
+@event.listens_for(SessionLocal, "before_commit")
+def _assign_pending_numbers(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    targets = defaultdict(list)
+    for key, target, attribute in pending:
+        targets[key].append((target, attribute))
+    # Same order in every transaction, so two committers never deadlock
+    for key in sorted(targets, key=lambda key: (key[0], key[1].value, key[2])):
+        numbers = allocate_gap_free(session, *key, count=len(targets[key]))
+        for (target, attribute), number in zip(targets[key], numbers):
+            setattr(target, attribute, number)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending_numbers(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ===== BLOCKS (gaps allowed) =====
+class NumberBlocks:
+    """
+    Numbers reserved by this process, handed out from memory.
+
+    Only one database round trip per `block_size` numbers, in its own
+    transaction, so callers never hold the counter row lock.
+    """
+
+    def __init__(self, block_size: int = settings.NUMBER_BLOCK_SIZE):
+        self.block_size = block_size
+        self._blocks: dict[tuple, list] = {}  # key -> [next value, end (exclusive), prefix, padding]
+        self._key_locks: dict[tuple, threading.Lock] = defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+        self.reservations = 0
+
+    def take(self, company_id: int, document_type: DocumentType, year: int) -> str:
+        key = (company_id, document_type, year)
+        with self._lock:
+            key_lock = self._key_locks[key]
+        with key_lock:
+            block = self._blocks.get(key)
+            if block is None or block[0] >= block[1]:
+                block = self._blocks[key] = self._reserve(key)
+            value = block[0]
+            block[0] += 1
+            return format_number(block[2], year, value, block[3])
+
+    def forget(self, company_id: int, document_type: DocumentType) -> None:
+        """Drop this process's blocks (e.g. after the prefix changed)."""
+        with self._lock:
+            for key in [key for key in self._blocks if key[:2] == (company_id, document_type)]:
+                del self._blocks[key]
+
+    def _reserve(self, key: tuple) -> list:
+        db = SessionLocal()
+        try:
+            first, prefix, padding = _advance(db, *key, self.block_size)
+            db.commit()
+        finally:
+            db.close()
+        self.reservations += 1
+        return [first, first + self.block_size, prefix, padding]
+
+
+number_blocks = NumberBlocks()
+
+
+# ===== PUBLIC API =====
+def next_number(
+    db: Session,
+    company_id: int,
+    document_type: DocumentType,
+    on_date: Optional[date] = None,
+) -> str:
+    """
+    Next number for a document dated `on_date` (default today).
+
+    Gap-free types are allocated in `db` (commit soon after); the others come
+    from this process's block and don't touch `db`.
+    """
+    year = (on_date or date.today()).year
+    if document_type in GAP_FREE_TYPES:
+        return allocate_gap_free(db, company_id, document_type, year)[0]
+    return number_blocks.take(company_id, document_type, year)
+
+
+def list_sequences(db: Session, company_id: int) -> list[DocumentSequence]:
+    """All counters of a company, newest year first."""
+    return db.scalars(
+        select(DocumentSequence)
+        .where(DocumentSequence.company_id == company_id)
+        .order_by(DocumentSequence.year.desc(), DocumentSequence.document_type)
+    ).all()
+
+
+def update_sequence(
+    db: Session,
+    company_id: int,
+    document_type: DocumentType,
+    sequence_data: DocumentSequenceUpdate,
+    actor_user_id: Optional[int] = None,
+) -> DocumentSequence:
+    """
+    Change the prefix / padding of a document type from this year on.
+    Numbers already issued keep their old format.
+    """
+    year = date.today().year
+    _create_sequence(db, company_id, document_type, year)
+    sequence = db.get(DocumentSequence, (company_id, document_type, year), with_for_update=True)
+    changes = {
+        field: [getattr(sequence, field), value]
+        for field, value in sequence_data.model_dump().items()
+        if getattr(sequence, field) != value
+    }
+    db.execute(
+        update(_sequences)
+        .where(
+            _sequences.c.company_id == company_id,
+            _sequences.c.document_type == document_type,
+            _sequences.c.year >= year,
+        )
+        .values(**sequence_data.model_dump())
+    )
+    record_audit(
+        db, "numbering.updated", "document_sequence", document_type.value,
+        company_id=company_id, actor_user_id=actor_user_id, changes=changes
+    )
+    db.commit()
+    db.refresh(sequence)
+    number_blocks.forget(company_id, document_type)
+    return sequence
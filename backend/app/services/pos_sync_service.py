@@ -0,0 +1,304 @@
+# app/services/pos_sync_service.py
+
+"""
+POS Sync Service
+Offline-first POS: terminals queue sales locally and upload them in batches.
+
+One upload = one transaction:
+1. Sales are inserted with INSERT ... ON CONFLICT (company_id, idempotency_key)
+   DO NOTHING RETURNING id - a retried upload, or two uploads racing each
+   other, store every sale exactly once. Rows that come back are new, the
+   rest are duplicates.
+2. Lines and stock movements of the new sales are bulk inserted
+3. Stock levels get one UPDATE per (product, warehouse), not per line.
+   Sales already happened, so they are never refused for lack of stock
+   (levels may go negative until the next receipt or stock count).
+4. New sales are scored for fraud from in-memory activity windows
+   (app/services/fraud_service.py) within FRAUD_SCORE_BUDGET_MS
+5. Their lines are screened against the company's Sharia-compliance rules
+   (app/services/screening_service.py) - reported, never refused
+
+The response also carries the catalog changes since the terminal's cursor,
+so one round trip both drains the terminal's queue and refreshes its prices.
+"""
+
+import base64
+import json
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.money import from_sen, to_sen
+from app.models.pos import PosSale, PosSaleLine
+from app.models.screening import ScreeningSource
+from app.models.product import Product
+from app.models.stock import MovementType, StockMovement
+from app.models.warehouse import Warehouse
+from app.schemas.catalog import CatalogItemResponse
+from app.schemas.pos import PosSaleCreate, PosSyncRejected, PosSyncRequest, PosSyncResponse
+from app.services.audit_service import record_audit
+from app.services.dashboard_service import publish_sales_today
+from app.services import fraud_service
+from app.services.inventory_service import apply_level_changes
+from app.services.screening_service import local_day, screen
+
+
+CENT = Decimal("0.01")
+
+
+# ===== CURSOR =====
+def encode_cursor(updated_at: Optional[datetime], product_id: int) -> str:
+    """Opaque sync cursor: position (updated_at, id) in the product change stream."""
+    payload = {"t": updated_at.isoformat() if updated_at else None, "id": product_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> tuple[Optional[datetime], int]:
+    """
+    Raises:
+        HTTPException 400: Not a cursor returned by this API
+    """
+    if not cursor:
+        return None, 0
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        updated_at = datetime.fromisoformat(payload["t"]) if payload["t"] else None
+        return updated_at, int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync cursor"
+        )
+
+
+# ===== UPLOAD =====
+def _insert_new_sales(db: Session):
+    """INSERT that skips sales whose idempotency key is already stored."""
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return (
+        dialect.insert(PosSale.__table__)
+        .on_conflict_do_nothing(index_elements=["company_id", "idempotency_key"])
+        .returning(PosSale.__table__.c.id, PosSale.__table__.c.idempotency_key)
+    )
+
+
+def _line_total(quantity: Decimal, unit_price: Decimal, discount: Decimal) -> int:
+    return to_sen((quantity * unit_price).quantize(CENT, rounding=ROUND_HALF_UP)) - to_sen(discount)
+
+
+def _validate(
+    db: Session,
+    company_id: int,
+    sales: list[PosSaleCreate],
+) -> tuple[list[PosSaleCreate], list[PosSyncRejected], dict]:
+    """
+    Split a batch into storable sales and rejected ones (unknown products or
+    warehouses - retrying will not help, so the terminal should drop them).
+
+    Returns:
+        (valid sales, rejected, {product_id: (is_stocked, reorder_level)})
+    """
+    product_ids = {line.product_id for sale in sales for line in sale.lines}
+    products = {
+        row.id: (row.is_stocked, row.reorder_level)
+        for row in db.execute(
+            select(Product.id, Product.is_stocked, Product.reorder_level)
+            .where(Product.company_id == company_id, Product.id.in_(product_ids))
+        )
+    }
+    warehouses = set(db.scalars(
+        select(Warehouse.id).where(
+            Warehouse.company_id == company_id,
+            Warehouse.id.in_({sale.warehouse_id for sale in sales}),
+        )
+    ))
+    valid, rejected = [], []
+    for sale in sales:
+        unknown = sorted({line.product_id for line in sale.lines} - products.keys())
+        if sale.warehouse_id not in warehouses:
+            rejected.append(PosSyncRejected(idempotency_key=sale.idempotency_key, reason=f"Unknown warehouse {sale.warehouse_id}"))
+        elif unknown:
+            rejected.append(PosSyncRejected(idempotency_key=sale.idempotency_key, reason=f"Unknown products {unknown}"))
+        elif any(_line_total(line.quantity, line.unit_price, line.discount) < 0 for line in sale.lines):
+            rejected.append(PosSyncRejected(idempotency_key=sale.idempotency_key, reason="Discount larger than line amount"))
+        else:
+            valid.append(sale)
+    return valid, rejected, products
+
+
+def upload_sales(
+    db: Session,
+    company_id: int,
+    sales: list[PosSaleCreate],
+    uploaded_by: Optional[int] = None,
+) -> tuple[list[str], list[str], list[PosSyncRejected]]:
+    """
+    Store a batch of sales and their stock movements in one transaction.
+
+    Returns:
+        (accepted keys, duplicate keys, rejected sales)
+    """
+    if not sales:
+        return [], [], []
+    # The same sale twice in one batch: keep the first
+    unique: dict[str, PosSaleCreate] = {}
+    duplicates = []
+    for sale in sales:
+        if sale.idempotency_key in unique:
+            duplicates.append(sale.idempotency_key)
+        else:
+            unique[sale.idempotency_key] = sale
+    valid, rejected, products = _validate(db, company_id, list(unique.values()))
+    if not valid:
+        return [], duplicates, rejected
+
+    sale_rows = []
+    line_totals: dict[str, list[int]] = {}
+    discounts: dict[str, int] = {}
+    sold_at: dict[str, datetime] = {}
+    for sale in valid:
+        totals = [_line_total(line.quantity, line.unit_price, line.discount) for line in sale.lines]
+        line_totals[sale.idempotency_key] = totals
+        discounts[sale.idempotency_key] = sum(to_sen(line.discount) for line in sale.lines)
+        # UTC once, so SQLite (which keeps the wall time) and PostgreSQL store the same instant
+        moment = sale.sold_at if sale.sold_at.tzinfo else sale.sold_at.replace(tzinfo=timezone.utc)
+        sold_at[sale.idempotency_key] = moment.astimezone(timezone.utc)
+        sale_rows.append({
+            "company_id": company_id,
+            "idempotency_key": sale.idempotency_key,
+            "terminal_code": sale.terminal_code,
+            "receipt_number": sale.receipt_number,
+            "warehouse_id": sale.warehouse_id,
+            "sold_at": sold_at[sale.idempotency_key],
+            "payment_method": sale.payment_method,
+            "total": sum(totals),
+            "uploaded_by": uploaded_by,
+        })
+    sale_ids = dict((key, sale_id) for sale_id, key in db.execute(_insert_new_sales(db), sale_rows))
+
+    accepted = [sale.idempotency_key for sale in valid if sale.idempotency_key in sale_ids]
+    duplicates += [sale.idempotency_key for sale in valid if sale.idempotency_key not in sale_ids]
+
+    line_rows, movement_rows = [], []
+    changes: dict[tuple[int, int], list] = defaultdict(lambda: [Decimal(0), Decimal(0)])
+    for sale in valid:
+        sale_id = sale_ids.get(sale.idempotency_key)
+        if sale_id is None:
+            continue
+        for line, line_total in zip(sale.lines, line_totals[sale.idempotency_key]):
+            line_rows.append({
+                "sale_id": sale_id, "company_id": company_id, "product_id": line.product_id,
+                "quantity": line.quantity, "unit_price": to_sen(line.unit_price),
+                "discount": to_sen(line.discount), "line_total": line_total,
+            })
+            if products[line.product_id][0]:  # Stocked (not a service)
+                movement_rows.append({
+                    "company_id": company_id, "product_id": line.product_id, "warehouse_id": sale.warehouse_id,
+                    "type": MovementType.SALE, "quantity": -line.quantity,
+                    "reference": sale.receipt_number, "note": f"POS {sale.terminal_code}", "created_by": uploaded_by,
+                    # When the sale happened, not when the terminal came back online (forecasts bucket by day)
+                    "created_at": sold_at[sale.idempotency_key],
+                })
+                changes[(line.product_id, sale.warehouse_id)][0] -= line.quantity
+
+    if line_rows:
+        db.execute(insert(PosSaleLine.__table__), line_rows)
+    if movement_rows:
+        db.execute(insert(StockMovement.__table__), movement_rows)
+        reorder_levels = {product_id: level for product_id, (_, level) in products.items()}
+        apply_level_changes(db, company_id, {key: tuple(value) for key, value in changes.items()}, reorder_levels)
+    scored = None
+    if accepted:
+        record_audit(
+            db, "pos.synced", "pos_sale", sale_ids[accepted[0]],
+            company_id=company_id, actor_user_id=uploaded_by,
+            changes={"accepted": len(accepted), "duplicates": len(duplicates), "lines": len(line_rows)}
+        )
+        if settings.FRAUD_SCORING_ENABLED:
+            scored = fraud_service.scorer.score(db, company_id, [
+                fraud_service.Transaction(
+                    sale_ids[sale.idempotency_key], sale.terminal_code, uploaded_by, fraud_service.epoch(sold_at[sale.idempotency_key]),
+                    sum(line_totals[sale.idempotency_key]) + discounts[sale.idempotency_key],
+                    discounts[sale.idempotency_key], len(sale.lines),
+                )
+                for sale in valid if sale.idempotency_key in sale_ids
+            ])
+        screen(
+            db, company_id, ScreeningSource.POS,
+            [row["sale_id"] for row in line_rows],
+            [row["product_id"] for row in line_rows],
+            [row["line_total"] for row in line_rows],
+            lambda: {sale_ids[sale.idempotency_key]: local_day(sold_at[sale.idempotency_key]) for sale in valid if sale.idempotency_key in sale_ids},
+        )
+    db.commit()
+    if scored is not None:
+        fraud_service.shipper.ship(scored)
+    if accepted:
+        publish_sales_today(db, company_id)
+    return accepted, duplicates, rejected
+
+
+# ===== CATALOG DELTA =====
+def catalog_changes(
+    db: Session,
+    company_id: int,
+    cursor: Optional[str],
+    limit: int = settings.POS_SYNC_CATALOG_PAGE,
+) -> tuple[list[CatalogItemResponse], list[int], str, bool]:
+    """
+    Products changed after `cursor`, oldest change first.
+
+    Changes from the last POS_SYNC_CURSOR_LAG_SECONDS are held back:
+    a transaction that commits late can carry an older updated_at, and
+    the cursor must not have moved past it yet.
+
+    Returns:
+        (changed products, deactivated product ids, next cursor, has_more)
+    """
+    since, since_id = decode_cursor(cursor)
+    until = datetime.now(timezone.utc) - timedelta(seconds=settings.POS_SYNC_CURSOR_LAG_SECONDS)
+    query = select(
+        Product.id, Product.sku, Product.barcode, Product.name, Product.category,
+        Product.unit, Product.price, Product.is_active, Product.updated_at,
+    ).where(Product.company_id == company_id, Product.updated_at < until)
+    if since is not None:
+        query = query.where(or_(
+            Product.updated_at > since,
+            and_(Product.updated_at == since, Product.id > since_id),
+        ))
+    rows = db.execute(query.order_by(Product.updated_at, Product.id).limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    products, removed = [], []
+    for row in rows:
+        if row.is_active:
+            products.append(CatalogItemResponse(
+                id=row.id, sku=row.sku, barcode=row.barcode, name=row.name,
+                category=row.category, unit=row.unit, price=from_sen(row.price),
+            ))
+        else:
+            removed.append(row.id)
+    next_cursor = encode_cursor(rows[-1].updated_at, rows[-1].id) if rows else (cursor or encode_cursor(None, 0))
+    return products, removed, next_cursor, has_more
+
+
+# ===== SYNC =====
+def sync(db: Session, company_id: int, request: PosSyncRequest, uploaded_by: Optional[int] = None) -> PosSyncResponse:
+    """Upload the terminal's queued sales, then return catalog changes since its cursor."""
+    accepted, duplicates, rejected = upload_sales(db, company_id, request.sales, uploaded_by)
+    products, removed, cursor, has_more = catalog_changes(db, company_id, request.cursor)
+    return PosSyncResponse(
+        accepted=accepted,
+        duplicates=duplicates,
+        rejected=rejected,
+        cursor=cursor,
+        has_more=has_more,
+        products=products,
+        removed_product_ids=removed,
+    )
@@ -0,0 +1,432 @@
+# app/services/report_service.py
+
+"""
+Report Service
+Financial reports (trial balance, profit & loss, balance sheet, aged
+receivables) computed with NumPy instead of row-by-row Python.
+
+How it works:
+1. Journal lines are read with a server-side cursor in chunks of
+   CHUNK_ROWS and turned into NumPy columns (account, month, amount...)
+2. Each chunk is added to a "movement cube" - the sum of amounts by
+   account x month [x cost center] - with one np.bincount call
+3. Report columns (including comparative periods) are slices of that
+   cube, so every column comes from the same single pass
+
+Balances at a date start from the month snapshots kept by the ledger
+(app/services/ledger_service.py) and only add the lines after them.
+
+Amounts are integer sen. np.bincount sums in float64, which is exact for
+totals below 2^53 sen (about RM 90 trillion).
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Iterator, Optional
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, cast, extract, func, select
+from sqlalchemy.orm import Session
+from app.core.money import from_sen
+from app.core.xlsx import XLSX_MEDIA_TYPE
+from app.models.account import Account, AccountType, DEBIT_NORMAL_TYPES
+from app.models.journal import JournalEntry, JournalLine
+from app.services.export_service import stream_export
+from app.services.ledger_service import get_account_balances, is_month_end, month_start
+
+
+# Journal lines per chunk pulled from the database
+CHUNK_ROWS = 100_000
+
+REPORT_FORMATS = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "xlsx": XLSX_MEDIA_TYPE,
+}
+
+PROFIT_AND_LOSS_TYPES = (AccountType.INCOME, AccountType.EXPENSE)
+BALANCE_SHEET_TYPES = (AccountType.ASSET, AccountType.LIABILITY, AccountType.EQUITY)
+
+# Aged receivables buckets: upper bound (days) -> label
+AGING_BUCKETS = [(30, "0-30 days"), (60, "31-60 days"), (90, "61-90 days"), (None, "Over 90 days")]
+
+
+@dataclass
+class ReportPeriod:
+    """A report column covering whole months, e.g. 2025-01-01 to 2025-12-31."""
+    start: date
+    end: date
+    label: str = ""
+
+    def __post_init__(self):
+        if self.start.day != 1 or not is_month_end(self.end) or self.end < self.start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Report periods must cover whole months (got {self.start} to {self.end})"
+            )
+        if not self.label:
+            self.label = f"{self.start:%b %Y} - {self.end:%b %Y}" if self.start.month != self.end.month \
+                or self.start.year != self.end.year else f"{self.start:%b %Y}"
+
+
+@dataclass
+class Report:
+    """Finished report: header row plus data rows (amounts as Decimal)."""
+    title: str
+    columns: list[str]
+    rows: list[tuple] = field(default_factory=list)
+
+
+# ===== COLUMNAR LOADING =====
+def _month_number(column, dialect: str):
+    """year * 12 + month - 1, computed by the database (no date objects in Python)."""
+    if dialect == "sqlite":
+        return cast(func.strftime("%Y", column), Integer) * 12 + cast(func.strftime("%m", column), Integer) - 1
+    return cast(extract("year", column) * 12 + extract("month", column) - 1, Integer)
+
+
+def _day_number(column, dialect: str):
+    """Days since 1970-01-01."""
+    if dialect == "sqlite":
+        return cast(func.julianday(column) - 2440587.5, Integer)
+    return column - date(1970, 1, 1)
+
+
+def month_number(day: date) -> int:
+    return day.year * 12 + day.month - 1
+
+
+_EPOCH = date(1970, 1, 1)
+
+
+def iter_journal_chunks(
+    db: Session,
+    company_id: int,
+    start: date,
+    end: date,
+    account_ids: Optional[list[int]] = None,
+    with_cost_center: bool = False,
+) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Yield journal lines between start and end (inclusive) as NumPy columns.
+
+    Each chunk: {"account_id", "month", "amount"[, "cost_center"]}
+    """
+    dialect = db.get_bind().dialect.name
+    columns = [JournalLine.account_id, _month_number(JournalLine.entry_date, dialect), JournalLine.amount]
+    if with_cost_center:
+        columns.append(JournalLine.cost_center)
+    query = select(*columns).where(
+        JournalLine.company_id == company_id,
+        JournalLine.entry_date >= start,
+        JournalLine.entry_date <= end,
+    )
+    if account_ids is not None:
+        query = query.where(JournalLine.account_id.in_(account_ids))
+
+    result = db.execute(query.execution_options(yield_per=CHUNK_ROWS))
+    for rows in result.partitions():
+        values = list(zip(*rows))
+        count = len(rows)
+        chunk = {
+            "account_id": np.fromiter(values[0], dtype=np.int64, count=count),
+            "month": np.fromiter(values[1], dtype=np.int64, count=count),
+            "amount": np.fromiter(values[2], dtype=np.int64, count=count),
+        }
+        if with_cost_center:
+            chunk["cost_center"] = values[3]
+        yield chunk
+
+
+class MovementCube:
+    """
+    Sum of journal amounts by account x month x cost center.
+
+    Example:
+        cube = MovementCube(accounts, first_month, month_count)
+        for chunk in iter_journal_chunks(...):
+            cube.add(chunk)
+        january = cube.total(first_month, first_month)  # per account
+    """
+
+    def __init__(self, account_ids: np.ndarray, first_month: int, month_count: int, cost_centers: Optional[list] = None):
+        self.account_ids = account_ids  # sorted
+        self.first_month = first_month
+        self.month_count = month_count
+        self.cost_centers = cost_centers or [None]
+        self._cost_center_codes = {name: index for index, name in enumerate(self.cost_centers)}
+        self.shape = (len(account_ids), month_count, len(self.cost_centers))
+        self._sums = np.zeros(int(np.prod(self.shape)), dtype=np.float64)
+
+    def add(self, chunk: dict) -> None:
+        accounts = np.searchsorted(self.account_ids, chunk["account_id"])
+        key = accounts * self.month_count + (chunk["month"] - self.first_month)
+        if len(self.cost_centers) > 1:
+            codes = self._cost_center_codes
+            cost_centers = np.fromiter(
+                (codes.get(name, 0) for name in chunk["cost_center"]), dtype=np.int64, count=len(accounts)
+            )
+            key = key * len(self.cost_centers) + cost_centers
+        self._sums += np.bincount(key, weights=chunk["amount"], minlength=self._sums.size)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Integer sen, shape (accounts, months, cost centers)."""
+        return np.rint(self._sums).astype(np.int64).reshape(self.shape)
+
+    def total(self, first: int, last: int) -> np.ndarray:
+        """Sum over months first..last (month numbers) -> (accounts, cost centers)."""
+        return self.values[:, first - self.first_month:last - self.first_month + 1, :].sum(axis=1)
+
+
+def _load_accounts(db: Session, company_id: int, types: Optional[tuple] = None) -> list:
+    query = select(Account.id, Account.code, Account.name, Account.type).where(Account.company_id == company_id)
+    if types is not None:
+        query = query.where(Account.type.in_(types))
+    return db.execute(query.order_by(Account.id)).all()
+
+
+def build_cube(
+    db: Session,
+    company_id: int,
+    accounts: list,
+    start: date,
+    end: date,
+    by_cost_center: bool = False,
+) -> MovementCube:
+    """Read the journal once for start..end and aggregate it by account and month."""
+    account_ids = np.array([account.id for account in accounts], dtype=np.int64)
+    cost_centers = None
+    if by_cost_center:
+        cost_centers = [None] + list(db.scalars(
+            select(JournalLine.cost_center).where(
+                JournalLine.company_id == company_id,
+                JournalLine.entry_date >= start,
+                JournalLine.entry_date <= end,
+                JournalLine.cost_center.is_not(None)
+            ).distinct().order_by(JournalLine.cost_center)
+        ))
+    cube = MovementCube(account_ids, month_number(start), month_number(end) - month_number(start) + 1, cost_centers)
+    for chunk in iter_journal_chunks(
+        db, company_id, start, end, account_ids=account_ids.tolist(), with_cost_center=by_cost_center
+    ):
+        cube.add(chunk)
+    return cube
+
+
+def balances_at(db: Session, company_id: int, accounts: list, dates: list[date]) -> np.ndarray:
+    """
+    Balances (sen, debit positive) of `accounts` at each month-end date.
+
+    Opening balances come from the ledger snapshots; movements after them
+    come from one pass over the journal.
+
+    Returns:
+        Array of shape (accounts, dates)
+    """
+    for day in dates:
+        if not is_month_end(day):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Balance dates must be month ends (got {day})"
+            )
+    first = month_start(min(dates))
+    opening_map = get_account_balances(db, company_id, first - timedelta(days=1), [account.id for account in accounts])
+    opening = np.array([opening_map.get(account.id, 0) for account in accounts], dtype=np.int64)
+
+    cube = build_cube(db, company_id, accounts, first, max(dates))
+    running = cube.values[:, :, 0].cumsum(axis=1)
+    columns = [running[:, month_number(day) - cube.first_month] for day in dates]
+    return opening[:, None] + np.stack(columns, axis=1)
+
+
+# ===== REPORTS =====
+def trial_balance(db: Session, company_id: int, dates: list[date]) -> Report:
+    """Debit / credit balance of every account at each date."""
+    accounts = _load_accounts(db, company_id)
+    balances = balances_at(db, company_id, accounts, dates) if accounts else np.zeros((0, len(dates)), np.int64)
+    columns = ["Code", "Account", "Type"]
+    for day in dates:
+        columns += [f"{day.isoformat()} Debit", f"{day.isoformat()} Credit"]
+
+    report = Report(title="Trial Balance", columns=columns)
+    order = sorted(range(len(accounts)), key=lambda index: accounts[index].code)
+    for index in order:
+        row = balances[index]
+        if not row.any():
+            continue
+        account = accounts[index]
+        cells = [account.code, account.name, account.type.value]
+        for value in row.tolist():
+            cells += [from_sen(max(value, 0)), from_sen(max(-value, 0))]
+        report.rows.append(tuple(cells))
+    totals = ["", "Total", ""]
+    for column in balances.T:
+        totals += [from_sen(int(column[column > 0].sum())), from_sen(int(-column[column < 0].sum()))]
+    report.rows.append(tuple(totals))
+    return report
+
+
+def profit_and_loss(db: Session, company_id: int, periods: list[ReportPeriod], by_cost_center: bool = False) -> Report:
+    """
+    Income and expenses for one or more periods (e.g. this year vs last year).
+
+    Income is shown positive, expenses positive, net profit = income - expenses.
+    """
+    accounts = _load_accounts(db, company_id, PROFIT_AND_LOSS_TYPES)
+    columns = ["Code", "Account", "Type"] + (["Cost center"] if by_cost_center else []) + [period.label for period in periods]
+    report = Report(title="Profit and Loss", columns=columns)
+    if not accounts:
+        return report
+
+    cube = build_cube(
+        db, company_id, accounts,
+        min(period.start for period in periods), max(period.end for period in periods),
+        by_cost_center=by_cost_center,
+    )
+    # (accounts, cost centers, periods)
+    totals = np.stack(
+        [cube.total(month_number(period.start), month_number(period.end)) for period in periods], axis=2
+    )
+    signs = np.array([-1 if account.type == AccountType.INCOME else 1 for account in accounts], dtype=np.int64)
+    totals = totals * signs[:, None, None]
+
+    order = sorted(range(len(accounts)), key=lambda index: (accounts[index].type != AccountType.INCOME, accounts[index].code))
+    for index in order:
+        account = accounts[index]
+        for cost_center_index, cost_center in enumerate(cube.cost_centers):
+            values = totals[index, cost_center_index]
+            if not values.any():
+                continue
+            cells = [account.code, account.name, account.type.value]
+            if by_cost_center:
+                cells.append(cost_center or "")
+            report.rows.append(tuple(cells + [from_sen(value) for value in values.tolist()]))
+
+    padding = [""] * (len(columns) - len(periods) - 1)
+    income = totals[signs == -1].sum(axis=(0, 1))
+    expenses = totals[signs == 1].sum(axis=(0, 1))
+    report.rows.append(tuple(padding + ["Total income"] + [from_sen(value) for value in income.tolist()]))
+    report.rows.append(tuple(padding + ["Total expenses"] + [from_sen(value) for value in expenses.tolist()]))
+    report.rows.append(tuple(padding + ["Net profit"] + [from_sen(value) for value in (income - expenses).tolist()]))
+    return report
+
+
+def balance_sheet(db: Session, company_id: int, dates: list[date]) -> Report:
+    """
+    Assets, liabilities and equity at each date.
+
+    Income and expense balances not yet closed to retained earnings are
+    shown as "Current earnings" under equity, so the sheet balances.
+    """
+    accounts = _load_accounts(db, company_id)
+    columns = ["Section", "Code", "Account"] + [day.isoformat() for day in dates]
+    report = Report(title="Balance Sheet", columns=columns)
+    if not accounts:
+        return report
+    balances = balances_at(db, company_id, accounts, dates)
+    types = [account.type for account in accounts]
+    # Show every section with its normal sign (credits positive for liabilities and equity)
+    shown = balances * np.array([1 if kind in DEBIT_NORMAL_TYPES else -1 for kind in types], dtype=np.int64)[:, None]
+
+    for section in BALANCE_SHEET_TYPES:
+        members = [index for index, kind in enumerate(types) if kind == section]
+        for index in sorted(members, key=lambda index: accounts[index].code):
+            if shown[index].any():
+                account = accounts[index]
+                report.rows.append((section.value, account.code, account.name, *[from_sen(value) for value in shown[index].tolist()]))
+        section_total = shown[members].sum(axis=0) if members else np.zeros(len(dates), np.int64)
+        if section == AccountType.EQUITY:
+            earnings = -balances[[index for index, kind in enumerate(types) if kind in PROFIT_AND_LOSS_TYPES]].sum(axis=0)
+            report.rows.append((section.value, "", "Current earnings", *[from_sen(value) for value in earnings.tolist()]))
+            section_total = section_total + earnings
+        report.rows.append((section.value, "", f"Total {section.value}", *[from_sen(value) for value in section_total.tolist()]))
+    return report
+
+
+def aged_receivables(db: Session, company_id: int, as_of: date, account_ids: list[int]) -> Report:
+    """
+    Open receivable balances by document (journal entry reference), aged
+    from the document's first debit.
+    """
+    dialect = db.get_bind().dialect.name
+    columns = ["Reference", "Date", "Age (days)"] + [label for _, label in AGING_BUCKETS] + ["Balance"]
+    report = Report(title=f"Aged Receivables at {as_of.isoformat()}", columns=columns)
+
+    query = select(
+        _day_number(JournalLine.entry_date, dialect), JournalLine.amount, JournalEntry.reference
+    ).join(JournalEntry, JournalEntry.id == JournalLine.entry_id).where(
+        JournalLine.company_id == company_id,
+        JournalLine.account_id.in_(account_ids),
+        JournalLine.entry_date <= as_of,
+    )
+    references: dict[Optional[str], int] = {}
+    days_parts, amount_parts, code_parts = [], [], []
+    for rows in db.execute(query.execution_options(yield_per=CHUNK_ROWS)).partitions():
+        days, amounts, refs = zip(*rows)
+        days_parts.append(np.fromiter(days, dtype=np.int64, count=len(rows)))
+        amount_parts.append(np.fromiter(amounts, dtype=np.int64, count=len(rows)))
+        code_parts.append(np.fromiter((references.setdefault(ref, len(references)) for ref in refs), dtype=np.int64, count=len(rows)))
+    if not references:
+        return report
+
+    days = np.concatenate(days_parts)
+    amounts = np.concatenate(amount_parts)
+    codes = np.concatenate(code_parts)
+    count = len(references)
+
+    balance = np.rint(np.bincount(codes, weights=amounts, minlength=count)).astype(np.int64)
+    # Document date: first debit (invoice), else first line of any kind
+    first_day = np.full(count, np.iinfo(np.int64).max)
+    debits = amounts > 0
+    np.minimum.at(first_day, codes[debits], days[debits])
+    no_debit = first_day == np.iinfo(np.int64).max
+    if no_debit.any():
+        any_first = np.full(count, np.iinfo(np.int64).max)
+        np.minimum.at(any_first, codes, days)
+        first_day[no_debit] = any_first[no_debit]
+
+    age = (as_of - _EPOCH).days - first_day
+    bucket = np.digitize(age, [limit + 1 for limit, _ in AGING_BUCKETS if limit is not None])
+    names = list(references)
+    open_documents = np.nonzero(balance)[0]
+    for index in open_documents[np.argsort(-age[open_documents], kind="stable")]:
+        cells = [None] * len(AGING_BUCKETS)
+        cells[bucket[index]] = from_sen(int(balance[index]))
+        report.rows.append((
+            names[index] or "(no reference)",
+            _EPOCH + timedelta(days=int(first_day[index])),
+            int(age[index]),
+            *cells,
+            from_sen(int(balance[index])),
+        ))
+    bucket_totals = np.bincount(bucket[open_documents], weights=balance[open_documents], minlength=len(AGING_BUCKETS))
+    report.rows.append((
+        "Total", None, None,
+        *[from_sen(int(round(value))) for value in bucket_totals.tolist()],
+        from_sen(int(balance[open_documents].sum())),
+    ))
+    return report
+
+
+# ===== OUTPUT =====
+def _stream_json(report: Report) -> Iterator[bytes]:
+    """Stream {"title", "columns", "rows"} without building the whole document in memory."""
+    yield (
+        '{"title": ' + json.dumps(report.title) + ', "columns": ' + json.dumps(report.columns) + ', "rows": ['
+    ).encode()
+    batch = []
+    for index, row in enumerate(report.rows):
+        batch.append(("," if index else "") + json.dumps(row, default=str))
+        if len(batch) == 500:
+            yield "".join(batch).encode()
+            batch.clear()
+    yield ("".join(batch) + "]}").encode()
+
+
+def stream_report(report: Report, report_format: str) -> Iterator[bytes]:
+    """Stream a report as json, csv or xlsx."""
+    if report_format == "json":
+        return _stream_json(report)
+    return stream_export(report.columns, report.rows, report_format)
@@ -0,0 +1,755 @@
+# app/services/screening_service.py
+
+"""
+Screening Service
+Sharia-compliance screening of journal postings and POS sales.
+
+Rules (app/models/screening.py) are compiled per company into predicate
+tables: every account and product matched by at least one rule gets a
+bitmask with one bit per rule. Screening a batch of lines is then a few
+column-wise NumPy operations, however many rules there are:
+
+1. Each line's account (journal) or product (POS) is looked up in the
+   table with one sorted search - lines nothing matches drop out here
+2. For each rule with a bit set, its lines are selected; amount limits
+   compare the absolute line amounts to max_amount in the same pass
+3. Offending lines are summed per (rule, document): one violation per
+   journal entry or sale and rule
+
+Where screening runs:
+- While posting: ledger_service.post_entries and pos_sync_service.upload_sales
+  screen their new lines before committing. Violations wait on the session,
+  are queued after the commit (dropped on rollback) and written by a
+  background thread (ViolationWriter). Screening reports, it never blocks:
+  a posting is not refused, delayed by a write or failed by a screening error.
+- Nightly sweep (job "screening.nightly" at SCREENING_RUN_HOUR): the last
+  SCREENING_SWEEP_DAYS days of every company with rules are screened again
+  in chunks, so new rules, renamed accounts and recategorised products
+  reach recent postings. POST /screening/sweep goes further back.
+
+A violation is stored once per (rule, document), however often it is found.
+Compiled tables are rebuilt after rule, account or product changes
+(invalidation bus, cache name "screening_rules").
+"""
+
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, time as day_time, timedelta, timezone
+from typing import Callable, Hashable, NamedTuple, Optional
+from zoneinfo import ZoneInfo
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.core import cache
+from app.core.config import settings
+from app.core.invalidation import publish
+from app.core.money import to_sen
+from app.database import SessionLocal, engine
+from app.models.account import Account
+from app.models.job import Job, JobStatus
+from app.models.journal import JournalLine
+from app.models.pos import PosSale, PosSaleLine
+from app.models.product import Product
+from app.models.screening import ScreeningRule, ScreeningRuleKind, ScreeningSource, ScreeningViolation
+from app.schemas.screening import ScreeningRuleCreate, ScreeningRuleUpdate, check_rule_terms
+from app.services.audit_service import diff_changes, record_audit, snapshot
+from app.services.job_service import enqueue_job, job_handler
+
+
+NIGHTLY_JOB = "screening.nightly"
+COMPANY_JOB = "screening.company"
+
+# Active rules per company: one bit each in an int64 mask
+MAX_RULES = 63
+
+_PENDING_KEY = "pending_screening_violations"
+
+
+# ===== COMPILED RULES =====
+class Violations(NamedTuple):
+    """Violations in a batch of lines, one entry per (rule, document)."""
+    rule_ids: np.ndarray
+    documents: np.ndarray
+    amounts: np.ndarray  # Sen, sum of the offending lines' absolute amounts
+    line_counts: np.ndarray
+
+
+def _no_violations() -> Violations:
+    return Violations(*(np.zeros(0, dtype=np.int64) for _ in Violations._fields))
+
+
+class RuleTable:
+    """
+    A company's active rules as predicate tables.
+
+    subjects[source] holds the sorted IDs of the accounts (JOURNAL) or
+    products (POS) matched by at least one rule, masks[source] their rule
+    bitmasks. Bit i stands for rule_ids[i], whose max_amount is limits[i]
+    (-1: any amount is a violation).
+    """
+
+    def __init__(self, rule_ids: list[int], limits: list[int], subjects: dict, masks: dict):
+        self.rule_ids = np.array(rule_ids, dtype=np.int64)
+        self.limits = np.array(limits, dtype=np.int64)
+        self.subjects = subjects
+        self.masks = masks
+
+    def __len__(self) -> int:
+        return len(self.rule_ids)
+
+    def evaluate(self, source: ScreeningSource, documents: np.ndarray, subjects: np.ndarray, amounts: np.ndarray) -> Violations:
+        """
+        Screen lines column-wise.
+
+        Args:
+            documents: Journal entry / sale ID of each line
+            subjects: Account / product ID of each line
+            amounts: Line amounts in sen (sign ignored)
+        """
+        ids = self.subjects[source]
+        if not len(ids) or not len(subjects):
+            return _no_violations()
+        positions = np.minimum(np.searchsorted(ids, subjects), len(ids) - 1)
+        lines = np.flatnonzero(ids[positions] == subjects)
+        if not len(lines):
+            return _no_violations()
+        masks = self.masks[source][positions[lines]]
+        sizes = np.abs(amounts[lines])
+        present = int(np.bitwise_or.reduce(masks))
+        bits, chosen = [], []
+        for bit in range(len(self.rule_ids)):
+            if not present >> bit & 1:
+                continue
+            selected = (masks >> bit & 1).astype(bool)
+            if self.limits[bit] >= 0:
+                selected &= sizes > self.limits[bit]
+            picked = np.flatnonzero(selected)
+            bits.append(np.full(len(picked), bit))
+            chosen.append(picked)
+        bit_column = np.concatenate(bits)
+        chosen = np.concatenate(chosen)
+        if not len(chosen):
+            return _no_violations()
+        document_column, sizes = documents[lines][chosen], sizes[chosen]
+        order = np.lexsort((document_column, bit_column))
+        bit_column, document_column, sizes = bit_column[order], document_column[order], sizes[order]
+        starts = np.flatnonzero(np.r_[
+            True, (bit_column[1:] != bit_column[:-1]) | (document_column[1:] != document_column[:-1])
+        ])
+        return Violations(
+            self.rule_ids[bit_column[starts]],
+            document_column[starts],
+            np.add.reduceat(sizes, starts),
+            np.diff(np.r_[starts, len(bit_column)]),
+        )
+
+
+def _predicate_table(ids: list[int], labels: list[str], names: list[str], rules: list[tuple]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Bitmask of every subject (account or product) matched by the rules.
+
+    Args:
+        labels: Account codes (matched by code prefix) or lower-case
+                product categories (matched exactly)
+        rules: (bit, rule row)
+
+    Returns:
+        (sorted IDs, masks) of the subjects with at least one bit set
+    """
+    ids = np.array(ids, dtype=np.int64)
+    labels = np.array(labels, dtype=str)
+    names = np.char.lower(np.array(names, dtype=str))
+    masks = np.zeros(len(ids), dtype=np.int64)
+    for bit, rule in rules:
+        matched = np.zeros(len(ids), dtype=bool)
+        for prefix in rule.account_codes:
+            matched |= np.char.startswith(labels, prefix.strip())
+        if rule.categories:
+            matched |= np.isin(labels, [category.strip().lower() for category in rule.categories])
+        for keyword in rule.keywords:
+            matched |= np.char.find(names, keyword.strip().lower()) >= 0
+        masks[matched] |= np.int64(1) << bit
+    kept = masks != 0
+    return ids[kept], masks[kept]
+
+
+def compile_rules(db: Session, company_id: int) -> RuleTable:
+    """Build a company's predicate tables from its active rules, accounts and products."""
+    rules = db.execute(
+        select(
+            ScreeningRule.id, ScreeningRule.kind, ScreeningRule.account_codes,
+            ScreeningRule.categories, ScreeningRule.keywords, ScreeningRule.max_amount,
+        )
+        .where(ScreeningRule.company_id == company_id, ScreeningRule.is_active.is_(True))
+        .order_by(ScreeningRule.id)
+        .limit(MAX_RULES)
+    ).all()
+    account_rules = [(bit, rule) for bit, rule in enumerate(rules) if rule.kind != ScreeningRuleKind.PROHIBITED_CATEGORY]
+    product_rules = [(bit, rule) for bit, rule in enumerate(rules) if rule.kind == ScreeningRuleKind.PROHIBITED_CATEGORY]
+    subjects, masks = {}, {}
+
+    accounts = db.execute(
+        select(Account.id, Account.code, Account.name).where(Account.company_id == company_id).order_by(Account.id)
+    ).all() if account_rules else []
+    subjects[ScreeningSource.JOURNAL], masks[ScreeningSource.JOURNAL] = _predicate_table(
+        [row.id for row in accounts], [row.code for row in accounts], [row.name for row in accounts], account_rules
+    )
+    products = db.execute(
+        select(Product.id, Product.category, Product.name).where(Product.company_id == company_id).order_by(Product.id)
+    ).all() if product_rules else []
+    subjects[ScreeningSource.POS], masks[ScreeningSource.POS] = _predicate_table(
+        [row.id for row in products], [(row.category or "").lower() for row in products],
+        [row.name for row in products], product_rules
+    )
+    return RuleTable(
+        [rule.id for rule in rules],
+        [rule.max_amount if rule.kind == ScreeningRuleKind.AMOUNT_LIMIT else -1 for rule in rules],
+        subjects,
+        masks,
+    )
+
+
+class ScreeningEngine:
+    """
+    Compiled rule tables of every company, built on first use.
+
+    Registered in cache.CACHES as "screening_rules": the invalidation bus
+    calls delete(company_id) after a rule, account or product change, and
+    clear() after a reconnect. Tables are compiled with their own session,
+    outside the posting's transaction.
+    """
+
+    name = "screening_rules"
+
+    def __init__(self):
+        self._companies: dict[int, RuleTable] = {}
+        self._generations: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.compiles = 0
+        self.lines = 0
+        self.found = 0
+        self.errors = 0
+
+    # ----- Cache interface -----
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._companies.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for company_id in list(self._companies):
+                self._generations[company_id] = self._generations.get(company_id, 0) + 1
+            self._companies.clear()
+
+    def __len__(self) -> int:
+        return len(self._companies)
+
+    # ----- Access -----
+    def get(self, company_id: int) -> RuleTable:
+        table = self._companies.get(company_id)
+        if table is not None:
+            return table
+        generation = self._generations.get(company_id, 0)
+        db = SessionLocal()
+        try:
+            table = compile_rules(db, company_id)
+        finally:
+            db.close()
+        with self._lock:
+            # A change committed while compiling: use this table once, compile again next time
+            if self._generations.get(company_id, 0) == generation:
+                self._companies[company_id] = table
+        self.compiles += 1
+        return table
+
+    def stats(self) -> dict:
+        return {
+            "companies": len(self._companies),
+            "compiles": self.compiles,
+            "lines": self.lines,
+            "found": self.found,
+            "errors": self.errors,
+        }
+
+
+# Single engine per process
+screening_engine = ScreeningEngine()
+cache.CACHES[screening_engine.name] = screening_engine
+
+
+# ===== WRITING =====
+def _violation_rows(company_id: int, source: ScreeningSource, found: Violations, days: dict, found_by: str) -> list[dict]:
+    detected_at = datetime.now(timezone.utc)
+    return [
+        {
+            "company_id": company_id, "rule_id": rule_id, "source": source, "document_id": document_id,
+            "occurred_on": days[document_id], "amount": amount, "line_count": line_count,
+            "found_by": found_by, "detected_at": detected_at,
+        }
+        for rule_id, document_id, amount, line_count in zip(*(column.tolist() for column in found))
+    ]
+
+
+def write_violations(connection, rows: list[dict]) -> None:
+    """INSERT that skips violations already stored (same rule and document)."""
+    if not rows:
+        return
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    connection.execute(dialect.insert(ScreeningViolation.__table__).on_conflict_do_nothing(), rows)
+
+
+class ViolationWriter:
+    """
+    Background thread that writes violations found while posting.
+
+    At most SCREENING_BUFFER_SIZE violations are held: if the database is
+    down for long, the oldest are dropped and counted (the nightly sweep
+    finds them again).
+    """
+
+    def __init__(self, interval: float = settings.SCREENING_FLUSH_INTERVAL_SECONDS):
+        self.interval = interval
+        self._rows: deque[dict] = deque(maxlen=settings.SCREENING_BUFFER_SIZE)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.written = 0
+        self.dropped = 0
+        self.failures = 0
+
+    def queue(self, rows: list[dict]) -> None:
+        """Queue violations of a committed posting."""
+        with self._lock:
+            self.dropped += max(len(self._rows) + len(rows) - self._rows.maxlen, 0)
+            self._rows.extend(rows)
+
+    def flush(self) -> int:
+        """Write everything queued. Returns rows written (duplicates included)."""
+        with self._lock:
+            rows = list(self._rows)
+            self._rows.clear()
+        if not rows:
+            return 0
+        try:
+            with engine.begin() as connection:
+                write_violations(connection, rows)
+        except Exception as exc:
+            self.failures += 1
+            self.queue(rows)
+            print(f"⚠️  Screening violation write failed ({len(rows)} kept in memory): {exc}")
+            return 0
+        self.written += len(rows)
+        return len(rows)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="screening-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and write whatever is still queued."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> dict:
+        return {
+            **screening_engine.stats(),
+            "queued": len(self._rows),
+            "written": self.written,
+            "dropped": self.dropped,
+            "write_failures": self.failures,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+
+writer = ViolationWriter()
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _queue_committed(session: Session) -> None:
+    """Violations of committed postings go to the writer."""
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        writer.queue(rows)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    """Rolled-back postings never happened - drop their violations."""
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ===== SCREENING WHILE POSTING =====
+def screen(
+    db: Session,
+    company_id: int,
+    source: ScreeningSource,
+    documents: list[int],
+    subjects: list[int],
+    amounts: list[int],
+    days: Callable[[], dict[int, date]],
+) -> int:
+    """
+    Screen lines about to be committed (one entry per line in each list).
+
+    Violations are written after the commit by the writer thread. Errors
+    are logged and counted, never raised: screening must not stop a posting.
+
+    Args:
+        days: Returns the date of each document (entry date / local day
+              of the sale); only called when something is found
+
+    Returns:
+        Violations found
+    """
+    if not settings.SCREENING_ENABLED:
+        return 0
+    try:
+        table = screening_engine.get(company_id)
+        if not len(table):
+            return 0
+        found = table.evaluate(
+            source,
+            np.array(documents, dtype=np.int64),
+            np.array(subjects, dtype=np.int64),
+            np.array(amounts, dtype=np.int64),
+        )
+    except Exception as exc:
+        screening_engine.errors += 1
+        print(f"⚠️  Screening failed for company {company_id}: {exc}")
+        return 0
+    screening_engine.lines += len(documents)
+    if len(found.rule_ids):
+        screening_engine.found += len(found.rule_ids)
+        db.info.setdefault(_PENDING_KEY, []).extend(_violation_rows(company_id, source, found, days(), "posting"))
+    return len(found.rule_ids)
+
+
+def local_day(moment: datetime) -> date:
+    """Day of a sale in DASHBOARD_TIMEZONE (naive datetimes are UTC, as SQLite returns them)."""
+    moment = moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(ZoneInfo(settings.DASHBOARD_TIMEZONE)).date()
+
+
+# ===== SWEEPS =====
+def _day_start(day: date) -> datetime:
+    """
+    Local midnight of `day` in UTC - the form sale times are stored in
+    (timestamptz on PostgreSQL, naive UTC on SQLite), so bounds compare
+    the same instant on both.
+    """
+    zone = ZoneInfo(settings.DASHBOARD_TIMEZONE)
+    return datetime.combine(day, day_time(), tzinfo=zone).astimezone(timezone.utc)
+
+
+def _document_chunks(db: Session, query, document_column, size: int):
+    """
+    Rows of `query` (document ID first) in document order, about `size`
+    at a time. A document's lines always stay in one chunk, so each
+    violation is summed over all of its lines.
+    """
+    last = None
+    while True:
+        page = query if last is None else query.where(document_column > last)
+        rows = db.execute(page.order_by(document_column).limit(size)).all()
+        if not rows:
+            return
+        full = len(rows) == size
+        if full:
+            final = rows[-1][0]
+            if rows[0][0] == final:
+                rows = db.execute(query.where(document_column == final)).all()  # One document bigger than a chunk
+            else:
+                rows = [row for row in rows if row[0] != final]  # Its lines continue in the next chunk
+        yield rows
+        if not full:
+            return
+        last = rows[-1][0]
+
+
+def _columns(rows: list, count: int) -> list[np.ndarray]:
+    return [np.fromiter((row[index] for row in rows), np.int64, len(rows)) for index in range(count)]
+
+
+def sweep_company(db: Session, company_id: int, since: date, until: Optional[date] = None) -> dict:
+    """
+    Screen a company's journal lines and POS sales from `since` (to `until`)
+    with its current rules. Commits.
+
+    Only lines of matched accounts / products are loaded, in chunks of
+    SCREENING_CHUNK_SIZE.
+
+    Returns:
+        {"company_id", "lines", "violations", "seconds"}
+    """
+    started = time.perf_counter()
+    table = compile_rules(db, company_id)
+    size = settings.SCREENING_CHUNK_SIZE
+    lines = found = 0
+
+    accounts = table.subjects[ScreeningSource.JOURNAL]
+    if len(accounts):
+        query = select(JournalLine.entry_id, JournalLine.account_id, JournalLine.amount, JournalLine.entry_date).where(
+            JournalLine.company_id == company_id,
+            JournalLine.entry_date >= since,
+            JournalLine.account_id.in_(accounts.tolist()),
+        )
+        if until is not None:
+            query = query.where(JournalLine.entry_date <= until)
+        for rows in _document_chunks(db, query, JournalLine.entry_id, size):
+            violations = table.evaluate(ScreeningSource.JOURNAL, *_columns(rows, 3))
+            write_violations(db.connection(), _violation_rows(
+                company_id, ScreeningSource.JOURNAL, violations, {row[0]: row[3] for row in rows}, "sweep"
+            ))
+            lines += len(rows)
+            found += len(violations.rule_ids)
+
+    products = table.subjects[ScreeningSource.POS]
+    if len(products):
+        query = (
+            select(PosSaleLine.sale_id, PosSaleLine.product_id, PosSaleLine.line_total, PosSale.sold_at)
+            .join(PosSale, PosSale.id == PosSaleLine.sale_id)
+            .where(
+                PosSaleLine.company_id == company_id,
+                PosSale.sold_at >= _day_start(since),
+                PosSaleLine.product_id.in_(products.tolist()),
+            )
+        )
+        if until is not None:
+            query = query.where(PosSale.sold_at < _day_start(until + timedelta(days=1)))
+        for rows in _document_chunks(db, query, PosSaleLine.sale_id, size):
+            violations = table.evaluate(ScreeningSource.POS, *_columns(rows, 3))
+            write_violations(db.connection(), _violation_rows(
+                company_id, ScreeningSource.POS, violations, {row[0]: local_day(row[3]) for row in rows}, "sweep"
+            ))
+            lines += len(rows)
+            found += len(violations.rule_ids)
+
+    db.commit()
+    return {
+        "company_id": company_id,
+        "lines": lines,
+        "violations": found,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def companies_with_rules(db: Session) -> list[int]:
+    return list(db.scalars(
+        select(ScreeningRule.company_id).where(ScreeningRule.is_active.is_(True))
+        .group_by(ScreeningRule.company_id).order_by(ScreeningRule.company_id)
+    ))
+
+
+def _local_today() -> date:
+    return datetime.now(ZoneInfo(settings.DASHBOARD_TIMEZONE)).date()
+
+
+def run_sweeps(db: Session, days: int = settings.SCREENING_SWEEP_DAYS) -> dict:
+    """
+    Sweep the last `days` days of every company with active rules.
+
+    Returns:
+        {"companies", "lines", "violations", "failed", "seconds"}
+    """
+    started = time.perf_counter()
+    since = _local_today() - timedelta(days=days)
+    results, failed = [], 0
+    for company_id in companies_with_rules(db):
+        try:
+            results.append(sweep_company(db, company_id, since))
+        except Exception as exc:
+            db.rollback()
+            failed += 1
+            print(f"⚠️  Screening sweep failed for company {company_id}: {exc}")
+    return {
+        "companies": len(results),
+        "lines": sum(result["lines"] for result in results),
+        "violations": sum(result["violations"] for result in results),
+        "failed": failed,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+# ===== SCHEDULING =====
+def schedule_nightly_sweep(db: Session) -> Optional[Job]:
+    """
+    Queue the next nightly sweep (at SCREENING_RUN_HOUR local time) unless
+    one is already queued or running. Called by the worker's maintenance loop.
+
+    Returns:
+        The new job, or None if one was already pending
+    """
+    pending = db.scalar(
+        select(Job.id).where(Job.kind == NIGHTLY_JOB, Job.status.in_((JobStatus.QUEUED, JobStatus.RUNNING))).limit(1)
+    )
+    if pending is not None:
+        return None
+    zone = ZoneInfo(settings.DASHBOARD_TIMEZONE)
+    now = datetime.now(zone)
+    run_at = datetime.combine(now.date(), day_time(settings.SCREENING_RUN_HOUR), tzinfo=zone)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    job = enqueue_job(db, NIGHTLY_JOB, run_at=run_at.astimezone(timezone.utc), max_attempts=3)
+    db.commit()
+    return job
+
+
+def request_sweep(db: Session, company_id: int, since: date) -> Job:
+    """Queue a sweep of one company from `since` (e.g. after adding a rule)."""
+    job = enqueue_job(db, COMPANY_JOB, payload={"since": since.isoformat()}, company_id=company_id, priority=1, max_attempts=3)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+# ===== RULES =====
+def _check_rule_count(db: Session, company_id: int) -> None:
+    active = db.scalar(
+        select(func.count()).select_from(ScreeningRule)
+        .where(ScreeningRule.company_id == company_id, ScreeningRule.is_active.is_(True))
+    )
+    if active >= MAX_RULES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A company can have at most {MAX_RULES} active screening rules"
+        )
+
+
+def create_rule(db: Session, company_id: int, rule_data: ScreeningRuleCreate, actor_user_id: Optional[int] = None) -> ScreeningRule:
+    """
+    Add a screening rule. It applies to postings from now on (and to the
+    last SCREENING_SWEEP_DAYS days from the next nightly sweep).
+
+    Raises:
+        HTTPException 409: Too many active rules
+    """
+    _check_rule_count(db, company_id)
+    values = rule_data.model_dump()
+    if values["max_amount"] is not None:
+        values["max_amount"] = to_sen(values["max_amount"])
+    rule = ScreeningRule(company_id=company_id, created_by=actor_user_id, **values)
+    db.add(rule)
+    db.flush()
+    record_audit(db, "screening_rule.created", "screening_rule", rule.id, company_id=company_id, actor_user_id=actor_user_id)
+    publish(db, screening_engine.name, company_id)
+    db.commit()
+    db.refresh(rule)
+    return rule
+
+
+def get_rule(db: Session, company_id: int, rule_id: int) -> ScreeningRule:
+    """
+    Raises:
+        HTTPException 404: No such rule in this company
+    """
+    rule = db.scalar(select(ScreeningRule).where(ScreeningRule.id == rule_id, ScreeningRule.company_id == company_id))
+    if rule is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Screening rule not found"
+        )
+    return rule
+
+
+def list_rules(db: Session, company_id: int) -> list[ScreeningRule]:
+    return list(db.scalars(select(ScreeningRule).where(ScreeningRule.company_id == company_id).order_by(ScreeningRule.id)))
+
+
+def update_rule(
+    db: Session,
+    company_id: int,
+    rule_id: int,
+    rule_data: ScreeningRuleUpdate,
+    actor_user_id: Optional[int] = None,
+) -> ScreeningRule:
+    """
+    Change a rule (violations already found are kept).
+
+    Raises:
+        HTTPException 400: The changed terms don't fit the rule kind
+        HTTPException 409: Reactivating would exceed the active rule limit
+    """
+    rule = get_rule(db, company_id, rule_id)
+    update_dict = rule_data.model_dump(exclude_unset=True)
+    if update_dict.get("max_amount") is not None:
+        update_dict["max_amount"] = to_sen(update_dict["max_amount"])
+    if update_dict.get("is_active") and not rule.is_active:
+        _check_rule_count(db, company_id)
+    merged = {field: update_dict.get(field, getattr(rule, field)) for field in ("account_codes", "categories", "keywords")}
+    try:
+        check_rule_terms(
+            rule.kind, **{field: terms or [] for field, terms in merged.items()},
+            max_amount=update_dict.get("max_amount", rule.max_amount),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    before = snapshot(rule, update_dict.keys())
+    for field, value in update_dict.items():
+        setattr(rule, field, value)
+    changes = diff_changes(before, snapshot(rule, update_dict.keys()))
+    if changes:
+        record_audit(
+            db, "screening_rule.updated", "screening_rule", rule.id,
+            company_id=company_id, actor_user_id=actor_user_id, changes=changes
+        )
+        publish(db, screening_engine.name, company_id)
+    db.commit()
+    db.refresh(rule)
+    return rule
+
+
+# ===== VIOLATIONS =====
+def list_violations(
+    db: Session,
+    company_id: int,
+    source: Optional[ScreeningSource] = None,
+    rule_id: Optional[int] = None,
+    since: Optional[date] = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> list[ScreeningViolation]:
+    """Violations of a company, latest day first."""
+    query = select(ScreeningViolation).where(ScreeningViolation.company_id == company_id)
+    if source is not None:
+        query = query.where(ScreeningViolation.source == source)
+    if rule_id is not None:
+        query = query.where(ScreeningViolation.rule_id == rule_id)
+    if since is not None:
+        query = query.where(ScreeningViolation.occurred_on >= since)
+    return list(db.scalars(
+        query.order_by(ScreeningViolation.occurred_on.desc(), ScreeningViolation.id.desc()).limit(limit).offset(offset)
+    ))
+
+
+# ===== JOB HANDLERS =====
+@job_handler(NIGHTLY_JOB)
+def nightly_sweep_job(db: Session, job) -> None:
+    """
+    Every company with active rules, last SCREENING_SWEEP_DAYS days.
+    Any failed company fails the job, so it is retried (sweeps only add
+    violations not found yet).
+    """
+    stats = run_sweeps(db)
+    print(f"🔎 Nightly screening sweep: {stats}")
+    if stats["failed"]:
+        raise RuntimeError(f"Screening sweep failed for {stats['failed']} companies")
+
+
+@job_handler(COMPANY_JOB)
+def company_sweep_job(db: Session, job) -> None:
+    """One company from payload["since"]."""
+    stats = sweep_company(db, job.company_id, date.fromisoformat(job.payload["since"]))
+    print(f"🔎 Screening sweep for company {job.company_id}: {stats}")
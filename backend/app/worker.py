@@ -0,0 +1,212 @@
+# app/worker.py
+
+"""
+Background Job Worker
+Runs jobs from the `jobs` table outside the API process.
+
+Usage (from the backend folder):
+    python -m app.worker                      # 1 thread, "default" queue
+    python -m app.worker --threads 4 --queue emails
+
+Run as many worker processes as you like (on one or many machines):
+jobs are claimed with FOR UPDATE SKIP LOCKED, so no job runs twice.
+"""
+
+import argparse
+import os
+import socket
+import threading
+import time
+from app.core.config import settings
+from app.database import SessionLocal
+from app.services import job_service
+from app.services.job_service import JOB_HANDLERS
+from app.services.audit_service import flusher as audit_flusher
+from app.services.inventory_service import release_expired_reservations
+from app.services.iot_service import delete_expired_readings
+from app.services.forecast_service import schedule_nightly_forecast
+from app.services.screening_service import schedule_nightly_sweep, writer as screening_writer
+import app.services.invoice_pdf_service  # noqa: F401  (registers job handlers)
+
+
+# ===== METRICS =====
+class WorkerMetrics:
+    """Thread-safe throughput counters shared by all threads of a worker."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.monotonic()
+        self.claimed = 0
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+
+    def add(self, claimed: int = 0, succeeded: int = 0, retried: int = 0, failed: int = 0) -> None:
+        with self._lock:
+            self.claimed += claimed
+            self.succeeded += succeeded
+            self.retried += retried
+            self.failed += failed
+
+    def snapshot(self) -> dict:
+        """Current counters plus jobs/second since start."""
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        processed = self.succeeded + self.retried + self.failed
+        return {
+            "claimed": self.claimed,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+            "elapsed_seconds": round(elapsed, 2),
+            "jobs_per_second": round(processed / elapsed, 1),
+        }
+
+
+# ===== WORKER =====
+class Worker:
+    """
+    Claims and runs jobs in a loop.
+
+    Each loop: claim a batch (short transaction), run the handlers,
+    then mark all successful jobs done with a single UPDATE.
+    """
+
+    def __init__(
+        self,
+        queue: str = "default",
+        threads: int = 1,
+        batch_size: int = settings.JOB_BATCH_SIZE,
+        poll_interval: float = settings.JOB_POLL_INTERVAL_SECONDS,
+    ):
+        self.queue = queue
+        self.threads = threads
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.metrics = WorkerMetrics()
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run_once(self, thread_name: str = "0") -> int:
+        """
+        Claim and process one batch.
+
+        Returns:
+            Number of jobs claimed (0 means the queue was empty)
+        """
+        db = SessionLocal()
+        try:
+            jobs = job_service.claim_jobs(
+                db, f"{self.worker_id}:{thread_name}", queue=self.queue, batch_size=self.batch_size
+            )
+            if not jobs:
+                return 0
+
+            succeeded_ids = []
+            retried = failed = 0
+            for job in jobs:
+                handler = JOB_HANDLERS.get(job.kind)
+                try:
+                    if handler is None:
+                        raise LookupError(f"No handler registered for job kind '{job.kind}'")
+                    handler(db, job)
+                    # Each job is its own transaction: a later job's rollback must not undo this one
+                    db.commit()
+                    succeeded_ids.append(job.id)
+                except Exception as exc:
+                    db.rollback()
+                    if job_service.fail_job(db, job, exc):
+                        retried += 1
+                    else:
+                        failed += 1
+
+            job_service.complete_jobs(db, succeeded_ids)
+            self.metrics.add(claimed=len(jobs), succeeded=len(succeeded_ids), retried=retried, failed=failed)
+            return len(jobs)
+        finally:
+            db.close()
+
+    def _loop(self, thread_name: str) -> None:
+        while not self._stop.is_set():
+            try:
+                claimed = self.run_once(thread_name)
+            except Exception as exc:
+                print(f"⚠️  Worker thread {thread_name} error: {exc}")
+                claimed = 0
+            if claimed == 0:
+                self._stop.wait(self.poll_interval)
+
+    def _maintenance(self, report_every: float) -> None:
+        """
+        Requeue jobs from dead workers, release expired stock reservations,
+        drop old sensor readings, queue the nightly forecast and screening sweep
+        and print throughput.
+        """
+        while not self._stop.wait(report_every):
+            db = SessionLocal()
+            try:
+                requeued, failed = job_service.requeue_stale_jobs(db)
+                if requeued or failed:
+                    print(f"♻️  Requeued {requeued} stale jobs ({failed} out of attempts, marked failed)")
+                released = release_expired_reservations(db)
+                if released:
+                    print(f"📦 Released {released} expired stock reservations")
+                expired = delete_expired_readings()
+                if expired:
+                    print(f"🧹 Removed expired sensor readings ({expired} partitions/rows)")
+                forecast = schedule_nightly_forecast(db)
+                if forecast is not None:
+                    print(f"📈 Nightly forecast queued for {forecast.run_at:%Y-%m-%d %H:%M} UTC")
+                sweep = schedule_nightly_sweep(db)
+                if sweep is not None:
+                    print(f"🔎 Nightly screening sweep queued for {sweep.run_at:%Y-%m-%d %H:%M} UTC")
+            except Exception as exc:
+                print(f"⚠️  Maintenance error: {exc}")
+            finally:
+                db.close()
+            print(f"📊 {self.metrics.snapshot()}")
+
+    def run(self, report_every: float = 30.0) -> None:
+        """Run until stopped (Ctrl+C)."""
+        workers = [
+            threading.Thread(target=self._loop, args=(str(index),), name=f"job-worker-{index}", daemon=True)
+            for index in range(self.threads)
+        ]
+        workers.append(threading.Thread(target=self._maintenance, args=(report_every,), daemon=True))
+        # Job handlers may record audit events and post journal entries
+        audit_flusher.start()
+        screening_writer.start()
+        for thread in workers:
+            thread.start()
+        try:
+            while not self._stop.wait(1):
+                pass
+        except KeyboardInterrupt:
+            self.stop()
+        for thread in workers:
+            thread.join(timeout=10)
+        audit_flusher.stop()
+        screening_writer.stop()
+        print(f"🛑 Worker stopped: {self.metrics.snapshot()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background jobs")
+    parser.add_argument("--queue", default="default", help="Queue to process")
+    parser.add_argument("--threads", type=int, default=1, help="Worker threads in this process")
+    parser.add_argument("--batch-size", type=int, default=settings.JOB_BATCH_SIZE, help="Jobs claimed per round trip")
+    parser.add_argument("--report-every", type=float, default=30.0, help="Seconds between metric reports")
+    args = parser.parse_args()
+
+    worker = Worker(queue=args.queue, threads=args.threads, batch_size=args.batch_size)
+    print("=" * 50)
+    print(f"👷 Job worker {worker.worker_id} on queue '{args.queue}' ({args.threads} threads)")
+    print(f"   Handlers: {', '.join(sorted(JOB_HANDLERS)) or 'none registered'}")
+    print("=" * 50)
+    worker.run(report_every=args.report_every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+# benchmarks/__init__.py
+
+"""
+Benchmarks Package
+Standalone performance scripts. Run from the backend folder, e.g.:
+
+    python -m benchmarks.bench_permissions
+"""
@@ -0,0 +1,174 @@
+# benchmarks/bench_alarm_rules.py
+
+"""
+Alarm Rule Benchmark
+--sensors sensors at --sites sites with --rules rules (half on one sensor,
+half on a sensor kind at a site). Uploads of --batch readings, where about
+--hot of the sensors run hot, are checked the way POST /iot/readings does.
+
+Reports:
+    compile       building the evaluators from the database
+    scan          checking each reading against every rule in a loop (the naive way)
+    evaluate      alarm_service.evaluate per upload (readings/s)
+    detect        time from upload to alarm decided, for uploads that raise one
+    alert         same, up to the alarm stored and pushed to alarm screens
+
+Usage:
+    python -m benchmarks.bench_alarm_rules --sensors 5000 --rules 5000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_alarm_rules
+"""
+
+import argparse
+import operator
+import random
+import statistics
+import time
+import numpy as np
+from sqlalchemy import delete, select
+from app.database import Base, SessionLocal, engine
+from app.models.alarm import Alarm, AlarmOperator, AlarmRule, AlarmSeverity
+from app.models.company import Company
+from app.models.iot import Sensor
+from app.services import alarm_service
+
+
+KINDS = ("temperature", "smoke", "humidity", "gate")
+
+
+def setup(sensors: int, sites: int, rules: int) -> tuple[int, np.ndarray, dict[int, str]]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        company = db.scalar(select(Company).where(Company.slug == "alarm-bench"))
+        if company is None:
+            company = Company(
+                display_name="Alarm Bench", legal_name="Alarm Bench Sdn Bhd",
+                slug="alarm-bench", business_registration_number="BENCH-6"
+            )
+            db.add(company)
+            db.flush()
+        for model in (Alarm, AlarmRule, Sensor):
+            db.execute(delete(model).where(model.company_id == company.id))
+        db.add_all(
+            Sensor(
+                company_id=company.id, code=f"D{i:05d}", name=f"Device {i}",
+                kind=KINDS[i % len(KINDS)], location=f"Site {i % sites}",
+            )
+            for i in range(sensors)
+        )
+        db.flush()
+        rows = db.execute(select(Sensor.id, Sensor.kind).where(Sensor.company_id == company.id)).all()
+        sensor_ids = [row.id for row in rows]
+        rng = random.Random(6)
+        for n in range(rules):
+            if n % 2:
+                target = {"sensor_kind": KINDS[n % len(KINDS)], "location": f"Site {rng.randrange(sites)}"}
+            else:
+                target = {"sensor_id": rng.choice(sensor_ids)}
+            db.add(AlarmRule(
+                company_id=company.id, name=f"Rule {n}", operator=AlarmOperator.GT,
+                threshold=rng.uniform(50, 70), duration_seconds=rng.choice((0, 10, 30)),
+                severity=AlarmSeverity.CRITICAL, **target,
+            ))
+        db.commit()
+        return company.id, np.array(sensor_ids, dtype=np.int64), {row.id: row.kind for row in rows}
+    finally:
+        db.close()
+
+
+def make_upload(sensor_ids: np.ndarray, hot: set[int], batch: int, moment: float, rng: np.random.Generator):
+    """One reading per chosen sensor; hot sensors read 90, the rest 20-40."""
+    chosen = rng.choice(sensor_ids, size=min(batch, len(sensor_ids)), replace=False)
+    values = rng.uniform(20, 40, len(chosen))
+    values[np.isin(chosen, list(hot))] = 90.0
+    return chosen, np.full(len(chosen), moment), values
+
+
+def naive_scan(rules: list[AlarmRule], kinds: dict[int, str], locations: dict[int, str], upload) -> int:
+    """Every reading against every rule (no index, no compiled state)."""
+    tests = {AlarmOperator.GT: operator.gt, AlarmOperator.GE: operator.ge, AlarmOperator.LT: operator.lt, AlarmOperator.LE: operator.le}
+    matches = 0
+    for sensor_id, _, value in zip(*(column.tolist() for column in upload)):
+        for rule in rules:
+            if rule.sensor_id is not None:
+                if rule.sensor_id != sensor_id:
+                    continue
+            elif rule.sensor_kind != kinds[sensor_id] or rule.location != locations[sensor_id]:
+                continue
+            matches += tests[rule.operator](value, rule.threshold)
+    return matches
+
+
+def run(sensors: int, sites: int, rules: int, batch: int, uploads: int, hot: float):
+    company_id, sensor_ids, kinds = setup(sensors, sites, rules)
+    rng = np.random.default_rng(6)
+    db = SessionLocal()
+    try:
+        print("=" * 70)
+        print(f"{sensors} sensors at {sites} sites, {rules} rules, uploads of {batch}, {engine.dialect.name}")
+
+        began = time.perf_counter()
+        compiled = alarm_service.alarm_engine.get(db, company_id)
+        print(f"  compile      {(time.perf_counter() - began) * 1000:10.1f} ms   ({len(compiled):,} evaluators)")
+
+        rule_rows = list(db.scalars(select(AlarmRule).where(AlarmRule.company_id == company_id)))
+        locations = dict(db.execute(select(Sensor.id, Sensor.location).where(Sensor.company_id == company_id)).all())
+        sample = make_upload(sensor_ids, set(), batch, time.time(), rng)
+        began = time.perf_counter()
+        naive_scan(rule_rows, kinds, locations, sample)
+        elapsed = time.perf_counter() - began
+        print(f"  scan         {len(sample[0]) / elapsed:10,.0f} readings/s")
+
+        # Steady state: a few sensors hot the whole time, one upload per second
+        hot_sensors = set(rng.choice(sensor_ids, size=max(1, int(sensors * hot)), replace=False).tolist())
+        moment = time.time() - uploads - 60
+        timings, alerted = [], []
+        for _ in range(uploads):
+            upload = make_upload(sensor_ids, hot_sensors, batch, moment, rng)
+            began = time.perf_counter()
+            changed = alarm_service.evaluate(db, company_id, *upload)
+            elapsed = time.perf_counter() - began
+            (alerted if changed else timings).append(elapsed * 1000)
+            moment += 1
+        readings = batch * len(timings)
+        print(f"  evaluate     {readings / (sum(timings) / 1000):10,.0f} readings/s   "
+              f"(median {statistics.median(timings):.2f} ms per upload without alarms)")
+
+        # One sensor crosses a duration-0 rule: upload -> alarm pushed
+        instant = list(db.scalars(
+            select(AlarmRule.sensor_id).where(
+                AlarmRule.company_id == company_id, AlarmRule.sensor_id.is_not(None), AlarmRule.duration_seconds == 0
+            )
+        ))
+        detections, latencies = [], []
+        for sensor_id in instant[:200]:
+            for value in (90.0, 20.0):  # Raise, then resolve so the next round raises again
+                upload = (np.array([sensor_id], dtype=np.int64), np.array([moment]), np.array([value]))
+                began = time.perf_counter()
+                transitions = alarm_service.alarm_engine.get(db, company_id).feed(*upload)
+                detected = time.perf_counter()
+                alarm_service.record_transitions(db, company_id, transitions)
+                if value > 50:
+                    detections.append((detected - began) * 1000)
+                    latencies.append((time.perf_counter() - began) * 1000)
+                moment += 1
+        for label, timings in (("detect", detections), ("alert", latencies)):
+            timings.sort()
+            if timings:
+                print(f"  {label:<12} median {statistics.median(timings):6.2f} ms   p99 {timings[int(len(timings) * 0.99) - 1]:6.2f} ms")
+        print(f"  {alarm_service.alarm_engine.stats()}")
+        print("=" * 70)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sensors", type=int, default=5000)
+    parser.add_argument("--sites", type=int, default=50)
+    parser.add_argument("--rules", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=5000, help="Readings per upload")
+    parser.add_argument("--uploads", type=int, default=60)
+    parser.add_argument("--hot", type=float, default=0.01, help="Share of sensors reading above thresholds")
+    args = parser.parse_args()
+    run(args.sensors, args.sites, args.rules, args.batch, args.uploads, args.hot)
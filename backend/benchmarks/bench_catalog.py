@@ -0,0 +1,87 @@
+# benchmarks/bench_catalog.py
+
+"""
+Catalog Index Benchmark
+Builds an in-memory catalog for one large retailer and times POS lookups:
+barcode scans, prefix search, fuzzy search and incremental updates.
+
+Usage:
+    python -m benchmarks.bench_catalog --products 200000
+"""
+
+import argparse
+import random
+import statistics
+import time
+import resource
+from app.services.catalog_service import CatalogIndex, CatalogItem
+
+
+BRANDS = ["Nestle", "Milo", "Julie's", "Mamee", "Gardenia", "Dutch Lady", "Adabi", "Ayam", "Boh", "Kopiko", "Maggi", "Yeo's"]
+NOUNS = ["Biscuit", "Coffee", "Tea", "Milk", "Bread", "Noodles", "Sardines", "Curry", "Sauce", "Chips", "Juice", "Rice", "Oil", "Soap"]
+SIZES = ["100g", "250g", "500g", "1kg", "1L", "2L", "6s", "12s", "Family Pack", "Refill"]
+
+
+def make_items(count: int, rng: random.Random) -> list[CatalogItem]:
+    return [
+        CatalogItem(
+            id=index + 1,
+            sku=f"SKU-{index:07d}",
+            barcode=f"955{index:010d}",
+            name=f"{rng.choice(BRANDS)} {rng.choice(NOUNS)} {rng.choice(NOUNS)} {rng.choice(SIZES)} V{index % 997}",
+            category=rng.choice(NOUNS),
+            unit="unit",
+            price=rng.randint(100, 10000),
+        )
+        for index in range(count)
+    ]
+
+
+def time_calls(function, arguments: list) -> tuple[float, float]:
+    """Median and 99th percentile in microseconds."""
+    timings = []
+    for argument in arguments:
+        began = time.perf_counter()
+        function(argument)
+        timings.append((time.perf_counter() - began) * 1_000_000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+
+def run(count: int, lookups: int):
+    rng = random.Random(3)
+    items = make_items(count, rng)
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    began = time.perf_counter()
+    index = CatalogIndex(company_id=1)
+    index.build(items)
+    build_seconds = time.perf_counter() - began
+    memory = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) * 1024  # Linux reports KiB
+
+    print("=" * 60)
+    print(f"Products: {count:,}  build {build_seconds:.2f}s  index memory (RSS growth) ~{memory / 1024 / 1024:.0f} MiB")
+    barcodes = [f"955{rng.randrange(count):010d}" for _ in range(lookups)]
+    median, p99 = time_calls(index.scan, barcodes)
+    print(f"  scan (barcode):     median {median:8.1f} us   p99 {p99:8.1f} us")
+    skus = [f"sku-{rng.randrange(count):07d}" for _ in range(lookups)]
+    median, p99 = time_calls(index.scan, skus)
+    print(f"  scan (SKU):         median {median:8.1f} us   p99 {p99:8.1f} us")
+    prefixes = [f"{rng.choice(BRANDS)[:3]} {rng.choice(NOUNS)[:4]} v{rng.randrange(997)}" for _ in range(lookups // 10)]
+    median, p99 = time_calls(lambda query: index.prefix_search(query), prefixes)
+    print(f"  prefix search:      median {median:8.1f} us   p99 {p99:8.1f} us")
+    typos = [f"{rng.choice(NOUNS)[::-1][:2]}{rng.choice(NOUNS)} {rng.choice(BRANDS)}" for _ in range(lookups // 100)]
+    median, p99 = time_calls(lambda query: index.fuzzy_search(query), typos)
+    print(f"  fuzzy search:       median {median:8.1f} us   p99 {p99:8.1f} us")
+    changed = [item._replace(name=item.name + " New") for item in rng.sample(items, lookups // 10)]
+    median, p99 = time_calls(index.upsert, changed)
+    print(f"  incremental update: median {median:8.1f} us   p99 {p99:8.1f} us")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--products", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+    run(args.products, args.lookups)
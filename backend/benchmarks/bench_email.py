@@ -0,0 +1,73 @@
+# benchmarks/bench_email.py
+
+"""
+Email Outbox Throughput Benchmark
+Fills the outbox, then drains it through the pooled SMTP sender into the
+local SMTP stand-in (benchmarks/smtp_sink.py).
+
+Usage:
+    python -m benchmarks.bench_email --messages 5000 --threads 4
+"""
+
+import argparse
+import threading
+import time
+from sqlalchemy import delete, insert
+from app.database import Base, SessionLocal, engine
+from app.core.smtp import SMTPConnectionPool
+from app.email_sender import EmailSender
+from app.models.email_outbox import EmailMessage, EmailStatus, EmailKind
+from benchmarks.smtp_sink import SMTPSink
+
+
+def run(total: int, threads: int, port: int):
+    Base.metadata.create_all(bind=engine, tables=[EmailMessage.__table__])
+    sink = SMTPSink(port=port)
+    sink.start_in_thread()
+
+    db = SessionLocal()
+    try:
+        db.execute(delete(EmailMessage))
+        db.execute(insert(EmailMessage), [
+            {
+                "to_email": f"user{index}@example.com",
+                "subject": "Benchmark",
+                "body_text": "Hello from the benchmark\n" * 10,
+                "kind": EmailKind.OTHER,
+                "status": EmailStatus.PENDING,
+                "attempts": 0,
+                "max_attempts": 3,
+            }
+            for index in range(total)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+    pool = SMTPConnectionPool(host="127.0.0.1", port=port, use_tls=False, username=None, size=threads)
+    sender = EmailSender(threads=threads, rate_per_second=0, pool=pool, poll_interval=0.05)
+    runner = threading.Thread(target=sender.run, kwargs={"report_every": 3600}, daemon=True)
+    start = time.perf_counter()
+    runner.start()
+    while sender.sent + sender.failed < total:
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - start
+    sender.stop()
+    runner.join()
+    sink.stop()
+
+    print("=" * 50)
+    print(f"Messages: {total:,}  threads: {threads}")
+    print(f"  throughput:        {total / elapsed:10,.0f} msg/s")
+    print(f"  SMTP connections:  {pool.connections_opened} opened (sink saw {sink.connections})")
+    print(f"  received by sink:  {sink.messages_received:,}")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--port", type=int, default=2525)
+    args = parser.parse_args()
+    run(args.messages, args.threads, args.port)
@@ -0,0 +1,154 @@
+# benchmarks/bench_event_stream.py
+
+"""
+Event Stream Benchmark
+--screens subscribers on one event loop (one worker) listen to --topics
+kitchen stations while a publisher thread (the POS / kitchen API) sends
+--events ticket updates at --rate events/s, spread over the stations and
+--tickets tickets per station. --slow of the screens stop reading for a
+while, like a frozen tablet.
+
+Reports publish cost, delivery latency (publish -> screen), how many updates
+were coalesced and how many slow screens were switched to a snapshot.
+Then measures the memory of --idle idle dashboard subscriptions (subscribed,
+waiting for events).
+
+Usage:
+    python -m benchmarks.bench_event_stream --screens 5000 --topics 500
+    python -m benchmarks.bench_event_stream --screens 2000 --topics 1 --rate 100   # one busy station
+"""
+
+import argparse
+import asyncio
+import resource
+import threading
+import time
+import tracemalloc
+from app.core.event_stream import EventBroker
+
+
+async def screen(broker, topic, published_at, latencies, stop, slow: bool, coalesce: float):
+    published_at = published_at[topic]
+    subscription = broker.subscribe(topic, broker.event_id(0))
+    received = snapshots = 0
+    try:
+        if slow:
+            await asyncio.sleep(2.0)
+        while not stop.is_set():
+            batch = await subscription.next_batch(0.5, coalesce)
+            if batch is None:
+                continue
+            events, snapshot_seq = batch
+            snapshots += snapshot_seq is not None
+            now = time.perf_counter()
+            if not slow:
+                latencies.extend(now - published_at[event.seq] for event in events)
+            received += len(events)
+    finally:
+        broker.unsubscribe(subscription)
+    return received, snapshots
+
+
+def publisher(broker, topics, published_at, events: int, tickets: int, rate: float, timings: list):
+    interval = 1 / rate
+    next_at = time.perf_counter()
+    for n in range(events):
+        topic = topics[n % len(topics)]
+        seq = n // len(topics) + 1  # Sequence number of this event in its topic (only publisher)
+        ticket = seq % tickets
+        data = {"id": ticket, "status": "preparing", "items": [{"name": "Chicken Chop", "quantity": "2"}]}
+        began = time.perf_counter()
+        published_at[topic][seq] = began
+        broker.publish(topic, "ticket", data, key=ticket)
+        timings.append(time.perf_counter() - began)
+        next_at += interval
+        time.sleep(max(0.0, next_at - time.perf_counter()))
+
+
+async def run(screens: int, topics: int, events: int, tickets: int, rate: float, slow: int, queue_size: int, coalesce_ms: float):
+    broker = EventBroker(replay=1000, queue_size=queue_size)
+    topic_keys = [(1 + n // 10, f"kitchen:station-{n % 10}") for n in range(topics)]
+    published_at: dict[tuple, dict[int, float]] = {topic: {} for topic in topic_keys}
+    latencies: list[float] = []
+    timings: list[float] = []
+    stop = asyncio.Event()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tasks = [
+        asyncio.create_task(screen(broker, topic_keys[n % topics], published_at, latencies, stop, n < slow, coalesce_ms / 1000))
+        for n in range(screens)
+    ]
+    await asyncio.sleep(0.5)  # Let every screen subscribe
+    rss_subscribed = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    began = time.perf_counter()
+    thread = threading.Thread(target=publisher, args=(broker, topic_keys, published_at, events, tickets, rate, timings))
+    thread.start()
+    while thread.is_alive():
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(1.5)  # Drain
+    stop.set()
+    results = await asyncio.gather(*tasks)
+    received = sum(result[0] for result in results)
+    snapshots = sum(result[1] for result in results)
+    elapsed = time.perf_counter() - began
+
+    latencies.sort()
+    timings.sort()
+    pick = lambda values, q: values[min(len(values) - 1, int(len(values) * q))] * 1000 if values else 0.0
+    stats = broker.stats()
+    print("=" * 60)
+    print(f"{screens} screens ({slow} slow) on {topics} stations, {events} events at {rate:g}/s, {tickets} tickets per station")
+    print(f"  publish            p50 {pick(timings, 0.5):8.3f} ms   p99 {pick(timings, 0.99):8.3f} ms")
+    print(f"  delivery latency   p50 {pick(latencies, 0.5):8.3f} ms   p99 {pick(latencies, 0.99):8.3f} ms   (responsive screens)")
+    print(f"  delivered          {received:,} events ({received / elapsed:,.0f}/s)")
+    print(f"  coalesced          {stats['coalesced']:,} updates")
+    print(f"  snapshots          {snapshots} (screens more than {queue_size} tickets behind)")
+    print(f"  memory             {(rss_subscribed - rss_before) / 1024:.1f} MiB for {screens} subscriptions")
+
+
+async def idle_memory(count: int):
+    """Bytes per idle subscriber: the subscription plus its waiting reader task."""
+    broker = EventBroker()
+    stop = asyncio.Event()
+
+    async def idle(n: int):
+        subscription = broker.subscribe((n % 1000, "dashboard"), broker.event_id(0), permissions=0b1011)
+        while not stop.is_set():
+            await subscription.next_batch(15, 1.0)
+        broker.unsubscribe(subscription)
+
+    for n in range(1000):  # Topics exist before measuring
+        broker.publish((n, "dashboard"), "company", {"id": n}, key="company")
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = [asyncio.create_task(idle(n)) for n in range(count)]
+    await asyncio.sleep(0.5)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"  idle subscribers   {count:,}: {used / count:,.0f} bytes each ({used / 2**20:.1f} MiB)")
+    stop.set()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def main(args):
+    await run(args.screens, args.topics, args.events, args.tickets, args.rate, args.slow, args.queue_size, args.coalesce_ms)
+    await idle_memory(args.idle)
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--screens", type=int, default=5000)
+    parser.add_argument("--topics", type=int, default=500, help="Stations the screens are spread over")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--tickets", type=int, default=20, help="Open tickets per station")
+    parser.add_argument("--rate", type=float, default=500, help="Events per second")
+    parser.add_argument("--slow", type=int, default=100, help="Screens that stop reading for 2s")
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--coalesce-ms", type=float, default=100)
+    parser.add_argument("--idle", type=int, default=20000, help="Idle subscribers for the memory check")
+    args = parser.parse_args()
+    asyncio.run(main(args))
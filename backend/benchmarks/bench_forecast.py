@@ -0,0 +1,135 @@
+# benchmarks/bench_forecast.py
+
+"""
+Demand Forecast Benchmark
+Fits Holt-Winters to --products products with --days days of synthetic
+daily sales (weekly pattern, trend, noise, intermittent sellers).
+
+Reports:
+    per product   one fit per product in a Python loop (the naive way; timed
+                  on --naive products and scaled up)
+    vectorized    forecast_service.fit_holt_winters over all products at once
+    company       forecast_company for --db-products products stored as stock
+                  movements: load + fit + bulk write back
+
+Usage:
+    python -m benchmarks.bench_forecast --products 20000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_forecast
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from sqlalchemy import delete, insert, select
+from app.core.config import settings
+from app.database import Base, SessionLocal, engine
+from app.models.company import Company
+from app.models.forecast import DemandForecast
+from app.models.product import Product
+from app.models.stock import MovementType, StockMovement
+from app.models.warehouse import Warehouse
+from app.services import forecast_service
+
+
+def make_sales(products: int, days: int, rng: np.random.Generator) -> np.ndarray:
+    """(products, days) daily sales: base x weekday pattern x trend + noise, some products sell rarely."""
+    base = rng.gamma(2.0, 10.0, (products, 1))
+    weekly = 1 + rng.uniform(0, 0.6, (products, 1)) * (np.arange(days) % 7 >= 5)
+    trend = 1 + rng.normal(0, 0.3, (products, 1)) * np.arange(days) / days
+    sales = np.maximum(base * weekly * trend + rng.normal(0, 1, (products, days)) * np.sqrt(base), 0)
+    rare = rng.random(products) < 0.2
+    sales[rare] *= rng.random((int(rare.sum()), days)) < 0.1
+    launched = rng.integers(0, days - 14, products)  # Products launched during the history
+    sales[np.arange(days) < launched[:, np.newaxis]] = 0
+    return np.round(sales)
+
+
+def setup(products: int, sales: np.ndarray) -> int:
+    """Bench company whose stock movements hold `sales` (one SALE per product per day)."""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        company = db.scalar(select(Company).where(Company.slug == "forecast-bench"))
+        if company is None:
+            company = Company(
+                display_name="Forecast Bench", legal_name="Forecast Bench Sdn Bhd",
+                slug="forecast-bench", business_registration_number="BENCH-7"
+            )
+            db.add(company)
+            db.flush()
+        for model in (DemandForecast, StockMovement, Product, Warehouse):
+            db.execute(delete(model).where(model.company_id == company.id))
+        warehouse = Warehouse(company_id=company.id, code="MAIN", name="Main")
+        db.add(warehouse)
+        db.execute(insert(Product), [
+            {"company_id": company.id, "sku": f"F{i:06d}", "name": f"Product {i}", "price": 100}
+            for i in range(products)
+        ])
+        db.flush()
+        product_ids = list(db.scalars(select(Product.id).where(Product.company_id == company.id).order_by(Product.id)))
+        midnight = datetime.now(timezone.utc).replace(hour=4, minute=0, second=0, microsecond=0)
+        days = sales.shape[1]
+        rows = [
+            {
+                "company_id": company.id, "product_id": product_id, "warehouse_id": warehouse.id,
+                "type": MovementType.SALE, "quantity": -quantity,
+                "created_at": midnight - timedelta(days=days - day),
+            }
+            for product_id, sold in zip(product_ids, sales.tolist())
+            for day, quantity in enumerate(sold) if quantity
+        ]
+        if rows:
+            db.execute(insert(StockMovement), rows)
+        db.commit()
+        return company.id
+    finally:
+        db.close()
+
+
+def run(products: int, days: int, naive: int, db_products: int):
+    rng = np.random.default_rng(7)
+    sales = make_sales(products, days, rng)
+
+    print("=" * 70)
+    print(f"{products:,} products x {days} days of sales, {engine.dialect.name}")
+
+    began = time.perf_counter()
+    for row in sales[:naive]:
+        forecast_service.fit_holt_winters(row[np.newaxis, :])
+    per_product = (time.perf_counter() - began) / naive
+    print(f"  per product  {1 / per_product:10,.0f} products/s   (~{per_product * products:.1f}s for all)")
+
+    began = time.perf_counter()
+    fit = forecast_service.fit_holt_winters(sales)
+    elapsed = time.perf_counter() - began
+    print(f"  vectorized   {products / elapsed:10,.0f} products/s   ({elapsed:.2f}s, {per_product * products / elapsed:.0f}x faster)")
+
+    # Forecast error on the last 4 weeks, fitted on the rest
+    holdout = min(28, settings.FORECAST_HORIZON_DAYS)
+    check = forecast_service.fit_holt_winters(sales[:, :-holdout], horizon=holdout)
+    actual = sales[:, -holdout:]
+    naive_error = np.abs(actual - sales[:, -holdout - 7:-holdout].mean(axis=1, keepdims=True)).mean()
+    print(f"  accuracy     MAE {np.abs(actual - check.forecast).mean():.2f} per product-day "
+          f"(last-week average: {naive_error:.2f})")
+    demand, safety, reorder_point = forecast_service.reorder_points(fit)
+    print(f"  reorder pt   median {np.median(reorder_point):.1f} (lead time demand {np.median(demand):.1f} + safety {np.median(safety):.1f})")
+
+    company_id = setup(db_products, sales[:db_products])
+    db = SessionLocal()
+    try:
+        stats = forecast_service.forecast_company(db, company_id)
+        print(f"  company      {stats['products'] / stats['seconds']:10,.0f} products/s   {stats}")
+    finally:
+        db.close()
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--products", type=int, default=20_000)
+    parser.add_argument("--days", type=int, default=settings.FORECAST_HISTORY_DAYS)
+    parser.add_argument("--naive", type=int, default=200, help="Products fitted one at a time")
+    parser.add_argument("--db-products", type=int, default=1000, help="Products stored for the end-to-end run")
+    args = parser.parse_args()
+    run(args.products, args.days, args.naive, args.db_products)
@@ -0,0 +1,175 @@
+# benchmarks/bench_fraud_scoring.py
+
+"""
+Fraud Scoring Benchmark
+--terminals terminals upload sales in batches of --batch. Measures the
+cost of scoring against the FRAUD_SCORE_BUDGET_MS budget:
+
+    per sale sql   window features from COUNT/SUM queries per sale (the naive way)
+    single sale    scorer.score for one sale (sliding windows + model)
+    batch          scorer.score for a whole upload
+    upload         pos_sync_service.upload_sales with scoring off and on
+
+Usage:
+    python -m benchmarks.bench_fraud_scoring --terminals 50 --batch 500
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_fraud_scoring
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from sqlalchemy import delete, func, select
+from app.core.config import settings
+from app.database import Base, SessionLocal, engine
+from app.models.company import Company
+from app.models.fraud import FraudScore
+from app.models.pos import PosSale, PosSaleLine
+from app.models.product import Product
+from app.models.stock import StockLevel, StockMovement
+from app.models.warehouse import Warehouse
+from app.schemas.pos import PosSaleCreate
+from app.services import fraud_service, pos_sync_service
+
+
+def setup() -> tuple[int, int, int]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        company = db.scalar(select(Company).where(Company.slug == "fraud-bench"))
+        if company is None:
+            company = Company(
+                display_name="Fraud Bench", legal_name="Fraud Bench Sdn Bhd",
+                slug="fraud-bench", business_registration_number="BENCH-8"
+            )
+            db.add(company)
+            db.flush()
+        sale_ids = select(PosSale.id).where(PosSale.company_id == company.id)
+        db.execute(delete(FraudScore).where(FraudScore.company_id == company.id))
+        db.execute(delete(PosSaleLine).where(PosSaleLine.sale_id.in_(sale_ids)))
+        for model in (PosSale, StockMovement, StockLevel, Product, Warehouse):
+            db.execute(delete(model).where(model.company_id == company.id))
+        product = Product(company_id=company.id, sku="FB-1", name="Bench item", price=990)
+        warehouse = Warehouse(company_id=company.id, code="FB", name="Bench store")
+        db.add_all([product, warehouse])
+        db.commit()
+        return company.id, product.id, warehouse.id
+    finally:
+        db.close()
+
+
+def make_sales(count: int, terminals: int, start: datetime, product_id: int, warehouse_id: int, prefix: str) -> list[PosSaleCreate]:
+    rng = random.Random(prefix)
+    return [
+        PosSaleCreate(
+            idempotency_key=f"{prefix}-{n:08d}", terminal_code=f"T{rng.randrange(terminals):03d}",
+            receipt_number=f"{prefix}-{n}", warehouse_id=warehouse_id,
+            sold_at=start + timedelta(seconds=n * 2), payment_method="card",
+            lines=[{
+                "product_id": product_id, "quantity": str(rng.randint(1, 3)), "unit_price": "9.90",
+                "discount": "2.00" if rng.random() < 0.05 else "0",
+            }],
+        )
+        for n in range(count)
+    ]
+
+
+def naive_features(db, company_id: int, sale: PosSaleCreate) -> list:
+    """What the windows replace: aggregate queries over stored sales, per sale."""
+    short = sale.sold_at - timedelta(seconds=settings.FRAUD_SHORT_WINDOW_SECONDS)
+    long = sale.sold_at - timedelta(seconds=settings.FRAUD_LONG_WINDOW_SECONDS)
+    terminal = (PosSale.company_id == company_id, PosSale.terminal_code == sale.terminal_code)
+    return [
+        db.scalar(select(func.count()).where(*terminal, PosSale.sold_at > short)),
+        db.execute(select(func.count(), func.sum(PosSale.total)).where(*terminal, PosSale.sold_at > long)).one(),
+        db.scalar(select(func.count()).where(PosSale.company_id == company_id, PosSale.sold_at > short)),
+        db.scalar(
+            select(func.sum(PosSaleLine.discount)).join(PosSale, PosSale.id == PosSaleLine.sale_id)
+            .where(*terminal, PosSale.sold_at > long)
+        ),
+    ]
+
+
+def percentiles(timings: list[float]) -> str:
+    timings = sorted(timings)
+    return f"median {statistics.median(timings):7.3f} ms   p99 {timings[int(len(timings) * 0.99) - 1]:7.3f} ms"
+
+
+def transactions(sales: list[PosSaleCreate], first_id: int) -> list[fraud_service.Transaction]:
+    return [
+        fraud_service.Transaction(
+            first_id + n, sale.terminal_code, int(sale.terminal_code[1:]), fraud_service.epoch(sale.sold_at),
+            pos_sync_service.to_sen(Decimal(sale.lines[0].quantity) * sale.lines[0].unit_price), 0, len(sale.lines),
+        )
+        for n, sale in enumerate(sales)
+    ]
+
+
+def run(terminals: int, batch: int, uploads: int):
+    company_id, product_id, warehouse_id = setup()
+    start = datetime.now(timezone.utc) - timedelta(days=1)
+    print("=" * 70)
+    print(f"{terminals} terminals, uploads of {batch}, budget {settings.FRAUD_SCORE_BUDGET_MS} ms, {engine.dialect.name}")
+
+    db = SessionLocal()
+    try:
+        # Upload with scoring off, then on (same number of sales each)
+        results = {}
+        for enabled in (False, True):
+            settings.FRAUD_SCORING_ENABLED = enabled
+            timings = []
+            for upload in range(uploads):
+                sales = make_sales(batch, terminals, start, product_id, warehouse_id, f"u{int(enabled)}-{upload}")
+                began = time.perf_counter()
+                pos_sync_service.upload_sales(db, company_id, sales, None)
+                timings.append((time.perf_counter() - began) * 1000)
+                start += timedelta(seconds=batch * 2)
+            results[enabled] = statistics.median(timings)
+        settings.FRAUD_SCORING_ENABLED = True
+        fraud_service.shipper.flush()
+
+        sample = make_sales(200, terminals, start - timedelta(minutes=30), product_id, warehouse_id, "naive")
+        timings = []
+        for sale in sample:
+            began = time.perf_counter()
+            naive_features(db, company_id, sale)
+            timings.append((time.perf_counter() - began) * 1000)
+        print(f"  per sale sql   {percentiles(timings)}")
+
+        scorer = fraud_service.FraudScorer()
+        warm = transactions(make_sales(batch * 4, terminals, start, product_id, warehouse_id, "warm"), 1)
+        scorer.score(None, company_id, warm, budget_ms=1e9)
+        singles = transactions(make_sales(2000, terminals, start + timedelta(hours=1), product_id, warehouse_id, "one"), 10 ** 6)
+        timings = []
+        for transaction in singles:
+            began = time.perf_counter()
+            scorer.score(None, company_id, [transaction])
+            timings.append((time.perf_counter() - began) * 1000)
+        print(f"  single sale    {percentiles(timings)}")
+
+        timings, deferred = [], 0
+        for upload in range(20):
+            batch_sales = transactions(make_sales(batch, terminals, start + timedelta(hours=2 + upload), product_id, warehouse_id, f"b{upload}"), 10 ** 7)
+            began = time.perf_counter()
+            scored = scorer.score(None, company_id, batch_sales)
+            timings.append((time.perf_counter() - began) * 1000)
+            deferred += len(scored.deferred)
+        print(f"  batch          {percentiles(timings)}   ({batch / (statistics.median(timings) / 1000):,.0f} sales/s, {deferred} deferred)")
+
+        print(f"  upload         median {results[False]:7.1f} ms without scoring, {results[True]:7.1f} ms with "
+              f"(+{results[True] - results[False]:.1f} ms)")
+        print(f"  {fraud_service.shipper.stats()}")
+    finally:
+        db.close()
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terminals", type=int, default=50)
+    parser.add_argument("--batch", type=int, default=500, help="Sales per upload")
+    parser.add_argument("--uploads", type=int, default=10, help="Uploads timed with scoring off and on")
+    args = parser.parse_args()
+    run(args.terminals, args.batch, args.uploads)
@@ -0,0 +1,80 @@
+# benchmarks/bench_invoice_pdf.py
+
+"""
+Invoice PDF Rendering Benchmark
+Renders a month-end batch of synthetic invoices, first in one process,
+then across a process pool, and prints pages per second for each.
+
+Usage:
+    python -m benchmarks.bench_invoice_pdf --invoices 2000 --workers 4
+"""
+
+import argparse
+import random
+import tempfile
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from app.schemas.company import CompanyResponse
+from app.schemas.invoice import InvoiceDocument, InvoiceLine
+from app.services.invoice_pdf_service import build_company_header, render_invoice_batch
+
+
+def make_company() -> CompanyResponse:
+    now = datetime.now(timezone.utc)
+    return CompanyResponse(
+        id=1, display_name="Acme Trading", legal_name="Acme Trading Sdn Bhd", slug="acme",
+        business_registration_number="202401012345", tax_id="W10-1234-56789012",
+        email="billing@acme.example", phone_country_code="+60", phone_number="3-1234 5678",
+        website="acme.example", mailing_address="Level 5, Menara Acme\nJalan Ampang\n50450 Kuala Lumpur",
+        is_active=True, created_at=now, updated_at=now,
+    )
+
+
+def make_invoices(count: int, max_lines: int) -> list[InvoiceDocument]:
+    rng = random.Random(42)
+    return [
+        InvoiceDocument(
+            invoice_number=f"INV-2025-01-{index:05d}",
+            issue_date=date(2025, 1, 31),
+            due_date=date(2025, 2, 28),
+            bill_to_name=f"Customer {index}",
+            bill_to_address="No. 1, Jalan Contoh\n47301 Petaling Jaya",
+            tax_rate=Decimal("8"),
+            lines=[
+                InvoiceLine(
+                    description=f"Item {line} - monthly service",
+                    quantity=Decimal(rng.randint(1, 20)),
+                    unit_price=Decimal(rng.randint(100, 100000)) / 100,
+                )
+                for line in range(rng.randint(1, max_lines))
+            ],
+        )
+        for index in range(count)
+    ]
+
+
+def run(total: int, workers: int, max_lines: int):
+    header = build_company_header(make_company())
+    invoices = make_invoices(total, max_lines)
+
+    print("=" * 50)
+    print(f"Invoices: {total:,}  (1-{max_lines} lines each)")
+    for worker_count in sorted({1, workers}):
+        with tempfile.TemporaryDirectory() as output_dir:
+            stats = render_invoice_batch(header, invoices, Path(output_dir), workers=worker_count)
+            size = sum(path.stat().st_size for path in Path(output_dir).iterdir())
+        print(
+            f"  {worker_count} process(es): {stats['pages']:,} pages in {stats['seconds']:.2f}s"
+            f"  -> {stats['pages_per_second']:,.0f} pages/s  ({size / stats['invoices'] / 1024:.1f} KiB/invoice)"
+        )
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--invoices", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-lines", type=int, default=60)
+    args = parser.parse_args()
+    run(args.invoices, args.workers, args.max_lines)
@@ -0,0 +1,178 @@
+# benchmarks/bench_iot_ingest.py
+
+"""
+IoT Ingestion Benchmark
+Sends --readings readings from --sensors sensors in uploads of --batch and
+measures, against the 50,000 readings/s per node target:
+
+    per reading   one INSERT + rollup upserts per reading (the naive way)
+    accept        request parsing + validation + buffering (what an upload costs the API)
+    flush         buffered readings written: COPY/INSERT + minute/hour/day rollups
+    end to end    uploads from --threads threads while the flusher runs
+
+Usage:
+    python -m benchmarks.bench_iot_ingest --readings 500000 --sensors 1000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_iot_ingest
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+from sqlalchemy import delete, select
+from app.core.config import settings
+from app.database import Base, SessionLocal, engine
+from app.models.company import Company
+from app.models.iot import RollupPeriod, Sensor, SensorReading, SensorRollup
+from app.schemas.iot import SensorReadingBatch
+from app.services import iot_service
+
+
+TARGET = 50_000  # Readings per second per node
+
+
+def setup(sensors: int) -> tuple[int, list[str]]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        company = db.scalar(select(Company).where(Company.slug == "iot-bench"))
+        if company is None:
+            company = Company(
+                display_name="IoT Bench", legal_name="IoT Bench Sdn Bhd",
+                slug="iot-bench", business_registration_number="BENCH-5"
+            )
+            db.add(company)
+            db.flush()
+        sensor_ids = select(Sensor.id).where(Sensor.company_id == company.id)
+        db.execute(delete(SensorReading).where(SensorReading.sensor_id.in_(sensor_ids)))
+        db.execute(delete(SensorRollup).where(SensorRollup.sensor_id.in_(sensor_ids)))
+        db.execute(delete(Sensor).where(Sensor.company_id == company.id))
+        codes = [f"S{i:05d}" for i in range(sensors)]
+        db.add_all(Sensor(company_id=company.id, code=code, name=code, kind="temperature") for code in codes)
+        db.commit()
+        return company.id, codes
+    finally:
+        db.close()
+
+
+def make_uploads(readings: int, batch: int, codes: list[str], start: float) -> tuple[list[bytes], int]:
+    """JSON bodies as a gateway would send them (one point per sensor per second), and their reading count."""
+    uploads, count = [], 0
+    per_sensor = max(1, batch // len(codes))
+    moment = start
+    for _ in range(0, readings, batch):
+        chosen = codes if per_sensor > 1 else random.sample(codes, min(batch, len(codes)))
+        series = [
+            {"sensor": code, "points": [[moment + i, round(random.uniform(2, 8), 2)] for i in range(per_sensor)]}
+            for code in chosen
+        ]
+        moment += per_sensor
+        count += per_sensor * len(chosen)
+        uploads.append(json.dumps({"series": series}).encode())
+    return uploads, count
+
+
+def naive(company_id: int, codes: list[str], count: int, start: float) -> None:
+    """One transaction per reading, rollups updated with read-modify-write."""
+    db = SessionLocal()
+    try:
+        sensor_ids = dict(db.execute(select(Sensor.code, Sensor.id).where(Sensor.company_id == company_id)).all())
+        zone = ZoneInfo(settings.DASHBOARD_TIMEZONE)
+        for n in range(count):
+            sensor_id = sensor_ids[codes[n % len(codes)]]
+            moment = start - 3600 - n  # Older than the other runs: no key collisions
+            value = random.uniform(2, 8)
+            db.add(SensorReading(sensor_id=sensor_id, recorded_at=datetime.fromtimestamp(moment, timezone.utc), value=value))
+            for period, width in iot_service.PERIOD_SECONDS.items():
+                if period == RollupPeriod.DAY:
+                    local = datetime.fromtimestamp(moment, zone)
+                    bucket = datetime.combine(local.date(), datetime.min.time(), tzinfo=zone).astimezone(timezone.utc)
+                else:
+                    bucket = datetime.fromtimestamp(moment // width * width, timezone.utc)
+                rollup = db.get(SensorRollup, (sensor_id, period, bucket))
+                if rollup is None:
+                    db.add(SensorRollup(sensor_id=sensor_id, period=period, bucket_start=bucket, count=1, sum=value, min=value, max=value))
+                else:
+                    rollup.count += 1
+                    rollup.sum += value
+                    rollup.min = min(rollup.min, value)
+                    rollup.max = max(rollup.max, value)
+            db.commit()
+    finally:
+        db.close()
+
+
+def accept(company_id: int, uploads: list[bytes]) -> int:
+    """Parse and buffer uploads like POST /iot/readings does."""
+    db = SessionLocal()
+    try:
+        accepted = 0
+        for body in uploads:
+            accepted += iot_service.ingest(db, company_id, SensorReadingBatch.model_validate_json(body)).accepted
+        return accepted
+    finally:
+        db.close()
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    rate = count / elapsed
+    verdict = "ok" if rate >= TARGET else "below target"
+    print(f"  {label:<12} {rate:12,.0f} readings/s   ({count:,} in {elapsed:.2f}s, {verdict})")
+
+
+def run(readings: int, sensors: int, batch: int, threads: int, naive_count: int):
+    settings.IOT_BUFFER_SIZE = iot_service.buffer.maxsize = readings * 2
+    company_id, codes = setup(sensors)
+    start = time.time() - 2 * 86400  # Spans ~2 days of rollups at most
+    uploads, total = make_uploads(readings, batch, codes, start)
+
+    print("=" * 70)
+    print(f"{total:,} readings, {sensors} sensors, uploads of {batch}, {engine.dialect.name}")
+
+    began = time.perf_counter()
+    naive(company_id, codes, naive_count, start)
+    report("per reading", naive_count, time.perf_counter() - began)
+
+    began = time.perf_counter()
+    accepted = accept(company_id, uploads)
+    report("accept", accepted, time.perf_counter() - began)
+
+    began = time.perf_counter()
+    stored = iot_service.flusher.flush()
+    report("flush", stored, time.perf_counter() - began)
+
+    # A day later: all new rows
+    uploads, _ = make_uploads(readings, batch, codes, start + 86400)
+    chunks = [uploads[i::threads] for i in range(threads)]
+    written_before = iot_service.flusher.written
+    iot_service.flusher.start()
+    began = time.perf_counter()
+    workers = [threading.Thread(target=accept, args=(company_id, chunk)) for chunk in chunks]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    iot_service.flusher.stop()
+    report("end to end", iot_service.flusher.written - written_before, time.perf_counter() - began)
+
+    db = SessionLocal()
+    try:
+        rollups = db.query(SensorRollup).filter(SensorRollup.period == RollupPeriod.MINUTE).count()
+        print(f"  {rollups:,} minute rollups, flusher {iot_service.flusher.stats()}")
+    finally:
+        db.close()
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readings", type=int, default=500_000)
+    parser.add_argument("--sensors", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=10_000, help="Readings per upload")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent uploaders in the end-to-end run")
+    parser.add_argument("--naive", type=int, default=2000, help="Readings written one at a time")
+    args = parser.parse_args()
+    run(args.readings, args.sensors, args.batch, args.threads, args.naive)
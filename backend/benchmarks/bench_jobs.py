@@ -0,0 +1,80 @@
+# benchmarks/bench_jobs.py
+
+"""
+Job Queue Throughput Benchmark
+Enqueues no-op jobs spread over several tenants, then drains them with
+worker threads and reports jobs/second.
+
+Run against a local PostgreSQL database (DATABASE_URL in .env):
+    python -m benchmarks.bench_jobs --jobs 20000 --threads 8
+
+Creates its own jobs on a dedicated queue and deletes them afterwards.
+"""
+
+import argparse
+import threading
+import time
+from sqlalchemy import delete
+from app.database import Base, SessionLocal, engine
+from app.models.job import Job
+from app.services.job_service import enqueue_jobs, job_handler
+from app.worker import Worker
+
+
+QUEUE = "benchmark"
+
+
+@job_handler("benchmark.noop")
+def noop(db, job):
+    """Does nothing - measures pure queue overhead."""
+    return None
+
+
+def run(total_jobs: int, threads: int, batch_size: int):
+    Base.metadata.create_all(bind=engine, tables=[Job.__table__])
+
+    db = SessionLocal()
+    try:
+        db.execute(delete(Job).where(Job.queue == QUEUE))
+        start = time.perf_counter()
+        for offset in range(0, total_jobs, 5000):
+            enqueue_jobs(db, [
+                {"kind": "benchmark.noop", "queue": QUEUE, "priority": index % 3, "payload": {"n": index}}
+                for index in range(offset, min(offset + 5000, total_jobs))
+            ])
+        db.commit()
+        enqueue_seconds = time.perf_counter() - start
+    finally:
+        db.close()
+
+    worker = Worker(queue=QUEUE, threads=threads, batch_size=batch_size, poll_interval=0.05)
+    runner = threading.Thread(target=worker.run, kwargs={"report_every": 3600}, daemon=True)
+    start = time.perf_counter()
+    runner.start()
+    while worker.metrics.succeeded < total_jobs:
+        time.sleep(0.05)
+    drain_seconds = time.perf_counter() - start
+    worker.stop()
+    runner.join()
+
+    db = SessionLocal()
+    try:
+        db.execute(delete(Job).where(Job.queue == QUEUE))
+        db.commit()
+    finally:
+        db.close()
+
+    print("=" * 50)
+    print(f"Jobs: {total_jobs:,}  threads: {threads}  batch: {batch_size}")
+    print(f"  enqueue: {total_jobs / enqueue_seconds:10,.0f} jobs/s")
+    print(f"  drain:   {total_jobs / drain_seconds:10,.0f} jobs/s")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+    run(args.jobs, args.threads, args.batch_size)
@@ -0,0 +1,144 @@
+# benchmarks/bench_ledger.py
+
+"""
+Ledger Benchmark
+Posts a large journal for one company through ledger_service.post_entries(),
+then compares balance lookups (snapshot + delta) with a full journal scan.
+
+Usage:
+    python -m benchmarks.bench_ledger --lines 10000000 --accounts 200
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_ledger --lines 10000000
+
+The default SQLite database is fine for a quick run; use PostgreSQL for
+realistic numbers at 10M+ lines.
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from sqlalchemy import delete, func, insert, select
+from app.database import Base, SessionLocal, engine
+from app.models.account import Account, AccountType
+from app.models.company import Company
+from app.models.journal import JournalEntry, JournalLine, AccountBalanceSnapshot
+from app.schemas.ledger import JournalEntryCreate, JournalLineCreate
+from app.services import ledger_service
+
+
+def setup(account_count: int) -> tuple[int, list[int]]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        company = db.scalar(select(Company).where(Company.slug == "ledger-bench"))
+        if company is None:
+            company = Company(
+                display_name="Ledger Bench", legal_name="Ledger Bench Sdn Bhd",
+                slug="ledger-bench", business_registration_number="BENCH-1"
+            )
+            db.add(company)
+            db.flush()
+        for model in (AccountBalanceSnapshot, JournalLine, JournalEntry, Account):
+            db.execute(delete(model).where(model.company_id == company.id))
+        account_ids = db.execute(
+            insert(Account).returning(Account.id, sort_by_parameter_order=True),
+            [
+                {"company_id": company.id, "code": f"{1000 + index}", "name": f"Account {index}",
+                 "type": list(AccountType)[index % 5], "is_active": True}
+                for index in range(account_count)
+            ]
+        ).scalars().all()
+        db.commit()
+        return company.id, list(account_ids)
+    finally:
+        db.close()
+
+
+def make_entries(rng: random.Random, account_ids: list[int], count: int, day: date, backdate: float) -> list[JournalEntryCreate]:
+    """
+    Balanced 2-3 line entries around `day` (validation skipped: the benchmark measures posting).
+    A `backdate` share of entries is dated up to 90 days earlier.
+    """
+    entries = []
+    for _ in range(count):
+        amount = Decimal(rng.randint(100, 1_000_000)) / 100
+        debit_split = amount / 2 if rng.random() < 0.5 else amount
+        debit_split = debit_split.quantize(Decimal("0.01"))
+        accounts = rng.sample(account_ids, 3)
+        lines = [JournalLineCreate.model_construct(account_id=accounts[0], debit=debit_split, credit=Decimal(0), cost_center=None, description=None)]
+        if debit_split != amount:
+            lines.append(JournalLineCreate.model_construct(account_id=accounts[1], debit=amount - debit_split, credit=Decimal(0), cost_center=None, description=None))
+        lines.append(JournalLineCreate.model_construct(account_id=accounts[2], debit=Decimal(0), credit=amount, cost_center=None, description=None))
+        entries.append(JournalEntryCreate.model_construct(
+            entry_date=day - timedelta(days=rng.randrange(90) if rng.random() < backdate else rng.randrange(3)),
+            reference=None, description=None, lines=lines
+        ))
+    return entries
+
+
+def run(total_lines: int, account_count: int, batch: int, days: int, lookups: int, backdate: float):
+    company_id, account_ids = setup(account_count)
+    rng = random.Random(7)
+    start = date(2024, 1, 1)
+
+    print("=" * 60)
+    print(f"Posting ~{total_lines:,} lines over {days} days, {account_count} accounts, {batch} entries/transaction")
+    print(f"  {backdate:.0%} of entries back-dated up to 90 days")
+    posted_lines = 0
+    post_seconds = 0.0
+    db = SessionLocal()
+    try:
+        while posted_lines < total_lines:
+            # Walk forward through the dates like a live ledger
+            day = start + timedelta(days=90 + int(days * (posted_lines / total_lines)))
+            entries = make_entries(rng, account_ids, batch, day, backdate)
+            began = time.perf_counter()
+            ledger_service.post_entries(db, company_id, entries, source="benchmark")
+            post_seconds += time.perf_counter() - began
+            posted_lines += sum(len(entry.lines) for entry in entries)
+            if posted_lines // 1_000_000 != (posted_lines - sum(len(entry.lines) for entry in entries)) // 1_000_000:
+                print(f"  {posted_lines:>12,} lines  {posted_lines / post_seconds:10,.0f} lines/s")
+        print(f"  posted {posted_lines:,} lines in {post_seconds:.1f}s -> {posted_lines / post_seconds:,.0f} lines/s")
+
+        # ----- Balance lookups -----
+        def full_scan(account_id: int, as_of: date) -> int:
+            return int(db.scalar(
+                select(func.coalesce(func.sum(JournalLine.amount), 0)).where(
+                    JournalLine.company_id == company_id,
+                    JournalLine.account_id == account_id,
+                    JournalLine.entry_date <= as_of
+                )
+            ))
+
+        snapshot_times, scan_times = [], []
+        for _ in range(lookups):
+            account_id = rng.choice(account_ids)
+            as_of = start + timedelta(days=rng.randrange(days + 90))
+            began = time.perf_counter()
+            fast = ledger_service.get_account_balance(db, company_id, account_id, as_of)
+            snapshot_times.append(time.perf_counter() - began)
+            began = time.perf_counter()
+            slow = full_scan(account_id, as_of)
+            scan_times.append(time.perf_counter() - began)
+            assert fast == slow, f"balance mismatch for account {account_id} at {as_of}: {fast} != {slow}"
+
+        print(f"Balance lookups ({lookups}, results identical):")
+        print(f"  snapshot + delta: median {statistics.median(snapshot_times) * 1000:8.2f} ms")
+        print(f"  full scan:        median {statistics.median(scan_times) * 1000:8.2f} ms")
+        print("=" * 60)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=10_000_000)
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=1000, help="Entries per transaction")
+    parser.add_argument("--days", type=int, default=730, help="Spread of entry dates")
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--backdate", type=float, default=0.05, help="Share of back-dated entries")
+    args = parser.parse_args()
+    run(args.lines, args.accounts, args.batch, args.days, args.lookups, args.backdate)
@@ -0,0 +1,124 @@
+# benchmarks/bench_numbering.py
+
+"""
+Document Numbering Benchmark
+Many threads (POS terminals) each create documents in their own transaction.
+Every document spends --work-ms on other work (building lines, inserting rows)
+inside the transaction. Compares:
+
+    lock early   number taken at the start, counter locked during the work
+    lock late    gap-free: number taken right before commit (numbering_service)
+    blocks       gaps allowed: numbers handed out from per-process blocks
+
+and checks that every mode produced unique numbers (and no gaps where required).
+
+Usage:
+    python -m benchmarks.bench_numbering --threads 16 --documents 200
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_numbering
+"""
+
+import argparse
+import threading
+import time
+from sqlalchemy import delete, select
+from app.database import Base, SessionLocal, engine
+from app.models.company import Company
+from app.models.document_sequence import DocumentSequence, DocumentType
+from app.services import numbering_service
+
+
+def setup() -> int:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        company = db.scalar(select(Company).where(Company.slug == "numbering-bench"))
+        if company is None:
+            company = Company(
+                display_name="Numbering Bench", legal_name="Numbering Bench Sdn Bhd",
+                slug="numbering-bench", business_registration_number="BENCH-2"
+            )
+            db.add(company)
+            db.flush()
+        db.execute(delete(DocumentSequence).where(DocumentSequence.company_id == company.id))
+        db.commit()
+        return company.id
+    finally:
+        db.close()
+
+
+def lock_early(db, company_id: int, year: int, work: float) -> str:
+    number = numbering_service.allocate_gap_free(db, company_id, DocumentType.INVOICE, year)[0]
+    time.sleep(work)
+    db.commit()
+    return number
+
+
+def lock_late(db, company_id: int, year: int, work: float) -> str:
+    time.sleep(work)
+    number = numbering_service.allocate_gap_free(db, company_id, DocumentType.INVOICE, year)[0]
+    db.commit()
+    return number
+
+
+def blocks(db, company_id: int, year: int, work: float) -> str:
+    number = numbering_service.number_blocks.take(company_id, DocumentType.RECEIPT, year)
+    time.sleep(work)
+    db.commit()
+    return number
+
+
+def run_mode(name, create, company_id: int, year: int, threads: int, documents: int, work: float, gap_free: bool):
+    numbers, errors = [], []
+    lock = threading.Lock()
+
+    def terminal():
+        db = SessionLocal()
+        try:
+            for _ in range(documents):
+                number = create(db, company_id, year, work)
+                with lock:
+                    numbers.append(number)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            db.close()
+
+    workers = [threading.Thread(target=terminal) for _ in range(threads)]
+    began = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - began
+
+    values = sorted(int(number.rsplit("-", 1)[1]) for number in numbers)
+    unique = len(set(values)) == len(values)
+    contiguous = values == list(range(values[0], values[0] + len(values))) if values else True
+    check = "unique" if unique else "DUPLICATES"
+    if gap_free:
+        check += ", no gaps" if contiguous else ", GAPS"
+    print(f"  {name:<12} {len(numbers) / elapsed:10,.0f} docs/s   ({check}{f', {len(errors)} errors' if errors else ''})")
+
+
+def run(threads: int, documents: int, work_ms: float, block_size: int):
+    company_id = setup()
+    numbering_service.number_blocks.block_size = block_size
+    work = work_ms / 1000
+
+    print("=" * 60)
+    print(f"{threads} terminals x {documents} documents, {work_ms:g} ms of work per document")
+    run_mode("lock early", lock_early, company_id, 2098, threads, documents, work, gap_free=True)
+    run_mode("lock late", lock_late, company_id, 2099, threads, documents, work, gap_free=True)
+    run_mode("blocks", blocks, company_id, 2099, threads, documents, work, gap_free=False)
+    print(f"  block reservations: {numbering_service.number_blocks.reservations} (block size {block_size})")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--documents", type=int, default=200, help="Documents per thread")
+    parser.add_argument("--work-ms", type=float, default=5)
+    parser.add_argument("--block-size", type=int, default=100)
+    args = parser.parse_args()
+    run(args.threads, args.documents, args.work_ms, args.block_size)
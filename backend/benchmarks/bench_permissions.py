@@ -0,0 +1,47 @@
+# benchmarks/bench_permissions.py
+
+"""
+RBAC Permission Check Benchmark
+Measures the cost of a permission check compared to a bare function call,
+to confirm authorization adds no measurable latency to hot endpoints.
+
+Usage:
+    python -m benchmarks.bench_permissions
+"""
+
+import timeit
+from app.core.permissions import Permission, role_has_permission
+from app.models.user import UserRole
+
+
+ITERATIONS = 1_000_000
+
+
+def _baseline(role, permission):
+    """Empty function with the same signature (measures call overhead only)."""
+    return True
+
+
+def run():
+    print("=" * 50)
+    print(f"RBAC benchmark ({ITERATIONS:,} checks per case)")
+    print("=" * 50)
+
+    baseline = timeit.timeit(
+        lambda: _baseline("accountant", Permission.ACCOUNTING_POST), number=ITERATIONS
+    )
+    print(f"  {'baseline call':<28} {baseline / ITERATIONS * 1e9:8.1f} ns/check")
+
+    cases = [(role.value, Permission.ACCOUNTING_POST) for role in UserRole]
+    cases.append(("accountant", Permission.ACCOUNTING_VIEW | Permission.REPORTS_VIEW))
+    cases.append((None, Permission.COMPANY_VIEW))  # non-member
+
+    for role, permission in cases:
+        elapsed = timeit.timeit(lambda: role_has_permission(role, permission), number=ITERATIONS)
+        allowed = role_has_permission(role, permission)
+        label = f"{role or 'no role'} ({'allow' if allowed else 'deny'})"
+        print(f"  {label:<28} {elapsed / ITERATIONS * 1e9:8.1f} ns/check")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,139 @@
+# benchmarks/bench_pos_sync.py
+
+"""
+POS Sync Benchmark
+Uploads --sales offline sales (--lines lines each) in batches of --batch and
+compares:
+
+    per sale     one transaction per sale: check the key, insert, update stock
+    batched      pos_sync_service.upload_sales (one transaction per batch)
+    re-upload    the same batches again (all duplicates, e.g. after a timeout)
+
+Usage:
+    python -m benchmarks.bench_pos_sync --sales 5000 --batch 1000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_pos_sync
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from sqlalchemy import delete, select
+from app.database import Base, SessionLocal, engine
+from app.models.company import Company
+from app.models.pos import PosSale, PosSaleLine
+from app.models.product import Product
+from app.models.stock import MovementType, StockLevel, StockMovement
+from app.models.warehouse import Warehouse
+from app.schemas.pos import PosSaleCreate, PosSaleLineCreate
+from app.services import pos_sync_service
+from app.services.inventory_service import apply_level_changes
+
+
+def setup(products: int) -> tuple[int, int, list[int]]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        company = db.scalar(select(Company).where(Company.slug == "pos-bench"))
+        if company is None:
+            company = Company(
+                display_name="POS Bench", legal_name="POS Bench Sdn Bhd",
+                slug="pos-bench", business_registration_number="BENCH-4"
+            )
+            db.add(company)
+            db.flush()
+        for model in (PosSaleLine, PosSale, StockMovement, StockLevel, Product, Warehouse):
+            db.execute(delete(model).where(model.company_id == company.id))
+        warehouse = Warehouse(company_id=company.id, code="S1", name="Store")
+        db.add(warehouse)
+        db.add_all(
+            Product(company_id=company.id, sku=f"P{i:05d}", name=f"Product {i}", price=990, reorder_level=Decimal(5))
+            for i in range(products)
+        )
+        db.commit()
+        product_ids = list(db.scalars(select(Product.id).where(Product.company_id == company.id)))
+        return company.id, warehouse.id, product_ids
+    finally:
+        db.close()
+
+
+def make_sales(count: int, lines: int, warehouse_id: int, product_ids: list[int]) -> list[PosSaleCreate]:
+    now = datetime.now(timezone.utc)
+    return [
+        PosSaleCreate(
+            idempotency_key=uuid.uuid4().hex, terminal_code="T1", receipt_number=f"R{n:06d}",
+            warehouse_id=warehouse_id, sold_at=now,
+            lines=[
+                PosSaleLineCreate(product_id=product_id, quantity=Decimal(1), unit_price=Decimal("9.90"))
+                for product_id in random.sample(product_ids, lines)
+            ],
+        )
+        for n in range(count)
+    ]
+
+
+def per_sale(db, company_id: int, sale: PosSaleCreate):
+    if db.scalar(select(PosSale.id).where(
+        PosSale.company_id == company_id, PosSale.idempotency_key == sale.idempotency_key
+    )):
+        return
+    record = PosSale(
+        company_id=company_id, idempotency_key=sale.idempotency_key, terminal_code=sale.terminal_code,
+        receipt_number=sale.receipt_number, warehouse_id=sale.warehouse_id, sold_at=sale.sold_at,
+        payment_method=sale.payment_method, total=sum(990 for _ in sale.lines),
+    )
+    db.add(record)
+    db.flush()
+    for line in sale.lines:
+        db.add(PosSaleLine(
+            sale_id=record.id, company_id=company_id, product_id=line.product_id,
+            quantity=line.quantity, unit_price=990, discount=0, line_total=990,
+        ))
+        db.add(StockMovement(
+            company_id=company_id, product_id=line.product_id, warehouse_id=sale.warehouse_id,
+            type=MovementType.SALE, quantity=-line.quantity, reference=sale.receipt_number,
+        ))
+        db.flush()
+        apply_level_changes(db, company_id, {(line.product_id, sale.warehouse_id): (-line.quantity, 0)}, {line.product_id: Decimal(5)})
+    db.commit()
+
+
+def timed(label: str, count: int, action):
+    began = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - began
+    print(f"  {label:<12} {count / elapsed:10,.0f} sales/s   ({elapsed:.2f}s)")
+
+
+def run(sales: int, lines: int, batch: int, products: int):
+    company_id, warehouse_id, product_ids = setup(products)
+    single = make_sales(min(sales, 1000), lines, warehouse_id, product_ids)
+    batched = make_sales(sales, lines, warehouse_id, product_ids)
+    batches = [batched[i:i + batch] for i in range(0, sales, batch)]
+    db = SessionLocal()
+    try:
+        print("=" * 60)
+        print(f"{sales} sales x {lines} lines, batches of {batch}, {products} products")
+        timed("per sale", len(single), lambda: [per_sale(db, company_id, sale) for sale in single])
+        timed("batched", sales, lambda: [pos_sync_service.upload_sales(db, company_id, chunk) for chunk in batches])
+        duplicates = []
+        timed("re-upload", sales, lambda: [
+            duplicates.extend(pos_sync_service.upload_sales(db, company_id, chunk)[1]) for chunk in batches
+        ])
+        stored = db.query(PosSale).filter(PosSale.company_id == company_id).count()
+        print(f"  stored {stored} sales, {len(duplicates)} duplicates on re-upload")
+        print("=" * 60)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sales", type=int, default=5000)
+    parser.add_argument("--lines", type=int, default=3, help="Lines per sale")
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=500)
+    args = parser.parse_args()
+    run(args.sales, args.lines, args.batch, args.products)
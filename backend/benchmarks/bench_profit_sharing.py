@@ -0,0 +1,164 @@
+# benchmarks/bench_profit_sharing.py
+
+"""
+Profit Sharing Benchmark
+Shares a quarter's profit among --investors investors of one pool, who
+joined and left at random days of the quarter.
+
+Reports:
+    per investor   Decimal share per investor in a Python loop, rounding
+                   difference pushed onto the last investor (the naive way)
+    vectorized     financing_service.capital_days + allocate on int64 arrays
+    distribute     financing_service.distribute_profit end to end: load the
+                   investments, allocate, bulk insert the payouts, post the
+                   journal entry, commit
+
+Every run checks that the payouts add up to the investors' amount exactly.
+
+Usage:
+    python -m benchmarks.bench_profit_sharing --investors 100000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_profit_sharing
+"""
+
+import argparse
+import time
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from app.database import Base, SessionLocal, engine
+from app.models.account import Account, AccountType
+from app.models.company import Company
+from app.models.financing import ContractType, FinancingPool, PoolInvestment, ProfitDistribution, ProfitPayout
+from app.models.journal import AccountBalanceSnapshot, JournalEntry, JournalLine
+from app.schemas.financing import ProfitDistributionCreate
+from app.services import financing_service
+
+
+PERIOD_START = date(2026, 1, 1)
+PERIOD_END = date(2026, 3, 31)
+PROFIT = Decimal("1234567.89")
+RATIO = Decimal("0.7")
+
+
+def make_investments(investors: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(capital sen, start ordinal, end ordinal): RM 100 - RM 50k each, a third join or leave mid-quarter."""
+    capital = rng.integers(100, 50_000, investors) * 100
+    days = (PERIOD_END - PERIOD_START).days
+    first = PERIOD_START.toordinal()
+    start = first + np.where(rng.random(investors) < 0.2, rng.integers(0, days, investors), 0)
+    end = np.where(rng.random(investors) < 0.1, np.minimum(start + rng.integers(0, days, investors), first + days), first + days)
+    return capital, start, end
+
+
+def naive_shares(amount: Decimal, capital: list, start: list, end: list) -> list[Decimal]:
+    weights = [c * (e - s + 1) for c, s, e in zip(capital, start, end)]
+    total = sum(weights)
+    shares = [(amount * w / total).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) for w in weights]
+    shares[-1] += amount - sum(shares)
+    return shares
+
+
+def setup(capital: np.ndarray, start: np.ndarray, end: np.ndarray) -> tuple[int, int]:
+    """Bench company with one pool holding the investments."""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        company = db.scalar(select(Company).where(Company.slug == "profit-sharing-bench"))
+        if company is None:
+            company = Company(
+                display_name="Profit Sharing Bench", legal_name="Profit Sharing Bench Sdn Bhd",
+                slug="profit-sharing-bench", business_registration_number="BENCH-9"
+            )
+            db.add(company)
+            db.flush()
+        pools = select(FinancingPool.id).where(FinancingPool.company_id == company.id)
+        distributions = select(ProfitDistribution.id).where(ProfitDistribution.company_id == company.id)
+        db.execute(delete(ProfitPayout).where(ProfitPayout.distribution_id.in_(distributions)))
+        db.execute(delete(ProfitDistribution).where(ProfitDistribution.company_id == company.id))
+        db.execute(delete(PoolInvestment).where(PoolInvestment.pool_id.in_(pools)))
+        db.execute(delete(FinancingPool).where(FinancingPool.company_id == company.id))
+        # Journal rows are append-only for the ORM; the bench clears them with Core statements
+        db.execute(delete(JournalLine.__table__).where(JournalLine.company_id == company.id))
+        db.execute(delete(JournalEntry.__table__).where(JournalEntry.company_id == company.id))
+        for model in (AccountBalanceSnapshot, Account):
+            db.execute(delete(model).where(model.company_id == company.id))
+        profit_account = Account(company_id=company.id, code="4900", name="Distributable profit", type=AccountType.INCOME)
+        investor_account = Account(company_id=company.id, code="2500", name="Investors", type=AccountType.LIABILITY)
+        db.add_all([profit_account, investor_account])
+        db.flush()
+        pool = FinancingPool(
+            company_id=company.id, name="Bench pool", contract_type=ContractType.MUDARABAH,
+            investor_profit_ratio=RATIO, profit_account_id=profit_account.id, investor_account_id=investor_account.id,
+        )
+        db.add(pool)
+        db.flush()
+        last = PERIOD_END.toordinal()
+        rows = [
+            {
+                "pool_id": pool.id, "company_id": company.id, "investor_reference": f"INV-{n:07d}",
+                "capital": amount, "start_date": date.fromordinal(first),
+                "end_date": date.fromordinal(final) if final < last else None,
+            }
+            for n, (amount, first, final) in enumerate(zip(capital.tolist(), start.tolist(), end.tolist()))
+        ]
+        for chunk in range(0, len(rows), 10_000):
+            db.execute(insert(PoolInvestment), rows[chunk:chunk + 10_000])
+        db.commit()
+        return company.id, pool.id
+    finally:
+        db.close()
+
+
+def run(investors: int, naive: int):
+    rng = np.random.default_rng(49)
+    capital, start, end = make_investments(investors, rng)
+    amount = (PROFIT * RATIO).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    sen = int(amount * 100)
+
+    print("=" * 70)
+    print(f"{investors:,} investors, profit {PROFIT} x {RATIO} = {amount} to share, {engine.dialect.name}")
+
+    began = time.perf_counter()
+    shares = naive_shares(amount, capital[:naive].tolist(), start[:naive].tolist(), end[:naive].tolist())
+    per_investor = (time.perf_counter() - began) / naive
+    assert sum(shares) == amount
+    print(f"  per investor {per_investor * investors * 1000:9.1f} ms   (scaled from {naive:,})")
+
+    timings = []
+    for _ in range(10):
+        began = time.perf_counter()
+        weights = financing_service.capital_days(capital, start, end, PERIOD_START, PERIOD_END)
+        payouts = financing_service.allocate(sen, weights)
+        timings.append(time.perf_counter() - began)
+    assert int(payouts.sum()) == sen
+    best = min(timings)
+    print(f"  vectorized   {best * 1000:9.1f} ms   ({per_investor * investors / best:.0f}x faster, "
+          f"payouts sum to {payouts.sum() / 100:.2f})")
+
+    company_id, pool_id = setup(capital, start, end)
+    db = SessionLocal()
+    try:
+        began = time.perf_counter()
+        distribution = financing_service.distribute_profit(
+            db, company_id, pool_id,
+            ProfitDistributionCreate(period_start=PERIOD_START, period_end=PERIOD_END, profit=PROFIT),
+        )
+        elapsed = time.perf_counter() - began
+        written = db.scalar(
+            select(func.sum(ProfitPayout.amount)).where(ProfitPayout.distribution_id == distribution.id)
+        )
+        assert written == distribution.investor_amount == sen
+        print(f"  distribute   {elapsed * 1000:9.1f} ms   ({distribution.investor_count:,} payouts, "
+              f"{distribution.investor_count / elapsed:,.0f} investors/s)")
+    finally:
+        db.close()
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--investors", type=int, default=100_000)
+    parser.add_argument("--naive", type=int, default=20_000, help="Investors shared out one at a time")
+    args = parser.parse_args()
+    run(args.investors, args.naive)
@@ -0,0 +1,73 @@
+# benchmarks/bench_reports.py
+
+"""
+Financial Report Benchmark
+Times the NumPy report engine on the journal created by bench_ledger,
+and compares it with a plain Python row-by-row aggregation.
+
+Usage:
+    python -m benchmarks.bench_ledger --lines 2000000     # create the data first
+    python -m benchmarks.bench_reports
+"""
+
+import argparse
+import time
+from collections import defaultdict
+from datetime import date
+from sqlalchemy import select
+from app.database import SessionLocal
+from app.models.company import Company
+from app.models.journal import JournalLine
+from app.services import report_service
+from app.services.report_service import ReportPeriod
+
+
+def timed(label: str, function):
+    began = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - began
+    print(f"  {label:<42} {elapsed:8.2f}s")
+    return result, elapsed
+
+
+def row_by_row(db, company_id: int, start: date, end: date) -> dict:
+    """The naive way: stream every line and add it up in a dict."""
+    totals = defaultdict(int)
+    query = select(JournalLine.account_id, JournalLine.entry_date, JournalLine.amount).where(
+        JournalLine.company_id == company_id, JournalLine.entry_date >= start, JournalLine.entry_date <= end
+    )
+    for account_id, entry_date, amount in db.execute(query.execution_options(yield_per=10_000)):
+        totals[(account_id, entry_date.year, entry_date.month)] += amount
+    return totals
+
+
+def run(year: int):
+    db = SessionLocal()
+    try:
+        company_id = db.scalar(select(Company.id).where(Company.slug == "ledger-bench"))
+        if company_id is None:
+            raise SystemExit("Run `python -m benchmarks.bench_ledger` first")
+        current = ReportPeriod(date(year, 1, 1), date(year, 12, 31))
+        previous = ReportPeriod(date(year - 1, 1, 1), date(year - 1, 12, 31))
+        line_count = db.scalar(
+            select(JournalLine.id).where(JournalLine.company_id == company_id).order_by(JournalLine.id.desc()).limit(1)
+        )
+
+        print("=" * 60)
+        print(f"Journal: ~{line_count:,} lines. Report years {year - 1} and {year}")
+        _, naive = timed("row-by-row Python, 2 years", lambda: row_by_row(db, company_id, previous.start, current.end))
+        _, fast = timed("P&L, 2 comparative years (NumPy)", lambda: report_service.profit_and_loss(db, company_id, [current, previous]))
+        timed("P&L by cost center", lambda: report_service.profit_and_loss(db, company_id, [current, previous], by_cost_center=True))
+        timed("trial balance, 2 year ends", lambda: report_service.trial_balance(db, company_id, [current.end, previous.end]))
+        timed("balance sheet, 2 year ends", lambda: report_service.balance_sheet(db, company_id, [current.end, previous.end]))
+        print(f"  NumPy P&L is {naive / fast:.1f}x faster than row-by-row")
+        print("=" * 60)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--year", type=int, default=2025)
+    args = parser.parse_args()
+    run(args.year)
@@ -0,0 +1,202 @@
+# benchmarks/bench_screening.py
+
+"""
+Sharia Screening Benchmark
+A company with --accounts accounts and --rules rules (prohibited accounts
+by code prefix and keyword, plus amount limits); --lines journal lines
+spread over the accounts, a few percent breaking a rule.
+
+Reports:
+    per line       every rule checked against every line in a Python loop
+                   (prefix, keyword and limit tests on the account's code/name)
+    column-wise    screening_service.compile_rules + RuleTable.evaluate
+    posting        ledger_service.post_entries of --entries entries, every
+                   other batch with screening off (the cost added to the write path)
+    sweep          screening_service.sweep_company over the posted entries
+
+Column-wise and per-line results are checked to find the same violations.
+
+Usage:
+    python -m benchmarks.bench_screening --lines 1000000
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_screening
+"""
+
+import argparse
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+import numpy as np
+from sqlalchemy import delete, select
+from app.core.config import settings
+from app.database import Base, SessionLocal, engine
+from app.models.account import Account, AccountType
+from app.models.company import Company
+from app.models.journal import AccountBalanceSnapshot, JournalEntry, JournalLine
+from app.models.screening import ScreeningRule, ScreeningRuleKind, ScreeningSource, ScreeningViolation
+from app.schemas.ledger import JournalEntryCreate, JournalLineCreate
+from app.services import ledger_service, screening_service
+
+
+FIRST_DAY = date(2026, 1, 1)
+
+
+def setup(accounts: int, rules: int) -> int:
+    """Bench company with its chart of accounts and rules (previous runs cleared)."""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        company = db.scalar(select(Company).where(Company.slug == "screening-bench"))
+        if company is None:
+            company = Company(
+                display_name="Screening Bench", legal_name="Screening Bench Sdn Bhd",
+                slug="screening-bench", business_registration_number="BENCH-10"
+            )
+            db.add(company)
+            db.flush()
+        db.execute(delete(ScreeningViolation).where(ScreeningViolation.company_id == company.id))
+        db.execute(delete(ScreeningRule).where(ScreeningRule.company_id == company.id))
+        # Journal rows are append-only for the ORM; the bench clears them with Core statements
+        db.execute(delete(JournalLine.__table__).where(JournalLine.company_id == company.id))
+        db.execute(delete(JournalEntry.__table__).where(JournalEntry.company_id == company.id))
+        for model in (AccountBalanceSnapshot, Account):
+            db.execute(delete(model).where(model.company_id == company.id))
+        # Codes 1000..; every 50th account earns interest, codes 29xx hold deferred consideration
+        db.add_all([
+            Account(
+                company_id=company.id, code=str(1000 + n),
+                name=f"{'Interest income' if n % 50 == 7 else 'Account'} {n}", type=AccountType.INCOME,
+            )
+            for n in range(accounts)
+        ])
+        rule_rows = []
+        for n in range(rules):
+            if n % 3 == 0:
+                rule_rows.append(ScreeningRule(company_id=company.id, name=f"Limit {n}", kind=ScreeningRuleKind.AMOUNT_LIMIT,
+                                               account_codes=[f"29{n % 10}"], max_amount=500_000))
+            elif n % 3 == 1:
+                rule_rows.append(ScreeningRule(company_id=company.id, name=f"Prefix {n}", kind=ScreeningRuleKind.PROHIBITED_ACCOUNT,
+                                               account_codes=[f"{1100 + n * 37}"]))
+            else:
+                rule_rows.append(ScreeningRule(company_id=company.id, name=f"Keyword {n}", kind=ScreeningRuleKind.PROHIBITED_ACCOUNT,
+                                               keywords=["interest" if n == 2 else f"riba {n}"]))
+        db.add_all(rule_rows)
+        db.commit()
+        return company.id
+    finally:
+        db.close()
+
+
+def naive_screen(rules: list, accounts: dict, documents: list, subjects: list, amounts: list) -> dict:
+    """{(rule_id, document): [amount, lines]} checking every rule on every line."""
+    found = defaultdict(lambda: [0, 0])
+    for document, account_id, amount in zip(documents, subjects, amounts):
+        code, name = accounts[account_id]
+        name = name.lower()
+        for rule in rules:
+            if rule.kind == ScreeningRuleKind.PROHIBITED_CATEGORY:
+                continue
+            if not (any(code.startswith(prefix) for prefix in rule.account_codes)
+                    or any(keyword.lower() in name for keyword in rule.keywords)):
+                continue
+            if rule.kind == ScreeningRuleKind.AMOUNT_LIMIT and abs(amount) <= rule.max_amount:
+                continue
+            violation = found[(rule.id, document)]
+            violation[0] += abs(amount)
+            violation[1] += 1
+    return found
+
+
+def make_entries(account_ids: np.ndarray, count: int, rng: np.random.Generator) -> list[JournalEntryCreate]:
+    """Two-line entries between random accounts."""
+    pairs = rng.choice(account_ids, (count, 2))
+    amounts = rng.integers(100, 1_000_000, count)
+    return [
+        JournalEntryCreate.model_construct(
+            entry_date=FIRST_DAY + timedelta(days=n % 90), reference=f"B{n}", description=None,
+            lines=[
+                JournalLineCreate.model_construct(account_id=int(debit), debit=Decimal(amount) / 100, credit=Decimal(0),
+                                                  cost_center=None, description=None),
+                JournalLineCreate.model_construct(account_id=int(credit), debit=Decimal(0), credit=Decimal(amount) / 100,
+                                                  cost_center=None, description=None),
+            ],
+        )
+        for n, ((debit, credit), amount) in enumerate(zip(pairs.tolist(), amounts.tolist()))
+    ]
+
+
+def run(accounts: int, rules: int, lines: int, naive: int, entries: int, batch: int):
+    rng = np.random.default_rng(50)
+    naive -= naive % 2  # Whole two-line documents
+    company_id = setup(accounts, rules)
+    db = SessionLocal()
+    try:
+        rule_rows = list(db.scalars(select(ScreeningRule).where(ScreeningRule.company_id == company_id)))
+        account_rows = {row.id: (row.code, row.name) for row in db.execute(
+            select(Account.id, Account.code, Account.name).where(Account.company_id == company_id)
+        )}
+        account_ids = np.array(sorted(account_rows), dtype=np.int64)
+        documents = np.arange(lines, dtype=np.int64) // 2
+        subjects = rng.choice(account_ids, lines)
+        amounts = rng.integers(-1_000_000, 1_000_000, lines)
+
+        print("=" * 70)
+        print(f"{lines:,} lines, {accounts:,} accounts, {rules} rules, {engine.dialect.name}")
+
+        began = time.perf_counter()
+        expected = naive_screen(rule_rows, account_rows, documents[:naive].tolist(),
+                                subjects[:naive].tolist(), amounts[:naive].tolist())
+        per_line = (time.perf_counter() - began) / naive
+        print(f"  per line     {per_line * lines * 1000:9.1f} ms   (scaled from {naive:,})")
+
+        began = time.perf_counter()
+        table = screening_service.compile_rules(db, company_id)
+        compiled = time.perf_counter() - began
+        timings = []
+        for _ in range(5):
+            began = time.perf_counter()
+            found = table.evaluate(ScreeningSource.JOURNAL, documents, subjects, amounts)
+            timings.append(time.perf_counter() - began)
+        best = min(timings)
+        print(f"  column-wise  {best * 1000:9.1f} ms   ({per_line * lines / best:.0f}x faster, "
+              f"{len(found.rule_ids):,} violations; compiling {compiled * 1000:.1f} ms)")
+        head = found.documents < naive // 2  # Documents fully inside the per-line sample
+        assert {
+            (rule_id, document): [amount, count]
+            for rule_id, document, amount, count in zip(*(column[head].tolist() for column in found))
+        } == dict(expected)
+
+        # Alternate batches so both halves post into an equally full ledger
+        timings = {False: 0.0, True: 0.0}
+        for n in range(entries // batch):
+            enabled = settings.SCREENING_ENABLED = n % 2 == 1
+            chunk = make_entries(account_ids, batch, rng)
+            began = time.perf_counter()
+            ledger_service.post_entries(db, company_id, chunk, source="bench")
+            timings[enabled] += time.perf_counter() - began
+        settings.SCREENING_ENABLED = True
+        queued = screening_service.writer.stats()["queued"]
+        screening_service.writer.flush()
+        print(f"  posting      {timings[False] * 1000:9.1f} ms off / {timings[True] * 1000:.1f} ms on   "
+              f"({entries // 2:,} entries each in batches of {batch}, {queued:,} violations queued)")
+
+        began = time.perf_counter()
+        swept = screening_service.sweep_company(db, company_id, FIRST_DAY)
+        elapsed = time.perf_counter() - began
+        print(f"  sweep        {elapsed * 1000:9.1f} ms   ({swept['lines']:,} matching lines of "
+              f"{entries * 2:,}, {swept['violations']:,} violations)")
+    finally:
+        db.close()
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=2000)
+    parser.add_argument("--rules", type=int, default=30)
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--naive", type=int, default=50_000, help="Lines screened one at a time")
+    parser.add_argument("--entries", type=int, default=20_000, help="Entries posted (half with screening on)")
+    parser.add_argument("--batch", type=int, default=100, help="Entries per post_entries call")
+    args = parser.parse_args()
+    run(args.accounts, args.rules, args.lines, args.naive, args.entries, args.batch)
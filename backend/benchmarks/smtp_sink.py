@@ -0,0 +1,111 @@
+# benchmarks/smtp_sink.py
+
+"""
+Local SMTP Stand-in
+A tiny SMTP server that accepts every message and throws it away
+(optionally printing it). Use it for local development, manual testing
+and email throughput benchmarks - no real mail is ever sent.
+
+Usage:
+    python -m benchmarks.smtp_sink --port 1025 --print
+"""
+
+import argparse
+import asyncio
+import threading
+
+
+class SMTPSink:
+    """
+    Minimal SMTP server (EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT).
+
+    Example:
+        sink = SMTPSink(port=1025)
+        sink.start_in_thread()
+        ...
+        print(sink.messages_received)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 1025, print_messages: bool = False):
+        self.host = host
+        self.port = port
+        self.print_messages = print_messages
+        self.messages_received = 0
+        self.connections = 0
+        self._loop = None
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        writer.write(b"220 smtp-sink ready\r\n")
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line[:4].upper()
+            if command in (b"EHLO", b"HELO"):
+                writer.write(b"250-smtp-sink\r\n250 8BITMIME\r\n" if command == b"EHLO" else b"250 smtp-sink\r\n")
+            elif command == b"DATA":
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                await writer.drain()
+                lines = []
+                while True:
+                    data_line = await reader.readline()
+                    if not data_line or data_line == b".\r\n":
+                        break
+                    if self.print_messages:
+                        lines.append(data_line)
+                self.messages_received += 1
+                if self.print_messages:
+                    print(b"".join(lines).decode(errors="replace"))
+                    print("-" * 50)
+                writer.write(b"250 OK queued\r\n")
+            elif command == b"QUIT":
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:  # MAIL, RCPT, RSET, NOOP...
+                writer.write(b"250 OK\r\n")
+            await writer.drain()
+        writer.close()
+
+    async def serve(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self) -> threading.Thread:
+        """Run the server in a background thread (for tests and benchmarks)."""
+        ready = threading.Event()
+
+        def runner():
+            self._loop = asyncio.new_event_loop()
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port)
+            )
+            ready.set()
+            self._loop.run_forever()
+
+        thread = threading.Thread(target=runner, name="smtp-sink", daemon=True)
+        thread.start()
+        ready.wait(5)
+        return thread
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local SMTP server that accepts and discards mail")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    parser.add_argument("--print", action="store_true", help="Print each message")
+    args = parser.parse_args()
+    print(f"📭 SMTP sink listening on {args.host}:{args.port}")
+    try:
+        asyncio.run(SMTPSink(args.host, args.port, args.print).serve())
+    except KeyboardInterrupt:
+        pass
@@ -53,6 +53,10 @@ export const getCurrentUser = () => {
   return api.get('/api/v1/auth/me')
 }
 
+export const getBootstrap = () => {
+  return api.get('/api/v1/bootstrap')
+}
+
 export const getUserCompanies = () => {
   return api.get('/api/v1/companies/')
 }
@@ -1,7 +1,7 @@
 // src/stores/auth.js
 import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
-import { login as apiLogin, register as apiRegister, getCurrentUser, getUserCompanies, selectCompany } from '@/services/api'
+import { login as apiLogin, register as apiRegister, getBootstrap, getCurrentUser, getUserCompanies, selectCompany } from '@/services/api'
 
 export const useAuthStore = defineStore('auth', () => {
   const user = ref(null)
@@ -36,8 +36,7 @@ export const useAuthStore = defineStore('auth', () => {
       const response = await apiLogin(email, password)
       token.value = response.data.access_token
       localStorage.setItem('token', response.data.access_token)
-      await fetchUser()
-      await fetchUserCompanies()
+      await bootstrap()
       return true
     } catch (err) {
       error.value = err.response?.data?.detail || 'Login failed'
@@ -75,6 +74,20 @@ export const useAuthStore = defineStore('auth', () => {
     }
   }
 
+  // Load user, current company and memberships in one request
+  async function bootstrap() {
+    try {
+      const response = await getBootstrap()
+      user.value = response.data.user
+      userCompanies.value = response.data.companies
+      localStorage.setItem('user', JSON.stringify(response.data.user))
+      localStorage.setItem('userCompanies', JSON.stringify(response.data.companies))
+    } catch (err) {
+      console.error('Bootstrap error:', err)
+      logout()
+    }
+  }
+
   async function fetchUser() {
     try {
       const response = await getCurrentUser()
@@ -103,9 +116,12 @@ export const useAuthStore = defineStore('auth', () => {
     loading.value = true
     error.value = null
     try {
+      // The new token carries the selected company
       const response = await selectCompany(companyId)
-      user.value = response.data
-      localStorage.setItem('user', JSON.stringify(response.data))
+      token.value = response.data.access_token
+      user.value = response.data.user
+      localStorage.setItem('token', response.data.access_token)
+      localStorage.setItem('user', JSON.stringify(response.data.user))
       return true
     } catch (err) {
       error.value = err.response?.data?.detail || 'Failed to switch company'
@@ -141,6 +157,7 @@ export const useAuthStore = defineStore('auth', () => {
     initAuth,
     login,
     register,
+    bootstrap,
     fetchUser,
     fetchUserCompanies,
     switchCompany,